@@ -14,74 +14,112 @@
 # limitations under the License.
 """Adapter to bridge NAT workflows with A2A AgentExecutor interface.
 
-This module implements a message-only A2A agent for Phase 1, providing stateless
-request/response interactions without task lifecycle management.
+Each request runs the workflow as an A2A task. Workflow output is streamed to the client as artifact updates, and
+intermediate progress as `working` status updates, so callers receive output as it is produced instead of waiting for
+the whole workflow to complete.
 """
 
+import asyncio
 import logging
+import uuid
+from dataclasses import dataclass
+from dataclasses import field
 
 from a2a.server.agent_execution import AgentExecutor
 from a2a.server.agent_execution import RequestContext
 from a2a.server.events import EventQueue
-from a2a.types import InternalError
+from a2a.server.tasks import TaskUpdater
 from a2a.types import InvalidParamsError
-from a2a.types import UnsupportedOperationError
+from a2a.types import Part
+from a2a.types import TaskNotCancelableError
+from a2a.types import TaskState
+from a2a.types import TextPart
 from a2a.utils import new_agent_text_message
+from a2a.utils import new_task
 from a2a.utils.errors import ServerError
+from nat.builder.context import Context
+from nat.data_models.intermediate_step import IntermediateStep
+from nat.data_models.intermediate_step import IntermediateStepType
 from nat.runtime.session import SessionManager
 
 logger = logging.getLogger(__name__)
 
+# Intermediate steps reported to the client as progress updates
+_PROGRESS_STEP_TYPES = {
+    IntermediateStepType.LLM_START: "Calling LLM",
+    IntermediateStepType.TOOL_START: "Calling tool",
+}
 
-class NATWorkflowAgentExecutor(AgentExecutor):
-    """Adapts NAT workflows to A2A AgentExecutor interface as a message-only agent.
 
-    This adapter implements Phase 1 support for A2A integration, providing stateless
-    message-based interactions. Each request is handled independently without maintaining
-    conversation state or task lifecycle.
+@dataclass
+class _InFlightTask:
+    """A task whose workflow is running."""
+
+    workflow_task: asyncio.Task
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+    cancel_requested: bool = False
+
+
+class NATWorkflowAgentExecutor(AgentExecutor):
+    """Adapts NAT workflows to A2A AgentExecutor interface.
 
-    Key characteristics:
-    - Stateless: Each message is processed independently
-    - Synchronous: Returns immediate responses (no long-running tasks)
-    - Message-only: Returns Message objects, not Task objects
-    - Concurrent: Uses SessionManager's semaphore for concurrency control
+    Each request is processed as an A2A task:
+    - The task is `submitted`, then `working` while the workflow runs
+    - Workflow output is streamed as chunks of a `response` artifact
+    - LLM and tool calls are reported as `working` status updates, if enabled
+    - The task ends as `completed`, `failed`, or `canceled` when cancelled with `tasks/cancel`
 
-    Note: Multi-turn conversations and task-based interactions are deferred to Phase 5.
+    Each message is processed independently, without conversation history. Concurrent workflow executions are limited
+    by the SessionManager's semaphore, and at most `max_in_flight_tasks` tasks are tracked at once, further tasks are
+    rejected.
     """
 
-    def __init__(self, session_manager: SessionManager):
+    def __init__(self,
+                 session_manager: SessionManager,
+                 max_in_flight_tasks: int = 256,
+                 stream_progress_updates: bool = True):
         """Initialize the adapter with a NAT SessionManager.
 
         Args:
             session_manager: The SessionManager for handling workflow execution
                 with concurrency control via semaphore
+            max_in_flight_tasks: Maximum number of tasks submitted or working at once
+            stream_progress_updates: Whether to send a status update for each LLM and tool call
         """
         self.session_manager = session_manager
-        logger.info("Initialized NATWorkflowAgentExecutor (message-only) for workflow: %s",
+        self.max_in_flight_tasks = max_in_flight_tasks
+        self.stream_progress_updates = stream_progress_updates
+        self._in_flight_tasks: dict[str, _InFlightTask] = {}
+        logger.info("Initialized NATWorkflowAgentExecutor for workflow: %s",
                     session_manager.workflow.config.workflow.type)
 
+    @property
+    def num_in_flight_tasks(self) -> int:
+        """Number of tasks whose workflow is running."""
+        return len(self._in_flight_tasks)
+
     async def execute(
         self,
         context: RequestContext,
         event_queue: EventQueue,
     ) -> None:
-        """Execute the NAT workflow and return a message response.
+        """Execute the NAT workflow as an A2A task, streaming its output.
 
-        This is a message-only implementation (Phase 1):
         1. Extracts the user query from the A2A message
-        2. Runs the NAT workflow (stateless, no conversation history)
-        3. Returns the result as a Message object (not a Task)
+        2. Publishes the task as `submitted`, then `working`
+        3. Runs the NAT workflow (stateless, no conversation history), publishing output chunks as artifact updates
+           and LLM and tool calls as status updates
+        4. Publishes the final task state
 
-        For Phase 1, each message is handled independently with no state preservation
-        between requests. The context_id and task_id from the A2A protocol are mapped
-        to NAT's conversation_id and user_message_id for tracing purposes only.
+        The context_id and task_id from the A2A protocol are mapped to NAT's conversation_id and user_message_id for
+        tracing purposes only.
 
         Args:
             context: The A2A request context containing the user message
-            event_queue: Queue for sending the response message back to the client
+            event_queue: Queue for sending task events back to the client
 
         Raises:
-            ServerError: If validation fails or workflow execution errors occur
+            ServerError: If validation fails
         """
         # Validate the request
         error = self._validate_request(context)
@@ -94,46 +132,103 @@ class NATWorkflowAgentExecutor(AgentExecutor):
             logger.error("No user input found in context")
             raise ServerError(error=InvalidParamsError())
 
-        # Extract IDs for tracing (stored but not used for state management in Phase 1)
-        context_id = context.context_id
-        task_id = context.task_id
+        task = context.current_task
+        if task is None:
+            task = new_task(context.message)
+            await event_queue.enqueue_event(task)
+        updater = TaskUpdater(event_queue, task.id, task.context_id)
 
-        logger.info("Processing message-only request (context_id=%s, task_id=%s): %s", context_id, task_id, query[:100])
+        if len(self._in_flight_tasks) >= self.max_in_flight_tasks:
+            logger.warning("Rejecting task %s, %d tasks are already in flight", task.id, len(self._in_flight_tasks))
+            await updater.reject(
+                new_agent_text_message("The agent is processing too many tasks, please retry later.",
+                                       context_id=task.context_id,
+                                       task_id=task.id))
+            return
 
-        try:
-            # Run the NAT workflow using SessionManager for proper concurrency handling
-            # Each message gets its own independent session (stateless)
-            # TODO: Add support for user input callbacks and authentication in later phases
-            async with self.session_manager.session() as session:
-                async with session.run(query) as runner:
-                    # Get the result as a string
-                    response_text = await runner.result(to_type=str)
+        logger.info("Processing task (context_id=%s, task_id=%s): %s", task.context_id, task.id, query[:100])
+        await updater.start_work()
 
-            logger.info("Workflow completed successfully (context_id=%s, task_id=%s)", context_id, task_id)
+        # Output chunks and progress steps, in the order the workflow produces them. None marks the end of the workflow
+        updates: asyncio.Queue[str | IntermediateStep | None] = asyncio.Queue()
+        in_flight = _InFlightTask(workflow_task=asyncio.create_task(self._run_workflow(query, updates)))
+        self._in_flight_tasks[task.id] = in_flight
 
-            # Create and send the response message (message-only pattern)
-            response_message = new_agent_text_message(
-                response_text,
-                context_id=context_id,
-                task_id=task_id,
-            )
-            await event_queue.enqueue_event(response_message)
+        try:
+            artifact_id = str(uuid.uuid4())
+            num_chunks = 0
+            while (update := await updates.get()) is not None:
+                if isinstance(update, IntermediateStep):
+                    progress = f"{_PROGRESS_STEP_TYPES[update.event_type]} {update.name or ''}".rstrip()
+                    await updater.update_status(TaskState.working,
+                                                message=new_agent_text_message(progress,
+                                                                               context_id=task.context_id,
+                                                                               task_id=task.id))
+                elif update:
+                    await updater.add_artifact([Part(root=TextPart(text=update))],
+                                               artifact_id=artifact_id,
+                                               name="response",
+                                               append=num_chunks > 0,
+                                               last_chunk=False)
+                    num_chunks += 1
+
+            await in_flight.workflow_task
+            if num_chunks > 0:
+                await updater.add_artifact([], artifact_id=artifact_id, name="response", append=True, last_chunk=True)
+            await updater.complete()
+            logger.info("Workflow completed successfully (context_id=%s, task_id=%s)", task.context_id, task.id)
+
+        except asyncio.CancelledError:
+            in_flight.workflow_task.cancel()
+            logger.info("Workflow cancelled (context_id=%s, task_id=%s)", task.context_id, task.id)
+            await updater.cancel()
+            # The workflow was cancelled with `cancel`, the request itself carries on
+            if not in_flight.cancel_requested:
+                raise
 
         except Exception as e:
             logger.error("Error executing NAT workflow (context_id=%s, task_id=%s): %s",
-                         context_id,
-                         task_id,
+                         task.context_id,
+                         task.id,
                          e,
                          exc_info=True)
-
-            # Send error message back to client
-            error_message = new_agent_text_message(
-                f"An error occurred while processing your request: {str(e)}",
-                context_id=context_id,
-                task_id=task_id,
-            )
-            await event_queue.enqueue_event(error_message)
-            raise ServerError(error=InternalError()) from e
+            await updater.failed(
+                new_agent_text_message(f"An error occurred while processing your request: {str(e)}",
+                                       context_id=task.context_id,
+                                       task_id=task.id))
+
+        finally:
+            in_flight.workflow_task.cancel()
+            del self._in_flight_tasks[task.id]
+            in_flight.done.set()
+
+    async def _run_workflow(self, query: str, updates: asyncio.Queue[str | IntermediateStep | None]) -> None:
+        """Run the workflow, putting its output chunks and progress steps on `updates`."""
+        try:
+            # Each message gets its own independent session (stateless)
+            # TODO: Add support for user input callbacks and authentication in later phases
+            async with self.session_manager.session() as session:
+                async with session.run(query) as runner:
+                    subscription = None
+                    if self.stream_progress_updates:
+
+                        def on_next(step: IntermediateStep):
+                            if step.event_type in _PROGRESS_STEP_TYPES:
+                                updates.put_nowait(step)
+
+                        subscription = Context.get().intermediate_step_manager.subscribe(on_next=on_next)
+
+                    try:
+                        if session.workflow.has_streaming_output:
+                            async for chunk in runner.result_stream(to_type=str):
+                                updates.put_nowait(chunk)
+                        else:
+                            updates.put_nowait(await runner.result(to_type=str))
+                    finally:
+                        if subscription is not None:
+                            subscription.unsubscribe()
+        finally:
+            updates.put_nowait(None)
 
     def _validate_request(self, context: RequestContext) -> bool:
         """Validate the incoming request context.
@@ -153,20 +248,26 @@ class NATWorkflowAgentExecutor(AgentExecutor):
 
     async def cancel(
         self,
-        _context: RequestContext,
+        context: RequestContext,
         _event_queue: EventQueue,
     ) -> None:
         """Handle task cancellation requests.
 
-        Not applicable for message-only agents in Phase 1. Cancellation is a task-based
-        feature that will be implemented in Phase 5 along with long-running task support.
+        Cancels the workflow of the task and waits for `execute` to publish the `canceled` task state.
 
         Args:
-            _context: The request context (unused in Phase 1)
-            _event_queue: Event queue for sending updates (unused in Phase 1)
+            context: The request context of the task to cancel
+            _event_queue: Event queue for sending updates (unused, `execute` publishes the final state)
 
         Raises:
-            ServerError: Always raises UnsupportedOperationError
+            ServerError: TaskNotCancelableError if the workflow of the task is not running
         """
-        logger.warning("Task cancellation requested but not supported in message-only mode (Phase 1)")
-        raise ServerError(error=UnsupportedOperationError())
+        in_flight = self._in_flight_tasks.get(context.task_id)
+        if in_flight is None:
+            logger.warning("Task cancellation requested for task %s, which is not running", context.task_id)
+            raise ServerError(error=TaskNotCancelableError())
+
+        logger.info("Cancelling task %s", context.task_id)
+        in_flight.cancel_requested = True
+        in_flight.workflow_task.cancel()
+        await in_flight.done.wait()
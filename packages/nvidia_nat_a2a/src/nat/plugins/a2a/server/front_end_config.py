@@ -96,6 +96,17 @@ class A2AFrontEndConfig(FrontEndBaseConfig, name="a2a"):
         ge=-1,
     )
 
+    max_in_flight_tasks: int = Field(
+        default=256,
+        description="Maximum number of tasks submitted or working at once (default: 256). "
+        "Tasks waiting for a free workflow execution slot count towards the limit, further tasks are rejected.",
+        ge=1,
+    )
+    stream_progress_updates: bool = Field(
+        default=True,
+        description="Send a task status update each time the workflow calls an LLM or tool (default: True)",
+    )
+
     # Content modes
     default_input_modes: list[str] = Field(
         default_factory=lambda: ["text", "text/plain"],
@@ -58,6 +58,9 @@ class A2AFrontEndPlugin(FrontEndBase[A2AFrontEndConfig]):
             # Create A2A server
             a2a_server = worker.create_a2a_server(agent_card, agent_executor)
 
+            # Bearer token validator of the OAuth2 middleware, if configured
+            validator = None
+
             # Start the server with proper cleanup
             try:
                 logger.info(
@@ -77,7 +80,10 @@ class A2AFrontEndPlugin(FrontEndBase[A2AFrontEndConfig]):
                 if self.front_end_config.server_auth:
                     from nat.plugins.a2a.server.oauth_middleware import OAuth2ValidationMiddleware
 
-                    app.add_middleware(OAuth2ValidationMiddleware, config=self.front_end_config.server_auth)
+                    validator = OAuth2ValidationMiddleware.create_validator(self.front_end_config.server_auth)
+                    app.add_middleware(OAuth2ValidationMiddleware,
+                                       config=self.front_end_config.server_auth,
+                                       validator=validator)
                     logger.info(
                         "OAuth2 token validation enabled for A2A server (issuer=%s, scopes=%s)",
                         self.front_end_config.server_auth.issuer_url,
@@ -100,8 +106,10 @@ class A2AFrontEndPlugin(FrontEndBase[A2AFrontEndConfig]):
                 logger.error("A2A server error: %s", e, exc_info=True)
                 raise
             finally:
-                # Ensure cleanup of resources (httpx client)
+                # Ensure cleanup of resources (httpx clients)
                 await worker.cleanup()
+                if validator is not None:
+                    await validator.aclose()
                 logger.info("A2A server resources cleaned up")
 
     def _get_worker_instance(self) -> A2AFrontEndPluginWorker:
@@ -254,7 +254,9 @@ class A2AFrontEndPluginWorker:
 
         logger.info("Created SessionManager with max_concurrency=%d", self.max_concurrency)
 
-        return NATWorkflowAgentExecutor(session_manager)
+        return NATWorkflowAgentExecutor(session_manager,
+                                        max_in_flight_tasks=self.front_end_config.max_in_flight_tasks,
+                                        stream_progress_updates=self.front_end_config.stream_progress_updates)
 
     def create_a2a_server(
         self,
@@ -39,17 +39,37 @@ class OAuth2ValidationMiddleware(BaseHTTPMiddleware):
     (/.well-known/agent.json) and validates all other A2A requests.
     """
 
-    def __init__(self, app, config: OAuth2ResourceServerConfig):
+    def __init__(self, app, config: OAuth2ResourceServerConfig, validator: BearerTokenValidator | None = None):
         """Initialize OAuth2 validation middleware.
 
         Args:
             app: Starlette application
             config: OAuth2 resource server configuration
+            validator: Validator to use, created from `config` if not provided. The owner of a provided validator is
+                responsible for closing it with `aclose` once the server has stopped.
         """
         super().__init__(app)
 
-        # Create validator using NAT's BearerTokenValidator
-        self.validator = BearerTokenValidator(
+        self.validator = validator or self.create_validator(config)
+
+        logger.info(
+            "OAuth2 validation middleware initialized (issuer=%s, scopes=%s, audience=%s)",
+            config.issuer_url,
+            config.scopes,
+            config.audience,
+        )
+
+    @staticmethod
+    def create_validator(config: OAuth2ResourceServerConfig) -> BearerTokenValidator:
+        """Create a NAT BearerTokenValidator from the OAuth2 resource server configuration.
+
+        Args:
+            config: OAuth2 resource server configuration
+
+        Returns:
+            Validator for the Bearer tokens accepted by the server
+        """
+        return BearerTokenValidator(
             issuer=config.issuer_url,
             audience=config.audience,
             scopes=config.scopes,
@@ -60,13 +80,6 @@ class OAuth2ValidationMiddleware(BaseHTTPMiddleware):
             client_secret=config.client_secret.get_secret_value() if config.client_secret else None,
         )
 
-        logger.info(
-            "OAuth2 validation middleware initialized (issuer=%s, scopes=%s, audience=%s)",
-            config.issuer_url,
-            config.scopes,
-            config.audience,
-        )
-
     async def dispatch(self, request: Request, call_next):
         """Validate OAuth2 Bearer token for all requests except agent card discovery.
 
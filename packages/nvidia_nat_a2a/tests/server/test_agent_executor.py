@@ -0,0 +1,198 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for streaming and task lifecycle of the A2A agent executor.
+
+The executor is driven through the A2A SDK's DefaultRequestHandler, the same way the A2A server invokes it.
+"""
+
+import asyncio
+import time
+import uuid
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.server.tasks import InMemoryTaskStore
+from a2a.types import Message
+from a2a.types import MessageSendParams
+from a2a.types import Part
+from a2a.types import Role
+from a2a.types import Task
+from a2a.types import TaskArtifactUpdateEvent
+from a2a.types import TaskIdParams
+from a2a.types import TaskState
+from a2a.types import TaskStatusUpdateEvent
+from a2a.types import TextPart
+
+from nat.builder.context import Context
+from nat.data_models.intermediate_step import IntermediateStepPayload
+from nat.data_models.intermediate_step import IntermediateStepType
+from nat.plugins.a2a.server.agent_executor_adapter import NATWorkflowAgentExecutor
+
+
+class _FakeRunner:
+
+    def __init__(self, chunks: list[str], delay: float, error: Exception | None):
+        self._chunks = chunks
+        self._delay = delay
+        self._error = error
+
+    async def result_stream(self, to_type: type | None = None):
+        Context.get().intermediate_step_manager.push_intermediate_step(
+            IntermediateStepPayload(UUID=str(uuid.uuid4()),
+                                    event_type=IntermediateStepType.TOOL_START,
+                                    name="calculator"))
+        for chunk in self._chunks:
+            await asyncio.sleep(self._delay)
+            yield chunk
+        if self._error is not None:
+            raise self._error
+
+
+class _FakeSessionManager:
+    """Session manager running a fake workflow which streams `chunks`, one every `delay` seconds."""
+
+    def __init__(self, chunks: list[str], delay: float = 0.0, error: Exception | None = None):
+        self.workflow = MagicMock()
+        self._runner = _FakeRunner(chunks, delay, error)
+        self.cancelled = asyncio.Event()
+
+    @asynccontextmanager
+    async def session(self):
+
+        @asynccontextmanager
+        async def run(_query: str):
+            try:
+                yield self._runner
+            except asyncio.CancelledError:
+                self.cancelled.set()
+                raise
+
+        yield SimpleNamespace(workflow=SimpleNamespace(has_streaming_output=True), run=run)
+
+
+def _handler(session_manager: _FakeSessionManager, **kwargs) -> DefaultRequestHandler:
+    return DefaultRequestHandler(agent_executor=NATWorkflowAgentExecutor(session_manager, **kwargs),
+                                 task_store=InMemoryTaskStore())
+
+
+def _params(text: str = "What is 2 + 2?") -> MessageSendParams:
+    return MessageSendParams(
+        message=Message(role=Role.user, parts=[Part(root=TextPart(text=text))], message_id=str(uuid.uuid4())))
+
+
+def _artifact_text(task: Task) -> str:
+    return "".join(part.root.text for artifact in task.artifacts or [] for part in artifact.parts)
+
+
+async def test_streams_output_before_workflow_completes():
+    chunks = ["The ", "answer ", "is ", "4"]
+    delay = 0.1
+    handler = _handler(_FakeSessionManager(chunks, delay=delay))
+
+    start = time.monotonic()
+    time_to_first_chunk = None
+    events = []
+    # The task manager updates the task and artifacts in place, record them when they are received
+    states = []
+    text = ""
+    async for event in handler.on_message_send_stream(_params()):
+        events.append(event)
+        if isinstance(event, Task | TaskStatusUpdateEvent):
+            states.append(event.status.state)
+        if isinstance(event, TaskArtifactUpdateEvent):
+            text += "".join(part.root.text for part in event.artifact.parts)
+            if time_to_first_chunk is None:
+                time_to_first_chunk = time.monotonic() - start
+    total_time = time.monotonic() - start
+
+    assert isinstance(events[0], Task)
+    assert states[:2] == [TaskState.submitted, TaskState.working]
+    assert states[-1] == TaskState.completed
+
+    # The first chunk arrives as soon as the workflow produces it, not when the workflow completes
+    assert time_to_first_chunk is not None
+    assert time_to_first_chunk < total_time - (len(chunks) - 2) * delay
+
+    assert text == "".join(chunks)
+
+    progress = [
+        event.status.message.parts[0].root.text for event in events
+        if isinstance(event, TaskStatusUpdateEvent) and event.status.message is not None
+    ]
+    assert progress == ["Calling tool calculator"]
+
+
+async def test_non_streaming_request_returns_completed_task():
+    handler = _handler(_FakeSessionManager(["The ", "answer ", "is ", "4"]), stream_progress_updates=False)
+
+    task = await handler.on_message_send(_params())
+
+    assert isinstance(task, Task)
+    assert task.status.state == TaskState.completed
+    assert _artifact_text(task) == "The answer is 4"
+
+
+async def test_workflow_error_fails_task():
+    handler = _handler(_FakeSessionManager(["partial"], error=RuntimeError("LLM unavailable")))
+
+    task = await handler.on_message_send(_params())
+
+    assert task.status.state == TaskState.failed
+    assert "LLM unavailable" in task.status.message.parts[0].root.text
+
+
+async def test_cancel_stops_workflow():
+    session_manager = _FakeSessionManager(["chunk"] * 100, delay=0.1)
+    handler = _handler(session_manager)
+
+    stream = handler.on_message_send_stream(_params())
+    task = await anext(stream)
+    # Wait for the workflow to produce output
+    async for event in stream:
+        if isinstance(event, TaskArtifactUpdateEvent):
+            break
+
+    start = time.monotonic()
+    cancelled_task = await handler.on_cancel_task(TaskIdParams(id=task.id))
+    cancel_latency = time.monotonic() - start
+    await stream.aclose()
+
+    assert cancelled_task.status.state == TaskState.canceled
+    assert session_manager.cancelled.is_set()
+    assert cancel_latency < 0.5
+    assert handler.agent_executor.num_in_flight_tasks == 0
+
+
+async def test_cancel_unknown_task_not_cancelable():
+    handler = _handler(_FakeSessionManager(["The answer is 4"]))
+    task = await handler.on_message_send(_params())
+
+    with pytest.raises(Exception):
+        await handler.on_cancel_task(TaskIdParams(id=task.id))
+
+
+async def test_tasks_beyond_limit_rejected():
+    handler = _handler(_FakeSessionManager(["chunk"] * 100, delay=0.1), max_in_flight_tasks=1)
+
+    stream = handler.on_message_send_stream(_params())
+    first_task = await anext(stream)
+    rejected = await handler.on_message_send(_params())
+
+    assert rejected.status.state == TaskState.rejected
+    await handler.on_cancel_task(TaskIdParams(id=first_task.id))
+    await stream.aclose()
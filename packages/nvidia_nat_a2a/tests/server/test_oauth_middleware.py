@@ -507,3 +507,25 @@ class TestConfigurationVariations:
         response = client.post("/", json={"task": "test"}, headers={"Authorization": f"Bearer {token}"})
 
         assert response.status_code == 200
+
+    async def test_middleware_uses_provided_validator(self, oauth_config, rsa_private_pem):
+        """A validator created by the owner is used as is, so the owner can close it on shutdown."""
+        validator = OAuth2ValidationMiddleware.create_validator(oauth_config)
+
+        async def protected(request: Request):
+            return JSONResponse({"message": "success"})
+
+        app = Starlette(routes=[Route("/", protected, methods=["POST"])])
+        app.add_middleware(OAuth2ValidationMiddleware, config=oauth_config, validator=validator)
+
+        token = make_jwt(rsa_private_pem, scopes=REQUIRED_SCOPES)
+        with patch.object(validator, "verify") as mock_verify:
+            mock_verify.return_value = TokenValidationResult(active=True,
+                                                             subject="test-user",
+                                                             client_id="test-client",
+                                                             scopes=REQUIRED_SCOPES,
+                                                             token_type="Bearer")
+            response = TestClient(app).post("/", json={"task": "test"}, headers={"Authorization": f"Bearer {token}"})
+
+        assert response.status_code == 200
+        mock_verify.assert_awaited_once_with(token)
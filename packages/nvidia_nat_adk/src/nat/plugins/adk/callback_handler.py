@@ -13,7 +13,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
 import logging
 import threading
 import time
@@ -28,7 +27,9 @@ from nat.data_models.intermediate_step import StreamEventData
 from nat.data_models.intermediate_step import TraceMetadata
 from nat.data_models.intermediate_step import UsageInfo
 from nat.data_models.profiler_callback import BaseProfilerCallback
+from nat.data_models.profiler_callback import PayloadCaptureConfig
 from nat.data_models.token_usage import TokenUsageBaseModel
+from nat.profiler.callbacks.payload_capture import PayloadCapture
 
 logger = logging.getLogger(__name__)
 
@@ -45,16 +46,17 @@ class ADKProfilerHandler(BaseProfilerCallback):
 
     _instance: "ADKProfilerHandler | None" = None
 
-    def __new__(cls):
+    def __new__(cls, *args, **kwargs):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
 
         return cls._instance
 
-    def __init__(self):
+    def __init__(self, payload_capture: PayloadCaptureConfig | None = None):
         self._lock = threading.Lock()
         self.last_call_ts = 0.0
         self.step_manager = Context.get().intermediate_step_manager
+        self._payload_capture = PayloadCapture(payload_capture)
 
         # Original references to Google ADK Tool and LLM methods (for uninstrumenting if needed)
         self._original_tool_call = None
@@ -261,8 +263,9 @@ class ADKProfilerHandler(BaseProfilerCallback):
                 event_type=IntermediateStepType.LLM_START,
                 framework=LLMFrameworkEnum.ADK,
                 name=model_name,
-                data=StreamEventData(input=model_input, payload=kwargs.get("messages", [])),
-                metadata=TraceMetadata(chat_inputs=copy.deepcopy(kwargs.get("messages", []))),
+                data=StreamEventData(input=self._payload_capture.capture(model_input),
+                                     payload=kwargs.get("messages", [])),
+                metadata=TraceMetadata(chat_inputs=self._payload_capture.capture(kwargs.get("messages", []))),
                 usage_info=UsageInfo(
                     token_usage=TokenUsageBaseModel(),
                     num_llm_calls=1,
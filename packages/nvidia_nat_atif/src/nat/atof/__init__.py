@@ -48,6 +48,7 @@ from nat.atof.extractors import register_llm_extractor
 from nat.atof.extractors import register_mark_extractor
 from nat.atof.extractors import register_tool_extractor
 from nat.atof.flags import Flags
+from nat.atof.io import iter_jsonl
 from nat.atof.io import read_jsonl
 from nat.atof.io import write_jsonl
 from nat.atof.schemas import ANTHROPIC_MESSAGES_V1
@@ -76,6 +77,7 @@ __all__ = [
     "SchemaMapLlmExtractor",
     "ScopeEvent",
     "ToolPayloadExtractor",
+    "iter_jsonl",
     "lookup_schema",
     "read_jsonl",
     "register_anthropic_messages_v1",
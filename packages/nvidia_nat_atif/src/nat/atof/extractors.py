@@ -71,12 +71,15 @@ hook fields on SchemaMap to handle the irreducible transforms.
 
 from __future__ import annotations
 
+import functools
 import json
 from collections.abc import Callable
+from collections.abc import Iterable
 from collections.abc import Mapping
 from dataclasses import dataclass
 from dataclasses import field
 from typing import Any
+from typing import Literal
 from typing import Protocol
 from typing import runtime_checkable
 
@@ -150,13 +153,96 @@ class MarkPayloadExtractor(Protocol):
 # Schema-map engine: declarative path resolver + optional hooks
 # ---------------------------------------------------------------------------
 
+# A compiled path is a tuple of ``(key, index)`` accessors, one per dotted
+# segment. ``key`` is used when the current node is a dict; ``index`` (the
+# segment parsed as an int, or ``None`` when it isn't digit-only) is used
+# when the current node is a list.
+_PathPlan = tuple[tuple[str, int | None], ...]
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_path(path: str) -> _PathPlan:
+    """Split a dotted path once into a tuple of ``(key, index)`` accessors."""
+    if not path:
+        return ()
+    return tuple((part, int(part) if part.isdigit() else None) for part in path.split("."))
+
+
+def _compile_paths(paths: tuple[str, ...]) -> tuple[_PathPlan, ...]:
+    return tuple(_compile_path(p) for p in paths)
+
+
+def _resolve_plan(data: Any, plan: _PathPlan) -> Any:
+    """Walk a compiled path through nested dicts/lists. Returns ``None`` on miss."""
+    current: Any = data
+    for key, index in plan:
+        if isinstance(current, dict):
+            # A missing key and an explicit ``None`` both end the walk with ``None``.
+            current = current.get(key)
+        elif isinstance(current, list):
+            if index is None or index >= len(current):
+                return None
+            current = current[index]
+        else:
+            return None
+    return current
+
+
+def _resolve_first_plan(data: Any, plans: tuple[_PathPlan, ...]) -> Any:
+    """Try each compiled path in order; return the first non-``None`` value, else ``None``."""
+    for plan in plans:
+        value = _resolve_plan(data, plan)
+        if value is not None:
+            return value
+    return None
+
+
+class _CompiledPaths:
+    """Candidate paths for one field, compiled once, with a memo of which
+    alternative matched last.
+
+    Payloads from one producer almost always share a shape, so the
+    alternative that matched the previous payload is tried first. Its hit is
+    only trusted when every higher-priority alternative is guaranteed to
+    miss because its first key is absent from ``data``; otherwise the
+    alternatives are tried in declared order. Results are therefore always
+    identical to :func:`_resolve_first_plan`.
+    """
+
+    __slots__ = ("plans", "_first_keys", "_last_hit")
+
+    def __init__(self, paths: tuple[str, ...]) -> None:
+        self.plans = _compile_paths(paths)
+        self._first_keys = tuple(plan[0][0] if plan else None for plan in self.plans)
+        self._last_hit = 0
+
+    def resolve(self, data: Any) -> Any:
+        last_hit = self._last_hit
+        if last_hit and isinstance(data, dict):
+            for i in range(last_hit):
+                key = self._first_keys[i]
+                if key is None or key in data:
+                    break
+            else:
+                value = _resolve_plan(data, self.plans[last_hit])
+                if value is not None:
+                    return value
+        for i, plan in enumerate(self.plans):
+            value = _resolve_plan(data, plan)
+            if value is not None:
+                self._last_hit = i
+                return value
+        return None
+
 
 def _resolve_path(data: Any, path: str) -> Any:
     """Walk a dotted path through nested dicts/lists. Returns ``None`` on miss.
 
     Path components are segmented on ``"."``. A digit-only segment indexes
     into a list at that position; any other segment is a dict key. Returns
-    the value at the final position, or ``None`` if any step fails.
+    the value at the final position, or ``None`` if any step fails. The
+    segmented form of each distinct path is cached, so repeated lookups do
+    not re-split the string.
 
     Examples::
 
@@ -165,35 +251,12 @@ def _resolve_path(data: Any, path: str) -> Any:
         _resolve_path({"a": 1}, "a.b")                      # -> None
         _resolve_path({}, "x")                              # -> None
     """
-    if not path:
-        return data
-    current: Any = data
-    for part in path.split("."):
-        if current is None:
-            return None
-        if isinstance(current, dict):
-            if part not in current:
-                return None
-            current = current[part]
-        elif isinstance(current, list):
-            if not part.isdigit():
-                return None
-            idx = int(part)
-            if idx >= len(current):
-                return None
-            current = current[idx]
-        else:
-            return None
-    return current
+    return _resolve_plan(data, _compile_path(path))
 
 
 def _resolve_first(data: Any, paths: tuple[str, ...]) -> Any:
     """Try each path in order; return the first non-``None`` value, else ``None``."""
-    for p in paths:
-        value = _resolve_path(data, p)
-        if value is not None:
-            return value
-    return None
+    return _resolve_first_plan(data, _compile_paths(paths))
 
 
 @dataclass(frozen=True)
@@ -279,10 +342,21 @@ class SchemaMapLlmExtractor:
     the map's hooks (when set) or its declarative field paths (otherwise).
     A single instance per ``(name, version)`` is the intended pattern;
     register it with :func:`register_llm_extractor`.
+
+    The map's dotted paths are compiled into accessor tuples once, at
+    construction, so per-event extraction never re-splits path strings,
+    and each field remembers which alternative path matched last.
+    Use :meth:`extract_many` to extract a batch of payloads in one call.
     """
 
     def __init__(self, schema_map: SchemaMap) -> None:
         self.schema_map = schema_map
+        self._input_messages_paths = _CompiledPaths(schema_map.input_messages_paths)
+        self._output_text_paths = _CompiledPaths(schema_map.output_text_paths)
+        self._output_tool_calls_paths = _CompiledPaths(schema_map.output_tool_calls_paths)
+        self._tool_call_id_paths = _CompiledPaths(schema_map.tool_call_id_paths)
+        self._tool_call_name_paths = _CompiledPaths(schema_map.tool_call_name_paths)
+        self._tool_call_args_paths = _CompiledPaths(schema_map.tool_call_args_paths)
 
     def extract_input_messages(self, data: Any) -> list[dict[str, Any]]:
         if not isinstance(data, dict) or not data:
@@ -291,7 +365,7 @@ class SchemaMapLlmExtractor:
         if self.schema_map.normalize_input_messages is not None:
             return self.schema_map.normalize_input_messages(data)
 
-        raw = _resolve_first(data, self.schema_map.input_messages_paths)
+        raw = self._input_messages_paths.resolve(data)
         if not isinstance(raw, list):
             return []
         return self._apply_role_aliases(raw)
@@ -304,7 +378,7 @@ class SchemaMapLlmExtractor:
             text, _ = self.schema_map.normalize_output_message(data)
             return text
 
-        value = _resolve_first(data, self.schema_map.output_text_paths)
+        value = self._output_text_paths.resolve(data)
         if isinstance(value, str):
             return value
         return ""
@@ -317,7 +391,7 @@ class SchemaMapLlmExtractor:
             _, tool_calls = self.schema_map.normalize_output_message(data)
             return tool_calls
 
-        raw_calls = _resolve_first(data, self.schema_map.output_tool_calls_paths)
+        raw_calls = self._output_tool_calls_paths.resolve(data)
         if not isinstance(raw_calls, list):
             return []
 
@@ -331,6 +405,35 @@ class SchemaMapLlmExtractor:
                 result.append(self._extract_tool_call_fields(raw))
         return result
 
+    def extract_output(self, data: Any) -> tuple[str, list[dict[str, Any]]]:
+        """Return ``(output_text, tool_calls)`` for an LLM scope-end payload.
+
+        Equivalent to calling :meth:`extract_output_text` and
+        :meth:`extract_tool_calls`, but runs a ``normalize_output_message``
+        hook only once.
+        """
+        if self.schema_map.normalize_output_message is not None and isinstance(data, dict):
+            text, tool_calls = self.schema_map.normalize_output_message(data)
+            return text, (tool_calls if data else [])
+        return self.extract_output_text(data), self.extract_tool_calls(data)
+
+    def extract_many(self, payloads: Iterable[Any], kind: Literal["llm_input", "llm_output"]) -> list[Any]:
+        """Extract a batch of payloads of the same ``kind``.
+
+        ``kind`` follows :class:`ShapeMismatchError` naming:
+
+        - ``"llm_input"`` — scope-start payloads; returns one message list
+          per payload (see :meth:`extract_input_messages`).
+        - ``"llm_output"`` — scope-end payloads; returns one
+          ``(output_text, tool_calls)`` pair per payload (see
+          :meth:`extract_output`).
+        """
+        if kind == "llm_input":
+            return [self.extract_input_messages(data) for data in payloads]
+        if kind == "llm_output":
+            return [self.extract_output(data) for data in payloads]
+        raise ValueError(f"kind must be 'llm_input' or 'llm_output', got {kind!r}")
+
     def _apply_role_aliases(self, messages: list[Any]) -> list[dict[str, Any]]:
         aliases = self.schema_map.role_aliases
         if not aliases:
@@ -346,9 +449,9 @@ class SchemaMapLlmExtractor:
         return out
 
     def _extract_tool_call_fields(self, raw: dict[str, Any]) -> dict[str, Any]:
-        tool_id = _resolve_first(raw, self.schema_map.tool_call_id_paths)
-        name = _resolve_first(raw, self.schema_map.tool_call_name_paths) or ""
-        args: Any = _resolve_first(raw, self.schema_map.tool_call_args_paths)
+        tool_id = self._tool_call_id_paths.resolve(raw)
+        name = self._tool_call_name_paths.resolve(raw) or ""
+        args: Any = self._tool_call_args_paths.resolve(raw)
         if args is None:
             args = {}
 
@@ -19,7 +19,11 @@ Read and write ATOF event streams as JSON-Lines files (one JSON object per line)
 
 from __future__ import annotations
 
+import heapq
 import json
+import pickle
+import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 
 from pydantic import TypeAdapter
@@ -84,6 +88,89 @@ def _reorder_for_wire(event_dict: dict) -> dict:
     return ordered
 
 
+def _iter_validated(path: Path) -> Iterator[Event]:
+    """Yield typed events from an ATOF JSON-Lines file in file order."""
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            yield _event_adapter.validate_python(json.loads(line))
+
+
+def _spill_sorted_run(run: list[tuple[int, int, Event]], spill_dir: Path, index: int) -> Path:
+    """Sort one in-memory run by ``(ts_micros, seq)`` and pickle it to disk."""
+    run.sort(key=lambda entry: (entry[0], entry[1]))
+    run_path = spill_dir / f"run-{index:06d}.pkl"
+    with run_path.open("wb") as f:
+        for entry in run:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return run_path
+
+
+def _iter_spilled_run(run_path: Path) -> Iterator[tuple[int, int, Event]]:
+    """Stream back the entries pickled by :func:`_spill_sorted_run`."""
+    with run_path.open("rb") as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+
+def iter_jsonl(path: str | Path, *, sort: bool = False, max_events_in_memory: int | None = None) -> Iterator[Event]:
+    """Lazily read an ATOF JSON-Lines file, yielding typed Event objects.
+
+    Each line is parsed and validated against the Event discriminated union
+    only when the consumer asks for the next event, so with ``sort=False``
+    memory use is independent of the file size. Blank lines are skipped.
+
+    With ``sort=True`` events are yielded in ``.ts_micros`` order (ties keep
+    file order, matching :func:`read_jsonl`). When ``max_events_in_memory``
+    is set, the sort is an external merge sort: sorted runs of at most that
+    many events are spilled to a temporary directory and k-way merged, so
+    peak memory is bounded by the run size rather than the trace size.
+    """
+    path = Path(path)
+    if not sort:
+        yield from _iter_validated(path)
+        return
+
+    if max_events_in_memory is None:
+        events = list(_iter_validated(path))
+        events.sort(key=lambda e: e.ts_micros)
+        yield from events
+        return
+
+    if max_events_in_memory < 1:
+        raise ValueError(f"max_events_in_memory must be >= 1, got {max_events_in_memory}")
+
+    with tempfile.TemporaryDirectory(prefix="atof-sort-") as tmp_dir:
+        spill_dir = Path(tmp_dir)
+        run_paths: list[Path] = []
+        run: list[tuple[int, int, Event]] = []
+        for seq, event in enumerate(_iter_validated(path)):
+            run.append((event.ts_micros, seq, event))
+            if len(run) >= max_events_in_memory:
+                run_paths.append(_spill_sorted_run(run, spill_dir, len(run_paths)))
+                run = []
+
+        if not run_paths:
+            # Everything fit in a single run: no need to touch the disk.
+            run.sort(key=lambda entry: (entry[0], entry[1]))
+            for _, _, event in run:
+                yield event
+            return
+
+        if run:
+            run_paths.append(_spill_sorted_run(run, spill_dir, len(run_paths)))
+            run = []
+
+        merged = heapq.merge(*(_iter_spilled_run(p) for p in run_paths), key=lambda entry: (entry[0], entry[1]))
+        for _, _, event in merged:
+            yield event
+
+
 def read_jsonl(path: str | Path) -> list[Event]:
     """Read an ATOF JSON-Lines file and return a list of typed Event objects.
 
@@ -91,19 +178,9 @@ def read_jsonl(path: str | Path) -> list[Event]:
     discriminated union. Blank lines are skipped. Events are returned sorted
     by ``.ts_micros`` (the normalized int-microsecond timestamp, spec §5.1)
     so downstream consumers get a stable ordering across mixed str/int
-    timestamp streams.
+    timestamp streams. Use :func:`iter_jsonl` to stream large files.
     """
-    path = Path(path)
-    events: list[Event] = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            raw = json.loads(line)
-            events.append(_event_adapter.validate_python(raw))
-    events.sort(key=lambda e: e.ts_micros)
-    return events
+    return list(iter_jsonl(path, sort=True))
 
 
 def write_jsonl(events: list[Event], path: str | Path) -> None:
@@ -43,6 +43,8 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Iterable
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -312,22 +314,65 @@ def _find_subagent_roots(events: list[Event], category_map: dict[str, str]) -> l
     return roots
 
 
-def _collect_descendants(root_uuid: str, events: list[Event], parent_map: dict[str, str | None]) -> list[Event]:
-    """Events whose ancestry chain reaches root_uuid (inclusive of events with uuid == root_uuid).
+def _build_children_index(parent_map: dict[str, str | None]) -> dict[str, list[str]]:
+    """parent_uuid → child UUIDs, built once from the parent map."""
+    children: dict[str, list[str]] = {}
+    for uuid, parent_uuid in parent_map.items():
+        if parent_uuid is not None:
+            children.setdefault(parent_uuid, []).append(uuid)
+    return children
 
-    ``events`` preserves the caller's order; the returned list preserves it too.
+
+def _assign_subagent_owners(root_uuids: list[str], children_index: dict[str, list[str]]) -> dict[str, str]:
+    """UUID → UUID of the outermost subagent root whose subtree contains it.
+
+    ``root_uuids`` must be in event-time order so an outer subagent is always
+    claimed before any subagent nested inside it; nested roots then resolve
+    to their outer root and are converted by the outer root's recursion.
+    Each UUID is visited at most once, making this linear in the number of
+    scopes. Depth is capped to guard against ``parent_uuid`` cycles.
     """
-    result: list[Event] = []
-    for e in events:
-        u = e.uuid
+    owners: dict[str, str] = {}
+    for root_uuid in root_uuids:
+        if root_uuid in owners:
+            continue
+        owners[root_uuid] = root_uuid
+        frontier = [root_uuid]
         depth = 0
-        while u is not None and depth < 64:  # guard against cycles
-            if u == root_uuid:
-                result.append(e)
-                break
-            u = parent_map.get(u)
+        while frontier and depth < 63:
+            next_frontier: list[str] = []
+            for uuid in frontier:
+                for child in children_index.get(uuid, ()):
+                    if child not in owners:
+                        owners[child] = root_uuid
+                        next_frontier.append(child)
+            frontier = next_frontier
             depth += 1
-    return result
+    return owners
+
+
+def _partition_subagent_events(
+    events: list[Event],
+    roots: list[ScopeEvent],
+    parent_map: dict[str, str | None],
+) -> tuple[dict[str, list[Event]], list[Event]]:
+    """Split ``events`` into per-subagent sub-streams and the main stream.
+
+    Returns ``(events_by_root_uuid, main_events)``. Only outermost subagent
+    roots get a sub-stream; ``events_by_root_uuid`` is ordered by first root
+    appearance and every list preserves the caller's event order. Runs in a
+    single pass over ``events`` after a one-time children index build.
+    """
+    owners = _assign_subagent_owners([root.uuid for root in roots], _build_children_index(parent_map))
+    events_by_root_uuid: dict[str, list[Event]] = {root.uuid: [] for root in roots if owners[root.uuid] == root.uuid}
+    main_events: list[Event] = []
+    for e in events:
+        owner = owners.get(e.uuid)
+        if owner is None:
+            main_events.append(e)
+        else:
+            events_by_root_uuid[owner].append(e)
+    return events_by_root_uuid, main_events
 
 
 # ---------------------------------------------------------------------------
@@ -335,12 +380,18 @@ def _collect_descendants(root_uuid: str, events: list[Event], parent_map: dict[s
 # ---------------------------------------------------------------------------
 
 
-def _events_to_step_dicts(
+def _iter_step_dicts(
     events: list[Event],
     subagent_ref_by_tc_id: dict[str, dict] | None = None,
     subagent_ref_by_context_uuid: dict[str, dict] | None = None,
-) -> list[dict]:
-    """Convert typed ATOF events to ATIF v1.7 step dicts.
+) -> Iterator[dict]:
+    """Convert typed ATOF events to ATIF v1.7 step dicts, yielding each step
+    as soon as it is final.
+
+    A step is final once no later event can modify it: every step except the
+    current agent step (which may still receive observations, R4) is yielded
+    in ``step_id`` order as the main loop advances, so only the open agent
+    step and the steps emitted after it are held in memory.
 
     ``subagent_ref_by_tc_id`` maps a ``tool_call_id`` to a
     ``SubagentTrajectoryRef``-shaped dict (R7 tool-wraps-agent).
@@ -379,7 +430,10 @@ def _events_to_step_dicts(
                     tool_start_args_by_tc_id[tc_id] = event.data if isinstance(event.data, dict) else {}
 
     # Streaming state
-    step_dicts: list[dict] = []
+    # Steps not yet yielded, keyed by zero-based index (step_id - 1).
+    pending_steps: dict[int, dict] = {}
+    num_steps = 0
+    next_step_to_yield = 0
     pending_observations: list[dict] = []
     pending_obs_timestamp: str | int | None = None
     pending_tool_ancestry_by_id: dict[str, dict] = {}
@@ -391,6 +445,21 @@ def _events_to_step_dicts(
     # new step, which naturally models multi-turn conversations.
     seen_input_messages: dict[tuple[str | None, str], set[str]] = {}
 
+    def append_step(step_dict: dict) -> int:
+        """Assign the next ``step_id`` and buffer the step until it is final."""
+        nonlocal num_steps
+        step_dict["step_id"] = num_steps + 1
+        pending_steps[num_steps] = step_dict
+        num_steps += 1
+        return num_steps - 1
+
+    def drain_final_steps() -> Iterator[dict]:
+        """Yield buffered steps, in order, up to the still-open agent step."""
+        nonlocal next_step_to_yield
+        while next_step_to_yield < num_steps and next_step_to_yield != current_agent_step_idx:
+            yield pending_steps.pop(next_step_to_yield)
+            next_step_to_yield += 1
+
     def flush_observations() -> None:
         """Attach buffered observations to the preceding agent step (R4 drain).
 
@@ -417,7 +486,7 @@ def _events_to_step_dicts(
             return results
 
         if current_agent_step_idx is not None:
-            agent_step = step_dicts[current_agent_step_idx]
+            agent_step = pending_steps[current_agent_step_idx]
 
             if pending_observations:
                 agent_step["observation"] = {"results": _build_results(pending_observations)}
@@ -439,7 +508,7 @@ def _events_to_step_dicts(
                         tc_extra["invocation"] = inv
                     tc["extra"] = tc_extra
         elif pending_observations:
-            step_dicts.append({
+            append_step({
                 "source": "system",
                 "message": "",
                 "timestamp": pending_obs_timestamp,
@@ -455,6 +524,8 @@ def _events_to_step_dicts(
 
     # Main event loop
     for event in sorted_events:
+        yield from drain_final_steps()
+
         if _is_scope_start(event) and event.category == "llm":
             flush_observations()
 
@@ -494,7 +565,7 @@ def _events_to_step_dicts(
                 key = (event.parent_uuid, role)
                 seen = seen_input_messages.setdefault(key, set())
                 if dedup_key not in seen:
-                    step_dicts.append({
+                    append_step({
                         "source": role,
                         "message": emit_content,
                         "timestamp": event.timestamp,
@@ -524,7 +595,7 @@ def _events_to_step_dicts(
                 }
                 if event.data_schema:
                     user_extra["data_schema"] = event.data_schema
-                step_dicts.append({
+                append_step({
                     "source": "user",
                     "message": message,
                     "timestamp": event.timestamp,
@@ -589,8 +660,7 @@ def _events_to_step_dicts(
             if tool_call_dicts:
                 step_dict["tool_calls"] = tool_call_dicts
 
-            step_dicts.append(step_dict)
-            current_agent_step_idx = len(step_dicts) - 1
+            current_agent_step_idx = append_step(step_dict)
 
         elif _is_scope_end(event) and event.category == "tool":
             tool_call_id = (event.category_profile or {}).get("tool_call_id")
@@ -634,9 +704,9 @@ def _events_to_step_dicts(
                 # re-emit it (same dedup path as R2/R3).
                 if source in ("user", "system") and isinstance(content, str):
                     seen_input_messages.setdefault((event.parent_uuid, source), set()).add(content)
-                step_dicts.append(step_dict)
+                append_step(step_dict)
             else:
-                step_dicts.append({
+                append_step({
                     "source": "system",
                     "message": json.dumps(data, separators=(",", ":")) if isinstance(data, dict) else str(data),
                     "timestamp": event.timestamp,
@@ -687,7 +757,7 @@ def _events_to_step_dicts(
                     entry["subagent_trajectory_ref"] = [subagent_ref]
                 step_dict["observation"] = {"results": [entry]}
 
-            step_dicts.append(step_dict)
+            append_step(step_dict)
 
             # R10 boundary-replace dedup: for boundary="replace", the compaction
             # summary REPLACES prior context — producers will typically include
@@ -733,8 +803,7 @@ def _events_to_step_dicts(
                 "tool_calls": synthetic_tcs,
                 "extra": r13_extra,
             }
-            step_dicts.append(step_dict)
-            current_agent_step_idx = len(step_dicts) - 1
+            current_agent_step_idx = append_step(step_dict)
             # flush_observations will now drain pending obs + tool_ancestry
             # into this newly-emitted orchestrator step.
             flush_observations()
@@ -781,7 +850,7 @@ def _events_to_step_dicts(
             }
             if event.data_schema:
                 r8_extra["data_schema"] = event.data_schema
-            step_dicts.append({
+            append_step({
                 "source": source,
                 "message": message,
                 "timestamp": event.timestamp,
@@ -798,14 +867,11 @@ def _events_to_step_dicts(
             )
 
     flush_observations()
+    current_agent_step_idx = None
+    yield from drain_final_steps()
 
-    for i, step in enumerate(step_dicts):
-        step["step_id"] = i + 1
 
-    return step_dicts
-
-
-def _materialize_steps(step_dicts: list[dict]) -> list[Step]:
+def _materialize_steps(step_dicts: Iterable[dict]) -> list[Step]:
     """Build validated Step instances from raw step dicts.
 
     ATIF v1.7: ancestry is no longer a typed top-level field — it's
@@ -860,25 +926,23 @@ def _convert_impl(events: list[Event], explicit_root_uuid: str | None) -> Trajec
     # R7: detect subagent roots and partition out their sub-streams
     subagent_roots = _find_subagent_roots(events, category_map)
 
-    excluded_ids: set[int] = set()
+    # When subagents nest (an agent inside a tool inside another subagent),
+    # _find_subagent_roots returns both the outer and inner agent. Only the
+    # outer root gets a sub-stream here; its recursive _convert_impl attaches
+    # the inner agent as a nested subagent_trajectory.
+    events_by_root_uuid, main_events = _partition_subagent_events(events, subagent_roots, parent_map)
+    roots_by_uuid = {root.uuid: root for root in reversed(subagent_roots)}
+    scope_starts_by_uuid: dict[str, ScopeEvent] = {}
+    for e in events:
+        if _is_scope_start(e) and isinstance(e, ScopeEvent) and e.uuid not in scope_starts_by_uuid:
+            scope_starts_by_uuid[e.uuid] = e
+
     subagent_trajectories: list[Trajectory] = []
     subagent_ref_by_tc_id: dict[str, dict] = {}
     subagent_ref_by_context_uuid: dict[str, dict] = {}
 
-    for root in subagent_roots:
-        # When subagents nest (an agent inside a tool inside another subagent),
-        # _find_subagent_roots returns both the outer and inner agent. The
-        # outer iteration's recursive _convert_impl already attaches the inner
-        # agent as a nested subagent_trajectory; processing the inner root
-        # again here would double-emit it (top-level sibling AND nested) and
-        # spend wasted work. Iteration is in event-time order so the outer
-        # root is always seen first, making this skip safe.
-        if id(root) in excluded_ids:
-            continue
-        descendants = _collect_descendants(root.uuid, events, parent_map)
-        for e in descendants:
-            excluded_ids.add(id(e))
-
+    for root_uuid, descendants in events_by_root_uuid.items():
+        root = roots_by_uuid[root_uuid]
         child_trajectory = _convert_impl(descendants, explicit_root_uuid=root.uuid)
         subagent_trajectories.append(child_trajectory)
 
@@ -889,13 +953,11 @@ def _convert_impl(events: list[Event], explicit_root_uuid: str | None) -> Trajec
         wrapping_uuid = root.parent_uuid
         wrapping_category = None
         wrapping_tc_id = None
-        if wrapping_uuid is not None:
-            for e in events:
-                if _is_scope_start(e) and isinstance(e, ScopeEvent) and e.uuid == wrapping_uuid:
-                    wrapping_category = e.category
-                    if e.category == "tool":
-                        wrapping_tc_id = (e.category_profile or {}).get("tool_call_id")
-                    break
+        wrapping_start = scope_starts_by_uuid.get(wrapping_uuid) if wrapping_uuid is not None else None
+        if wrapping_start is not None:
+            wrapping_category = wrapping_start.category
+            if wrapping_start.category == "tool":
+                wrapping_tc_id = (wrapping_start.category_profile or {}).get("tool_call_id")
 
         # ATIF v1.7: refs resolve via `trajectory_id` (canonical). `session_id`
         # is recorded as informational only — consumers MUST NOT use it to
@@ -911,8 +973,6 @@ def _convert_impl(events: list[Event], explicit_root_uuid: str | None) -> Trajec
         elif wrapping_category == "context" and wrapping_uuid:
             subagent_ref_by_context_uuid[wrapping_uuid] = ref
 
-    main_events = [e for e in events if id(e) not in excluded_ids]
-
     # Trajectory metadata extraction
     agent_name: str | None = None
     agent_version: str = "1.0.0"
@@ -979,7 +1039,7 @@ def _convert_impl(events: list[Event], explicit_root_uuid: str | None) -> Trajec
                 break
             model_name = event.name
 
-    step_dicts = _events_to_step_dicts(
+    step_dicts = _iter_step_dicts(
         main_events,
         subagent_ref_by_tc_id=subagent_ref_by_tc_id,
         subagent_ref_by_context_uuid=subagent_ref_by_context_uuid,
@@ -43,7 +43,10 @@ from nat.atof.extractors import LlmPayloadExtractor
 from nat.atof.extractors import MarkPayloadExtractor
 from nat.atof.extractors import NatRoleMarkExtractor
 from nat.atof.extractors import OpenAiChatCompletionsLlmExtractor
+from nat.atof.extractors import SchemaMap
+from nat.atof.extractors import SchemaMapLlmExtractor
 from nat.atof.extractors import ToolPayloadExtractor
+from nat.atof.extractors import _resolve_path
 from nat.atof.extractors import register_llm_extractor
 from nat.atof.extractors import register_mark_extractor
 from nat.atof.extractors import register_tool_extractor
@@ -164,6 +167,87 @@ def test_openai_extract_tool_calls_handles_unparseable_string_arguments() -> Non
     ]
 
 
+# ---------------------------------------------------------------------------
+# Compiled paths and bulk extraction
+# ---------------------------------------------------------------------------
+
+
+# yapf: disable
+@pytest.mark.parametrize(
+    "data, path, expected",
+    [
+        ({"choices": [{"message": {"content": "hi"}}]}, "choices.0.message.content", "hi"),
+        ({"choices": []}, "choices.0.message.content", None),
+        ({"choices": [{}]}, "choices.-1", None),
+        ({"0": "dict-key"}, "0", "dict-key"),
+        ({"a": "leaf"}, "a.b", None),
+        ({"a": 1}, "", {"a": 1}),
+    ],
+)
+# yapf: enable
+def test_resolve_path_compiled_semantics(data: Any, path: str, expected: Any) -> None:
+    assert _resolve_path(data, path) == expected
+
+
+def test_schema_map_extractor_keeps_path_priority_across_shapes() -> None:
+    extractor = SchemaMapLlmExtractor(
+        SchemaMap(name="test/priority", version="1", output_text_paths=("content", "choices.0.message.content")))
+
+    # Prime the memo with the second alternative, then check the first still wins when present.
+    assert extractor.extract_output_text({"choices": [{"message": {"content": "nested"}}]}) == "nested"
+    assert extractor.extract_output_text({"content": "flat", "choices": [{"message": {"content": "nested"}}]}) == "flat"
+    assert extractor.extract_output_text({"content": None, "choices": [{"message": {"content": "nested"}}]}) == "nested"
+    assert extractor.extract_output_text({"other": 1}) == ""
+
+
+def test_extract_output_matches_separate_calls() -> None:
+    extractor = OpenAiChatCompletionsLlmExtractor()
+    payload = {
+        "choices": [{
+            "message": {
+                "content": "calling",
+                "tool_calls": [{
+                    "id": "c1", "function": {
+                        "name": "search", "arguments": "{\"q\": 1}"
+                    }
+                }],
+            }
+        }]
+    }
+
+    assert extractor.extract_output(payload) == (extractor.extract_output_text(payload),
+                                                 extractor.extract_tool_calls(payload))
+
+
+def test_extract_output_runs_normalize_hook_once() -> None:
+    calls = []
+
+    def normalize(data: dict[str, Any]) -> tuple[str, list[Any]]:
+        calls.append(data)
+        return "normalized", [{"id": "t1", "name": "tool", "arguments": {}}]
+
+    extractor = SchemaMapLlmExtractor(SchemaMap(name="test/hook", version="1", normalize_output_message=normalize))
+
+    text, tool_calls = extractor.extract_output({"content": []})
+    assert text == "normalized"
+    assert [tc["id"] for tc in tool_calls] == ["t1"]
+    assert len(calls) == 1
+
+
+def test_extract_many_matches_per_payload_extraction() -> None:
+    extractor = OpenAiChatCompletionsLlmExtractor()
+    inputs = [{"messages": [{"role": "user", "content": f"q{i}"}]} for i in range(3)]
+    outputs = [{"content": "direct"}, {"choices": [{"message": {"content": "nested"}}]}, None]
+
+    assert extractor.extract_many(inputs, "llm_input") == [extractor.extract_input_messages(d) for d in inputs]
+    assert extractor.extract_many(outputs, "llm_output") == [("direct", []), ("nested", []), ("", [])]
+
+
+def test_extract_many_rejects_unknown_kind() -> None:
+    with pytest.raises(ValueError, match="kind"):
+        OpenAiChatCompletionsLlmExtractor().extract_many([], "tool_output")  # type: ignore[arg-type]
+
+
 # ---------------------------------------------------------------------------
 # Generic tool extractor unit tests
 # ---------------------------------------------------------------------------
@@ -0,0 +1,252 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Streaming ATOF reader and large-trace ATOF → ATIF conversion tests.
+
+Covers :func:`nat.atof.iter_jsonl` (lazy reading and the external merge sort)
+and the single-pass subagent partitioning in the reference converter. The
+``benchmark`` test converts a synthetic 1M-event multi-agent trace and is
+skipped unless ``--run_slow`` is given:
+    uv run pytest packages/nvidia_nat_atif/tests/test_streaming_conversion.py --run_slow -s
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import random
+import time
+from datetime import UTC
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from nat.atof import ScopeEvent
+from nat.atof import iter_jsonl
+from nat.atof import read_jsonl
+from nat.atof import write_jsonl
+from nat.atof.scripts.atof_to_atif_converter import convert
+from nat.atof.scripts.atof_to_atif_converter import convert_file
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Synthetic trace helpers
+# ---------------------------------------------------------------------------
+
+
+def _write_synthetic_trace(path: Path, num_events: int, seed: int = 0) -> int:
+    """Write a synthetic multi-agent ATOF trace and return the event count.
+
+    The root agent loops over LLM call → tool call turns. Roughly one tool in
+    twenty delegates to a subagent (nested up to two levels deep), giving the
+    converter many subagent roots to partition.
+    """
+    rng = random.Random(seed)
+    ts = 1_767_225_600_000_000
+    next_uuid = 0
+    lines: list[str] = []
+
+    def scope(category: str,
+              scope_category: str,
+              uuid: str,
+              parent_uuid: str | None,
+              data: dict,
+              profile: dict | None = None) -> None:
+        nonlocal ts
+        ts += rng.randint(1, 5)
+        lines.append(
+            json.dumps({
+                "kind": "scope",
+                "scope_category": scope_category,
+                "category": category,
+                "category_profile": profile,
+                "uuid": uuid,
+                "parent_uuid": parent_uuid,
+                "data": data,
+                "timestamp": datetime.fromtimestamp(ts / 1_000_000, tz=UTC).isoformat().replace("+00:00", "Z"),
+                "name": f"{category}_{uuid}",
+                "attributes": [],
+            }))
+
+    def new_uuid() -> str:
+        nonlocal next_uuid
+        next_uuid += 1
+        return f"u{next_uuid}"
+
+    def agent_turns(agent_uuid: str, depth: int, budget: int) -> None:
+        start = len(lines)
+        turn = 0
+        while len(lines) - start < budget:
+            turn += 1
+            llm_uuid = new_uuid()
+            tool_call_id = f"call_{llm_uuid}"
+            scope("llm",
+                  "start",
+                  llm_uuid,
+                  agent_uuid, {"messages": [{
+                      "role": "user", "content": f"question {turn % 3}"
+                  }]}, {"model_name": "synthetic-model"})
+            scope(
+                "llm",
+                "end",
+                llm_uuid,
+                agent_uuid,
+                {
+                    "choices": [{
+                        "message": {
+                            "role":
+                                "assistant",
+                            "content":
+                                "calling tool",
+                            "tool_calls": [{
+                                "id": tool_call_id,
+                                "type": "function",
+                                "function": {
+                                    "name": "lookup", "arguments": "{}"
+                                },
+                            }],
+                        }
+                    }]
+                }, {"model_name": "synthetic-model"})
+            tool_uuid = new_uuid()
+            scope("tool", "start", tool_uuid, agent_uuid, {"query": "x"}, {"tool_call_id": tool_call_id})
+            if depth < 2 and rng.random() < 0.05:
+                sub_uuid = new_uuid()
+                scope("agent", "start", sub_uuid, tool_uuid, {"task": "delegate"})
+                agent_turns(sub_uuid, depth + 1, min(200, budget // 4))
+                scope("agent", "end", sub_uuid, tool_uuid, {"result": "delegated"})
+            scope("tool", "end", tool_uuid, agent_uuid, {"result": "found"}, {"tool_call_id": tool_call_id})
+
+    root_uuid = new_uuid()
+    scope("agent", "start", root_uuid, None, {"query": "hello"})
+    agent_turns(root_uuid, 0, num_events - 2)
+    scope("agent", "end", root_uuid, None, {"result": "done"})
+
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return len(lines)
+
+
+def _count_steps(trajectory_dict: dict) -> int:
+    return len(trajectory_dict["steps"]) + sum(
+        _count_steps(sub) for sub in trajectory_dict.get("subagent_trajectories") or [])
+
+
+def _scope(uuid: str, timestamp: int, parent_uuid: str | None = None) -> ScopeEvent:
+    return ScopeEvent(scope_category="start",
+                      uuid=uuid,
+                      parent_uuid=parent_uuid,
+                      timestamp=timestamp,
+                      name=uuid,
+                      attributes=[],
+                      category="unknown")
+
+
+# ---------------------------------------------------------------------------
+# iter_jsonl
+# ---------------------------------------------------------------------------
+
+
+def test_iter_jsonl_unsorted_preserves_file_order(tmp_path: Path) -> None:
+    path = tmp_path / "trace.jsonl"
+    write_jsonl([_scope("late", 30), _scope("early", 10), _scope("middle", 20)], path)
+
+    assert [e.uuid for e in iter_jsonl(path)] == ["late", "early", "middle"]
+
+
+def test_iter_jsonl_is_lazy(tmp_path: Path) -> None:
+    path = tmp_path / "trace.jsonl"
+    path.write_text(json.dumps(_scope("ok", 1).model_dump(exclude={"ts_micros"}, mode="json")) + "\n{not json}\n",
+                    encoding="utf-8")
+
+    events = iter_jsonl(path)
+    assert next(events).uuid == "ok"
+    with pytest.raises(json.JSONDecodeError):
+        next(events)
+
+
+@pytest.mark.parametrize("max_events_in_memory", [None, 1, 3, 1000])
+def test_iter_jsonl_sorted_matches_read_jsonl(tmp_path: Path, max_events_in_memory: int | None) -> None:
+    rng = random.Random(7)
+    # Duplicate timestamps check that ties keep file order across spilled runs.
+    events = [_scope(f"e{i}", rng.randint(0, 5)) for i in range(25)]
+    path = tmp_path / "trace.jsonl"
+    write_jsonl(events, path)
+
+    streamed = [e.uuid for e in iter_jsonl(path, sort=True, max_events_in_memory=max_events_in_memory)]
+
+    assert streamed == [e.uuid for e in read_jsonl(path)]
+    assert streamed == [e.uuid for e in sorted(events, key=lambda e: e.ts_micros)]
+
+
+def test_iter_jsonl_rejects_non_positive_run_size(tmp_path: Path) -> None:
+    path = tmp_path / "trace.jsonl"
+    write_jsonl([_scope("a", 1)], path)
+
+    with pytest.raises(ValueError, match="max_events_in_memory"):
+        list(iter_jsonl(path, sort=True, max_events_in_memory=0))
+
+
+# ---------------------------------------------------------------------------
+# Subagent partitioning
+# ---------------------------------------------------------------------------
+
+
+def test_nested_subagents_are_partitioned_once(tmp_path: Path) -> None:
+    path = tmp_path / "trace.jsonl"
+    _write_synthetic_trace(path, 5_000, seed=3)
+    events = read_jsonl(path)
+
+    trajectory = convert(events).model_dump(exclude_none=True, mode="json")
+
+    def collect_ids(traj: dict) -> list[str]:
+        ids = []
+        for sub in traj.get("subagent_trajectories") or []:
+            ids.append(sub["trajectory_id"])
+            ids.extend(collect_ids(sub))
+        return ids
+
+    nested_ids = collect_ids(trajectory)
+    assert nested_ids, "synthetic trace should contain subagents"
+    # Each subagent appears exactly once, nested under its wrapping agent.
+    assert len(nested_ids) == len(set(nested_ids))
+    num_subagent_starts = sum(1 for e in events if isinstance(e, ScopeEvent) and e.scope_category == "start"
+                              and e.category == "agent" and e.parent_uuid is not None)
+    assert len(nested_ids) == num_subagent_starts
+    assert [s["step_id"] for s in trajectory["steps"]] == list(range(1, len(trajectory["steps"]) + 1))
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+def test_benchmark_convert_1m_event_trace(tmp_path: Path) -> None:
+    path = tmp_path / "trace.jsonl"
+    num_events = _write_synthetic_trace(path, 1_000_000)
+
+    start = time.perf_counter()
+    trajectory = convert_file(path)
+    elapsed = time.perf_counter() - start
+
+    num_steps = _count_steps(trajectory.model_dump(exclude_none=True, mode="json"))
+    logger.info("Converted %d ATOF events into %d ATIF steps in %.1fs (%.0f events/s)",
+                num_events,
+                num_steps,
+                elapsed,
+                num_events / elapsed)
+    assert num_steps > 0
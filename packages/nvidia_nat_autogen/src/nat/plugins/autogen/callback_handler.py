@@ -30,7 +30,6 @@ Supported Methods
 - ``BaseTool.run_json``: Tool executions
 """
 
-import copy
 import logging
 import threading
 import time
@@ -48,7 +47,9 @@ from nat.data_models.intermediate_step import StreamEventData
 from nat.data_models.intermediate_step import TraceMetadata
 from nat.data_models.intermediate_step import UsageInfo
 from nat.data_models.profiler_callback import BaseProfilerCallback
+from nat.data_models.profiler_callback import PayloadCaptureConfig
 from nat.data_models.token_usage import TokenUsageBaseModel
+from nat.profiler.callbacks.payload_capture import PayloadCapture
 
 logger = logging.getLogger(__name__)
 
@@ -94,12 +95,17 @@ class AutoGenProfilerHandler(BaseProfilerCallback):
         >>> handler.uninstrument()
     """
 
-    def __init__(self) -> None:
-        """Initialize the AutoGenProfilerHandler."""
+    def __init__(self, payload_capture: PayloadCaptureConfig | None = None) -> None:
+        """Initialize the AutoGenProfilerHandler.
+
+        Args:
+            payload_capture: How LLM and tool inputs are captured for intermediate steps.
+        """
         super().__init__()
         self._lock = threading.Lock()
         self.last_call_ts = time.time()
         self.step_manager = Context.get().intermediate_step_manager
+        self._payload_capture = PayloadCapture(payload_capture)
         self._patched = PatchedClients()
         self._instrumented = False
 
@@ -367,7 +373,7 @@ class AutoGenProfilerHandler(BaseProfilerCallback):
             client = args[0] if args else None
             model_name = handler._extract_model_name(client) if client else "unknown_model"
             messages = kwargs.get("messages", [])
-            model_input = handler._extract_input_text(messages)
+            model_input = handler._payload_capture.capture(handler._extract_input_text(messages))
 
             # Push LLM_START event
             start_payload = IntermediateStepPayload(
@@ -375,7 +381,7 @@ class AutoGenProfilerHandler(BaseProfilerCallback):
                 framework=LLMFrameworkEnum.AUTOGEN,
                 name=model_name,
                 data=StreamEventData(input=model_input),
-                metadata=TraceMetadata(chat_inputs=copy.deepcopy(messages)),
+                metadata=TraceMetadata(chat_inputs=handler._payload_capture.capture(messages)),
                 usage_info=UsageInfo(
                     token_usage=TokenUsageBaseModel(),
                     num_llm_calls=1,
@@ -455,7 +461,7 @@ class AutoGenProfilerHandler(BaseProfilerCallback):
             client = args[0] if args else None
             model_name = handler._extract_model_name(client) if client else "unknown_model"
             messages = kwargs.get("messages", [])
-            model_input = handler._extract_input_text(messages)
+            model_input = handler._payload_capture.capture(handler._extract_input_text(messages))
 
             # Push LLM_START event
             start_payload = IntermediateStepPayload(
@@ -463,7 +469,7 @@ class AutoGenProfilerHandler(BaseProfilerCallback):
                 framework=LLMFrameworkEnum.AUTOGEN,
                 name=model_name,
                 data=StreamEventData(input=model_input),
-                metadata=TraceMetadata(chat_inputs=copy.deepcopy(messages)),
+                metadata=TraceMetadata(chat_inputs=handler._payload_capture.capture(messages)),
                 usage_info=UsageInfo(
                     token_usage=TokenUsageBaseModel(),
                     num_llm_calls=1,
@@ -28,6 +28,7 @@ class Individual:
     - metrics: evaluator name -> average score; filled after evaluation.
     - scalar_fitness: single fitness value used for selection; set after normalize/scalarize/diversity.
     - worst_items_reasoning: optional reasoning strings from worst eval items for oracle feedback.
+    - partial: whether the metrics were only measured on the racing sample of the dataset.
     """
 
     prompts: dict[str, str]
@@ -36,3 +37,4 @@ class Individual:
     worst_items_reasoning: list[str] | None = None
     trial_number: int | None = None
     eval_output: Any | None = None
+    partial: bool = False
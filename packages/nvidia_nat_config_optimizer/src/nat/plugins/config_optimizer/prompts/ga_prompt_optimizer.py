@@ -18,16 +18,21 @@ from __future__ import annotations
 
 import asyncio
 import csv
+import glob
 import json
 import logging
+import math
 import random
 from collections.abc import Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import NamedTuple
 
 from nat.builder.workflow_builder import WorkflowBuilder
 from nat.data_models.config import Config
+from nat.data_models.dataset_handler import EvalFilterConfig
+from nat.data_models.dataset_handler import EvalFilterEntryConfig
 from nat.data_models.evaluate_runtime import EvaluationRunConfig
 from nat.data_models.optimizable import SearchSpace
 from nat.data_models.optimizer import OptimizerConfig
@@ -49,6 +54,23 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class _FitnessRecord(NamedTuple):
+    """Metrics of an evaluated prompt set, reused by individuals with the same prompts."""
+    metrics: dict[str, float]
+    worst_items_reasoning: list[str] | None
+    partial: bool
+
+
+def _normalize_prompt(text: str) -> str:
+    lines = text.replace("\r\n", "\n").strip().split("\n")
+    return "\n".join(line.rstrip() for line in lines)
+
+
+def _prompt_set_key(prompts: dict[str, str]) -> str:
+    """Key identifying a prompt set, insensitive to whitespace surrounding the prompts and their lines."""
+    return json.dumps({k: _normalize_prompt(v) for k, v in prompts.items()}, sort_keys=True)
+
+
 def _on_prompt_trial_end(
     callback_manager: OptimizerCallbackManager | None,
     population: Sequence[Individual],
@@ -227,34 +249,128 @@ class GAPromptOptimizer(BasePromptOptimizer):
         max_concurrency: int = 8,
         callback_manager: OptimizerCallbackManager | None = None,
         oracle_feedback_worst_n: int = 5,
+        fitness_memo: dict[str, _FitnessRecord] | None = None,
+        racing_sample: list[Any] | None = None,
     ) -> None:
-        """Evaluate all individuals (concurrently)."""
-        unevaluated = [ind for ind in population if not ind.metrics]
-        if unevaluated:
-            sem = asyncio.Semaphore(max_concurrency)
-
-            async def _eval_one(ind: Individual) -> None:
-                async with sem:
-                    cfg_trial = apply_suggestions(base_cfg, ind.prompts)
-
-                    if callback_manager and ind.trial_number is not None:
-                        trial_project = callback_manager.get_trial_project_name(ind.trial_number)
-                        if trial_project:
-                            from nat.observability.utils.tracing_utils import get_tracing_configs
-                            tracing = get_tracing_configs(cfg_trial)
-                            for exporter_config in tracing.values():
-                                if hasattr(exporter_config, 'project'):
-                                    exporter_config.project = trial_project
-
-                    await self._evaluate_single_given_trial(
-                        ind,
-                        cfg_trial,
-                        optimizer_config,
-                        opt_run_config,
-                        oracle_feedback_worst_n=oracle_feedback_worst_n,
-                    )
+        """
+        Evaluate all individuals (concurrently).
+
+        When `fitness_memo` is given, individuals with the prompts of an individual evaluated before reuse its
+        metrics, and individuals with identical prompts are evaluated once. When `racing_sample` is given, the
+        individuals are first evaluated on the dataset items with these ids, and only the most promising are evaluated
+        on the full dataset. The others keep the metrics measured on the sample and are marked as partial.
+        """
+        groups: dict[str, list[Individual]] = {}
+        for idx, ind in enumerate(population):
+            if not ind.metrics:
+                key = _prompt_set_key(ind.prompts) if fitness_memo is not None else str(idx)
+                groups.setdefault(key, []).append(ind)
+        if not groups:
+            return
 
-            await asyncio.gather(*[_eval_one(ind) for ind in unevaluated])
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _eval_one(ind: Individual, sample: list[Any] | None = None) -> None:
+            async with sem:
+                cfg_trial = apply_suggestions(base_cfg, ind.prompts)
+                if sample is not None:
+                    self._restrict_dataset(cfg_trial, sample)
+
+                if callback_manager and ind.trial_number is not None:
+                    trial_project = callback_manager.get_trial_project_name(ind.trial_number)
+                    if trial_project:
+                        from nat.observability.utils.tracing_utils import get_tracing_configs
+                        tracing = get_tracing_configs(cfg_trial)
+                        for exporter_config in tracing.values():
+                            if hasattr(exporter_config, 'project'):
+                                exporter_config.project = trial_project
+
+                await self._evaluate_single_given_trial(
+                    ind,
+                    cfg_trial,
+                    optimizer_config,
+                    opt_run_config,
+                    oracle_feedback_worst_n=oracle_feedback_worst_n,
+                )
+
+        # One representative of each group is evaluated, unless a full evaluation of its prompts is memoized
+        pending: dict[str, Individual] = {}
+        for key, members in groups.items():
+            record = fitness_memo.get(key) if fitness_memo is not None else None
+            if record is not None and not record.partial:
+                for ind in members:
+                    self._apply_record(ind, record)
+                continue
+            pending[key] = members[0]
+            if record is not None:
+                self._apply_record(members[0], record)
+
+        promoted = list(pending.values())
+        if racing_sample is not None and len(promoted) > 1:
+            await asyncio.gather(*[_eval_one(ind, racing_sample) for ind in promoted if not ind.metrics])
+            for ind in promoted:
+                ind.partial = False
+            self._compute_fitness(promoted, optimizer_config)
+            ranked = sorted(promoted, key=lambda i: (i.scalar_fitness or 0.0), reverse=True)
+            num_promoted = max(1, math.ceil(len(ranked) * optimizer_config.prompt.ga_racing_promotion_rate))
+            promoted = ranked[:num_promoted]
+            for ind in ranked[num_promoted:]:
+                ind.partial = True
+            logger.info("[GA] Racing: promoting %d of %d individuals to the full dataset", len(promoted), len(ranked))
+        for ind in promoted:
+            ind.metrics = None
+            ind.partial = False
+        await asyncio.gather(*[_eval_one(ind) for ind in promoted])
+
+        for key, members in groups.items():
+            representative = pending.get(key)
+            if representative is None:
+                continue
+            record = _FitnessRecord(metrics=dict(representative.metrics or {}),
+                                    worst_items_reasoning=representative.worst_items_reasoning,
+                                    partial=representative.partial)
+            if fitness_memo is not None:
+                fitness_memo[key] = record
+            for ind in members[1:]:
+                self._apply_record(ind, record)
+
+    @staticmethod
+    def _apply_record(ind: Individual, record: _FitnessRecord) -> None:
+        ind.metrics = dict(record.metrics)
+        ind.worst_items_reasoning = record.worst_items_reasoning
+        ind.partial = record.partial
+
+    @staticmethod
+    def _restrict_dataset(cfg_trial: Config, sample: list[Any]) -> None:
+        """Restrict the evaluation dataset of a trial config to the items with the given ids."""
+        dataset_config = cfg_trial.eval.general.dataset
+        filter_config = dataset_config.filter or EvalFilterConfig()
+        fields = dict(filter_config.allowlist.field) if filter_config.allowlist else {}
+        # The allowlist matches shell-style wildcards, escape them so ids only match themselves
+        fields[dataset_config.id_key] = [glob.escape(str(item_id)) for item_id in sample]
+        dataset_config.filter = EvalFilterConfig(allowlist=EvalFilterEntryConfig(field=fields),
+                                                 denylist=filter_config.denylist)
+
+    @staticmethod
+    def _select_racing_sample(base_cfg: Config, opt_run_config: OptimizerRunConfig,
+                              sample_size: int) -> list[Any] | None:
+        """Pick the ids of the dataset items individuals are raced on, or None if the dataset is not larger."""
+        dataset_config = base_cfg.eval.general.dataset
+        if dataset_config is None:
+            logger.warning("[GA] No evaluation dataset configured, racing is disabled")
+            return None
+
+        from nat.plugins.eval.dataset_handler.dataset_handler import DatasetHandler
+        dataset_handler = DatasetHandler(dataset_config=dataset_config,
+                                         reps=1,
+                                         concurrency=base_cfg.eval.general.max_concurrency)
+        eval_input = dataset_handler.get_eval_input_from_dataset(opt_run_config.dataset)
+        item_ids = [item.id for item in eval_input.eval_input_items]
+        if len(item_ids) <= sample_size:
+            logger.info("[GA] Dataset has %d items, no more than the racing sample size; racing is disabled",
+                        len(item_ids))
+            return None
+        return random.sample(item_ids, sample_size)
 
     # ---------- fitness ---------- #
 
@@ -345,6 +461,14 @@ class GAPromptOptimizer(BasePromptOptimizer):
         for ind, norm_scores, penalty in zip(population, norm_per_ind, penalties):
             ind.scalar_fitness = (self._scalarize(norm_scores, mode=mode, weights=weights) - penalty)
 
+        # Individuals only evaluated on the racing sample rank below every individual evaluated on the full dataset
+        full_fitness = [ind.scalar_fitness for ind in population if not ind.partial]
+        if full_fitness and len(full_fitness) < len(population):
+            floor = min(full_fitness) - 1e-6
+            for ind in population:
+                if ind.partial:
+                    ind.scalar_fitness = min(ind.scalar_fitness, floor)
+
     # ---------- persistence ---------- #
 
     @staticmethod
@@ -580,6 +704,11 @@ class GAPromptOptimizer(BasePromptOptimizer):
                     raise ValueError(f"Invalid ga_selection_method: {selection_method!r}. "
                                      "Must be 'tournament' or 'roulette'.")
 
+            fitness_memo: dict[str, _FitnessRecord] | None = {} if prompt_cfg.ga_memoize_fitness else None
+            racing_sample = None
+            if prompt_cfg.ga_racing_sample_size is not None:
+                racing_sample = self._select_racing_sample(base_cfg, opt_run_config, prompt_cfg.ga_racing_sample_size)
+
             population = await _initial_population()
             history_rows: list[dict[str, Any]] = []
 
@@ -601,6 +730,8 @@ class GAPromptOptimizer(BasePromptOptimizer):
                     max_concurrency=max_eval_concurrency,
                     callback_manager=callback_manager,
                     oracle_feedback_worst_n=oracle_feedback_worst_n,
+                    fitness_memo=fitness_memo,
+                    racing_sample=racing_sample,
                 )
                 self._compute_fitness(population, optimizer_config, diversity_lambda)
 
@@ -631,6 +762,7 @@ class GAPromptOptimizer(BasePromptOptimizer):
                         "generation": gen,
                         "index": idx,
                         "scalar_fitness": ind.scalar_fitness,
+                        "racing_sample_only": ind.partial,
                     }
                     if ind.metrics:
                         row.update({f"metric::{m}": ind.metrics[m] for m in eval_metrics})
@@ -673,6 +805,8 @@ class GAPromptOptimizer(BasePromptOptimizer):
                 max_concurrency=max_eval_concurrency,
                 callback_manager=callback_manager,
                 oracle_feedback_worst_n=oracle_feedback_worst_n,
+                fitness_memo=fitness_memo,
+                racing_sample=racing_sample,
             )
             self._compute_fitness(population, optimizer_config, diversity_lambda)
             best = max(population, key=lambda i: (i.scalar_fitness or 0.0))
@@ -24,11 +24,14 @@ from nat.builder.builder import Builder
 from nat.builder.function_info import FunctionInfo
 from nat.cli.register_workflow import register_function
 from nat.data_models.config import Config
+from nat.data_models.dataset_handler import EvalDatasetJsonConfig
 from nat.data_models.function import FunctionBaseConfig
 from nat.data_models.optimizable import SearchSpace
 from nat.data_models.optimizer import OptimizerConfig
 from nat.data_models.optimizer import OptimizerMetric
 from nat.data_models.optimizer import OptimizerRunConfig
+from nat.plugins.config_optimizer.prompts.ga_individual import Individual
+from nat.plugins.config_optimizer.prompts.ga_prompt_optimizer import GAPromptOptimizer
 from nat.plugins.config_optimizer.prompts.ga_prompt_optimizer import PromptOptimizerInputSchema
 from nat.plugins.config_optimizer.prompts.ga_prompt_optimizer import optimize_prompts
 
@@ -183,8 +186,8 @@ async def test_optimize_prompts_happy_path_with_recombine(tmp_path: Path):
     val = best_prompts["prompt_param"]
     assert isinstance(val, list) and len(val) == 2
 
-    # We ran at least once; lower bound: population size * reps (approximate)
-    assert eval_calls["count"] >= optimizer_config.prompt.ga_population_size * optimizer_config.reps_per_param_set
+    # The population holds two distinct prompt sets ("Base" and "mut(Base)"), each evaluated once with every rep
+    assert eval_calls["count"] == 2 * optimizer_config.reps_per_param_set
 
 
 async def test_optimize_prompts_happy_path_without_recombine(tmp_path: Path):
@@ -296,3 +299,69 @@ async def test_optimize_prompts_with_oracle_feedback(tmp_path: Path):
     # Verify the feedback content contains the expected reasoning from worst-scoring items
     assert any("Failed to greet properly" in fb for fb in oracle_feedback_received["values"]), \
         "Feedback should contain reasoning from worst-scoring evaluation items"
+
+
+def _make_trial_config(cfg, prompts):  # noqa: ANN001
+    _ = (cfg, prompts)
+    trial_cfg = Config()
+    trial_cfg.eval.general.dataset = EvalDatasetJsonConfig(file_path="data.json")
+    return trial_cfg
+
+
+async def test_evaluate_population_memoizes_identical_prompt_sets(tmp_path: Path):
+    optimizer_config = _make_optimizer_config(tmp_path)
+    run_cfg = _make_run_config(Config())
+    optimizer = GAPromptOptimizer()
+    evaluated: list[str] = []
+
+    async def fake_evaluate(ind, cfg_trial, *_args, **_kwargs):  # noqa: ANN001
+        evaluated.append(ind.prompts["p"])
+        ind.metrics = {"Accuracy": 0.5}
+
+    memo = {}
+    first = [Individual(prompts={"p": "Hello"}), Individual(prompts={"p": "  Hello  \r\n"})]
+    second = [Individual(prompts={"p": "Hello"}), Individual(prompts={"p": "Bye"})]
+    with patch.object(optimizer, "_evaluate_single_given_trial", side_effect=fake_evaluate), \
+         patch("nat.plugins.config_optimizer.prompts.ga_prompt_optimizer.apply_suggestions",
+               side_effect=_make_trial_config):
+        await optimizer._evaluate_population(first, Config(), optimizer_config, run_cfg, fitness_memo=memo)
+        await optimizer._evaluate_population(second, Config(), optimizer_config, run_cfg, fitness_memo=memo)
+
+    assert evaluated == ["Hello", "Bye"]
+    assert all(ind.metrics == {"Accuracy": 0.5} for ind in first + second)
+
+
+async def test_evaluate_population_races_on_sample(tmp_path: Path):
+    optimizer_config = _make_optimizer_config(tmp_path)
+    optimizer_config.prompt.ga_racing_promotion_rate = 0.5
+    run_cfg = _make_run_config(Config())
+    optimizer = GAPromptOptimizer()
+    scores = {"a": 0.9, "b": 0.1, "c": 0.5, "d": 0.3}
+    full_runs: list[str] = []
+
+    async def fake_evaluate(ind, cfg_trial, *_args, **_kwargs):  # noqa: ANN001
+        allowlist = cfg_trial.eval.general.dataset.filter.allowlist
+        if allowlist is None:
+            full_runs.append(ind.prompts["p"])
+        else:
+            assert allowlist.field == {"id": ["1", "[[]2]"]}
+        ind.metrics = {"Accuracy": scores[ind.prompts["p"]]}
+
+    population = [Individual(prompts={"p": p}) for p in scores]
+    with patch.object(optimizer, "_evaluate_single_given_trial", side_effect=fake_evaluate), \
+         patch("nat.plugins.config_optimizer.prompts.ga_prompt_optimizer.apply_suggestions",
+               side_effect=_make_trial_config):
+        await optimizer._evaluate_population(population,
+                                             Config(),
+                                             optimizer_config,
+                                             run_cfg,
+                                             fitness_memo={},
+                                             racing_sample=[1, "[2]"])
+    optimizer._compute_fitness(population, optimizer_config)
+
+    assert sorted(full_runs) == ["a", "c"]
+    assert [ind.partial for ind in population] == [False, True, False, True]
+    best = max(population, key=lambda i: i.scalar_fitness)
+    worst_full = min((ind for ind in population if not ind.partial), key=lambda i: i.scalar_fitness)
+    assert best.prompts["p"] == "a"
+    assert all(ind.scalar_fitness < worst_full.scalar_fitness for ind in population if ind.partial)
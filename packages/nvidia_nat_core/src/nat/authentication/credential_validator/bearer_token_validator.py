@@ -13,9 +13,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import hashlib
 import json
 import logging
 import time
+from collections import OrderedDict
+from collections.abc import Awaitable
+from collections.abc import Callable
 from collections.abc import Mapping
 from typing import Any
 from urllib.parse import urlparse
@@ -37,6 +42,11 @@ class BearerTokenValidator:
     """Bearer token validator supporting JWT and opaque tokens.
 
     Implements RFC 7519 (JWT) and RFC 7662 (Token Introspection) standards.
+
+    Successful validations are kept in a bounded LRU keyed by a SHA-256 digest of the token, so repeat requests with
+    the same token skip signature verification and introspection. JWT results are reused until the token's `exp`;
+    introspection results for at most `introspection_cache_ttl` seconds so revocations are picked up. Discovery and
+    JWKS documents are refreshed once for all concurrent callers, and introspection reuses one pooled HTTP client.
     """
 
     def __init__(
@@ -52,6 +62,8 @@ class BearerTokenValidator:
         timeout: float = 10.0,
         leeway: int = 60,
         discovery_url: str | None = None,
+        validated_token_cache_size: int = 1024,
+        introspection_cache_ttl: int = 300,
     ):
         """
         Args:
@@ -66,6 +78,9 @@ class BearerTokenValidator:
             timeout: HTTP request timeout for discovery/JWKS/introspection (default: 10.0s).
             leeway: Clock-skew allowance for `exp`/`nbf`/`iat` checks (default: 60s).
             discovery_url: OIDC/OAuth metadata URL to auto-discover `jwks_uri` and `introspection_endpoint`.
+            validated_token_cache_size: Maximum number of validated tokens to cache; 0 disables the cache
+                (default: 1024).
+            introspection_cache_ttl: Maximum time an introspection result is reused, in seconds (default: 300s).
         """
         # Configuration parameters
         self.introspection_endpoint = introspection_endpoint
@@ -96,12 +111,21 @@ class BearerTokenValidator:
         self._jwks_cache: dict[str, dict[str, Any]] = {}
         # OIDC config cache: url -> {config, cache_expires_at}
         self._oidc_config_cache: dict[str, dict[str, Any]] = {}
-        # Positive introspection result cache: token_prefix -> {result, cache_expires_at}
-        self._introspection_cache: dict[str, dict[str, Any]] = {}
+        # Positive validation result cache: sha256(token) -> (result, cache_expires_at), least recently used first
+        self._validated_cache: OrderedDict[bytes, tuple[TokenValidationResult, float]] = OrderedDict()
+        self._validated_cache_size = validated_token_cache_size
 
         # Cache TTL settings
         self._jwks_cache_ttl = 900  # 15 minutes
         self._discovery_cache_ttl = 900  # 15 minutes
+        self._introspection_cache_ttl = introspection_cache_ttl
+
+        # In-flight discovery/JWKS fetches shared by concurrent callers: url -> task
+        self._inflight_fetches: dict[str, asyncio.Future] = {}
+
+        # Long-lived HTTP clients, created on first use and closed by `aclose`
+        self._http_client: httpx.AsyncClient | None = None
+        self._oauth_client: AsyncOAuth2Client | None = None
 
     def _validate_configuration(self) -> None:
         """Validate that at least one token verification method is configured."""
@@ -132,6 +156,54 @@ class BearerTokenValidator:
         if not token:
             return TokenValidationResult(client_id="", token_type="bearer", active=False)
 
+        cached_result = self._get_cached_result(token)
+        if cached_result is not None:
+            return cached_result
+
+        return await self._verify_uncached(token)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP clients. The validator may still be used afterwards; clients are recreated."""
+        http_client, self._http_client = self._http_client, None
+        oauth_client, self._oauth_client = self._oauth_client, None
+        if http_client is not None:
+            await http_client.aclose()
+        if oauth_client is not None:
+            await oauth_client.aclose()
+
+    @staticmethod
+    def _token_digest(token: str) -> bytes:
+        """Cache key for a token, so raw tokens are never held by the cache."""
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def _get_cached_result(self, token: str) -> TokenValidationResult | None:
+        """Return a cached validation result if present and not yet expired."""
+        cache_key = self._token_digest(token)
+        cache_entry = self._validated_cache.get(cache_key)
+        if cache_entry is None:
+            return None
+
+        result, cache_expires_at = cache_entry
+        if time.time() >= cache_expires_at:
+            del self._validated_cache[cache_key]
+            return None
+
+        self._validated_cache.move_to_end(cache_key)
+        return result
+
+    def _cache_result(self, token: str, result: TokenValidationResult, cache_expires_at: float) -> None:
+        """Cache a positive validation result until `cache_expires_at`, evicting the least recently used entry."""
+        if self._validated_cache_size <= 0 or cache_expires_at <= time.time():
+            return
+
+        cache_key = self._token_digest(token)
+        self._validated_cache[cache_key] = (result, cache_expires_at)
+        self._validated_cache.move_to_end(cache_key)
+        while len(self._validated_cache) > self._validated_cache_size:
+            self._validated_cache.popitem(last=False)
+
+    async def _verify_uncached(self, token: str) -> TokenValidationResult:
+        """Validate a token without consulting the validated-token cache."""
         if token.count(".") == 2:
             try:
                 return await self._verify_jwt_token(token)
@@ -218,7 +290,7 @@ class BearerTokenValidator:
 
         self._check_jwt_policies(issuer, audience, scopes)
 
-        return TokenValidationResult(
+        result = TokenValidationResult(
             client_id=claims.get("azp") or claims.get("client_id") or subject,
             expires_at=claims.get("exp"),
             audience=audience,
@@ -232,6 +304,10 @@ class BearerTokenValidator:
             active=True,
         )
 
+        # A verified JWT stays valid until it expires, so signature verification is skipped until then
+        self._cache_result(token, result, float(claims["exp"]))
+        return result
+
     async def _verify_opaque_token(self, token: str, *, introspection_endpoint: str) -> TokenValidationResult:
         """Verify opaque token via RFC 7662 introspection.
 
@@ -243,22 +319,82 @@ class BearerTokenValidator:
             TokenValidationResult
         """
 
-        cache_key = token[:10] if len(token) >= 10 else token
+        try:
+            response = await self._get_oauth_client().introspect_token(
+                introspection_endpoint,
+                token,
+                token_type_hint="access_token",
+            )
+            introspection_response = self._coerce_introspection_response(response)
+
+            # Check if token is active
+            if not introspection_response.get("active", False):
+                raise ValueError("Token is inactive")
+
+            # Extract claims
+            client_id = introspection_response.get("client_id")
+            username = introspection_response.get("username")
+            token_type = introspection_response.get("token_type", "opaque")
+            expires_at = introspection_response.get("exp")
+            not_before = introspection_response.get("nbf")
+            issued_at = introspection_response.get("iat")
+            subject = introspection_response.get("sub")
+            audience = self._extract_audience_from_introspection(introspection_response)
+            issuer = introspection_response.get("iss")
+            jwt_id = introspection_response.get("jti")
+
+            # Parse scopes
+            scope_value = introspection_response.get("scope")
+            scopes = None
+            if scope_value and isinstance(scope_value, str):
+                scopes = scope_value.split()
+            elif isinstance(scope_value, list):
+                scopes = scope_value
+
+            # Check expiration and not-before with leeway
+            if self._is_expired(expires_at):
+                raise ValueError("Token is expired")
+
+            # Check not-before claim with leeway
+            if not_before and self._is_not_yet_valid(not_before):
+                raise ValueError("Token is not yet valid")
+
+            # Apply opaque token policy checks
+            self._check_opaque_policies(issuer, audience, scopes)
+
+            result = TokenValidationResult(
+                client_id=client_id,
+                username=username,
+                token_type=token_type,
+                expires_at=expires_at,
+                audience=audience,
+                subject=subject,
+                issuer=issuer,
+                jti=jwt_id,
+                scopes=scopes,
+                active=True,
+                nbf=not_before,
+                iat=issued_at,
+            )
+
+            # Cache positive result with TTL based on token expiration, capped so revocations are picked up
+            if expires_at:
+                self._cache_result(token, result, min(expires_at, time.time() + self._introspection_cache_ttl))
+
+            return result
 
-        # Check cache first
-        cache_entry = self._introspection_cache.get(cache_key)
-        if cache_entry:
-            cached_result = cache_entry["result"]
-            cache_expires_at = cache_entry["cache_expires_at"]
-            now = int(time.time())
+        except (ValueError, TypeError, KeyError, httpx.HTTPError) as e:
+            raise ValueError(f"Introspection failed: {e}") from e
 
-            # Use cached result if not expired
-            if now < cache_expires_at:
-                return cached_result
-            else:
-                del self._introspection_cache[cache_key]
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the pooled client used for discovery and JWKS requests."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(timeout=self.timeout)
+        return self._http_client
 
-        try:
+    def _get_oauth_client(self) -> AsyncOAuth2Client:
+        """Return the pooled client used for introspection requests."""
+        if self._oauth_client is None:
             oauth_client_kwargs = {
                 "client_id": self.client_id,
                 "client_secret": self.client_secret,
@@ -266,73 +402,20 @@ class BearerTokenValidator:
             }
             if self.client_auth_method:
                 oauth_client_kwargs["token_endpoint_auth_method"] = self.client_auth_method
+            self._oauth_client = AsyncOAuth2Client(**oauth_client_kwargs)
+        return self._oauth_client
 
-            async with AsyncOAuth2Client(**oauth_client_kwargs) as oauth_client:
-                introspection_response = self._coerce_introspection_response(await oauth_client.introspect_token(
-                    introspection_endpoint,
-                    token,
-                    token_type_hint="access_token",
-                ))
-
-                # Check if token is active
-                if not introspection_response.get("active", False):
-                    raise ValueError("Token is inactive")
-
-                # Extract claims
-                client_id = introspection_response.get("client_id")
-                username = introspection_response.get("username")
-                token_type = introspection_response.get("token_type", "opaque")
-                expires_at = introspection_response.get("exp")
-                not_before = introspection_response.get("nbf")
-                issued_at = introspection_response.get("iat")
-                subject = introspection_response.get("sub")
-                audience = self._extract_audience_from_introspection(introspection_response)
-                issuer = introspection_response.get("iss")
-                jwt_id = introspection_response.get("jti")
-
-                # Parse scopes
-                scope_value = introspection_response.get("scope")
-                scopes = None
-                if scope_value and isinstance(scope_value, str):
-                    scopes = scope_value.split()
-                elif isinstance(scope_value, list):
-                    scopes = scope_value
-
-                # Check expiration and not-before with leeway
-                if self._is_expired(expires_at):
-                    raise ValueError("Token is expired")
-
-                # Check not-before claim with leeway
-                if not_before and self._is_not_yet_valid(not_before):
-                    raise ValueError("Token is not yet valid")
-
-                # Apply opaque token policy checks
-                self._check_opaque_policies(issuer, audience, scopes)
-
-                result = TokenValidationResult(
-                    client_id=client_id,
-                    username=username,
-                    token_type=token_type,
-                    expires_at=expires_at,
-                    audience=audience,
-                    subject=subject,
-                    issuer=issuer,
-                    jti=jwt_id,
-                    scopes=scopes,
-                    active=True,
-                    nbf=not_before,
-                    iat=issued_at,
-                )
-
-                # Cache positive result with TTL based on token expiration
-                if expires_at:
-                    cache_expires_at = min(expires_at, int(time.time()) + 300)  # Max 5 minutes
-                    self._introspection_cache[cache_key] = {"result": result, "cache_expires_at": cache_expires_at}
-
-                return result
+    async def _single_flight(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `fetch` once for all concurrent callers asking for the same `key`.
 
-        except (ValueError, TypeError, KeyError, httpx.HTTPError) as e:
-            raise ValueError(f"Introspection failed: {e}") from e
+        The shared fetch is shielded, so a cancelled caller does not cancel it for the others.
+        """
+        future = self._inflight_fetches.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fetch())
+            self._inflight_fetches[key] = future
+            future.add_done_callback(lambda _: self._inflight_fetches.pop(key, None))
+        return await asyncio.shield(future)
 
     async def _resolve_introspection_endpoint_for_validation(self) -> str | None:
         """Resolve the introspection endpoint when credentials make introspection viable."""
@@ -411,26 +494,37 @@ class BearerTokenValidator:
                 # Remove expired entry
                 del self._oidc_config_cache[discovery_url]
 
+        return await self._single_flight(discovery_url, lambda: self._refresh_oidc_configuration(discovery_url))
+
+    async def _refresh_oidc_configuration(self, discovery_url: str) -> dict[str, Any]:
+        """Fetch the OIDC configuration and cache it.
+
+        Args:
+            discovery_url: OIDC discovery URL
+
+        Returns:
+            OIDC configuration dict
+        """
+
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(discovery_url)
-                response.raise_for_status()
-                config = response.json()
-
-                if not isinstance(config, dict):
-                    logger.warning("OIDC discovery returned non-dict; not caching")
-                    return config
-
-                jwks_uri = config.get("jwks_uri")
-                if jwks_uri is not None and not isinstance(jwks_uri, str):
-                    logger.warning("OIDC discovery jwks_uri is not a string; not caching")
-                    return config
-
-                # Cache with TTL
-                cache_expires_at = int(time.time()) + self._discovery_cache_ttl
-                self._oidc_config_cache[discovery_url] = {"config": config, "cache_expires_at": cache_expires_at}
+            response = await self._get_http_client().get(discovery_url)
+            response.raise_for_status()
+            config = response.json()
+
+            if not isinstance(config, dict):
+                logger.warning("OIDC discovery returned non-dict; not caching")
                 return config
 
+            jwks_uri = config.get("jwks_uri")
+            if jwks_uri is not None and not isinstance(jwks_uri, str):
+                logger.warning("OIDC discovery jwks_uri is not a string; not caching")
+                return config
+
+            # Cache with TTL
+            cache_expires_at = int(time.time()) + self._discovery_cache_ttl
+            self._oidc_config_cache[discovery_url] = {"config": config, "cache_expires_at": cache_expires_at}
+            return config
+
         except httpx.HTTPError as e:
             raise ValueError(f"OIDC discovery failed: {e}") from e
         except json.JSONDecodeError as e:
@@ -459,10 +553,21 @@ class BearerTokenValidator:
                 # Remove expired entry
                 del self._jwks_cache[jwks_uri]
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(jwks_uri)
-            response.raise_for_status()
-            jwks_data = response.json()
+        return await self._single_flight(jwks_uri, lambda: self._refresh_jwks(jwks_uri))
+
+    async def _refresh_jwks(self, jwks_uri: str) -> KeySet:
+        """Fetch JWKS from URI and cache the keyset.
+
+        Args:
+            jwks_uri: JWKS endpoint URI
+
+        Returns:
+            KeySet for token verification
+        """
+
+        response = await self._get_http_client().get(jwks_uri)
+        response.raise_for_status()
+        jwks_data = response.json()
 
         keys = jwks_data.get("keys", [])
         if not keys:
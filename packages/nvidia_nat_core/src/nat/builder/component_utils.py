@@ -275,6 +275,34 @@ def config_to_dependency_objects(config: "Config") -> tuple[dict[str, ComponentI
     return dependency_map, dependency_graph
 
 
+def build_dependency_map(config: "Config") -> dict[str, set[str]]:
+    """Generates a map of each component runtime instance ID to the instance IDs it directly references.
+
+    Args:
+        config (Config): A NAT configuration object.
+
+    Returns:
+        dict[str, set[str]]: Direct dependencies keyed by runtime instance ID. Instances without references are
+            omitted.
+    """
+
+    _, dependency_graph = config_to_dependency_objects(config=config)
+
+    dependency_map: dict[str, set[str]] = {}
+    for node in dependency_graph.nodes:
+        if isinstance(node, ComponentRefNode):
+            continue
+        dependencies = {
+            dependency
+            for ref_node in dependency_graph.successors(node)
+            for dependency in dependency_graph.successors(ref_node)
+        }
+        if dependencies:
+            dependency_map[node] = dependencies
+
+    return dependency_map
+
+
 def build_dependency_sequence(config: "Config") -> list[ComponentInstanceData]:
     """Generates the depencency sequence from a NAT configuration object
 
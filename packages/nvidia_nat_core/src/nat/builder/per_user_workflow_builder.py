@@ -170,6 +170,7 @@ class PerUserWorkflowBuilder(Builder, AbstractAsyncContextManager):
         llms = {k: v.instance for k, v in self._shared_builder._llms.items()}
         middleware_instances = await self._resolve_middleware_instances_from_shared_builder(
             config.middleware, "function")
+        telemetry_config = self._shared_builder.general_config.telemetry
         return await _build_function_impl(name=name,
                                           config=config,
                                           registry=self._registry,
@@ -177,7 +178,9 @@ class PerUserWorkflowBuilder(Builder, AbstractAsyncContextManager):
                                           inner_builder=inner_builder,
                                           llms=llms,
                                           dependencies=self.per_user_function_dependencies,
-                                          middleware_instances=middleware_instances)
+                                          middleware_instances=middleware_instances,
+                                          token_events=telemetry_config.token_events,
+                                          payload_capture=telemetry_config.payload_capture)
 
     async def _build_per_user_function_group(self, name: str,
                                              config: FunctionGroupBaseConfig) -> ConfiguredFunctionGroup:
@@ -191,6 +194,7 @@ class PerUserWorkflowBuilder(Builder, AbstractAsyncContextManager):
         llms = {k: v.instance for k, v in self._shared_builder._llms.items()}
         middleware_instances = await self._resolve_middleware_instances_from_shared_builder(
             config.middleware, "function group")
+        telemetry_config = self._shared_builder.general_config.telemetry
 
         return await _build_function_group_impl(name=name,
                                                 config=config,
@@ -199,7 +203,9 @@ class PerUserWorkflowBuilder(Builder, AbstractAsyncContextManager):
                                                 inner_builder=inner_builder,
                                                 llms=llms,
                                                 dependencies=self.per_user_function_group_dependencies,
-                                                middleware_instances=middleware_instances)
+                                                middleware_instances=middleware_instances,
+                                                token_events=telemetry_config.token_events,
+                                                payload_capture=telemetry_config.payload_capture)
 
     @override
     async def add_function(self, name: str | FunctionRef, config: FunctionBaseConfig) -> Function:
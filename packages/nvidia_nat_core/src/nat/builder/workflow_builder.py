@@ -17,6 +17,7 @@ import asyncio
 import dataclasses
 import inspect
 import logging
+import time
 import typing
 import warnings
 from abc import ABC
@@ -24,6 +25,7 @@ from collections.abc import Sequence
 from contextlib import AbstractAsyncContextManager
 from contextlib import AsyncExitStack
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from typing import cast
 
 from nat.authentication.interfaces import AuthProviderBase
@@ -31,6 +33,8 @@ from nat.builder.builder import Builder
 from nat.builder.builder import EvalBuilder
 from nat.builder.child_builder import ChildBuilder
 from nat.builder.component_utils import WORKFLOW_COMPONENT_NAME
+from nat.builder.component_utils import ComponentInstanceData
+from nat.builder.component_utils import build_dependency_map
 from nat.builder.component_utils import build_dependency_sequence
 from nat.builder.context import ContextState
 from nat.builder.embedder import EmbedderProviderInfo
@@ -73,6 +77,8 @@ from nat.data_models.llm import LLMBaseConfig
 from nat.data_models.memory import MemoryBaseConfig
 from nat.data_models.middleware import MiddlewareBaseConfig
 from nat.data_models.object_store import ObjectStoreBaseConfig
+from nat.data_models.profiler_callback import PayloadCaptureConfig
+from nat.data_models.profiler_callback import TokenEventsConfig
 from nat.data_models.retriever import RetrieverBaseConfig
 from nat.data_models.telemetry_exporter import TelemetryExporterBaseConfig
 from nat.data_models.ttc_strategy import TTCStrategyBaseConfig
@@ -98,12 +104,16 @@ except ImportError:
     def detect_llm_frameworks_in_build_fn(registration) -> list[LLMFrameworkEnum]:
         return []
 
-    def chain_wrapped_build_fn(original_build_fn, workflow_llms, function_frameworks):  # noqa: ARG001
+    def chain_wrapped_build_fn(original_build_fn, *_args, **_kwargs):
         return original_build_fn
 
 
 logger = logging.getLogger(__name__)
 
+# Exit stack that owns the resources of the component currently being built concurrently, scoped to one builder
+_ComponentExitStack = tuple["WorkflowBuilder", AsyncExitStack]
+_component_exit_stack: ContextVar[_ComponentExitStack | None] = ContextVar("component_exit_stack", default=None)
+
 
 @dataclasses.dataclass
 class ConfiguredTelemetryExporter:
@@ -233,6 +243,8 @@ async def _build_function_impl(
     llms: dict[str, LLMProviderInfo],
     dependencies: dict[str, FunctionDependencies],
     middleware_instances: list[FunctionMiddleware],
+    token_events: TokenEventsConfig | None = None,
+    payload_capture: PayloadCaptureConfig | None = None,
 ) -> ConfiguredFunction:
     """
     Helper for core function building logic.
@@ -246,11 +258,17 @@ async def _build_function_impl(
         llms: Dictionary of LLM instances
         dependencies: Dictionary to store function dependencies
         middleware_instances: Pre-resolved middleware instances
+        token_events: How framework callback handlers report streamed LLM tokens
+        payload_capture: How framework callback handlers capture LLM and tool inputs
     """
     registration = registry.get_function(type(config))
 
     function_frameworks = detect_llm_frameworks_in_build_fn(registration)
-    build_fn = chain_wrapped_build_fn(registration.build_fn, llms, function_frameworks)
+    build_fn = chain_wrapped_build_fn(registration.build_fn,
+                                      llms,
+                                      function_frameworks,
+                                      token_events=token_events,
+                                      payload_capture=payload_capture)
 
     build_result = await exit_stack.enter_async_context(build_fn(config, inner_builder))
 
@@ -282,6 +300,8 @@ async def _build_function_group_impl(
     llms: dict[str, LLMProviderInfo],
     dependencies: dict[str, FunctionDependencies],
     middleware_instances: list[FunctionMiddleware],
+    token_events: TokenEventsConfig | None = None,
+    payload_capture: PayloadCaptureConfig | None = None,
 ) -> ConfiguredFunctionGroup:
     """
     Core function group building logic shared between WorkflowBuilder and PerUserWorkflowBuilder.
@@ -295,11 +315,17 @@ async def _build_function_group_impl(
         llms: Dictionary of LLM instances
         dependencies: Dictionary to store function group dependencies
         middleware_instances: Pre-resolved middleware instances
+        token_events: How framework callback handlers report streamed LLM tokens
+        payload_capture: How framework callback handlers capture LLM and tool inputs
     """
     registration = registry.get_function_group(type(config))
 
     function_frameworks = detect_llm_frameworks_in_build_fn(registration)
-    build_fn = chain_wrapped_build_fn(registration.build_fn, llms, function_frameworks)
+    build_fn = chain_wrapped_build_fn(registration.build_fn,
+                                      llms,
+                                      function_frameworks,
+                                      token_events=token_events,
+                                      payload_capture=payload_capture)
 
     build_result = await exit_stack.enter_async_context(build_fn(config, inner_builder))
 
@@ -362,6 +388,8 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
         self.completed_components: list[tuple[str, str]] = []
         # List of remaining components to be built
         self.remaining_components: list[tuple[str, str]] = []
+        # Wall-clock build time in seconds of each completed component, as (name, group, seconds)
+        self.component_build_times: list[tuple[str, str, float]] = []
 
     async def __aenter__(self):
 
@@ -578,6 +606,11 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
 
     def _get_exit_stack(self) -> AsyncExitStack:
 
+        # Components built concurrently get their own stack, registered on the main stack in build order
+        component_stack = _component_exit_stack.get()
+        if component_stack is not None and component_stack[0] is self:
+            return component_stack[1]
+
         if self._exit_stack is None:
             raise ValueError(
                 "Exit stack not initialized. Did you forget to call `async with WorkflowBuilder() as builder`?")
@@ -626,6 +659,8 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
                 llms=llms,
                 dependencies=self.function_dependencies,
                 middleware_instances=middleware_instances,
+                token_events=self.general_config.telemetry.token_events,
+                payload_capture=self.general_config.telemetry.payload_capture,
             )
 
     async def _build_function_group(self, name: str, config: FunctionGroupBaseConfig) -> ConfiguredFunctionGroup:
@@ -657,7 +692,9 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
                                                     inner_builder=inner_builder,
                                                     llms=llms,
                                                     dependencies=self.function_group_dependencies,
-                                                    middleware_instances=middleware_instances)
+                                                    middleware_instances=middleware_instances,
+                                                    token_events=self.general_config.telemetry.token_events,
+                                                    payload_capture=self.general_config.telemetry.payload_capture)
 
     @override
     async def add_function(self, name: str | FunctionRef, config: FunctionBaseConfig) -> Function:
@@ -1422,89 +1459,14 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
         if not skip_workflow:
             self.remaining_components.append((WORKFLOW_COMPONENT_NAME, "workflow"))
 
-        # Loop over all components and add to the workflow builder
-        for component_instance in build_sequence:
-            try:
-                # Instantiate a the llm
-                if component_instance.component_group == ComponentGroup.LLMS:
-                    await self.add_llm(component_instance.name, cast(LLMBaseConfig, component_instance.config))
-                # Instantiate a the embedder
-                elif component_instance.component_group == ComponentGroup.EMBEDDERS:
-                    await self.add_embedder(component_instance.name,
-                                            cast(EmbedderBaseConfig, component_instance.config))
-                # Instantiate a memory client
-                elif component_instance.component_group == ComponentGroup.MEMORY:
-                    await self.add_memory_client(component_instance.name,
-                                                 cast(MemoryBaseConfig, component_instance.config))
-                # Instantiate a object store client
-                elif component_instance.component_group == ComponentGroup.OBJECT_STORES:
-                    await self.add_object_store(component_instance.name,
-                                                cast(ObjectStoreBaseConfig, component_instance.config))
-                # Instantiate a retriever client
-                elif component_instance.component_group == ComponentGroup.RETRIEVERS:
-                    await self.add_retriever(component_instance.name,
-                                             cast(RetrieverBaseConfig, component_instance.config))
-                # Instantiate middleware
-                elif component_instance.component_group == ComponentGroup.MIDDLEWARE:
-                    await self.add_middleware(component_instance.name,
-                                              cast(MiddlewareBaseConfig, component_instance.config))
-                # Instantiate a function group
-                elif component_instance.component_group == ComponentGroup.FUNCTION_GROUPS:
-                    config_obj = cast(FunctionGroupBaseConfig, component_instance.config)
-                    registration = self._registry.get_function_group(type(config_obj))
-                    if registration.is_per_user:
-                        # Skip per-user function groups as they will be built lazily by PerUserWorkflowBuilder
-                        continue
-                    await self.add_function_group(component_instance.name,
-                                                  cast(FunctionGroupBaseConfig, component_instance.config))
-                # Instantiate a function
-                elif component_instance.component_group == ComponentGroup.FUNCTIONS:
-                    config_obj = cast(FunctionBaseConfig, component_instance.config)
-                    if skip_workflow and component_instance.is_root:
-                        # Skip root workflow registration/build when requested.
-                        continue
-                    registration = self._registry.get_function(type(config_obj))
-                    if registration.is_per_user:
-                        # Skip per-user functions as they will be built lazily by PerUserWorkflowBuilder
-                        continue
-                    elif not component_instance.is_root:
-                        # If the function is not the root, add it to the workflow builder
-                        await self.add_function(component_instance.name, config_obj)
-                elif component_instance.component_group == ComponentGroup.TTC_STRATEGIES:
-                    await self.add_ttc_strategy(component_instance.name,
-                                                cast(TTCStrategyBaseConfig, component_instance.config))
-
-                elif component_instance.component_group == ComponentGroup.AUTHENTICATION:
-                    await self.add_auth_provider(component_instance.name,
-                                                 cast(AuthProviderBaseConfig, component_instance.config))
-
-                elif component_instance.component_group == ComponentGroup.TRAINERS:
-                    await self.add_trainer(component_instance.name, cast(TrainerConfig, component_instance.config))
-
-                elif component_instance.component_group == ComponentGroup.TRAINER_ADAPTERS:
-                    await self.add_trainer_adapter(component_instance.name,
-                                                   cast(TrainerAdapterConfig, component_instance.config))
-
-                elif component_instance.component_group == ComponentGroup.TRAJECTORY_BUILDERS:
-                    await self.add_trajectory_builder(component_instance.name,
-                                                      cast(TrajectoryBuilderConfig, component_instance.config))
-                else:
-                    raise ValueError(f"Unknown component group {component_instance.component_group}")
-
-                # Remove from remaining and add to completed after successful build (if not root)
-                if not component_instance.is_root:
-                    self.remaining_components.remove(
-                        (str(component_instance.name), component_instance.component_group.value))
-                    self.completed_components.append(
-                        (str(component_instance.name), component_instance.component_group.value))
-
-            except Exception as e:
-                _log_build_failure(str(component_instance.name),
-                                   component_instance.component_group.value,
-                                   self.completed_components,
-                                   self.remaining_components,
-                                   e)
-                raise
+        populate_start = time.perf_counter()
+        components = [component_instance for component_instance in build_sequence if not component_instance.is_root]
+        max_concurrency = config.general.max_concurrent_component_builds
+        if max_concurrency > 1:
+            await self._build_components_concurrently(config, components, max_concurrency)
+        else:
+            for component_instance in components:
+                await self._build_component(component_instance)
 
         # Instantiate the workflow
         if not skip_workflow:
@@ -1515,8 +1477,11 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
                 if not workflow_registration.is_per_user:
                     # Remove workflow from remaining as we start building
                     self.remaining_components.remove((WORKFLOW_COMPONENT_NAME, "workflow"))
+                    workflow_start = time.perf_counter()
                     await self.set_workflow(config.workflow)
                     self.completed_components.append((WORKFLOW_COMPONENT_NAME, "workflow"))
+                    self.component_build_times.append(
+                        (WORKFLOW_COMPONENT_NAME, "workflow", time.perf_counter() - workflow_start))
             except Exception as e:
                 _log_build_failure(WORKFLOW_COMPONENT_NAME,
                                    "workflow",
@@ -1525,9 +1490,189 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
                                    e)
                 raise
 
+        self._log_build_times(time.perf_counter() - populate_start, max_concurrency)
+
         # Check if any shared components have dependencies on per-user components
         self._validate_dependencies(config)
 
+    async def _add_component(self, component_instance: ComponentInstanceData) -> bool:
+        """
+        Add a single non-root component to the builder.
+
+        Returns:
+            bool: False if the component was skipped because it is built lazily per user.
+        """
+        # Instantiate a the llm
+        if component_instance.component_group == ComponentGroup.LLMS:
+            await self.add_llm(component_instance.name, cast(LLMBaseConfig, component_instance.config))
+        # Instantiate a the embedder
+        elif component_instance.component_group == ComponentGroup.EMBEDDERS:
+            await self.add_embedder(component_instance.name, cast(EmbedderBaseConfig, component_instance.config))
+        # Instantiate a memory client
+        elif component_instance.component_group == ComponentGroup.MEMORY:
+            await self.add_memory_client(component_instance.name, cast(MemoryBaseConfig, component_instance.config))
+        # Instantiate a object store client
+        elif component_instance.component_group == ComponentGroup.OBJECT_STORES:
+            await self.add_object_store(component_instance.name, cast(ObjectStoreBaseConfig, component_instance.config))
+        # Instantiate a retriever client
+        elif component_instance.component_group == ComponentGroup.RETRIEVERS:
+            await self.add_retriever(component_instance.name, cast(RetrieverBaseConfig, component_instance.config))
+        # Instantiate middleware
+        elif component_instance.component_group == ComponentGroup.MIDDLEWARE:
+            await self.add_middleware(component_instance.name, cast(MiddlewareBaseConfig, component_instance.config))
+        # Instantiate a function group
+        elif component_instance.component_group == ComponentGroup.FUNCTION_GROUPS:
+            config_obj = cast(FunctionGroupBaseConfig, component_instance.config)
+            registration = self._registry.get_function_group(type(config_obj))
+            if registration.is_per_user:
+                # Skip per-user function groups as they will be built lazily by PerUserWorkflowBuilder
+                return False
+            await self.add_function_group(component_instance.name, config_obj)
+        # Instantiate a function
+        elif component_instance.component_group == ComponentGroup.FUNCTIONS:
+            config_obj = cast(FunctionBaseConfig, component_instance.config)
+            registration = self._registry.get_function(type(config_obj))
+            if registration.is_per_user:
+                # Skip per-user functions as they will be built lazily by PerUserWorkflowBuilder
+                return False
+            await self.add_function(component_instance.name, config_obj)
+        elif component_instance.component_group == ComponentGroup.TTC_STRATEGIES:
+            await self.add_ttc_strategy(component_instance.name, cast(TTCStrategyBaseConfig, component_instance.config))
+
+        elif component_instance.component_group == ComponentGroup.AUTHENTICATION:
+            await self.add_auth_provider(component_instance.name,
+                                         cast(AuthProviderBaseConfig, component_instance.config))
+
+        elif component_instance.component_group == ComponentGroup.TRAINERS:
+            await self.add_trainer(component_instance.name, cast(TrainerConfig, component_instance.config))
+
+        elif component_instance.component_group == ComponentGroup.TRAINER_ADAPTERS:
+            await self.add_trainer_adapter(component_instance.name,
+                                           cast(TrainerAdapterConfig, component_instance.config))
+
+        elif component_instance.component_group == ComponentGroup.TRAJECTORY_BUILDERS:
+            await self.add_trajectory_builder(component_instance.name,
+                                              cast(TrajectoryBuilderConfig, component_instance.config))
+        else:
+            raise ValueError(f"Unknown component group {component_instance.component_group}")
+
+        return True
+
+    async def _build_component(self, component_instance: ComponentInstanceData) -> None:
+        """Build one component, keeping the completed/remaining bookkeeping and build times up to date."""
+        component_key = (str(component_instance.name), component_instance.component_group.value)
+        start = time.perf_counter()
+        try:
+            built = await self._add_component(component_instance)
+        except Exception as e:
+            _log_build_failure(component_key[0],
+                               component_key[1],
+                               self.completed_components,
+                               self.remaining_components,
+                               e)
+            raise
+
+        if built:
+            # Remove from remaining and add to completed after successful build
+            self.remaining_components.remove(component_key)
+            self.completed_components.append(component_key)
+            self.component_build_times.append((*component_key, time.perf_counter() - start))
+
+    async def _build_components_concurrently(self,
+                                             config: Config,
+                                             components: list[ComponentInstanceData],
+                                             max_concurrency: int) -> None:
+        """
+        Build components concurrently, starting each one as soon as the components it depends on are built.
+
+        At most ``max_concurrency`` components build at once. Each component enters its resources on its own exit
+        stack; the stacks are registered on the builder's exit stack in dependency sequence order, so teardown order
+        matches a sequential build regardless of which build finished first.
+
+        Args:
+            config (Config): The configuration the components come from.
+            components (list[ComponentInstanceData]): The non-root components, in dependency sequence order.
+            max_concurrency (int): The maximum number of components to build at once.
+        """
+        component_ids = {component.instance_id for component in components}
+        referenced = build_dependency_map(config)
+
+        # Functions and function groups snapshot the LLMs and resolve middleware when they are built, and the
+        # finetuning components come last in the sequential order, so those group-level orderings are kept.
+        llm_and_middleware_ids = {
+            component.instance_id
+            for component in components if component.component_group in (ComponentGroup.LLMS, ComponentGroup.MIDDLEWARE)
+        }
+        finetuning_groups = (ComponentGroup.TRAINER_ADAPTERS,
+                             ComponentGroup.TRAJECTORY_BUILDERS,
+                             ComponentGroup.TRAINERS)
+
+        waits_for: dict[str, set[str]] = {}
+        for position, component in enumerate(components):
+            dependencies = set(referenced.get(component.instance_id, set()))
+            if component.component_group in (ComponentGroup.FUNCTIONS, ComponentGroup.FUNCTION_GROUPS):
+                dependencies |= llm_and_middleware_ids
+            elif component.component_group in finetuning_groups:
+                dependencies |= {earlier.instance_id for earlier in components[:position]}
+            dependencies &= component_ids
+            dependencies.discard(component.instance_id)
+            waits_for[component.instance_id] = dependencies
+
+        component_stacks: dict[str, AsyncExitStack] = {}
+        tasks: list[asyncio.Task] = []
+        running: dict[asyncio.Task, ComponentInstanceData] = {}
+        built_ids: set[str] = set()
+
+        async def _build_with_own_stack(component: ComponentInstanceData, stack: AsyncExitStack) -> None:
+            _component_exit_stack.set((self, stack))
+            await self._build_component(component)
+
+        try:
+            while len(built_ids) < len(components):
+                for component in components:
+                    if len(running) >= max_concurrency:
+                        break
+                    if component.instance_id in component_stacks or not waits_for[component.instance_id] <= built_ids:
+                        continue
+                    stack = AsyncExitStack()
+                    component_stacks[component.instance_id] = stack
+                    task = asyncio.create_task(_build_with_own_stack(component, stack),
+                                               name=f"build:{component.component_group.value}:{component.name}")
+                    tasks.append(task)
+                    running[task] = component
+
+                if not running:
+                    raise RuntimeError("Unable to schedule remaining components; the dependency graph has a cycle.")
+
+                finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    component = running.pop(task)
+                    task.result()
+                    built_ids.add(component.instance_id)
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+            exit_stack = self._get_exit_stack()
+            for component in components:
+                if component.instance_id in component_stacks:
+                    exit_stack.push_async_exit(component_stacks[component.instance_id])
+
+    def _log_build_times(self, total_seconds: float, max_concurrency: int) -> None:
+        if not self.component_build_times:
+            return
+
+        component_seconds = sum(seconds for _, _, seconds in self.component_build_times)
+        logger.info("Built %d components in %.2fs (%.2fs of total component build time, concurrency %d)",
+                    len(self.component_build_times),
+                    total_seconds,
+                    component_seconds,
+                    max_concurrency)
+        if logger.isEnabledFor(logging.DEBUG):
+            for name, group, seconds in sorted(self.component_build_times, key=lambda item: item[2], reverse=True):
+                logger.debug("  %-8.3fs %s `%s`", seconds, group, name)
+
     def _validate_dependencies(self, config: Config):
         """
         Validate no shared component has dependencies on any per-user components.
@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pydantic import BaseModel
+from pydantic import Field
+from pydantic import model_validator
+
+
+class AdaptiveConcurrencyConfig(BaseModel):
+    """Configuration for adaptively limiting the number of concurrent requests sent to an LLM endpoint."""
+
+    initial_limit: int = Field(default=16, ge=1, description="Number of concurrent requests allowed at first.")
+    min_limit: int = Field(default=1, ge=1, description="Lower bound of the concurrency limit.")
+    max_limit: int = Field(default=256, ge=1, description="Upper bound of the concurrency limit.")
+    backoff_ratio: float = Field(default=0.5,
+                                 gt=0.0,
+                                 lt=1.0,
+                                 description="Factor the limit is multiplied by when the endpoint is overloaded.")
+    latency_tolerance: float | None = Field(default=None,
+                                            gt=1.0,
+                                            description="The endpoint is considered overloaded when the smoothed "
+                                            "latency exceeds the lowest observed latency by this factor. Latency is "
+                                            "measured until the response headers arrive, so it grows with the output "
+                                            "length of non-streaming requests. If None, only rate limiting responses "
+                                            "and timeouts reduce the limit.")
+    overload_status_codes: list[int] = Field(default_factory=lambda: [429, 503],
+                                             description="HTTP status codes indicating the endpoint is overloaded.")
+    coalesce_identical_requests: bool = Field(default=False,
+                                              description="Send identical concurrent requests with a temperature of "
+                                              "0 only once and share the response. Streaming requests are never "
+                                              "coalesced.")
+
+    @model_validator(mode="after")
+    def _check_limits(self) -> "AdaptiveConcurrencyConfig":
+        if not self.min_limit <= self.initial_limit <= self.max_limit:
+            raise ValueError("Expected min_limit <= initial_limit <= max_limit")
+        return self
+
+
+class AdaptiveConcurrencyMixin(BaseModel):
+    """Mixin for adaptive concurrency limiting configuration."""
+
+    adaptive_concurrency: AdaptiveConcurrencyConfig | None = Field(
+        default=None,
+        description="Adapt the number of concurrent requests sent to the LLM endpoint to its capacity, backing off "
+        "when it is overloaded. The limit is shared by every LLM client sending requests for the same model to the "
+        "same endpoint. Disabled by default.",
+        exclude=True)
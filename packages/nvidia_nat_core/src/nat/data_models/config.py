@@ -38,6 +38,8 @@ from nat.data_models.function import FunctionBaseConfig
 from nat.data_models.function import FunctionGroupBaseConfig
 from nat.data_models.logging import LoggingBaseConfig
 from nat.data_models.optimizer import OptimizerConfig
+from nat.data_models.profiler_callback import PayloadCaptureConfig
+from nat.data_models.profiler_callback import TokenEventsConfig
 from nat.data_models.telemetry_exporter import TelemetryExporterBaseConfig
 from nat.data_models.ttc_strategy import TTCStrategyBaseConfig
 from nat.front_ends.fastapi.fastapi_front_end_config import FastApiFrontEndConfig
@@ -155,6 +157,14 @@ class TelemetryConfig(BaseModel):
 
     logging: dict[str, LoggingBaseConfig] = Field(default_factory=dict)
     tracing: dict[str, TelemetryExporterBaseConfig] = Field(default_factory=dict)
+    token_events: TokenEventsConfig = Field(
+        default_factory=TokenEventsConfig,
+        description="How framework callback handlers report the tokens streamed by LLMs. By default the tokens "
+        "received in each 0.1 second interval are reported as one event.")
+    payload_capture: PayloadCaptureConfig = Field(
+        default_factory=PayloadCaptureConfig,
+        description="How framework callback handlers capture the inputs of LLM and tool calls. By default the "
+        "inputs are captured in full.")
 
     @field_validator("logging", "tracing", mode="wrap")
     @classmethod
@@ -223,10 +233,35 @@ class GeneralConfig(BaseModel):
         default=timedelta(minutes=5),
         description="Interval for running cleanup of inactive per-user workflows. "
         "Only applies when workflow is per-user. Defaults to 5 minutes.")
+    max_per_user_workflows: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum number of per-user workflows kept at the same time. When the limit is reached, the least "
+        "recently used idle per-user workflow is evicted to make room for a new user. When all of them are in use, "
+        "requests for new users wait for one to become idle. Only applies when workflow is per-user. Defaults to 0, "
+        "which means no limit.")
+    per_user_workflow_admission_timeout: timedelta = Field(
+        default=timedelta(seconds=30),
+        description="Time a request for a new user waits for a per-user workflow to become idle when "
+        "`max_per_user_workflows` are in use, before it is rejected. The FastAPI front end responds to rejected "
+        "requests with 503 Service Unavailable. Only applies when `max_per_user_workflows` is set. "
+        "Defaults to 30 seconds.")
+    max_concurrent_component_builds: int = Field(
+        default=1,
+        ge=1,
+        description="Maximum number of components the workflow builder constructs concurrently. Components are "
+        "started as soon as the components they reference are built. Defaults to 1, which builds components one at "
+        "a time in dependency order.")
     enable_per_user_monitoring: bool = Field(
         default=False,
         description="Enable the /monitor/users endpoint for per-user workflow resource monitoring. "
-        "When enabled, exposes metrics like request counts, latency, LLM usage, and memory for each user.")
+        "When enabled, exposes metrics like request counts, latency, LLM usage, and memory for each user, and the "
+        "utilization of shared HTTP connection pools on the /monitor/http_connection_pools endpoint.")
+    enable_runtime_metrics: bool = Field(
+        default=False,
+        description="Record latency histograms for workflow runs, the time runs wait for a concurrency slot, and the "
+        "function, LLM and tool calls they make, along with LLM token counts. The FastAPI front end exposes them in "
+        "the Prometheus text format on the /metrics endpoint.")
 
     # FrontEnd Configuration
     front_end: FrontEndBaseConfig = FastApiFrontEndConfig()
@@ -98,6 +98,43 @@ class EvalOutputConfig(BaseModel):
         "for troubleshooting and debugging.")
 
 
+class PipelinedScoringConfig(BaseModel):
+    """
+    Configuration for scoring each item with the evaluators as soon as its workflow run finishes, rather than after the
+    workflow has run on the whole dataset. This is specified in the `eval.general.pipelined_scoring` section of the
+    evaluation configuration yaml file.
+    """
+    queue_size: int = Field(default=32,
+                            ge=1,
+                            description="Maximum number of items waiting to be scored by each evaluator. Once a "
+                            "queue is full, finished workflow runs wait for space before the next item is started.")
+
+    batch_size: int = Field(default=8,
+                            ge=1,
+                            description="Maximum number of waiting items passed to an evaluator in a single call.")
+
+    max_concurrent_batches: int = Field(default=4,
+                                        ge=1,
+                                        description="Maximum number of calls in progress for each evaluator.")
+
+
+class EvalResultCacheConfig(BaseModel):
+    """
+    Configuration for reusing workflow outputs and evaluator scores across evaluation runs. This is specified in the
+    `eval.general.result_cache` section of the evaluation configuration yaml file.
+    """
+    path: Path = Field(default=Path("./.tmp/nat/eval_cache.db"), description="Path of the cache database file.")
+
+    workflow_outputs: bool = Field(default=True,
+                                   description="Reuse the workflow output of a dataset item when the item and the "
+                                   "configuration outside of the `eval` section are unchanged. Only applies when the "
+                                   "workflow is run locally.")
+
+    scores: bool = Field(default=True,
+                         description="Reuse the score of an item when the item, its workflow output and the "
+                         "configuration of the evaluator are unchanged.")
+
+
 class EvalGeneralConfig(BaseModel):
     """
     Configuration for the general evaluation options. This is specifiied in the `eval.general` section
@@ -132,6 +169,17 @@ class EvalGeneralConfig(BaseModel):
         "this creates a fresh workflow instance per eval item, resetting all stateful tools to their "
         "initial state. Set to False to disable this behavior.")
 
+    pipelined_scoring: PipelinedScoringConfig | None = Field(
+        default=None,
+        description="When set, each item is scored as soon as its workflow run finishes, so the evaluators run while "
+        "the workflow is still running on the rest of the dataset. The evaluators must score items independently of "
+        "each other. Only applies when the workflow is run locally.")
+
+    result_cache: EvalResultCacheConfig | None = Field(
+        default=None,
+        description="When set, workflow outputs and evaluator scores are stored in a local cache, so later runs only "
+        "run the workflow and the evaluators on the items affected by a change.")
+
     # overwrite the output_dir with the output config if present
     @model_validator(mode="before")
     @classmethod
@@ -195,6 +195,17 @@ class CurriculumLearningConfig(BaseModel):
         return self
 
 
+class PipelinedTrainingConfig(BaseModel):
+    """
+    Configuration for collecting the trajectories of the next epochs while the current epoch trains.
+    """
+    max_staleness: int = Field(default=1,
+                               ge=1,
+                               description="Maximum number of collected epochs waiting for or undergoing training when "
+                               "the trajectories of the next epoch are collected, that is the number of weight updates "
+                               "the model used for collection may lag behind.")
+
+
 class FinetuneRunConfig(BaseModel):
     """
     CLI Args for running finetuning and configuring
@@ -233,6 +244,10 @@ class FinetuneConfig(BaseModel):
         default=None)
     curriculum_learning: CurriculumLearningConfig = Field(
         default=CurriculumLearningConfig(), description="Configuration for curriculum learning during fine-tuning")
+    pipelined_training: PipelinedTrainingConfig | None = Field(
+        default=None,
+        description="When set, the trajectories of the next epochs are collected while the current epoch trains, "
+        "rather than after training completes. Only supported by trainers implementing `collect_trajectories`.")
 
     num_epochs: int = Field(default=1, description="Number of epochs to run", ge=1)
     output_dir: Path = Field(default=Path("./.tmp/nat/finetuning/"),
@@ -0,0 +1,50 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pydantic import BaseModel
+from pydantic import Field
+
+
+class HTTPConnectionPoolConfig(BaseModel):
+    """Configuration for the HTTP connection pool used to send requests to a model endpoint."""
+
+    shared: bool = Field(default=True,
+                         description="Share the connection pool with every other component, including those of "
+                         "per-user workflows, sending requests to the same endpoint with the same pool settings.")
+    max_connections: int | None = Field(
+        default=100,
+        ge=1,
+        description="Maximum number of concurrent connections. When the pool is shared, "
+        "the limit applies to all clients of the endpoint together. If None, unlimited.")
+    max_keepalive_connections: int | None = Field(default=20,
+                                                  ge=0,
+                                                  description="Maximum number of idle connections kept open. If None, "
+                                                  "unlimited.")
+    keepalive_expiry: float | None = Field(default=5.0,
+                                           ge=0.0,
+                                           description="Seconds an idle connection is kept open. If None, idle "
+                                           "connections are kept open indefinitely.")
+    http2: bool = Field(default=False,
+                        description="Enable HTTP/2, multiplexing concurrent requests over a single connection when "
+                        "the endpoint supports it. Requires the `h2` package.")
+
+
+class HTTPConnectionPoolMixin(BaseModel):
+    """Mixin for HTTP connection pool configuration."""
+
+    http_connection_pool: HTTPConnectionPoolConfig = Field(
+        default_factory=HTTPConnectionPoolConfig,
+        description="Settings of the HTTP connection pool used to send requests to the endpoint.",
+        exclude=True)
@@ -128,6 +128,24 @@ class GAPromptOptimizationConfig(PromptOptimizationConfig, name="ga"):
         default=0.0,
         ge=0.0,
     )
+    ga_memoize_fitness: bool = Field(
+        description="Reuse the metrics of an individual whose prompts, ignoring surrounding whitespace, match an "
+        "individual evaluated earlier in the run, rather than evaluating it again.",
+        default=True,
+    )
+    ga_racing_sample_size: int | None = Field(
+        description="When set, individuals are first evaluated on a random sample of this many dataset items, and "
+        "only the most promising are evaluated on the full dataset. The sample is the same for the whole run.",
+        default=None,
+        ge=1,
+    )
+    ga_racing_promotion_rate: float = Field(
+        description="Fraction of the individuals evaluated on the racing sample that are evaluated on the full "
+        "dataset. At least one individual is promoted.",
+        default=0.5,
+        gt=0.0,
+        le=1.0,
+    )
 
     # Oracle feedback configuration
     oracle_feedback_mode: Literal["never", "always", "failing_only", "adaptive"] = Field(
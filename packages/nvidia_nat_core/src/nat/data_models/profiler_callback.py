@@ -14,6 +14,62 @@
 # limitations under the License.
 
 from abc import ABC
+from enum import StrEnum
+
+from pydantic import BaseModel
+from pydantic import Field
+
+
+class TokenEventMode(StrEnum):
+    """How the tokens streamed by an LLM are reported as `LLM_NEW_TOKEN` intermediate steps."""
+
+    EVERY_TOKEN = "every_token"
+    COUNT = "count"
+    INTERVAL = "interval"
+    OFF = "off"
+
+
+class TokenEventsConfig(BaseModel):
+    """
+    Configuration for coalescing the streamed tokens reported by framework callback handlers.
+
+    The first token of each LLM call is always reported as soon as it arrives, so the time to the first token can be
+    measured. Tokens not yet reported when the LLM call ends are reported before its `LLM_END` step.
+    """
+
+    mode: TokenEventMode = Field(default=TokenEventMode.INTERVAL,
+                                 description="`every_token` reports each token as its own event, `count` reports "
+                                 "batches of `tokens_per_event` tokens, `interval` reports the tokens received every "
+                                 "`interval` seconds and `off` reports no token events, leaving the output to the "
+                                 "`LLM_END` step.")
+    tokens_per_event: int = Field(default=32, ge=1, description="Number of tokens per event in `count` mode.")
+    interval: float = Field(default=0.1, gt=0.0, description="Seconds between events in `interval` mode.")
+
+
+class LargePayloadMode(StrEnum):
+    """How payloads larger than the maximum captured size are recorded."""
+
+    TRUNCATE = "truncate"
+    HASH = "hash"
+
+
+class PayloadCaptureConfig(BaseModel):
+    """
+    Configuration for the prompts, messages and tool inputs captured by framework callback handlers.
+
+    Payloads are captured as snapshots which share their strings and other leaf values with the original payload, so
+    capturing them costs time proportional to the number of messages rather than to their size.
+    """
+
+    max_size: int | None = Field(default=None,
+                                 ge=0,
+                                 description="Maximum number of characters of text captured per payload. If None, "
+                                 "payloads are captured in full.")
+    large_payloads: LargePayloadMode = Field(default=LargePayloadMode.TRUNCATE,
+                                             description="How payloads with more than `max_size` characters of text "
+                                             "are captured. `truncate` keeps the structure of the payload and "
+                                             "truncates its text, `hash` replaces the payload with its size and a "
+                                             "SHA-256 digest of its text.")
 
 
 class BaseProfilerCallback(ABC):
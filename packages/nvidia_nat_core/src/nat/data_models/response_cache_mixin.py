@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pydantic import BaseModel
+from pydantic import Field
+
+from nat.data_models.common import OptionalSecretStr
+
+
+class SimilarityMatchConfig(BaseModel):
+    """Configuration for serving cached responses to prompts that are similar, but not identical, to a cached one."""
+
+    embedding_base_url: str = Field(description="Base URL of an OpenAI compatible embeddings endpoint, used to embed "
+                                    "prompts.")
+    embedding_model: str = Field(description="Name of the embedding model.")
+    api_key: OptionalSecretStr = Field(default=None, description="API key for the embeddings endpoint.")
+    threshold: float = Field(default=0.97,
+                             gt=0.0,
+                             le=1.0,
+                             description="Minimum cosine similarity between two prompts for a cached response to be "
+                             "reused.")
+    max_candidates: int = Field(default=1000,
+                                ge=1,
+                                description="Maximum number of cached prompts, most recently used first, compared "
+                                "against a new prompt.")
+
+
+class LLMResponseCacheConfig(BaseModel):
+    """Configuration for caching LLM responses at the HTTP level."""
+
+    path: str | None = Field(default=None,
+                             description="Path of the cache database file. If None, the cache is kept in memory and "
+                             "lost when the process exits.")
+    ttl: float | None = Field(default=7 * 24 * 60 * 60,
+                              gt=0.0,
+                              description="Seconds after which a cached response expires. If None, responses do not "
+                              "expire.")
+    max_size_bytes: int = Field(default=1024 * 1024 * 1024,
+                                gt=0,
+                                description="Maximum total size of cached responses, least recently used responses are "
+                                "evicted first.")
+    cache_nondeterministic: bool = Field(default=False,
+                                         description="Whether to cache requests sampled with a non-zero temperature. "
+                                         "By default only requests with `temperature` set to 0 are cached, since "
+                                         "other requests are expected to produce different responses.")
+    similarity: SimilarityMatchConfig | None = Field(default=None,
+                                                     description="When set, a request without an exact match reuses "
+                                                     "the response of a cached request with a similar prompt and the "
+                                                     "same model and sampling parameters.")
+
+
+class ResponseCacheMixin(BaseModel):
+    """Mixin for LLM response cache configuration."""
+
+    response_cache: LLMResponseCacheConfig | None = Field(
+        default=None,
+        description="Cache responses of the LLM, so repeated identical requests are served without calling the LLM. "
+        "Disabled by default.",
+        exclude=True)
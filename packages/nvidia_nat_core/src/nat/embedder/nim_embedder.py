@@ -25,6 +25,7 @@ from nat.builder.embedder import EmbedderProviderInfo
 from nat.cli.register_workflow import register_embedder_provider
 from nat.data_models.common import OptionalSecretStr
 from nat.data_models.embedder import EmbedderBaseConfig
+from nat.data_models.http_connection_pool_mixin import HTTPConnectionPoolMixin
 from nat.data_models.retry_mixin import RetryMixin
 from nat.data_models.ssl_verification_mixin import SSLVerificationMixin
 
@@ -40,7 +41,7 @@ def option_in_allowed_values(v):
 TruncationOption = typing.Annotated[str, AfterValidator(option_in_allowed_values)]
 
 
-class NIMEmbedderModelConfig(EmbedderBaseConfig, RetryMixin, SSLVerificationMixin, name="nim"):
+class NIMEmbedderModelConfig(EmbedderBaseConfig, RetryMixin, SSLVerificationMixin, HTTPConnectionPoolMixin, name="nim"):
     """A NVIDIA Inference Microservice (NIM) embedder provider to be used with an embedder client."""
 
     api_key: OptionalSecretStr = Field(default=None, description="NVIDIA API key to interact with hosted NIM.")
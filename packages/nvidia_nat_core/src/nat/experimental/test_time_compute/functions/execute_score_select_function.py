@@ -16,6 +16,7 @@
 import logging
 
 from pydantic import Field
+from pydantic import model_validator
 
 from nat.builder.builder import Builder
 from nat.builder.function import Function
@@ -27,6 +28,7 @@ from nat.data_models.function import FunctionBaseConfig
 from nat.experimental.test_time_compute.models.stage_enums import PipelineTypeEnum
 from nat.experimental.test_time_compute.models.stage_enums import StageTypeEnum
 from nat.experimental.test_time_compute.models.ttc_item import TTCItem
+from nat.experimental.test_time_compute.scoring.score_cache import ScoreCache
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +40,30 @@ class ExecuteScoreSelectFunctionConfig(FunctionBaseConfig, name="execute_score_s
 
     num_executions: int = Field(3, description="Number of times to execute the function")
 
+    max_concurrency: int = Field(0,
+                                 ge=0,
+                                 description="Maximum number of executions in flight at once. "
+                                 "0 launches all `num_executions` at once.")
+    early_stop_score: float | None = Field(
+        None,
+        description="Enables anytime mode: each output is scored as soon as it completes, and once one scores at "
+        "least this value no further executions are launched and in-flight ones are cancelled. Requires `scorer`.")
+    max_latency_seconds: float | None = Field(
+        None,
+        gt=0,
+        description="Latency budget. Once it is spent and at least one output is available, no further executions "
+        "are launched, in-flight ones are cancelled, and selection runs on the outputs collected so far.")
+    score_cache_size: int = Field(128,
+                                  ge=0,
+                                  description="Number of scores to keep in an LRU cache so duplicate outputs for the "
+                                  "same input are scored once. 0 disables the cache.")
+
+    @model_validator(mode="after")
+    def validate_early_stop(self) -> "ExecuteScoreSelectFunctionConfig":
+        if self.early_stop_score is not None and self.scorer is None:
+            raise ValueError("`early_stop_score` requires a `scorer`.")
+        return self
+
 
 @register_function(config_type=ExecuteScoreSelectFunctionConfig)
 async def execute_score_select_function(config: ExecuteScoreSelectFunctionConfig, builder: Builder):
@@ -68,22 +94,86 @@ async def execute_score_select_function(config: ExecuteScoreSelectFunctionConfig
             return str(arg.model_dump())
         return str(arg)
 
-    async def execute_fn(input_msg: executable_fn.input_type) -> executable_fn.single_output_type:
+    score_cache = ScoreCache(config.score_cache_size)
+
+    async def score_items(items: list[TTCItem]) -> None:
+        # Score each distinct output once; duplicates and previously scored outputs reuse the cached score.
+        keys = [ScoreCache.make_key(item.input, item.output) for item in items]
+        scores: dict[str, float | None] = {}
+        to_score: dict[str, TTCItem] = {}
+        for key, item in zip(keys, items):
+            cached = score_cache.get(key)
+            if cached is not None:
+                scores[key] = cached
+            elif key not in to_score:
+                to_score[key] = item
+
+        if to_score:
+            scored_items = await scorer.ainvoke(items=list(to_score.values()))
+            for key, scored_item in zip(to_score, scored_items):
+                scores[key] = scored_item.score
+                if scored_item.score is not None:
+                    score_cache.put(key, scored_item.score)
+
+        for key, item in zip(keys, items):
+            item.score = scores[key]
 
-        logger.info("Executing function %d times", config.num_executions)
-        tasks = [executable_fn.ainvoke(input_msg) for _ in range(config.num_executions)]
-        results = await asyncio.gather(*tasks)
+    async def execute_fn(input_msg: executable_fn.input_type) -> executable_fn.single_output_type:
 
+        logger.info("Executing function up to %d times", config.num_executions)
         input_str = convert_to_str(input_msg)
-        function_outputs = [convert_to_str(out) for out in results]
-        its_items = [TTCItem(
-            input=input_str,
-            output=out,
-        ) for out in function_outputs]
-
-        if scorer:
+        max_in_flight = config.max_concurrency or config.num_executions
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + config.max_latency_seconds if config.max_latency_seconds else None
+
+        results = []
+        its_items: list[TTCItem] = []
+        pending: set[asyncio.Task] = set()
+        launched = 0
+        try:
+            while True:
+                while launched < config.num_executions and len(pending) < max_in_flight:
+                    pending.add(asyncio.create_task(executable_fn.ainvoke(input_msg)))
+                    launched += 1
+                if not pending:
+                    break
+
+                # The latency budget only applies once there is at least one output to select from
+                timeout = max(deadline - loop.time(), 0) if deadline is not None and results else None
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                satisfied = False
+                for task in done:
+                    result = task.result()
+                    item = TTCItem(input=input_str, output=convert_to_str(result))
+                    if config.early_stop_score is not None:
+                        await score_items([item])
+                        satisfied = item.score is not None and item.score >= config.early_stop_score
+                    results.append(result)
+                    its_items.append(item)
+                    if satisfied:
+                        break
+
+                if satisfied:
+                    logger.info("Output scored at least %s after %d of %d executions; stopping early",
+                                config.early_stop_score,
+                                len(results),
+                                config.num_executions)
+                    break
+                if deadline is not None and loop.time() >= deadline:
+                    logger.info("Latency budget of %ss spent after %d of %d executions; stopping early",
+                                config.max_latency_seconds,
+                                len(results),
+                                config.num_executions)
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        if scorer and config.early_stop_score is None:
             logger.info("Beginning scoring")
-            its_items = await scorer.ainvoke(items=its_items)
+            await score_items(its_items)
 
         logger.info("Beginning selection")
         selected_item = (await selector.ainvoke(items=its_items, original_prompt=its_items[0].input))[0]
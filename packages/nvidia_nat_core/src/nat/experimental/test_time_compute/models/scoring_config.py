@@ -41,6 +41,16 @@ class LLMBasedPlanScoringConfig(TTCStrategyBaseConfig, name="llm_based_plan_scor
                  "other text before or after it\n"),
         description="The template to use for scoring the plans.")
 
+    max_concurrency: int = Field(default=0,
+                                 ge=0,
+                                 description="Maximum number of scoring LLM calls in flight at once. "
+                                 "0 scores every plan concurrently.")
+
+    score_cache_size: int = Field(default=128,
+                                  ge=0,
+                                  description="Number of plan scores to keep in an LRU cache so duplicate plans "
+                                  "for the same prompt and context are scored once. 0 disables the cache.")
+
     @model_validator(mode="before")
     def validate_strategies(cls, values: dict[str, typing.Any]) -> dict[str, typing.Any]:
         """
@@ -68,6 +68,10 @@ class MultiLLMPlanConfig(TTCStrategyBaseConfig, name="multi_llm_plan"):
         default_factory=list,
         description="list of LLMs to use for plan generation. Each LLM can generate one or more plans.")
     plans_per_llm: int = Field(default=2, description="Number of plans each LLM should generate.")
+    max_concurrency: int = Field(default=0,
+                                 ge=0,
+                                 description="Maximum number of plan generation calls in flight at once across all "
+                                 "LLMs. 0 generates every plan concurrently.")
     max_temperature: float = Field(default=1.0,
                                    description="Maximum temperature to use for sampling when generating plans. "
                                    "This can help control the randomness of the generated plans.")
@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import asyncio
+import contextlib
 import logging
 import re
 
@@ -26,6 +27,7 @@ from nat.experimental.test_time_compute.models.stage_enums import PipelineTypeEn
 from nat.experimental.test_time_compute.models.stage_enums import StageTypeEnum
 from nat.experimental.test_time_compute.models.strategy_base import StrategyBase
 from nat.experimental.test_time_compute.models.ttc_item import TTCItem
+from nat.experimental.test_time_compute.scoring.score_cache import ScoreCache
 from nat.utils.io.model_processing import remove_r1_think_tags
 
 logger = logging.getLogger(__name__)
@@ -36,6 +38,7 @@ class LLMBasedPlanScorer(StrategyBase):
     def __init__(self, config: TTCStrategyBaseConfig) -> None:
         super().__init__(config)
         self.llm_bound = None
+        self.score_cache = ScoreCache(config.score_cache_size)
 
     async def build_components(self, builder: Builder) -> None:
         """
@@ -126,27 +129,44 @@ class LLMBasedPlanScorer(StrategyBase):
         Returns:
             list[float]: A list of scores corresponding to each planning item.
         """
-        # Run score single concurrently for all planning items
-        # Then set the score attribute on each planning item
+        # Score each distinct plan once; duplicates and previously scored plans reuse the cached score.
         if not items:
             return []
-        tasks = [
-            self.score_single(original_prompt=original_prompt, agent_context=agent_context, planning_item=item)
-            for item in items
-        ]
 
-        # Gather all scores concurrently
-        scores = await asyncio.gather(*tasks)
-
-        if len(scores) != len(items):
-            logger.warning(f"Number of scores {len(scores)} does not match the number of planning items {len(items)}.")
-            raise ValueError("Mismatch in number of scores and planning items.")
-
-        logger.debug("Scores for planning items: %s", scores)
+        keys = [ScoreCache.make_key(original_prompt, agent_context, item.plan) for item in items]
+        scores_by_key: dict[str, float] = {}
+        to_score: dict[str, TTCItem] = {}
+        for key, item in zip(keys, items):
+            cached = self.score_cache.get(key)
+            if cached is not None:
+                scores_by_key[key] = cached
+            elif key not in to_score:
+                to_score[key] = item
+
+        limiter = (asyncio.Semaphore(self.config.max_concurrency)
+                   if self.config.max_concurrency > 0 else contextlib.nullcontext())
+
+        async def _score(item: TTCItem) -> float:
+            async with limiter:
+                return await self.score_single(original_prompt=original_prompt,
+                                               agent_context=agent_context,
+                                               planning_item=item)
+
+        # Gather the remaining scores concurrently, bounded by max_concurrency
+        scores = await asyncio.gather(*(_score(item) for item in to_score.values()))
+        for key, score in zip(to_score, scores):
+            scores_by_key[key] = score
+            self.score_cache.put(key, score)
+
+        logger.debug("Scored %d of %d planning items (%d reused): %s",
+                     len(to_score),
+                     len(items),
+                     len(items) - len(to_score),
+                     scores)
 
         # Set the score on each planning item for reference
-        for idx, score in enumerate(scores):
-            items[idx].score = score
+        for key, item in zip(keys, items):
+            item.score = scores_by_key[key]
 
         return items
 
@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import typing
+from collections import OrderedDict
+
+
+class ScoreCache:
+    """
+    Bounded LRU of candidate scores, keyed by a digest of the text that was scored.
+
+    Best-of-N style pipelines frequently produce identical candidates, especially on easy inputs. Caching scores
+    lets duplicates reuse an earlier score instead of issuing another scoring LLM call. A ``max_size`` of 0
+    disables caching.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._scores: OrderedDict[str, float] = OrderedDict()
+
+    @staticmethod
+    def make_key(*parts: typing.Any) -> str:
+        """
+        Build a cache key from the values that determine a score.
+
+        Args:
+            parts: The values the score depends on, for example the prompt and the candidate.
+
+        Returns:
+            str: A digest identifying the combination of ``parts``.
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(str(part).encode("utf-8"))
+            digest.update(b"\x1f")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> float | None:
+        score = self._scores.get(key)
+        if score is not None:
+            self._scores.move_to_end(key)
+        return score
+
+    def put(self, key: str, score: float) -> None:
+        if self.max_size <= 0:
+            return
+        self._scores[key] = score
+        self._scores.move_to_end(key)
+        while len(self._scores) > self.max_size:
+            self._scores.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._scores)
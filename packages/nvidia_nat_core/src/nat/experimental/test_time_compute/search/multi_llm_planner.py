@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import asyncio
+import contextlib
 import logging
 import re
 
@@ -58,9 +59,14 @@ class MultiLLMPlanner(StrategyBase):
     def stage_type(self) -> StageTypeEnum:
         return StageTypeEnum.SEARCH
 
-    async def _generate_plan_for_temperature(self, llm, base_prompt: str, temperature: float) -> TTCItem:
+    async def _generate_plan_for_temperature(self,
+                                             llm,
+                                             base_prompt: str,
+                                             temperature: float,
+                                             limiter: contextlib.AbstractAsyncContextManager | None = None) -> TTCItem:
         bound_llm = llm.bind(temperature=temperature)
-        response = await bound_llm.ainvoke(base_prompt)
+        async with limiter or contextlib.nullcontext():
+            response = await bound_llm.ainvoke(base_prompt)
         cleaned = remove_r1_think_tags(response.content if hasattr(response, 'content') else str(response))
         # The plan is expected to start with "PLAN:" and all the text after it is the plan
         cleaned = re.sub(r'(?i)^\s*PLAN:\s*', '', cleaned).strip()
@@ -72,7 +78,10 @@ class MultiLLMPlanner(StrategyBase):
 
         return TTCItem(plan=cleaned)
 
-    async def _generate_plans_for_llm(self, llm, base_prompt: str) -> list[TTCItem]:
+    async def _generate_plans_for_llm(self,
+                                      llm,
+                                      base_prompt: str,
+                                      limiter: contextlib.AbstractAsyncContextManager | None = None) -> list[TTCItem]:
         if self.config.plans_per_llm == 1:
             temps = [self.config.min_temperature]
         else:
@@ -80,7 +89,7 @@ class MultiLLMPlanner(StrategyBase):
                 self.config.min_temperature + (i / (self.config.plans_per_llm - 1)) *
                 (self.config.max_temperature - self.config.min_temperature) for i in range(self.config.plans_per_llm)
             ]
-        tasks = [self._generate_plan_for_temperature(llm, base_prompt, temp) for temp in temps]
+        tasks = [self._generate_plan_for_temperature(llm, base_prompt, temp, limiter) for temp in temps]
         return await asyncio.gather(*tasks)
 
     async def ainvoke(self,
@@ -108,8 +117,9 @@ class MultiLLMPlanner(StrategyBase):
             "context": agent_context, "prompt": original_prompt
         })).to_string()
 
-        # Launch generation for each llm concurrently using the new helper method
-        tasks = [self._generate_plans_for_llm(llm, base_prompt) for llm in self.llms_bound]
+        # Launch generation for each llm concurrently, sharing one bound on in-flight calls across all LLMs
+        limiter = asyncio.Semaphore(self.config.max_concurrency) if self.config.max_concurrency > 0 else None
+        tasks = [self._generate_plans_for_llm(llm, base_prompt, limiter) for llm in self.llms_bound]
         results_nested = await asyncio.gather(*tasks)
 
         # Flatten the nested lists of TTCItem
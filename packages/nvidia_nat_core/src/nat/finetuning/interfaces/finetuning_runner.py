@@ -13,7 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import logging
+import time
 from abc import ABC
 from abc import abstractmethod
 from typing import Any
@@ -24,6 +26,7 @@ from nat.data_models.finetuning import FinetuneRunConfig
 from nat.data_models.finetuning import TrainerConfig
 from nat.data_models.finetuning import TrainingJobRef
 from nat.data_models.finetuning import TrainingJobStatus
+from nat.data_models.finetuning import TrainingStatusEnum
 from nat.data_models.finetuning import TrajectoryCollection
 from nat.finetuning.interfaces.trainer_adapter import TrainerAdapter
 from nat.finetuning.interfaces.trajectory_builder import TrajectoryBuilder
@@ -31,6 +34,24 @@ from nat.finetuning.interfaces.trajectory_builder import TrajectoryBuilder
 logger = logging.getLogger(__name__)
 
 
+def _pipeline_metrics(wall_time: float,
+                      rollout_intervals: list[tuple[float, float]],
+                      training_intervals: list[tuple[float, float]]) -> dict[str, float]:
+    rollout_time = sum(end - start for start, end in rollout_intervals)
+    training_time = sum(end - start for start, end in training_intervals)
+    overlap_time = sum(
+        max(0.0, min(r_end, t_end) - max(r_start, t_start)) for r_start, r_end in rollout_intervals
+        for t_start, t_end in training_intervals)
+    return {
+        "wall_time_seconds": wall_time,
+        "rollout_seconds": rollout_time,
+        "training_seconds": training_time,
+        "overlap_seconds": overlap_time,
+        "rollout_idle_seconds": max(0.0, wall_time - rollout_time),
+        "training_idle_seconds": max(0.0, wall_time - training_time),
+    }
+
+
 class Trainer(ABC):
     """
     Abstract interface for running finetuning workflows.
@@ -60,6 +81,9 @@ class Trainer(ABC):
         # Curriculum learning state
         self._curriculum_state = None
 
+        # Timing of the last pipelined run, see `run_pipelined`
+        self.pipeline_metrics: dict[str, float] = {}
+
     async def bind_components(self, trajectory_builder: TrajectoryBuilder, trainer_adapter: TrainerAdapter) -> None:
         """
         Bind the TrajectoryBuilder and TrainerAdapter components.
@@ -121,6 +145,111 @@ class Trainer(ABC):
         """
         raise NotImplementedError
 
+    async def collect_trajectories(self, epoch: int, run_id: str) -> TrajectoryCollection | None:
+        """
+        Collect the trajectories of an epoch without submitting them for training. Required by `run_pipelined`.
+
+        Args:
+            epoch: The current epoch number (0-indexed)
+            run_id: Unique identifier for this training run
+
+        Returns:
+            TrajectoryCollection | None: The trajectories to train on, or None if there are none
+        """
+        raise NotImplementedError("Pipelined training not implemented for this backend.")
+
+    async def submit_trajectories(self, trajectories: TrajectoryCollection) -> TrainingJobRef:
+        """
+        Submit collected trajectories for training through the TrainerAdapter.
+
+        Args:
+            trajectories: The trajectories to train on
+
+        Returns:
+            TrainingJobRef: Reference to the submitted training job
+        """
+        return await self.trainer_adapter.submit(trajectories)
+
+    async def run_pipelined(self, num_epochs: int, run_id: str, max_staleness: int = 1) -> list[TrainingJobStatus]:
+        """
+        Run the finetuning workflow for the specified number of epochs, collecting the trajectories of the next epochs
+        while the current epoch trains.
+
+        Trajectories are collected with `collect_trajectories` one epoch at a time, and each collection is submitted to
+        the TrainerAdapter once the previous training job completes. The trajectories of an epoch are only collected
+        while at most `max_staleness` collected epochs are waiting for or undergoing training. The time spent
+        collecting, training and doing both at once is stored in `pipeline_metrics`.
+
+        Args:
+            num_epochs: Number of epochs to train
+            run_id: Unique identifier for this training run
+            max_staleness: Number of weight updates the model used for collection may lag behind
+
+        Returns:
+            list[TrainingJobStatus]: Status of all training jobs
+        """
+        slots = asyncio.Semaphore(max_staleness + 1)
+        collected: asyncio.Queue[tuple[int, TrajectoryCollection | Exception | None]] = asyncio.Queue()
+        rollout_intervals: list[tuple[float, float]] = []
+        training_intervals: list[tuple[float, float]] = []
+
+        async def _collect_all() -> None:
+            for epoch in range(num_epochs):
+                await slots.acquire()
+                started = time.monotonic()
+                try:
+                    result = await self.collect_trajectories(epoch, run_id)
+                except Exception as e:
+                    result = e
+                rollout_intervals.append((started, time.monotonic()))
+                await collected.put((epoch, result))
+                if isinstance(result, Exception):
+                    return
+
+        run_started = time.monotonic()
+        collect_task = asyncio.create_task(_collect_all())
+        job_statuses: list[TrainingJobStatus] = []
+        try:
+            for _ in range(num_epochs):
+                epoch, result = await collected.get()
+                try:
+                    if isinstance(result, Exception):
+                        raise result
+                    if result is None or not result.trajectories:
+                        status = TrainingJobStatus(run_id=run_id,
+                                                   backend=self.trainer_config.type,
+                                                   status=TrainingStatusEnum.COMPLETED,
+                                                   message="No trajectories to train on",
+                                                   metadata={"epoch": epoch})
+                    else:
+                        started = time.monotonic()
+                        job_ref = await self.submit_trajectories(result)
+                        status = await self.trainer_adapter.wait_until_complete(job_ref)
+                        training_intervals.append((started, time.monotonic()))
+                except Exception as e:
+                    logger.error("Error during epoch %d: %s", epoch, e)
+                    status = TrainingJobStatus(run_id=run_id,
+                                               backend=self.trainer_config.type,
+                                               status=TrainingStatusEnum.FAILED,
+                                               message=str(e),
+                                               metadata={"epoch": epoch})
+
+                job_statuses.append(status)
+                if status.status == TrainingStatusEnum.FAILED:
+                    logger.error("Training failed at epoch %d: %s", epoch, status.message)
+                    break
+                slots.release()
+                logger.info("Completed epoch %d/%d", epoch + 1, num_epochs)
+        finally:
+            collect_task.cancel()
+            await asyncio.gather(collect_task, return_exceptions=True)
+            self.pipeline_metrics = _pipeline_metrics(time.monotonic() - run_started,
+                                                      rollout_intervals,
+                                                      training_intervals)
+            logger.info("Pipelined training metrics: %s", self.pipeline_metrics)
+
+        return job_statuses
+
     @abstractmethod
     async def get_metrics(self, run_id: str) -> dict[str, Any]:
         """
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import json
 import logging
 import os
@@ -32,6 +33,7 @@ from pydantic import BaseModel
 from sqlalchemy import DateTime
 from sqlalchemy import String
 from sqlalchemy import and_
+from sqlalchemy import or_
 from sqlalchemy import select
 from sqlalchemy import update
 from sqlalchemy.ext.asyncio import async_scoped_session
@@ -44,6 +46,7 @@ from sqlalchemy.sql import expression as sa_expr
 from nat.front_ends.fastapi.async_jobs.dask_client_mixin import DaskClientMixin
 
 if typing.TYPE_CHECKING:
+    from dask.distributed import Future as DaskFuture
     from sqlalchemy.engine import Engine
     from sqlalchemy.ext.asyncio import AsyncEngine
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -133,6 +136,26 @@ class JobInfo(Base):
         return f"JobInfo(job_id={self.job_id}, status={self.status})"
 
 
+class _JobWatch:
+    """
+    Shared state for every client waiting on the same job: the latest known row, and an event that is set and
+    replaced each time that row changes.
+    """
+    __slots__ = ("job", "changed", "waiters")
+
+    def __init__(self, job: JobInfo):
+        self.job = job
+        self.changed = asyncio.Event()
+        self.waiters = 0
+
+    def update(self, job: JobInfo) -> None:
+        if (job.status, job.updated_at) == (self.job.status, self.job.updated_at):
+            return
+        self.job = job
+        changed, self.changed = self.changed, asyncio.Event()
+        changed.set()
+
+
 class JobStore(DaskClientMixin):
     """
     Tracks and manages jobs submitted to the Dask scheduler, along with persisting job metadata (JobInfo objects) in a
@@ -147,6 +170,13 @@ class JobStore(DaskClientMixin):
     db_url: str | None, optional, default=None
         The database URL to connect to, used when db_engine is not provided. Refer to:
         https://docs.sqlalchemy.org/en/20/core/engines.html#database-urls
+    status_poll_interval: float, optional, default=2.0
+        How often, in seconds, the rows of jobs that clients are waiting on are re-read in one batched query. Jobs
+        submitted by this process, and status updates made through this instance, wake waiting clients immediately;
+        the interval only bounds how late a status change made by another process (for example a Dask worker marking a
+        job as running) is noticed.
+    cleanup_page_size: int, optional, default=500
+        Number of finished jobs loaded per page by `cleanup_expired_jobs`.
     """
 
     MIN_EXPIRY = 600  # 10 minutes
@@ -161,8 +191,17 @@ class JobStore(DaskClientMixin):
         scheduler_address: str,
         db_engine: "AsyncEngine | None" = None,
         db_url: str | None = None,
+        status_poll_interval: float = 2.0,
+        cleanup_page_size: int = 500,
     ):
         self._scheduler_address = scheduler_address
+        self._status_poll_interval = status_poll_interval
+        self._cleanup_page_size = cleanup_page_size
+
+        # Clients waiting on job status changes, keyed by job ID, and the single task that refreshes them
+        self._job_watches: dict[str, _JobWatch] = {}
+        self._watch_task: asyncio.Task | None = None
+        self._refresh_requested: asyncio.Event | None = None
 
         if db_engine is None:
             if db_url is None:
@@ -296,9 +335,14 @@ class JobStore(DaskClientMixin):
         # Store the future in a variable, this allows us to potentially cancel the future later if needed
         future_var = Variable(name=job_id, client=self.dask_client)
         future_var.set(future, timeout="5 s")
+
+        # Wake any clients waiting on this job as soon as it finishes, rather than on the next status poll
+        completion = self._wrap_dask_future(future)
+        completion.add_done_callback(lambda _: self._request_status_refresh())
+
         if sync_timeout > 0:
             try:
-                future.result(timeout=sync_timeout)
+                await asyncio.wait_for(asyncio.shield(completion), timeout=sync_timeout)
                 job = await self.get_job(job_id)
                 assert job is not None, "Job should exist after future result"
                 return (job_id, job)
@@ -309,6 +353,42 @@ class JobStore(DaskClientMixin):
 
         return (job_id, None)
 
+    @staticmethod
+    def _wrap_dask_future(future: "DaskFuture") -> asyncio.Future:
+        """
+        Return an asyncio future that resolves with None once a Dask future has finished, or with its error if it
+        failed, without blocking the event loop.
+
+        The Dask client is synchronous, and waiting on the Dask future from the event loop would block it. Instead,
+        Dask runs the done callback on its own callback thread, and the outcome is handed back to the event loop. The
+        result of the job is not fetched, since it is stored in the job store by the job itself, and fetching it would
+        copy every job's output into this process.
+        """
+        loop = asyncio.get_running_loop()
+        completion = loop.create_future()
+
+        def _resolve(error: BaseException | None = None):
+            if completion.done():
+                return
+            if error is not None:
+                completion.set_exception(error)
+            else:
+                completion.set_result(None)
+
+        def _on_done(done_future: "DaskFuture"):
+            error = None
+            if done_future.status != "finished":
+                try:
+                    error = done_future.exception()
+                except BaseException as e:  # noqa: BLE001 - any outcome, including cancellation, completes the wait
+                    error = e
+            loop.call_soon_threadsafe(_resolve, error)
+
+        future.add_done_callback(_on_done)
+        # Nobody may ever await the completion; retrieve failures so they are not reported as unhandled
+        completion.add_done_callback(lambda f: f.cancelled() or f.exception())
+        return completion
+
     async def update_status(self,
                             job_id: str,
                             status: str | JobStatus,
@@ -361,6 +441,98 @@ class JobStore(DaskClientMixin):
 
             job.output = output
 
+        self._request_status_refresh()
+
+    async def wait_for_status_change(self,
+                                     job_id: str,
+                                     *,
+                                     timeout: float,
+                                     last_status: str | JobStatus | None = None) -> JobInfo | None:
+        """
+        Wait for a job to leave a given status, for long-polling clients.
+
+        Returns as soon as the job's status differs from `last_status`, or immediately if the job has already
+        finished. Waiting clients do not query the database themselves: all watched jobs are refreshed together by a
+        single background task, in one query, whenever a job submitted by this process completes, when this instance
+        updates a job, and every `status_poll_interval` seconds otherwise.
+
+        Parameters
+        ----------
+        job_id : str
+            The unique identifier of the job to wait on.
+        timeout : float
+            The maximum number of seconds to wait.
+        last_status : str | JobStatus | None, optional, default=None
+            The status the client last saw. Defaults to the job's current status, waiting for its next change.
+
+        Returns
+        -------
+        JobInfo or None
+            The latest job info, which still has `last_status` if the timeout expired, or None if the job does not
+            exist.
+        """
+        job = await self.get_job(job_id)
+        if job is None:
+            return None
+
+        baseline = JobStatus(last_status or job.status)
+        if job.status != baseline or job.status not in self.ACTIVE_STATUS or timeout <= 0:
+            return job
+
+        watch = self._job_watches.get(job_id)
+        if watch is None:
+            watch = self._job_watches[job_id] = _JobWatch(job)
+        else:
+            # The watch may not have been refreshed since the job last changed, the row just read is more recent
+            watch.update(job)
+        watch.waiters += 1
+        self._ensure_watch_task()
+
+        try:
+            async with asyncio.timeout(timeout):
+                while watch.job.status == baseline and watch.job.status in self.ACTIVE_STATUS:
+                    await watch.changed.wait()
+        except TimeoutError:
+            pass
+        finally:
+            watch.waiters -= 1
+            if watch.waiters == 0 and self._job_watches.get(job_id) is watch:
+                del self._job_watches[job_id]
+
+        return watch.job
+
+    def _request_status_refresh(self) -> None:
+        if self._refresh_requested is not None and self._job_watches:
+            self._refresh_requested.set()
+
+    def _ensure_watch_task(self) -> None:
+        if self._watch_task is None or self._watch_task.done():
+            self._refresh_requested = asyncio.Event()
+            self._watch_task = asyncio.create_task(self._watch_jobs(), name="job_store_status_watch")
+
+    async def _watch_jobs(self) -> None:
+        """Refresh every watched job in one query per wake-up, until no clients are waiting."""
+        assert self._refresh_requested is not None
+        while self._job_watches:
+            try:
+                await asyncio.wait_for(self._refresh_requested.wait(), timeout=self._status_poll_interval)
+            except TimeoutError:
+                pass
+            self._refresh_requested.clear()
+
+            job_ids = list(self._job_watches)
+            try:
+                async with self.session() as session:
+                    jobs = (await session.scalars(select(JobInfo).where(JobInfo.job_id.in_(job_ids)))).all()
+            except Exception:
+                logger.exception("Failed to refresh the status of %d watched job(s)", len(job_ids))
+                continue
+
+            for job in jobs:
+                watch = self._job_watches.get(job.job_id)
+                if watch is not None:
+                    watch.update(job)
+
     async def get_all_jobs(self) -> list[JobInfo]:
         """
         Retrieve all jobs from the job store.
@@ -493,68 +665,103 @@ class JobStore(DaskClientMixin):
 
         Updated_at is used instead of created_at to determine the most recent job. This is because jobs may not be
         processed in the order they are created.
-        """
-        from dask.distributed import Future
-        from dask.distributed import Variable
 
+        Finished jobs are read `cleanup_page_size` rows at a time, and each page is expired in its own transaction.
+        Removing output files and cancelling Dask futures are blocking operations, so they run in a worker thread
+        rather than on the event loop.
+        """
         logger.info("Starting cleanup of expired jobs")
         now = datetime.now(UTC)
 
-        stmt = select(JobInfo).where(
-            and_(JobInfo.is_expired == sa_expr.false(),
-                 JobInfo.status.not_in(self.ACTIVE_STATUS))).order_by(JobInfo.updated_at.desc())
+        # Only the columns needed to decide on expiry are loaded; outputs can be large
+        columns = (JobInfo.job_id, JobInfo.status, JobInfo.updated_at, JobInfo.expiry_seconds, JobInfo.output_path)
         # Filter out active jobs
-        async with self.session() as session:
-            finished_jobs = (await session.execute(stmt)).scalars().all()
+        base_stmt = (select(*columns).where(
+            and_(JobInfo.is_expired == sa_expr.false(), JobInfo.status.not_in(self.ACTIVE_STATUS))).order_by(
+                JobInfo.updated_at.desc(), JobInfo.job_id.desc()).limit(self._cleanup_page_size))
+
+        num_expired = 0
+        cursor: tuple[datetime, str] | None = None
+        is_first_page = True
+        while True:
+            stmt = base_stmt
+            if cursor is not None:
+                # Keyset pagination, stable while rows from earlier pages are being marked as expired
+                stmt = stmt.where(
+                    or_(JobInfo.updated_at < cursor[0],
+                        and_(JobInfo.updated_at == cursor[0], JobInfo.job_id < cursor[1])))
+            async with self.session() as session:
+                page = (await session.execute(stmt)).all()
+            if not page:
+                break
+            cursor = (page[-1].updated_at, page[-1].job_id)
 
             # Always keep the most recent finished job
-            jobs_to_check = finished_jobs[1:]
-
-            expired_ids = []
-            for job in jobs_to_check:
-                expires_at = self.get_expires_at(job)
-                if expires_at and now > expires_at:
-                    expired_ids.append(job.job_id)
-                    # cleanup output dir if present
-                    if job.output_path:
-                        logger.info("Cleaning up output directory for job %s at %s", job.job_id, job.output_path)
-                        # If it is a file remove it
-                        if os.path.isfile(job.output_path):
-                            os.remove(job.output_path)
-                        # If it is a directory remove it
-                        elif os.path.isdir(job.output_path):
-                            shutil.rmtree(job.output_path)
-
-            num_expired = len(expired_ids)
-            if num_expired > 0:
-                successfully_expired = []
-                for job_id in expired_ids:
-                    var = None
-                    try:
-                        var = Variable(name=job_id, client=self.dask_client)
-                        try:
-                            future = var.get(timeout=5)
-                            if isinstance(future, Future):
-                                self.dask_client.cancel([future], force=True)
+            jobs_to_check = page[1:] if is_first_page else page
+            is_first_page = False
 
-                        except TimeoutError:
-                            pass
+            expired = [job for job in jobs_to_check if (expires_at := self.get_expires_at(job)) and now > expires_at]
+            if expired:
+                num_expired += len(expired)
+                successfully_expired = await asyncio.to_thread(self._release_expired_jobs, expired)
+                if successfully_expired:
+                    async with self.session() as session:
+                        await session.execute(
+                            update(JobInfo).where(JobInfo.job_id.in_(successfully_expired)).values(is_expired=True))
 
-                        successfully_expired.append(job_id)
-                    except Exception:
-                        logger.exception("Failed to expire %s", job_id)
+            if len(page) < self._cleanup_page_size:
+                break
+
+        return num_expired
+
+    def _release_expired_jobs(self, jobs: list[typing.Any]) -> list[str]:
+        """
+        Remove output files and cancel the Dask futures of expired jobs. This blocks, and is run in a worker thread.
+
+        Returns
+        -------
+        list[str]
+            The IDs of the jobs that were released and can be marked as expired.
+        """
+        from dask.distributed import Future
+        from dask.distributed import Variable
+
+        for job in jobs:
+            # cleanup output dir if present
+            if job.output_path:
+                logger.info("Cleaning up output directory for job %s at %s", job.job_id, job.output_path)
+                # If it is a file remove it
+                if os.path.isfile(job.output_path):
+                    os.remove(job.output_path)
+                # If it is a directory remove it
+                elif os.path.isdir(job.output_path):
+                    shutil.rmtree(job.output_path)
+
+        successfully_expired = []
+        for job in jobs:
+            var = None
+            try:
+                var = Variable(name=job.job_id, client=self.dask_client)
+                try:
+                    future = var.get(timeout=5)
+                    if isinstance(future, Future):
+                        self.dask_client.cancel([future], force=True)
+
+                except TimeoutError:
+                    pass
 
-                    finally:
-                        if var is not None:
-                            try:
-                                var.delete()
-                            except Exception:
-                                logger.exception("Failed to delete variable %s", job_id)
+                successfully_expired.append(job.job_id)
+            except Exception:
+                logger.exception("Failed to expire %s", job.job_id)
 
-                await session.execute(
-                    update(JobInfo).where(JobInfo.job_id.in_(successfully_expired)).values(is_expired=True))
+            finally:
+                if var is not None:
+                    try:
+                        var.delete()
+                    except Exception:
+                        logger.exception("Failed to delete variable %s", job.job_id)
 
-            return num_expired
+        return successfully_expired
 
 
 def get_db_engine(db_url: str | None = None, echo: bool = False, use_async: bool = True) -> "Engine | AsyncEngine":
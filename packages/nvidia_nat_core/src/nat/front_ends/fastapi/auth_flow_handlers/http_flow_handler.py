@@ -37,6 +37,7 @@ from nat.data_models.interactive_http import StreamOAuthEvent
 if typing.TYPE_CHECKING:
     from nat.front_ends.fastapi.auth_flow_handlers.websocket_flow_handler import FlowState
     from nat.front_ends.fastapi.execution_store import ExecutionStore
+    from nat.front_ends.fastapi.execution_store import PendingOAuth
 
 logger = logging.getLogger(__name__)
 
@@ -163,6 +164,30 @@ class HTTPAuthenticationFlowHandler(FlowHandlerBase):
         except (OAuthError, ValueError, TypeError) as e:
             raise RuntimeError(f"Error creating OAuth authorization URL: {e}") from e
 
+    @staticmethod
+    async def _wait_for_token(
+        config: OAuth2AuthCodeFlowProviderConfig,
+        state: str,
+        flow_state: "FlowState",
+        pending_oauth: "PendingOAuth",
+    ) -> dict[str, typing.Any]:
+        """
+        Wait for the redirect_uri endpoint of this process to resolve the token. When the execution store is shared
+        with other processes, the redirect may instead reach another process, which forwards it through the store;
+        the code is then exchanged for a token here, where the PKCE verifier is known.
+        """
+        await asyncio.wait((flow_state.future, pending_oauth.redirect), return_when=asyncio.FIRST_COMPLETED)
+        if flow_state.future.done():
+            return flow_state.future.result()
+
+        try:
+            return await flow_state.client.fetch_token(url=config.token_url,
+                                                       authorization_response=pending_oauth.redirect.result(),
+                                                       code_verifier=flow_state.verifier,
+                                                       state=state)
+        except OAuthError as e:
+            raise RuntimeError(f"Authorization server rejected request: {e.error} ({e.description})") from e
+
     async def _handle_oauth2_auth_code_flow(
         self,
         config: OAuth2AuthCodeFlowProviderConfig,
@@ -195,7 +220,7 @@ class HTTPAuthenticationFlowHandler(FlowHandlerBase):
 
         try:
             # Publish to execution store
-            await ctx.store.set_oauth_required(
+            pending_oauth = await ctx.store.set_oauth_required(
                 execution_id=ctx.execution_id,
                 auth_url=authorization_url,
                 oauth_state=state,
@@ -211,7 +236,8 @@ class HTTPAuthenticationFlowHandler(FlowHandlerBase):
                 await ctx.stream_queue.put(event)
 
             # Block until the redirect_uri endpoint resolves the token
-            token = await asyncio.wait_for(flow_state.future, timeout=self._auth_timeout_seconds)
+            token = await asyncio.wait_for(self._wait_for_token(config, state, flow_state, pending_oauth),
+                                           timeout=self._auth_timeout_seconds)
         except TimeoutError as exc:
             raise RuntimeError(f"Authentication flow timed out after {self._auth_timeout_seconds} seconds.") from exc
         finally:
@@ -17,6 +17,11 @@ In-memory execution store for HTTP HITL and OAuth interactive workflows.
 
 Each *execution* tracks a single background workflow run that may be paused
 while waiting for a human interaction response or an OAuth consent.
+
+The in-memory store is only visible to the process running the workflow. When
+the server runs several workers or replicas, use
+:class:`~nat.front_ends.fastapi.sql_execution_store.SQLExecutionStore`, which
+shares the execution state through a database.
 """
 
 import asyncio
@@ -31,6 +36,9 @@ from nat.data_models.interactive import HumanPrompt
 from nat.data_models.interactive import HumanResponse
 from nat.data_models.interactive_http import ExecutionStatus
 
+if typing.TYPE_CHECKING:
+    from nat.runtime.session import PerUserWorkflowCapacityError
+
 logger = logging.getLogger(__name__)
 
 # Default TTL for completed / failed executions (seconds).
@@ -51,6 +59,8 @@ class PendingOAuth:
     """State for an outstanding OAuth flow within an execution."""
     auth_url: str
     oauth_state: str
+    # Resolved with the redirect URL when the OAuth redirect reached another process
+    redirect: asyncio.Future[str] = field(default_factory=lambda: asyncio.get_running_loop().create_future())
     created_at: float = field(default_factory=time.monotonic)
 
 
@@ -64,6 +74,8 @@ class ExecutionRecord:
     # Result / error – populated on completion
     result: typing.Any = None
     error: str | None = None
+    # Set when the execution failed because no per-user workflow was available for the user
+    capacity_error: "PerUserWorkflowCapacityError | None" = None
 
     # Pending interaction (at most one at a time per execution)
     pending_interaction: PendingInteraction | None = None
@@ -99,8 +111,29 @@ class ExecutionStore:
         record = ExecutionRecord(execution_id=execution_id)
         async with self._lock:
             self._executions[execution_id] = record
+        await self._persist(record)
         return record
 
+    async def _persist(self, record: ExecutionRecord) -> None:
+        """
+        Called after every change to an execution, before the handler
+        awaiting ``first_outcome`` is notified. The in-memory store has
+        nothing to persist.
+        """
+
+    async def _persist_outcome(self, record: ExecutionRecord) -> None:
+        """
+        Persist an outcome of the execution and notify the handler awaiting
+        ``first_outcome``. A failure to persist is logged rather than raised,
+        so the handler is notified of the outcome held in memory either way.
+        """
+        try:
+            await self._persist(record)
+        except Exception:
+            logger.exception("Failed to persist the %s status of execution %s", record.status, record.execution_id)
+        finally:
+            record.first_outcome.set()
+
     # ------------------------------------------------------------------
     # Lookup
     # ------------------------------------------------------------------
@@ -136,7 +169,8 @@ class ExecutionStore:
                 raise KeyError(f"Execution {execution_id} not found")
             record.status = ExecutionStatus.INTERACTION_REQUIRED
             record.pending_interaction = pending
-            record.first_outcome.set()
+
+        await self._persist_outcome(record)
 
         return pending
 
@@ -145,15 +179,25 @@ class ExecutionStore:
         execution_id: str,
         auth_url: str,
         oauth_state: str,
-    ) -> None:
-        """Mark the execution as waiting for OAuth consent."""
+    ) -> PendingOAuth:
+        """
+        Mark the execution as waiting for OAuth consent.
+
+        Returns the ``PendingOAuth`` whose ``.redirect`` future is resolved
+        if the OAuth redirect is received by another process.
+        """
+        pending = PendingOAuth(auth_url=auth_url, oauth_state=oauth_state)
+
         async with self._lock:
             record = self._executions.get(execution_id)
             if record is None:
                 raise KeyError(f"Execution {execution_id} not found")
             record.status = ExecutionStatus.OAUTH_REQUIRED
-            record.pending_oauth = PendingOAuth(auth_url=auth_url, oauth_state=oauth_state)
-            record.first_outcome.set()
+            record.pending_oauth = pending
+
+        await self._persist_outcome(record)
+
+        return pending
 
     async def set_running(self, execution_id: str) -> None:
         """Transition back to running (after interaction / OAuth completes)."""
@@ -165,6 +209,8 @@ class ExecutionStore:
             record.pending_interaction = None
             record.pending_oauth = None
 
+        await self._persist(record)
+
     async def set_completed(self, execution_id: str, result: typing.Any) -> None:
         """Mark the execution as successfully completed."""
         async with self._lock:
@@ -174,7 +220,8 @@ class ExecutionStore:
             record.status = ExecutionStatus.COMPLETED
             record.result = result
             record.completed_at = time.monotonic()
-            record.first_outcome.set()
+
+        await self._persist_outcome(record)
 
     async def set_failed(self, execution_id: str, error: str) -> None:
         """Mark the execution as failed."""
@@ -185,7 +232,8 @@ class ExecutionStore:
             record.status = ExecutionStatus.FAILED
             record.error = error
             record.completed_at = time.monotonic()
-            record.first_outcome.set()
+
+        await self._persist_outcome(record)
 
     # ------------------------------------------------------------------
     # Interaction resolution
@@ -217,6 +265,17 @@ class ExecutionStore:
         # the background task resumes.
         pending.future.set_result(response)
 
+    async def forward_oauth_redirect(self, oauth_state: str, authorization_response: str) -> bool:
+        """
+        Hand an OAuth redirect over to the process running the execution
+        waiting for it, when the flow is not known to this process.
+
+        Returns ``True`` if an execution waiting for the redirect was found.
+        The in-memory store is not shared with other processes, so this
+        always returns ``False``.
+        """
+        return False
+
     # ------------------------------------------------------------------
     # Cleanup
     # ------------------------------------------------------------------
@@ -239,3 +298,6 @@ class ExecutionStore:
         """Explicitly remove an execution."""
         async with self._lock:
             self._executions.pop(execution_id, None)
+
+    async def close(self) -> None:
+        """Release any resources held by the store."""
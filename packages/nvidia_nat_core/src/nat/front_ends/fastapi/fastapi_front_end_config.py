@@ -218,6 +218,31 @@ class FastApiFrontEndConfig(FrontEndBaseConfig, name="fastapi"):
             description="Sets a maximum time in seconds for browsers to cache CORS responses.",
         )
 
+    class WebSocketSettings(BaseModel):
+        send_queue_size: int = Field(
+            default=1024,
+            ge=1,
+            description="Maximum number of outbound messages buffered per WebSocket connection.",
+        )
+        flush_interval: float = Field(
+            default=0.005,
+            ge=0,
+            description=("Time in seconds to wait for more messages before writing a frame, for clients that negotiate "
+                         "the batched sub-protocol. Set to 0 to only batch messages that are already queued."),
+        )
+        max_batch_size: int = Field(
+            default=64,
+            ge=1,
+            description="Maximum number of messages written in a single frame with the batched sub-protocol.",
+        )
+        slow_consumer_policy: typing.Literal["block", "drop_intermediate", "disconnect"] = Field(
+            default="block",
+            description=(
+                "What to do when a client reads slower than the workflow produces messages and the send queue is "
+                "full. 'block' pauses the workflow until there is room, 'drop_intermediate' discards intermediate "
+                "step messages (other messages still block), and 'disconnect' closes the connection."),
+        )
+
     root_path: str = Field(default="", description="The root path for the API")
     host: str = Field(default="localhost", description="Host to bind the server to")
     port: int = Field(default=8000, description="Port to bind the server to", ge=0, le=65535)
@@ -231,6 +256,21 @@ class FastApiFrontEndConfig(FrontEndBaseConfig, name="fastapi"):
         default=None,
         description=
         "SQLAlchemy database URL for storing async job metadata, if unset a temporary SQLite database is used.")
+    execution_store: typing.Literal["memory", "database"] = Field(
+        default="memory",
+        description=(
+            "Where the state of HTTP interactive executions (human-in-the-loop prompts and OAuth consents) is kept. "
+            "'memory' keeps it in the process running the workflow, so status requests, interaction responses and "
+            "OAuth redirects must reach that process. 'database' shares it through the async job store database, so "
+            "any worker or replica can serve them. Requires `db_url` to be set when running without Dask."),
+    )
+    execution_store_poll_interval: float = Field(
+        default=0.5,
+        gt=0.0,
+        description=("How often, in seconds, a worker running an execution waiting for an interaction response or "
+                     "an OAuth redirect checks whether another worker received it. Only used when `execution_store` "
+                     "is 'database'."),
+    )
     max_running_async_jobs: int = Field(
         default=10,
         description=(
@@ -263,6 +303,8 @@ class FastApiFrontEndConfig(FrontEndBaseConfig, name="fastapi"):
             "scheduler_address is `None` and a local Dask cluster is created. When set to 0 the value uses the Dask "
             "default."))
     step_adaptor: StepAdaptorConfig = StepAdaptorConfig()
+    websocket: WebSocketSettings = Field(default_factory=WebSocketSettings,
+                                         description="Outbound message handling for WebSocket connections.")
 
     workflow: typing.Annotated[EndpointBase, Field(description="Endpoint for the default workflow.")] = EndpointBase(
         method="POST",
@@ -26,12 +26,14 @@ from fastapi import FastAPI
 from fastapi import Request
 from fastapi import Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
 from nat.builder.evaluator import EvaluatorInfo
 from nat.builder.workflow_builder import WorkflowBuilder
 from nat.builder.workflow_builder import WorkflowEvalBuilderBase
 from nat.data_models.config import Config
+from nat.runtime.session import PerUserWorkflowCapacityError
 from nat.runtime.session import SessionManager
 from nat.utils.log_utils import setup_logging
 
@@ -45,6 +47,7 @@ from .routes.chat import add_chat_routes
 from .routes.execution import add_execution_routes
 from .routes.generate import add_generate_routes
 from .routes.health import add_health_route
+from .routes.monitor import add_metrics_route
 from .routes.monitor import add_monitor_route
 from .routes.static import add_static_files_route
 from .routes.websocket import add_websocket_routes
@@ -112,7 +115,7 @@ class FastApiFrontEndPluginWorkerBase(ABC):
 
                 yield
 
-                # The cleanup_session_managers and cleanup_evaluators methods only exist in the
+                # The cleanup_session_managers, cleanup_evaluators and cleanup_execution_store methods only exist in the
                 # FastApiFrontEndPluginWorker subclass, hence the hasattr checks
                 # Ensure session manager resources are cleaned up when the app shuts down
                 if hasattr(self, "cleanup_session_managers"):
@@ -122,6 +125,9 @@ class FastApiFrontEndPluginWorkerBase(ABC):
                 if hasattr(self, "cleanup_evaluators"):
                     await self.cleanup_evaluators()
 
+                if hasattr(self, "cleanup_execution_store"):
+                    await self.cleanup_execution_store()
+
             logger.debug("Closing NAT server from process %s", os.getpid())
 
         nat_app = FastAPI(lifespan=lifespan)
@@ -129,12 +135,21 @@ class FastApiFrontEndPluginWorkerBase(ABC):
         # Configure app CORS.
         self.set_cors_config(nat_app)
 
+        # Reject requests for new users when every per-user workflow is in use
+        nat_app.add_exception_handler(PerUserWorkflowCapacityError, self._per_user_capacity_error_handler)
+
         @nat_app.middleware("http")
         async def authentication_log_filter(request: Request, call_next: Callable[[Request], Awaitable[Response]]):
             return await self._suppress_authentication_logs(request, call_next)
 
         return nat_app
 
+    @staticmethod
+    async def _per_user_capacity_error_handler(_request: Request, exc: PerUserWorkflowCapacityError) -> Response:
+        return JSONResponse(content={"detail": str(exc)},
+                            status_code=503,
+                            headers={"Retry-After": str(exc.retry_after)})
+
     def set_cors_config(self, nat_app: FastAPI) -> None:
         """
         Set the cross origin resource sharing configuration.
@@ -220,7 +235,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
         self._eval_builder: WorkflowEvalBuilderBase | None = None
 
         # HTTP interactive execution store
-        self._execution_store = ExecutionStore()
+        self._execution_store = self._create_execution_store()
 
         # Re-create the HTTP flow handler with OAuth flow callbacks for interactive mode
         self._http_flow_handler = HTTPAuthenticationFlowHandler(
@@ -302,6 +317,26 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
         self._session_managers.clear()
         logger.info("All SessionManagers cleaned up")
 
+    def _create_execution_store(self) -> ExecutionStore:
+        """Create the HTTP interactive execution store selected in the front end configuration."""
+        if self.front_end_config.execution_store == "memory":
+            return ExecutionStore()
+
+        db_url = self._db_url or self.front_end_config.db_url
+        if db_url is None:
+            raise ValueError("A database URL is required for the 'database' execution store, set `db_url` in the "
+                             "front end configuration.")
+
+        from nat.front_ends.fastapi.sql_execution_store import SQLExecutionStore
+        return SQLExecutionStore(db_url=db_url, poll_interval=self.front_end_config.execution_store_poll_interval)
+
+    async def cleanup_execution_store(self):
+        """Release the resources of the HTTP interactive execution store on shutdown."""
+        try:
+            await self._execution_store.close()
+        except Exception as e:
+            logger.error(f"Error closing execution store: {e}")
+
     async def cleanup_evaluators(self):
         """Clean up evaluator resources on shutdown."""
         if self._eval_builder:
@@ -336,6 +371,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
         await add_authorization_route(self, app)
         await add_execution_routes(self, app)
         await add_monitor_route(self, app)
+        await add_metrics_route(self, app)
         await add_health_route(app)
         await add_static_files_route(self, app, builder)
 
@@ -40,6 +40,7 @@ from nat.front_ends.fastapi.response_helpers import generate_single_response
 from nat.front_ends.fastapi.response_helpers import generate_streaming_response
 from nat.front_ends.fastapi.response_helpers import generate_streaming_response_full_as_str
 from nat.front_ends.fastapi.step_adaptor import StepAdaptor
+from nat.runtime.session import PerUserWorkflowCapacityError
 from nat.runtime.session import SessionManager
 
 if typing.TYPE_CHECKING:
@@ -229,6 +230,10 @@ class HTTPInteractiveRunner:
                 ) as session:
                     result = await generate_single_response(payload, session, result_type=result_type)
                     await self._store.set_completed(record.execution_id, result)
+            except PerUserWorkflowCapacityError as exc:
+                logger.warning("Interactive execution %s rejected: %s", record.execution_id, exc)
+                record.capacity_error = exc
+                await self._store.set_failed(record.execution_id, str(exc))
             except Exception as exc:
                 logger.exception("Interactive execution %s failed", record.execution_id)
                 await self._store.set_failed(record.execution_id, str(exc))
@@ -248,7 +253,12 @@ class HTTPInteractiveRunner:
         error_log_message: str,
         passthrough_str_items: bool = False,
     ) -> AsyncGenerator[str]:
-        """Shared streaming orchestration for interactive HTTP endpoints."""
+        """
+        Shared streaming orchestration for interactive HTTP endpoints.
+
+        Raises ``PerUserWorkflowCapacityError`` before yielding anything if
+        no per-user workflow is available for the user.
+        """
         record = await self._store.create_execution()
 
         # Queue used by the HITL / OAuth callbacks to inject events
@@ -278,6 +288,8 @@ class HTTPInteractiveRunner:
                                 message=str(exc),
                                 details=type(exc).__name__,
                             ))
+            except PerUserWorkflowCapacityError as exc:
+                await stream_queue.put(exc)
             except Exception as exc:
                 logger.exception(error_log_message)
                 await stream_queue.put(
@@ -296,6 +308,8 @@ class HTTPInteractiveRunner:
                 item = await stream_queue.get()
                 if item is None:
                     break
+                if isinstance(item, PerUserWorkflowCapacityError):
+                    raise item
                 if isinstance(item, ResponseSerializable):
                     yield item.get_stream_data()
                 elif isinstance(item, Error):
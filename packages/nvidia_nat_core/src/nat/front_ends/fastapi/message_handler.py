@@ -61,6 +61,8 @@ from nat.data_models.user_info import UserInfo
 from nat.front_ends.fastapi.message_validator import MessageValidator
 from nat.front_ends.fastapi.response_helpers import generate_streaming_response
 from nat.front_ends.fastapi.step_adaptor import StepAdaptor
+from nat.front_ends.fastapi.websocket_sender import WebSocketSender
+from nat.front_ends.fastapi.websocket_sender import negotiate_subprotocol
 from nat.runtime.session import SessionManager
 from nat.runtime.user_manager import UserManager
 
@@ -105,6 +107,9 @@ class WebSocketMessageHandler:
 
         self._flow_handler: FlowHandlerBase | None = None
 
+        # Outbound message queue, created once the connection is accepted
+        self._sender: WebSocketSender | None = None
+
         self._schema_output_mapping: dict[str, type[BaseModel] | type[None]] = {
             WorkflowSchemaType.GENERATE: self._session_manager.get_workflow_single_output_schema(),
             WorkflowSchemaType.CHAT: ChatResponse,
@@ -139,8 +144,9 @@ class WebSocketMessageHandler:
         if not disconnected_handler:
             return
 
-        # Swap socket on disconnected handler so its running workflow can send through new connection
+        # Swap socket and sender on disconnected handler so its running workflow can send through new connection
         disconnected_handler._socket = self._socket
+        disconnected_handler._sender = self._sender
 
         # Copy disconnected handler's state so this handler can receive and process messages
         self._conversation_id = disconnected_handler._conversation_id
@@ -168,12 +174,23 @@ class WebSocketMessageHandler:
                                                 status=WebSocketMessageStatus.IN_PROGRESS)
 
     async def __aenter__(self) -> "WebSocketMessageHandler":
-        await self._socket.accept()
+        subprotocol = negotiate_subprotocol(self._socket)
+        await self._socket.accept(subprotocol=subprotocol)
+        self._sender = WebSocketSender(self._socket, self._worker.front_end_config.websocket, subprotocol=subprotocol)
+        self._sender.start()
         await self._restore_execution_state()
         return self
 
     async def __aexit__(self, exc_type, exc_value, traceback) -> None:
-        pass
+        if self._sender is not None:
+            await self._sender.aclose()
+
+    async def _send_message(self, message: BaseModel) -> None:
+        """Send a message through the connection's outbound queue, or directly if there is none."""
+        if self._sender is not None:
+            await self._sender.send(message)
+        else:
+            await self._socket.send_json(message.model_dump())
 
     async def _run_preflight_auth(self) -> None:
         """Authenticate all providers with ``preflight_auth=True`` at WebSocket connect time."""
@@ -192,11 +209,11 @@ class WebSocketMessageHandler:
                         await provider.authenticate()
                     except Exception:
                         logger.exception("Preflight auth failed for provider '%s'", name)
-                        await self._socket.send_json(
+                        await self._send_message(
                             Error(
                                 code=ErrorTypes.USER_AUTH_ERROR,
                                 message=f"Preflight authentication failed for provider '{name}'",
-                            ).model_dump())
+                            ))
 
     async def run(self) -> None:
         """
@@ -264,7 +281,7 @@ class WebSocketMessageHandler:
                     details=str(exc),
                 ),
             )
-        await self._socket.send_json(response.model_dump())
+        await self._send_message(response)
 
     async def _process_websocket_user_interaction_response_message(
             self, user_content: WebSocketUserInteractionResponseMessage) -> TextContent:
@@ -425,7 +442,7 @@ class WebSocketMessageHandler:
 
         finally:
             if (message is not None):
-                await self._socket.send_json(message.model_dump())
+                await self._send_message(message)
 
     async def human_interaction_callback(self, prompt: InteractionPrompt) -> HumanResponse:
         """
@@ -21,6 +21,7 @@ from typing import cast
 
 from fastapi import FastAPI
 from fastapi import HTTPException
+from fastapi import Query
 from fastapi import Request
 from fastapi import Response
 from pydantic import BaseModel
@@ -95,8 +96,21 @@ def post_async_generation(*, worker: Any, session_manager: SessionManager, reque
 
 def get_async_job_status(*, worker: Any, session_manager: SessionManager):
     """Build async generation status GET handler."""
+    from nat.front_ends.fastapi.async_jobs.job_store import JobStatus
 
-    async def _get_async_job_status(job_id: str, http_request: Request):
+    async def _get_async_job_status(
+        job_id: str,
+        http_request: Request,
+        wait: float = Query(default=0,
+                            ge=0,
+                            le=300,
+                            description="Long-poll: wait up to this many seconds for the job status to change "
+                            "before responding."),
+        status: JobStatus | None = Query(default=None,
+                                         description="The status the client last saw; with `wait`, the response is "
+                                         "sent as soon as the job's status differs from it. Defaults to the current "
+                                         "status."),
+    ):
         logger.info("Getting status for job %s", job_id)
         async with session_manager.session(http_connection=http_request):
             job = await worker._job_store.get_job(job_id)
@@ -104,8 +118,13 @@ def get_async_job_status(*, worker: Any, session_manager: SessionManager):
                 logger.warning("Job %s not found", job_id)
                 raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
 
-            logger.info("Found job %s with status %s", job_id, job.status)
-            return _job_status_to_response(worker, job)
+        if wait > 0:
+            # The wait happens outside the workflow session so that long-polling clients do not hold one open
+            last_status = status or job.status
+            job = await worker._job_store.wait_for_status_change(job_id, timeout=wait, last_status=last_status) or job
+
+        logger.info("Found job %s with status %s", job_id, job.status)
+        return _job_status_to_response(worker, job)
 
     return _get_async_job_status
 
@@ -168,7 +187,7 @@ async def add_async_generation_routes(
         endpoint=get_async_job_status(worker=worker, session_manager=session_manager),
         methods=["GET"],
         response_model=AsyncGenerationStatusResponse,
-        description="Get the status of an async job",
+        description="Get the status of an async job, optionally long-polling for a status change",
         responses={
             404: {
                 "description": "Job not found"
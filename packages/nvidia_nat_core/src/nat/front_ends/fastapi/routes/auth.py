@@ -39,10 +39,17 @@ async def add_authorization_route(worker: "FastApiFrontEndPluginWorker", app: Fa
         state = request.query_params.get("state")
 
         async with worker._outstanding_flows_lock:
-            if not state or state not in worker._outstanding_flows:
-                return HTMLResponse("Invalid state. Please restart the authentication process.", status_code=400)
+            flow_state = worker._outstanding_flows.get(state) if state else None
 
-            flow_state = worker._outstanding_flows[state]
+        if flow_state is None:
+            # The flow may have been started by another worker sharing the execution store
+            if state and await worker._execution_store.forward_oauth_redirect(state, str(request.url)):
+                return HTMLResponse(content=AUTH_REDIRECT_SUCCESS_HTML,
+                                    status_code=200,
+                                    headers={
+                                        "Content-Type": "text/html; charset=utf-8", "Cache-Control": "no-cache"
+                                    })
+            return HTMLResponse("Invalid state. Please restart the authentication process.", status_code=400)
 
         config = flow_state.config
         verifier = flow_state.verifier
@@ -15,6 +15,7 @@
 """Shared FastAPI route helpers for HTTP generate/chat endpoints."""
 
 import logging
+from collections.abc import AsyncGenerator
 from typing import Any
 
 from fastapi import Body
@@ -30,6 +31,7 @@ from nat.data_models.interactive_http import ExecutionAcceptedResponse
 from nat.data_models.interactive_http import ExecutionStatus
 from nat.front_ends.fastapi.response_helpers import generate_single_response
 from nat.front_ends.fastapi.response_helpers import generate_streaming_response_as_str
+from nat.runtime.session import PerUserWorkflowCapacityError
 from nat.runtime.session import SessionManager
 
 from .execution import build_accepted_response
@@ -94,6 +96,26 @@ def _build_interactive_runner(worker: Any, session_manager: SessionManager):
     )
 
 
+async def _interactive_streaming_response(content: AsyncGenerator[str]) -> StreamingResponse:
+    """
+    Start the SSE response of an interactive streaming handler once the first chunk is available, so a request
+    rejected because no per-user workflow is available fails with 503 instead of an error event in a 200 response.
+    """
+    try:
+        first_chunk = await anext(content)
+    except StopAsyncIteration:
+        first_chunk = None
+
+    async def _chunks() -> AsyncGenerator[str]:
+        if first_chunk is None:
+            return
+        yield first_chunk
+        async for chunk in content:
+            yield chunk
+
+    return StreamingResponse(headers={"Content-Type": "text/event-stream; charset=utf-8"}, content=_chunks())
+
+
 def _with_annotation(handler: Any, param_name: str, annotation: Any):
     annotations = dict(getattr(handler, "__annotations__", {}))
     annotations[param_name] = annotation
@@ -177,6 +199,8 @@ def post_single_endpoint(*,
                     add_context_headers_to_response(response)
                     return record.result
                 case ExecutionStatus.FAILED:
+                    if record.capacity_error is not None:
+                        raise record.capacity_error
                     add_context_headers_to_response(response)
                     return JSONResponse(
                         content=Error(
@@ -190,6 +214,8 @@ def post_single_endpoint(*,
                     response.status_code = 202
                     return build_accepted_response(record)
 
+        except PerUserWorkflowCapacityError:
+            raise
         except Exception as exc:
             logger.exception("Unhandled interactive workflow error")
             add_context_headers_to_response(response)
@@ -238,9 +264,8 @@ def post_streaming_endpoint(*,
 
     async def post_stream_interactive(request: Request, payload: Any = Body()):
         runner = _build_interactive_runner(worker, session_manager)
-        return StreamingResponse(
-            headers={"Content-Type": "text/event-stream; charset=utf-8"},
-            content=runner.streaming_generator(
+        return await _interactive_streaming_response(
+            runner.streaming_generator(
                 payload,
                 request,
                 streaming=streaming,
@@ -248,8 +273,7 @@ def post_streaming_endpoint(*,
                 result_type=result_type,
                 output_type=output_type,
                 wrap_output_in_payload=wrap_output_in_payload,
-            ),
-        )
+            ))
 
     async def post_stream(request: Request, payload: Any = Body()):
         auth_cb = worker._http_flow_handler.authenticate if worker._http_flow_handler else None
@@ -33,6 +33,7 @@ from .async_generation import add_async_generation_routes
 from .common_utils import RESPONSE_500
 from .common_utils import _build_interactive_runner
 from .common_utils import _interactive_response_model
+from .common_utils import _interactive_streaming_response
 from .common_utils import _with_annotation
 from .common_utils import get_single_endpoint
 from .common_utils import get_streaming_endpoint
@@ -74,17 +75,15 @@ def post_streaming_raw_endpoint(*,
 
     async def post_stream_interactive(request: Request, payload: Any = Body(), filter_steps: str | None = None):
         runner = _build_interactive_runner(worker, session_manager)
-        return StreamingResponse(
-            headers={"Content-Type": "text/event-stream; charset=utf-8"},
-            content=runner.streaming_generator_raw(
+        return await _interactive_streaming_response(
+            runner.streaming_generator_raw(
                 payload,
                 request,
                 streaming=streaming,
                 result_type=result_type,
                 output_type=output_type,
                 filter_steps=filter_steps,
-            ),
-        )
+            ))
 
     async def post_stream(request: Request, payload: Any = Body(), filter_steps: str | None = None):
         async with session_manager.session(http_connection=request) as session:
@@ -19,10 +19,15 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 
+from nat.runtime.metrics import HTTPConnectionPoolMonitorResponse
+from nat.runtime.metrics import PerUserBuilderPoolMetrics
 from nat.runtime.metrics import PerUserMetricsCollector
 from nat.runtime.metrics import PerUserMonitorResponse
 from nat.runtime.metrics import PerUserResourceUsage
+from nat.runtime.metrics import collect_http_connection_pool_metrics
+from nat.runtime.runtime_metrics import get_runtime_metrics
 
 if TYPE_CHECKING:
     from nat.front_ends.fastapi.fastapi_front_end_plugin_worker import FastApiFrontEndPluginWorker
@@ -31,14 +36,15 @@ logger = logging.getLogger(__name__)
 
 
 async def add_monitor_route(worker: "FastApiFrontEndPluginWorker", app: FastAPI):
-    """Add per-user monitoring endpoint when enabled."""
+    """Add per-user and HTTP connection pool monitoring endpoints when enabled."""
     if not worker._config.general.enable_per_user_monitoring:
-        logger.debug("Per-user monitoring disabled, skipping /monitor/users endpoint")
+        logger.debug("Per-user monitoring disabled, skipping /monitor endpoints")
         return
 
     async def get_per_user_metrics(user_id: str | None = None) -> PerUserMonitorResponse:
         """Get resource usage metrics for per-user workflows."""
         all_users: list[PerUserResourceUsage] = []
+        pools: list[PerUserBuilderPoolMetrics] = []
 
         for session_manager in worker._session_managers:
             if not session_manager.is_workflow_per_user:
@@ -52,11 +58,13 @@ async def add_monitor_route(worker: "FastApiFrontEndPluginWorker", app: FastAPI)
             else:
                 response = await collector.collect_all_metrics()
                 all_users.extend(response.users)
+                pools.extend(response.pools)
 
         return PerUserMonitorResponse(
             timestamp=datetime.now(),
             total_active_users=len(all_users),
             users=all_users,
+            pools=pools,
         )
 
     app.add_api_route(path="/monitor/users",
@@ -104,4 +112,62 @@ async def add_monitor_route(worker: "FastApiFrontEndPluginWorker", app: FastAPI)
                           }
                       })
 
-    logger.info("Added per-user monitoring endpoint at /monitor/users")
+    async def get_http_connection_pool_metrics() -> HTTPConnectionPoolMonitorResponse:
+        """Get utilization metrics for the HTTP connection pools shared by LLM and embedder clients."""
+        return collect_http_connection_pool_metrics()
+
+    app.add_api_route(path="/monitor/http_connection_pools",
+                      endpoint=get_http_connection_pool_metrics,
+                      methods=["GET"],
+                      response_model=HTTPConnectionPoolMonitorResponse,
+                      description="Get utilization metrics for shared HTTP connection pools",
+                      tags=["Monitoring"],
+                      responses={
+                          200: {
+                              "description": "Successfully retrieved HTTP connection pool metrics",
+                              "content": {
+                                  "application/json": {
+                                      "example": {
+                                          "timestamp":
+                                              "2025-12-16T10:30:00Z",
+                                          "pools": [{
+                                              "origin": "https://integrate.api.nvidia.com",
+                                              "is_async": True,
+                                              "http2": False,
+                                              "clients": 12,
+                                              "max_connections": 100,
+                                              "connections": 8,
+                                              "active_connections": 5,
+                                              "idle_connections": 3,
+                                              "queued_requests": 0
+                                          }]
+                                      }
+                                  }
+                              }
+                          },
+                          500: {
+                              "description": "Internal Server Error"
+                          }
+                      })
+
+    logger.info("Added per-user monitoring endpoints at /monitor/users and /monitor/http_connection_pools")
+
+
+async def add_metrics_route(worker: "FastApiFrontEndPluginWorker", app: FastAPI):
+    """Add the Prometheus metrics endpoint when runtime metrics are enabled."""
+    if not worker._config.general.enable_runtime_metrics:
+        logger.debug("Runtime metrics disabled, skipping /metrics endpoint")
+        return
+
+    async def get_metrics() -> PlainTextResponse:
+        """Get runtime latency histograms and counters in the Prometheus text format."""
+        return PlainTextResponse(get_runtime_metrics().render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+    app.add_api_route(path="/metrics",
+                      endpoint=get_metrics,
+                      methods=["GET"],
+                      response_class=PlainTextResponse,
+                      description="Get runtime latency histograms and counters in the Prometheus text format",
+                      tags=["Monitoring"])
+
+    logger.info("Added runtime metrics endpoint at /metrics")
@@ -32,11 +32,13 @@ from nat.data_models.interactive_http import ExecutionAcceptedResponse
 from nat.data_models.interactive_http import ExecutionStatus
 from nat.front_ends.fastapi.response_helpers import generate_single_response
 from nat.front_ends.fastapi.response_helpers import generate_streaming_response_as_str
+from nat.runtime.session import PerUserWorkflowCapacityError
 from nat.runtime.session import SessionManager
 
 from .common_utils import RESPONSE_500
 from .common_utils import _build_interactive_runner
 from .common_utils import _interactive_response_model
+from .common_utils import _interactive_streaming_response
 from .common_utils import add_context_headers_to_response
 from .execution import build_accepted_response
 
@@ -52,17 +54,15 @@ def post_openai_api_compatible_endpoint(*, worker: Any, session_manager: Session
         runner = _build_interactive_runner(worker, session_manager)
 
         if stream_requested:
-            return StreamingResponse(
-                headers={"Content-Type": "text/event-stream; charset=utf-8"},
-                content=runner.streaming_generator(
+            return await _interactive_streaming_response(
+                runner.streaming_generator(
                     payload,
                     request,
                     streaming=True,
                     step_adaptor=worker.get_step_adaptor(),
                     result_type=ChatResponseChunk,
                     output_type=ChatResponseChunk,
-                ),
-            )
+                ))
 
         response.headers["Content-Type"] = "application/json"
         try:
@@ -79,6 +79,8 @@ def post_openai_api_compatible_endpoint(*, worker: Any, session_manager: Session
                     add_context_headers_to_response(response)
                     return record.result
                 case ExecutionStatus.FAILED:
+                    if record.capacity_error is not None:
+                        raise record.capacity_error
                     add_context_headers_to_response(response)
                     return JSONResponse(
                         content=Error(
@@ -92,6 +94,8 @@ def post_openai_api_compatible_endpoint(*, worker: Any, session_manager: Session
                     response.status_code = 202
                     return build_accepted_response(record)
 
+        except PerUserWorkflowCapacityError:
+            raise
         except Exception as e:
             logger.exception("Unhandled interactive workflow error")
             add_context_headers_to_response(response)
@@ -0,0 +1,333 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Database-backed execution store for HTTP HITL and OAuth interactive workflows.
+
+The state of every execution is mirrored to a table of the async job store
+database, so any worker or replica of the server can report the status of an
+execution, accept an interaction response, or receive an OAuth redirect. The
+process running the workflow polls the table for the responses and redirects
+received by other processes, and resumes the workflow.
+"""
+
+import asyncio
+import json
+import logging
+import time
+import typing
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+
+from pydantic import TypeAdapter
+from pydantic_core import to_jsonable_python
+from sqlalchemy import DateTime
+from sqlalchemy import String
+from sqlalchemy import delete
+from sqlalchemy import or_
+from sqlalchemy import select
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+
+from nat.data_models.interactive import HumanPrompt
+from nat.data_models.interactive import HumanResponse
+from nat.data_models.interactive_http import ExecutionStatus
+from nat.front_ends.fastapi.async_jobs.job_store import Base
+from nat.front_ends.fastapi.async_jobs.job_store import get_db_engine
+from nat.front_ends.fastapi.execution_store import DEFAULT_EXECUTION_TTL
+from nat.front_ends.fastapi.execution_store import ExecutionRecord
+from nat.front_ends.fastapi.execution_store import ExecutionStore
+from nat.front_ends.fastapi.execution_store import PendingInteraction
+from nat.front_ends.fastapi.execution_store import PendingOAuth
+
+if typing.TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+_PROMPT_ADAPTER = TypeAdapter(HumanPrompt)
+_RESPONSE_ADAPTER = TypeAdapter(HumanResponse)
+
+
+class ExecutionInfo(Base):
+    """
+    SQLAlchemy model mirroring an :class:`ExecutionRecord`, along with the interaction response or OAuth redirect
+    received by a process other than the one running the execution.
+    """
+    __tablename__ = "execution_info"
+
+    execution_id: Mapped[str] = mapped_column(primary_key=True)
+    status: Mapped[ExecutionStatus] = mapped_column(String(20))
+    result: Mapped[str] = mapped_column(nullable=True)
+    error: Mapped[str] = mapped_column(nullable=True)
+    interaction_id: Mapped[str] = mapped_column(nullable=True)
+    interaction_prompt: Mapped[str] = mapped_column(nullable=True)
+    interaction_response: Mapped[str] = mapped_column(nullable=True)
+    auth_url: Mapped[str] = mapped_column(nullable=True)
+    oauth_state: Mapped[str] = mapped_column(nullable=True, index=True)
+    oauth_redirect: Mapped[str] = mapped_column(nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(UTC))
+    completed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True, index=True)
+
+    def __repr__(self):
+        return f"ExecutionInfo(execution_id={self.execution_id}, status={self.status})"
+
+
+class SQLExecutionStore(ExecutionStore):
+    """
+    Execution store sharing the state of executions with other processes through a database.
+
+    Records of executions running in this process are kept in memory as with :class:`ExecutionStore`, and written
+    to the database on every status change. Lookups of executions running in other processes, and interaction
+    responses and OAuth redirects for them, go through the database.
+
+    Parameters
+    ----------
+    db_engine: AsyncEngine | None, optional, default=None
+        The database engine, usually the engine of the async job store.
+    db_url: str | None, optional, default=None
+        The database URL to connect to, used when db_engine is not provided.
+    ttl_seconds: int, optional, default=600
+        Number of seconds completed and failed executions are kept for.
+    poll_interval: float, optional, default=0.5
+        How often, in seconds, the process running an execution waiting for an interaction response or an OAuth
+        redirect checks whether another process received it.
+    """
+
+    def __init__(self,
+                 db_engine: "AsyncEngine | None" = None,
+                 db_url: str | None = None,
+                 ttl_seconds: int = DEFAULT_EXECUTION_TTL,
+                 poll_interval: float = 0.5) -> None:
+        super().__init__(ttl_seconds=ttl_seconds)
+
+        self._owns_engine = db_engine is None
+        if db_engine is None:
+            if db_url is None:
+                raise ValueError("Either db_engine or db_url must be provided")
+
+            db_engine = get_db_engine(db_url, use_async=True)
+
+        self._db_engine = db_engine
+        self._session_maker = async_sessionmaker(db_engine, expire_on_commit=False)
+        self._poll_interval = poll_interval
+        self._table_created = False
+        self._poll_task: asyncio.Task | None = None
+        self._last_cleanup = time.monotonic()
+
+    async def _ensure_table(self) -> None:
+        if not self._table_created:
+            async with self._db_engine.begin() as conn:
+                await conn.run_sync(ExecutionInfo.__table__.create, checkfirst=True)
+            self._table_created = True
+
+    async def _persist(self, record: ExecutionRecord) -> None:
+        """Write the current state of a local execution, discarding any previously received response or redirect."""
+        interaction = record.pending_interaction
+        oauth = record.pending_oauth
+        row = ExecutionInfo(
+            execution_id=record.execution_id,
+            status=record.status,
+            result=json.dumps(to_jsonable_python(record.result))
+            if record.status == ExecutionStatus.COMPLETED else None,
+            error=record.error,
+            interaction_id=interaction.interaction_id if interaction is not None else None,
+            interaction_prompt=(json.dumps(to_jsonable_python(interaction.prompt))
+                                if interaction is not None else None),
+            interaction_response=None,
+            auth_url=oauth.auth_url if oauth is not None else None,
+            oauth_state=oauth.oauth_state if oauth is not None else None,
+            oauth_redirect=None,
+            updated_at=datetime.now(UTC),
+            completed_at=datetime.now(UTC) if record.completed_at is not None else None,
+        )
+        await self._ensure_table()
+        async with self._session_maker() as session:
+            async with session.begin():
+                await session.merge(row)
+
+    # ------------------------------------------------------------------
+    # Creation and lookup
+    # ------------------------------------------------------------------
+
+    async def create_execution(self) -> ExecutionRecord:
+        if time.monotonic() - self._last_cleanup > self._ttl_seconds / 2:
+            self._last_cleanup = time.monotonic()
+            await self.cleanup_expired()
+
+        return await super().create_execution()
+
+    async def get(self, execution_id: str) -> ExecutionRecord | None:
+        """Return the record of an execution, loading it from the database if it runs in another process."""
+        record = await super().get(execution_id)
+        if record is not None:
+            return record
+
+        await self._ensure_table()
+        async with self._session_maker() as session:
+            row = await session.get(ExecutionInfo, execution_id)
+        if row is None:
+            return None
+
+        record = ExecutionRecord(execution_id=row.execution_id,
+                                 status=ExecutionStatus(row.status),
+                                 result=json.loads(row.result) if row.result is not None else None,
+                                 error=row.error)
+        if row.interaction_id is not None:
+            record.pending_interaction = PendingInteraction(interaction_id=row.interaction_id,
+                                                            prompt=_PROMPT_ADAPTER.validate_json(
+                                                                row.interaction_prompt))
+        if row.oauth_state is not None:
+            record.pending_oauth = PendingOAuth(auth_url=row.auth_url, oauth_state=row.oauth_state)
+        return record
+
+    # ------------------------------------------------------------------
+    # Status transitions
+    # ------------------------------------------------------------------
+
+    async def set_interaction_required(self,
+                                       execution_id: str,
+                                       prompt: HumanPrompt,
+                                       interaction_id: str | None = None) -> PendingInteraction:
+        pending = await super().set_interaction_required(execution_id, prompt, interaction_id)
+        self._ensure_polling()
+        return pending
+
+    async def set_oauth_required(self, execution_id: str, auth_url: str, oauth_state: str) -> PendingOAuth:
+        pending = await super().set_oauth_required(execution_id, auth_url, oauth_state)
+        self._ensure_polling()
+        return pending
+
+    # ------------------------------------------------------------------
+    # Interaction and OAuth resolution
+    # ------------------------------------------------------------------
+
+    async def resolve_interaction(self, execution_id: str, interaction_id: str, response: HumanResponse) -> None:
+        """
+        Resolve a pending interaction. For executions running in another process, the response is written to the
+        database, and picked up by that process.
+
+        Raises ``KeyError`` if the execution or interaction does not exist.
+        Raises ``ValueError`` if the interaction has already been resolved.
+        """
+        if await super().get(execution_id) is not None:
+            await super().resolve_interaction(execution_id, interaction_id, response)
+            return
+
+        await self._ensure_table()
+        async with self._session_maker() as session:
+            async with session.begin():
+                stmt = (update(ExecutionInfo).where(ExecutionInfo.execution_id == execution_id,
+                                                    ExecutionInfo.interaction_id == interaction_id,
+                                                    ExecutionInfo.interaction_response.is_(None)).values(
+                                                        interaction_response=response.model_dump_json(),
+                                                        updated_at=datetime.now(UTC)))
+                result = await session.execute(stmt)
+                if result.rowcount:
+                    return
+                row = await session.get(ExecutionInfo, execution_id)
+
+        if row is None:
+            raise KeyError(f"Execution {execution_id} not found")
+        if row.interaction_id != interaction_id:
+            raise KeyError(f"Interaction {interaction_id} not found for execution {execution_id}")
+        raise ValueError(f"Interaction {interaction_id} has already been resolved")
+
+    async def forward_oauth_redirect(self, oauth_state: str, authorization_response: str) -> bool:
+        await self._ensure_table()
+        async with self._session_maker() as session:
+            async with session.begin():
+                stmt = (update(ExecutionInfo).where(ExecutionInfo.oauth_state == oauth_state,
+                                                    ExecutionInfo.status == ExecutionStatus.OAUTH_REQUIRED,
+                                                    ExecutionInfo.oauth_redirect.is_(None)).values(
+                                                        oauth_redirect=authorization_response,
+                                                        updated_at=datetime.now(UTC)))
+                result = await session.execute(stmt)
+        return bool(result.rowcount)
+
+    def _ensure_polling(self) -> None:
+        if self._poll_task is None or self._poll_task.done():
+            self._poll_task = asyncio.create_task(self._poll_forwarded())
+
+    async def _poll_forwarded(self) -> None:
+        """Resume local executions whose interaction response or OAuth redirect was received by another process."""
+        while True:
+            await asyncio.sleep(self._poll_interval)
+
+            async with self._lock:
+                waiting = {
+                    eid: record
+                    for eid, record in self._executions.items()
+                    if (record.pending_interaction is not None and not record.pending_interaction.future.done()) or (
+                        record.pending_oauth is not None and not record.pending_oauth.redirect.done())
+                }
+            if not waiting:
+                return
+
+            try:
+                async with self._session_maker() as session:
+                    rows = (await session.scalars(
+                        select(ExecutionInfo).where(
+                            ExecutionInfo.execution_id.in_(list(waiting)),
+                            or_(ExecutionInfo.interaction_response.is_not(None),
+                                ExecutionInfo.oauth_redirect.is_not(None))))).all()
+            except Exception:
+                logger.exception("Failed to check for forwarded interaction responses")
+                continue
+
+            for row in rows:
+                record = waiting[row.execution_id]
+                interaction = record.pending_interaction
+                if (row.interaction_response is not None and interaction is not None
+                        and interaction.interaction_id == row.interaction_id and not interaction.future.done()):
+                    interaction.future.set_result(_RESPONSE_ADAPTER.validate_json(row.interaction_response))
+                oauth = record.pending_oauth
+                if (row.oauth_redirect is not None and oauth is not None and oauth.oauth_state == row.oauth_state
+                        and not oauth.redirect.done()):
+                    oauth.redirect.set_result(row.oauth_redirect)
+
+    # ------------------------------------------------------------------
+    # Cleanup
+    # ------------------------------------------------------------------
+
+    async def cleanup_expired(self) -> int:
+        """Remove completed/failed executions older than TTL, from this process and the database."""
+        await super().cleanup_expired()
+
+        await self._ensure_table()
+        cutoff = datetime.now(UTC) - timedelta(seconds=self._ttl_seconds)
+        async with self._session_maker() as session:
+            async with session.begin():
+                result = await session.execute(delete(ExecutionInfo).where(ExecutionInfo.completed_at < cutoff))
+        if result.rowcount:
+            logger.debug("Deleted %d expired executions from the database", result.rowcount)
+        return result.rowcount or 0
+
+    async def remove(self, execution_id: str) -> None:
+        await super().remove(execution_id)
+        await self._ensure_table()
+        async with self._session_maker() as session:
+            async with session.begin():
+                await session.execute(delete(ExecutionInfo).where(ExecutionInfo.execution_id == execution_id))
+
+    async def close(self) -> None:
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            await asyncio.gather(self._poll_task, return_exceptions=True)
+            self._poll_task = None
+        if self._owns_engine:
+            await self._db_engine.dispose()
@@ -0,0 +1,202 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Buffered, per-connection outbound message writer for the WebSocket front end."""
+
+import asyncio
+import logging
+
+from fastapi import WebSocket
+from pydantic import BaseModel
+
+from nat.data_models.api_server import WebSocketMessageType
+from nat.front_ends.fastapi.fastapi_front_end_config import FastApiFrontEndConfig
+
+logger = logging.getLogger(__name__)
+
+# Sub-protocols a client can request in the `Sec-WebSocket-Protocol` header. With the default protocol every message is
+# sent as its own JSON text frame. With the batched protocol each text frame holds a JSON array of one or more messages,
+# so bursts of small updates such as intermediate steps and tokens are written together.
+JSON_SUBPROTOCOL = "nat.json"
+JSON_BATCH_SUBPROTOCOL = "nat.json.batch"
+SUPPORTED_SUBPROTOCOLS = (JSON_BATCH_SUBPROTOCOL, JSON_SUBPROTOCOL)
+
+# The close code used when a client is disconnected for reading too slowly (1013: "Try Again Later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+def negotiate_subprotocol(socket: WebSocket) -> str | None:
+    """
+    Select the sub-protocol for a connection from the ones offered by the client, in the client's order of preference.
+
+    Returns None when the client did not offer a supported sub-protocol, in which case the default protocol is used
+    and no sub-protocol is echoed back to the client.
+    """
+    for subprotocol in socket.scope.get("subprotocols", []):
+        if subprotocol in SUPPORTED_SUBPROTOCOLS:
+            return subprotocol
+    return None
+
+
+class WebSocketSender:
+    """
+    Decouples producing WebSocket messages from writing them to the socket.
+
+    Messages are serialized once, placed on a bounded queue and written by a single writer task, so a workflow
+    streaming to a slow client only waits on the socket when the queue is full, and what happens then is decided by
+    the configured slow consumer policy. Messages are always written in the order they were sent.
+
+    Parameters
+    ----------
+    socket : WebSocket
+        The accepted WebSocket to write to.
+    settings : FastApiFrontEndConfig.WebSocketSettings
+        Queue size, flush window and slow consumer policy.
+    subprotocol : str | None, optional, default=None
+        The negotiated sub-protocol, refer to `negotiate_subprotocol`.
+    """
+
+    def __init__(self,
+                 socket: WebSocket,
+                 settings: FastApiFrontEndConfig.WebSocketSettings,
+                 subprotocol: str | None = None):
+        self._socket = socket
+        self._settings = settings
+        self._batched = subprotocol == JSON_BATCH_SUBPROTOCOL
+
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=settings.send_queue_size)
+        self._writer_task: asyncio.Task | None = None
+        self._closed = asyncio.Event()
+        self._num_dropped = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._closed.is_set()
+
+    @property
+    def num_dropped(self) -> int:
+        """Number of messages discarded by the `drop_intermediate` slow consumer policy."""
+        return self._num_dropped
+
+    def start(self) -> None:
+        if self._writer_task is None:
+            self._writer_task = asyncio.create_task(self._write_messages(), name="websocket_sender")
+
+    async def send(self, message: BaseModel) -> None:
+        """
+        Queue a message to be written to the socket. Messages sent after the connection is closed are discarded.
+        """
+        if self._closed.is_set():
+            logger.debug("WebSocket connection closed, discarding %s message", getattr(message, "type", "unknown"))
+            return
+
+        data = message.model_dump_json()
+        try:
+            self._queue.put_nowait(data)
+            return
+        except asyncio.QueueFull:
+            pass
+
+        policy = self._settings.slow_consumer_policy
+        is_intermediate_step = getattr(message, "type", None) == WebSocketMessageType.INTERMEDIATE_STEP_MESSAGE
+        if policy == "drop_intermediate" and is_intermediate_step:
+            self._num_dropped += 1
+            if self._num_dropped == 1 or self._num_dropped % 1000 == 0:
+                logger.warning("WebSocket client is reading too slowly, %d intermediate step message(s) dropped",
+                               self._num_dropped)
+            return
+
+        if policy == "disconnect":
+            logger.warning("WebSocket client is reading too slowly, closing the connection")
+            await self._disconnect_slow_consumer()
+            return
+
+        # Block until there is room, or until the connection is closed
+        put_task = asyncio.ensure_future(self._queue.put(data))
+        closed_task = asyncio.ensure_future(self._closed.wait())
+        try:
+            await asyncio.wait([put_task, closed_task], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            put_task.cancel()
+            closed_task.cancel()
+
+    async def flush(self, timeout: float | None = None) -> None:
+        """Wait until every queued message has been written, or the connection is closed."""
+        if self._writer_task is None or self._closed.is_set():
+            return
+        join_task = asyncio.ensure_future(self._queue.join())
+        try:
+            await asyncio.wait([join_task, self._writer_task], timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            join_task.cancel()
+
+    async def aclose(self, flush_timeout: float = 1.0) -> None:
+        """Write any queued messages, waiting at most `flush_timeout` seconds, then stop the writer task."""
+        await self.flush(timeout=flush_timeout)
+        self._close()
+        if self._writer_task is not None:
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+
+    def _close(self) -> None:
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+        self._discard_queued()
+
+    def _discard_queued(self) -> None:
+        self._closed.set()
+        while not self._queue.empty():
+            self._queue.get_nowait()
+            self._queue.task_done()
+
+    async def _disconnect_slow_consumer(self) -> None:
+        self._close()
+        try:
+            await self._socket.close(code=SLOW_CONSUMER_CLOSE_CODE, reason="Client is reading messages too slowly")
+        except Exception:
+            logger.debug("Failed to close WebSocket connection", exc_info=True)
+
+    async def _next_batch(self) -> list[str]:
+        batch = [await self._queue.get()]
+        if not self._batched:
+            return batch
+
+        if self._settings.flush_interval > 0 and self._queue.qsize() < self._settings.max_batch_size - 1:
+            await asyncio.sleep(self._settings.flush_interval)
+
+        while len(batch) < self._settings.max_batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _write_messages(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                if self._batched:
+                    await self._socket.send_text(f"[{','.join(batch)}]")
+                else:
+                    await self._socket.send_text(batch[0])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.debug("WebSocket connection closed while sending, discarding queued messages", exc_info=True)
+                for _ in batch:
+                    self._queue.task_done()
+                self._discard_queued()
+                return
+
+            for _ in batch:
+                self._queue.task_done()
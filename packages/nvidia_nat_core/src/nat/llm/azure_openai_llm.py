@@ -21,10 +21,13 @@ from pydantic import computed_field
 from nat.builder.builder import Builder
 from nat.builder.llm import LLMProviderInfo
 from nat.cli.register_workflow import register_llm_provider
+from nat.data_models.adaptive_concurrency_mixin import AdaptiveConcurrencyMixin
 from nat.data_models.common import OptionalSecretStr
+from nat.data_models.http_connection_pool_mixin import HTTPConnectionPoolMixin
 from nat.data_models.llm import LLMBaseConfig
 from nat.data_models.optimizable import OptimizableField
 from nat.data_models.optimizable import SearchSpace
+from nat.data_models.response_cache_mixin import ResponseCacheMixin
 from nat.data_models.retry_mixin import RetryMixin
 from nat.data_models.ssl_verification_mixin import SSLVerificationMixin
 from nat.data_models.thinking_mixin import ThinkingMixin
@@ -35,6 +38,9 @@ class AzureOpenAIModelConfig(
         RetryMixin,
         ThinkingMixin,
         SSLVerificationMixin,
+        ResponseCacheMixin,
+        AdaptiveConcurrencyMixin,
+        HTTPConnectionPoolMixin,
         name="azure_openai",
 ):
     """An Azure OpenAI LLM provider to be used with an LLM client."""
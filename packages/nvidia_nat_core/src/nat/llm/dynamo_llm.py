@@ -732,6 +732,7 @@ async def _create_httpx_client_with_dynamo_hooks(config: DynamoModelConfig) -> "
     """
     import httpx
 
+    from nat.llm.utils.connection_pool import acquire_transport
     from nat.llm.utils.http_client import async_http_client
 
     http_client_kwargs = {}
@@ -751,8 +752,9 @@ async def _create_httpx_client_with_dynamo_hooks(config: DynamoModelConfig) -> "
             except Exception:
                 logger.exception("Failed to load prediction trie")
 
-        # Create base transport and wrap with custom transport
-        base_transport = httpx.AsyncHTTPTransport(verify=config.verify_ssl)
+        # Wrap the shared connection pool of the endpoint with the custom transport
+        base_transport = (acquire_transport(config, use_async=True, kwargs={"verify": config.verify_ssl})
+                          or httpx.AsyncHTTPTransport(verify=config.verify_ssl))
         dynamo_transport = _DynamoTransport(
             transport=base_transport,
             total_requests=config.nvext_prefix_total_requests,
@@ -0,0 +1,302 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Adaptive client-side concurrency limiting for LLM endpoints.
+
+The limiter is installed as an httpx transport on the HTTP clients created by `nat.llm.utils.http_client`. Limiters are
+shared process-wide per endpoint and model, so every LLM client sending requests to the same endpoint, whatever the
+framework, draws from the same limit.
+"""
+
+import asyncio
+import collections
+import hashlib
+import json
+import logging
+import threading
+import time
+import typing
+
+import httpx
+
+from nat.data_models.adaptive_concurrency_mixin import AdaptiveConcurrencyConfig
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Concurrency limiter using additive increase, multiplicative decrease (AIMD).
+
+    While the limit is in use and requests succeed, the limit grows by about one for every `limit` completed requests.
+    When the endpoint reports it is overloaded, a request times out, or, if `latency_tolerance` is set, the smoothed
+    latency rises above `latency_tolerance` times the lowest recent latency, the limit is multiplied by
+    `backoff_ratio`. The limit is reduced at most once per smoothed latency, so a burst of rejected requests counts as a
+    single overload.
+
+    Args:
+        config: The limiter configuration.
+    """
+
+    # Weight of a new latency sample in the smoothed latency
+    _LATENCY_SMOOTHING = 0.1
+    # Rate at which the lowest latency drifts towards the observed latency, so it adapts when requests get slower
+    _MIN_LATENCY_DRIFT = 0.01
+    # Seconds between limit reductions before any latency has been observed
+    _DEFAULT_BACKOFF_INTERVAL = 1.0
+
+    def __init__(self, config: AdaptiveConcurrencyConfig):
+        self._config = config
+        self._limit = float(config.initial_limit)
+        self._in_flight = 0
+        self._waiters: collections.deque[asyncio.Future] = collections.deque()
+        self._min_latency: float | None = None
+        self._smoothed_latency: float | None = None
+        self._last_decrease: float | None = None
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def num_waiting(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> None:
+        """Wait until a request can be sent."""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was granted just before the cancellation, hand it to the next waiter
+                self._in_flight -= 1
+                self._wake_waiters()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self, latency: float | None = None, overloaded: bool = False) -> None:
+        """
+        Release a slot acquired with `acquire`, updating the limit.
+
+        Args:
+            latency: Seconds the endpoint took to respond, or None if the request failed without a response.
+            overloaded: Whether the endpoint reported it is overloaded or the request timed out.
+        """
+        was_saturated = self._in_flight >= self.limit
+        self._in_flight -= 1
+
+        if latency is not None and not overloaded:
+            overloaded = self._record_latency(latency)
+
+        if overloaded:
+            self._decrease()
+        elif latency is not None and was_saturated:
+            self._limit = min(float(self._config.max_limit), self._limit + 1.0 / self._limit)
+
+        self._wake_waiters()
+
+    def _record_latency(self, latency: float) -> bool:
+        if self._min_latency is None or latency < self._min_latency:
+            self._min_latency = latency
+        else:
+            self._min_latency += (latency - self._min_latency) * self._MIN_LATENCY_DRIFT
+
+        if self._smoothed_latency is None:
+            self._smoothed_latency = latency
+        else:
+            self._smoothed_latency += (latency - self._smoothed_latency) * self._LATENCY_SMOOTHING
+
+        tolerance = self._config.latency_tolerance
+        return tolerance is not None and self._smoothed_latency > self._min_latency * tolerance
+
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        interval = self._smoothed_latency if self._smoothed_latency is not None else self._DEFAULT_BACKOFF_INTERVAL
+        if self._last_decrease is not None and now - self._last_decrease < interval:
+            return
+        self._last_decrease = now
+        previous_limit = self.limit
+        self._limit = max(float(self._config.min_limit), self._limit * self._config.backoff_ratio)
+        if self._smoothed_latency is not None and self._min_latency is not None:
+            # Start measuring congestion afresh at the new limit
+            self._smoothed_latency = self._min_latency
+        logger.debug("LLM endpoint overloaded, reducing concurrency limit from %d to %d", previous_limit, self.limit)
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+
+class _EndpointState:
+    """The limiter and in-flight coalesced requests of an endpoint and model."""
+
+    def __init__(self, config: AdaptiveConcurrencyConfig):
+        self.limiter = AdaptiveConcurrencyLimiter(config)
+        self.in_flight_requests: dict[str, asyncio.Future] = {}
+
+
+_endpoints: dict[tuple[str, str | None], _EndpointState] = {}
+_endpoints_lock = threading.Lock()
+
+
+def get_endpoint_limiters() -> dict[tuple[str, str | None], AdaptiveConcurrencyLimiter]:
+    """Return the limiters created so far, keyed by endpoint origin and model name."""
+    with _endpoints_lock:
+        return {key: state.limiter for key, state in _endpoints.items()}
+
+
+def _get_endpoint_state(origin: str, model: str | None, config: AdaptiveConcurrencyConfig) -> _EndpointState:
+    with _endpoints_lock:
+        state = _endpoints.get((origin, model))
+        if state is None:
+            # The first configuration seen for an endpoint and model is used by every client sending requests to it
+            state = _EndpointState(config)
+            _endpoints[(origin, model)] = state
+        return state
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Holds the limiter slot of a response until its body has been read or the response is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: typing.Callable[[], None]):
+        self._stream = stream
+        self._release: typing.Callable[[], None] | None = release
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class AdaptiveConcurrencyTransport(httpx.AsyncBaseTransport):
+    """
+    Transport wrapper limiting the number of concurrent requests to an LLM endpoint.
+
+    A request holds a slot until its response body has been read, so streaming responses count towards the limit for
+    as long as they stream. The latency used to adapt the limit is the time until the response headers arrive.
+
+    Args:
+        transport: The transport used to send requests.
+        config: The limiter configuration.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, config: AdaptiveConcurrencyConfig):
+        self._transport = transport
+        self._config = config
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        content = await request.aread()
+        body = None
+        if request.method == "POST" and content:
+            try:
+                body = json.loads(content)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                pass
+        if not isinstance(body, dict):
+            body = {}
+
+        model = body.get("model") if isinstance(body.get("model"), str) else None
+        state = _get_endpoint_state(f"{request.url.scheme}://{request.url.netloc.decode('ascii')}", model, self._config)
+
+        if not (self._config.coalesce_identical_requests and body.get("temperature") == 0 and not body.get("stream")):
+            return await self._send(request, state.limiter)
+
+        key = hashlib.sha256(request.method.encode() + str(request.url).encode() + b"\0" + content).hexdigest()
+        leader = state.in_flight_requests.get(key)
+        if leader is not None:
+            logger.debug("Coalescing identical in-flight LLM request")
+            result = await asyncio.shield(leader)
+            if result is None:
+                # The request being waited on was cancelled, send this one instead
+                return await self._send(request, state.limiter)
+            status_code, headers, raw_content, extensions = result
+            return httpx.Response(status_code,
+                                  headers=headers,
+                                  stream=httpx.ByteStream(raw_content),
+                                  extensions=extensions,
+                                  request=request)
+
+        leader = asyncio.get_running_loop().create_future()
+        state.in_flight_requests[key] = leader
+        try:
+            response = await self._send(request, state.limiter)
+            try:
+                raw_content = b"".join([chunk async for chunk in response.aiter_raw()])
+            finally:
+                await response.aclose()
+            result = (response.status_code, response.headers.multi_items(), raw_content, response.extensions)
+            leader.set_result(result)
+        except asyncio.CancelledError:
+            leader.set_result(None)
+            raise
+        except Exception as e:
+            leader.set_exception(e)
+            # Avoid "exception was never retrieved" warnings when there are no other requests waiting
+            leader.exception()
+            raise
+        finally:
+            del state.in_flight_requests[key]
+
+        return httpx.Response(result[0],
+                              headers=result[1],
+                              stream=httpx.ByteStream(raw_content),
+                              extensions=result[3],
+                              request=request)
+
+    async def _send(self, request: httpx.Request, limiter: AdaptiveConcurrencyLimiter) -> httpx.Response:
+        await limiter.acquire()
+        start = time.monotonic()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except httpx.TimeoutException:
+            limiter.release(overloaded=True)
+            raise
+        except BaseException:
+            limiter.release()
+            raise
+
+        latency = time.monotonic() - start
+        overloaded = response.status_code in self._config.overload_status_codes
+        return httpx.Response(status_code=response.status_code,
+                              headers=response.headers,
+                              stream=_ReleasingStream(response.stream,
+                                                      lambda: limiter.release(latency=latency, overloaded=overloaded)),
+                              extensions=response.extensions,
+                              request=request)
+
+    async def aclose(self) -> None:
+        """Close the underlying transport."""
+        await self._transport.aclose()
@@ -0,0 +1,243 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Process-wide registry of HTTP connection pools shared by model clients.
+
+Each httpx client created by `nat.llm.utils.http_client` keeps its own settings, such as timeouts and event hooks, but
+sends its requests through a transport shared with every other client using the same endpoint, TLS, proxy and pool
+settings. A shared transport is reference counted and closed when the last client using it is closed, so components of
+per-user workflows reuse the connections opened by the shared workflow instead of opening their own.
+"""
+
+import asyncio
+import dataclasses
+import logging
+import ssl
+import threading
+import typing
+from urllib.parse import urlsplit
+
+import httpx
+
+from nat.data_models.http_connection_pool_mixin import HTTPConnectionPoolConfig
+
+logger = logging.getLogger(__name__)
+
+# Client arguments which configure the transport itself, clients passing them get a transport of their own
+_UNSHARED_TRANSPORT_KWARGS = ("transport", "mounts", "cert", "uds", "local_address", "retries", "socket_options")
+
+
+class _PoolKey(typing.NamedTuple):
+    origin: str | None
+    verify: typing.Hashable
+    proxy: str | None
+    http2: bool
+    max_connections: int | None
+    max_keepalive_connections: int | None
+    keepalive_expiry: float | None
+    is_async: bool
+    # Connections of async transports can only be used from the event loop which opened them
+    loop: asyncio.AbstractEventLoop | None
+
+
+class _SharedTransport:
+    """A transport and the number of clients using it."""
+
+    def __init__(self, key: _PoolKey, transport: httpx.AsyncHTTPTransport | httpx.HTTPTransport):
+        self.key = key
+        self.transport = transport
+        self.ref_count = 0
+
+
+class _AsyncTransportHandle(httpx.AsyncBaseTransport):
+    """Reference to a shared async transport held by one client, released when the client is closed."""
+
+    def __init__(self, shared: _SharedTransport):
+        self._shared = shared
+        self._closed = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._shared.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if _release(self._shared):
+            await self._shared.transport.aclose()
+
+
+class _TransportHandle(httpx.BaseTransport):
+    """Reference to a shared sync transport held by one client, released when the client is closed."""
+
+    def __init__(self, shared: _SharedTransport):
+        self._shared = shared
+        self._closed = False
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._shared.transport.handle_request(request)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if _release(self._shared):
+            self._shared.transport.close()
+
+
+_shared_transports: dict[_PoolKey, _SharedTransport] = {}
+_shared_transports_lock = threading.Lock()
+
+
+def _release(shared: _SharedTransport) -> bool:
+    """Release a reference to a shared transport, returning whether it is no longer used and should be closed."""
+    with _shared_transports_lock:
+        shared.ref_count -= 1
+        if shared.ref_count > 0:
+            return False
+        if _shared_transports.get(shared.key) is shared:
+            del _shared_transports[shared.key]
+        logger.debug("Closing shared HTTP connection pool for %s", shared.key.origin)
+        return True
+
+
+def _get_origin(config: typing.Any) -> str | None:
+    base_url = getattr(config, "base_url", None) or getattr(config, "azure_endpoint", None)
+    if not isinstance(base_url, str):
+        return None
+    parts = urlsplit(base_url)
+    return f"{parts.scheme}://{parts.netloc}".lower() if parts.netloc else None
+
+
+def _hashable_verify(verify: typing.Any) -> typing.Hashable:
+    # SSL contexts are only equal to themselves
+    return ("ssl_context", id(verify)) if isinstance(verify, ssl.SSLContext) else verify
+
+
+def acquire_transport(config: typing.Any, use_async: bool,
+                      kwargs: dict[str, typing.Any]) -> httpx.AsyncBaseTransport | httpx.BaseTransport | None:
+    """
+    Acquire a shared transport for a client created with `kwargs` for the given component configuration.
+
+    The `proxy`, `limits` and `http2` client arguments are moved from `kwargs` to the shared transport. httpx ignores
+    the proxies configured with environment variables for clients created with a transport, so a shared transport is
+    also acquired for each of them and added to the `mounts` client argument.
+
+    Args:
+        config: The LLM or embedder configuration.
+        use_async: Whether the transport is used by an async client.
+        kwargs: The keyword arguments the client is created with.
+
+    Returns:
+        A transport, which releases the shared transport when closed, or None if the client should not share its
+        transport.
+    """
+    pool_config = getattr(config, "http_connection_pool", None) or HTTPConnectionPoolConfig()
+    if not pool_config.shared or any(name in kwargs for name in _UNSHARED_TRANSPORT_KWARGS):
+        return None
+
+    proxy = kwargs.get("proxy")
+    if proxy is not None and not isinstance(proxy, str):
+        return None
+
+    limits = kwargs.get("limits") or httpx.Limits(max_connections=pool_config.max_connections,
+                                                  max_keepalive_connections=pool_config.max_keepalive_connections,
+                                                  keepalive_expiry=pool_config.keepalive_expiry)
+    http2 = kwargs.get("http2", pool_config.http2)
+    verify = kwargs.get("verify", True)
+
+    loop = None
+    if use_async:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+
+    from nat.llm.utils.http_client import _get_environment_proxies
+    environment_proxies = _get_environment_proxies(kwargs)
+
+    def _acquire(proxy: str | None) -> httpx.AsyncBaseTransport | httpx.BaseTransport:
+        key = _PoolKey(origin=_get_origin(config),
+                       verify=_hashable_verify(verify),
+                       proxy=proxy,
+                       http2=http2,
+                       max_connections=limits.max_connections,
+                       max_keepalive_connections=limits.max_keepalive_connections,
+                       keepalive_expiry=limits.keepalive_expiry,
+                       is_async=use_async,
+                       loop=loop)
+
+        with _shared_transports_lock:
+            shared = _shared_transports.get(key)
+            if shared is None:
+                transport_class = httpx.AsyncHTTPTransport if use_async else httpx.HTTPTransport
+                shared = _SharedTransport(key, transport_class(verify=verify, http2=http2, limits=limits, proxy=proxy))
+                _shared_transports[key] = shared
+                logger.debug("Created shared HTTP connection pool for %s", key.origin)
+            shared.ref_count += 1
+
+        return _AsyncTransportHandle(shared) if use_async else _TransportHandle(shared)
+
+    transport = _acquire(proxy)
+    if environment_proxies:
+        # A mount without a transport sends requests through the client's transport, without a proxy
+        kwargs["mounts"] = {
+            pattern: None if proxy_url is None else _acquire(proxy_url)
+            for pattern, proxy_url in environment_proxies.items()
+        }
+
+    for name in ("proxy", "limits", "http2"):
+        kwargs.pop(name, None)
+
+    return transport
+
+
+@dataclasses.dataclass
+class ConnectionPoolStats:
+    """Utilization of a shared HTTP connection pool."""
+
+    origin: str | None
+    is_async: bool
+    http2: bool
+    clients: int
+    max_connections: int | None
+    connections: int
+    active_connections: int
+    idle_connections: int
+    queued_requests: int
+
+
+def get_connection_pool_stats() -> list[ConnectionPoolStats]:
+    """Return the utilization of every shared HTTP connection pool."""
+    with _shared_transports_lock:
+        shared_transports = list(_shared_transports.values())
+
+    stats = []
+    for shared in shared_transports:
+        pool = getattr(shared.transport, "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+        idle_connections = sum(1 for connection in connections if connection.is_idle())
+        queued_requests = sum(1 for request in list(getattr(pool, "_requests", [])) if request.is_queued())
+        stats.append(
+            ConnectionPoolStats(origin=shared.key.origin,
+                                is_async=shared.key.is_async,
+                                http2=shared.key.http2,
+                                clients=shared.ref_count,
+                                max_connections=shared.key.max_connections,
+                                connections=len(connections),
+                                active_connections=len(connections) - idle_connections,
+                                idle_connections=idle_connections,
+                                queued_requests=queued_requests))
+    return stats
@@ -22,11 +22,69 @@ if typing.TYPE_CHECKING:
     from nat.data_models.llm import LLMBaseConfig
 
 
+def _get_environment_proxies(kwargs: dict[str, typing.Any]) -> dict[str, str | None]:
+    """
+    Get the proxies configured with the `HTTP_PROXY`, `HTTPS_PROXY`, `ALL_PROXY` and `NO_PROXY` environment variables
+    which apply to a client created with `kwargs`, as a mapping of URL patterns to proxy URLs, `None` meaning no proxy.
+
+    httpx ignores these variables for clients created with an explicit transport, so clients given one of our
+    transports mount a transport for each proxy instead.
+    """
+    if not kwargs.get("trust_env", True) or any(name in kwargs for name in ("proxy", "mounts")):
+        return {}
+
+    from httpx._utils import get_environment_proxies
+    return get_environment_proxies()
+
+
+def _wrap_async_transport(llm_config: "LLMBaseConfig", kwargs: dict[str, typing.Any]) -> None:
+    """
+    Wrap the async transports with the response cache and adaptive concurrency limiter, if enabled in the LLM
+    configuration. The cache is the outermost layer, so responses served from it do not count against the limit.
+    """
+    import httpx
+
+    response_cache = getattr(llm_config, "response_cache", None)
+    adaptive_concurrency = getattr(llm_config, "adaptive_concurrency", None)
+    if response_cache is None and adaptive_concurrency is None:
+        return
+
+    def _wrap(transport: httpx.AsyncBaseTransport) -> httpx.AsyncBaseTransport:
+        if adaptive_concurrency is not None:
+            from nat.llm.utils.concurrency import AdaptiveConcurrencyTransport
+            transport = AdaptiveConcurrencyTransport(transport, adaptive_concurrency)
+        if response_cache is not None:
+            from nat.llm.utils.response_cache import ResponseCacheTransport
+            transport = ResponseCacheTransport(transport, response_cache)
+        return transport
+
+    if kwargs.get("transport") is None:
+        # Create the transports the client would otherwise create itself, so proxied requests are wrapped too
+        verify = kwargs.get("verify", True)
+        proxies = _get_environment_proxies(kwargs)
+        kwargs["transport"] = httpx.AsyncHTTPTransport(verify=verify, proxy=kwargs.pop("proxy", None))
+        if proxies:
+            kwargs["mounts"] = {
+                pattern: None if proxy is None else httpx.AsyncHTTPTransport(verify=verify, proxy=proxy)
+                for pattern, proxy in proxies.items()
+            }
+
+    kwargs["transport"] = _wrap(kwargs["transport"])
+    if kwargs.get("mounts"):
+        kwargs["mounts"] = {
+            pattern: None if transport is None else _wrap(transport)
+            for pattern, transport in kwargs["mounts"].items()
+        }
+
+
 def _create_http_client(llm_config: "LLMBaseConfig",
                         use_async: bool = True,
                         **kwargs) -> "httpx.AsyncClient | httpx.Client":
     """
-    Create an httpx client with timeout and verify setting based on LLM configuration parameters.
+    Create an httpx client with timeout and verify setting based on LLM configuration parameters. Unless disabled in
+    the `http_connection_pool` configuration, the client sends its requests through a connection pool shared with
+    other clients of the same endpoint, see `nat.llm.utils.connection_pool`. Async clients also apply the response
+    cache and adaptive concurrency limit when the LLM configuration enables them.
 
     Args:
         llm_config: LLM configuration object
@@ -45,7 +103,13 @@ def _create_http_client(llm_config: "LLMBaseConfig",
     _set_kwarg("verify", "verify_ssl")
     _set_kwarg("timeout", "request_timeout")
 
+    from nat.llm.utils.connection_pool import acquire_transport
+    shared_transport = acquire_transport(llm_config, use_async=use_async, kwargs=kwargs)
+    if shared_transport is not None:
+        kwargs["transport"] = shared_transport
+
     if use_async:
+        _wrap_async_transport(llm_config, kwargs)
         client_class = httpx.AsyncClient
     else:
         client_class = httpx.Client
@@ -0,0 +1,375 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Provider agnostic LLM response cache.
+
+The cache is installed as an httpx transport on the HTTP clients created by `nat.llm.utils.http_client`, so it applies
+to every LLM client that sends its requests through those clients, regardless of the provider or framework. Requests
+are keyed on the request URL, the credentials sent with the request and the JSON request body, with prompts normalized
+so insignificant whitespace differences do not cause a miss. Responses are stored exactly as received, so streaming
+responses are replayed as streams.
+"""
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import typing
+
+import httpx
+import numpy as np
+
+from nat.data_models.common import get_secret_value
+from nat.data_models.response_cache_mixin import LLMResponseCacheConfig
+
+logger = logging.getLogger(__name__)
+
+# Header added to responses served from the cache
+CACHE_HEADER = "x-nat-cache"
+
+# Request body fields which do not change the generated response
+_IGNORED_BODY_FIELDS = frozenset({"user", "metadata", "store", "service_tier", "nvext"})
+
+# Request headers holding the credentials of the request, responses are not shared between different credentials
+_CREDENTIAL_HEADERS = ("authorization", "api-key", "x-api-key")
+
+# Request body fields holding the prompt
+_PROMPT_FIELDS = frozenset({"messages", "input", "prompt", "instructions", "system"})
+
+# Response headers which describe the original connection rather than the response
+_IGNORED_RESPONSE_HEADERS = frozenset(
+    {"date", "set-cookie", "connection", "keep-alive", "transfer-encoding", "content-length"})
+
+
+def _normalize_text(text: str) -> str:
+    lines = text.replace("\r\n", "\n").strip().split("\n")
+    return "\n".join(line.rstrip() for line in lines)
+
+
+def _normalize_prompt(value: typing.Any) -> typing.Any:
+    if isinstance(value, str):
+        return _normalize_text(value)
+    if isinstance(value, list):
+        return [_normalize_prompt(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _normalize_prompt(item) for key, item in value.items()}
+    return value
+
+
+def _prompt_text(value: typing.Any) -> str:
+    """Flatten the text of a prompt, used to embed it for similarity matching."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list):
+        return "\n".join(text for item in value if (text := _prompt_text(item)))
+    if isinstance(value, dict):
+        text = _prompt_text(value.get("content", value.get("text", "")))
+        return f"{value['role']}: {text}" if "role" in value and text else text
+    return ""
+
+
+def _hash(value: typing.Any) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+
+@dataclasses.dataclass
+class _CacheKey:
+    key: str
+    # Identifies requests which only differ in their prompt, similarity matching only compares prompts within it
+    partition: str
+    prompt_text: str
+
+
+@dataclasses.dataclass
+class CachedResponse:
+    status_code: int
+    headers: list[tuple[str, str]]
+    body: bytes
+
+
+class ResponseCacheStore:
+    """
+    SQLite backed store of cached responses, evicting expired and least recently used responses.
+
+    The methods are blocking and are called from worker threads by `ResponseCacheTransport`.
+
+    Args:
+        path: Path of the database file, or None to keep the cache in memory.
+        ttl: Seconds after which a cached response expires, or None if responses do not expire.
+        max_size_bytes: Maximum total size of the cached response bodies.
+    """
+
+    def __init__(self, path: str | None, ttl: float | None, max_size_bytes: int):
+        self._ttl = ttl
+        self._max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path or ":memory:", check_same_thread=False, isolation_level=None)
+        with self._lock:
+            if path is not None:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, partition TEXT NOT NULL, "
+                               "embedding BLOB, status_code INTEGER NOT NULL, headers TEXT NOT NULL, "
+                               "body BLOB NOT NULL, size INTEGER NOT NULL, created REAL NOT NULL, "
+                               "accessed REAL NOT NULL)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_partition ON responses (partition, accessed)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_created ON responses (created)")
+            self._size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def _min_created(self) -> float:
+        return time.time() - self._ttl if self._ttl is not None else 0.0
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            row = self._conn.execute("SELECT status_code, headers, body FROM responses WHERE key = ? AND created >= ?",
+                                     (key, self._min_created())).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (time.time(), key))
+        return CachedResponse(status_code=row[0], headers=[tuple(header) for header in json.loads(row[1])], body=row[2])
+
+    def find_similar(self, partition: str, embedding: np.ndarray, threshold: float,
+                     max_candidates: int) -> CachedResponse | None:
+        """Return the response of the cached request in `partition` whose prompt embedding is most similar."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, embedding FROM responses WHERE partition = ? AND created >= ? AND embedding IS NOT NULL "
+                "ORDER BY accessed DESC LIMIT ?", (partition, self._min_created(), max_candidates)).fetchall()
+        # Skip embeddings of a different size, for example from a previously configured embedding model
+        rows = [row for row in rows if len(row[1]) == embedding.nbytes]
+        if not rows:
+            return None
+
+        candidates = np.stack([np.frombuffer(row[1], dtype=np.float32) for row in rows])
+        similarities = candidates @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] < threshold:
+            return None
+        logger.debug("Found cached LLM response with prompt similarity %.3f", similarities[best])
+        return self.get(rows[best][0])
+
+    def put(self, cache_key: _CacheKey, response: CachedResponse, embedding: np.ndarray | None = None) -> None:
+        size = len(response.body)
+        if size > self._max_size_bytes:
+            return
+
+        now = time.time()
+        with self._lock:
+            previous = self._conn.execute("SELECT size FROM responses WHERE key = ?", (cache_key.key, )).fetchone()
+            self._conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                               (cache_key.key,
+                                cache_key.partition,
+                                embedding.astype(np.float32).tobytes() if embedding is not None else None,
+                                response.status_code,
+                                json.dumps(response.headers),
+                                response.body,
+                                size,
+                                now,
+                                now))
+            self._size += size - (previous[0] if previous else 0)
+            self._evict()
+
+    def _evict(self) -> None:
+        num_evicted = 0
+        if self._ttl is not None:
+            num_evicted += self._conn.execute("DELETE FROM responses WHERE created < ?",
+                                              (self._min_created(), )).rowcount
+        if self._size > self._max_size_bytes:
+            # Delete least recently used responses until the cache fits, leaving some room for new responses
+            target = self._max_size_bytes * 0.9
+            rows = self._conn.execute("SELECT key, size FROM responses ORDER BY accessed").fetchall()
+            size = sum(row[1] for row in rows)
+            evicted = []
+            for key, entry_size in rows:
+                if size <= target:
+                    break
+                evicted.append((key, ))
+                size -= entry_size
+            self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+            num_evicted += len(evicted)
+        if num_evicted:
+            self._size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+
+_stores: dict[tuple[str | None, float | None, int], ResponseCacheStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_response_cache_store(config: LLMResponseCacheConfig) -> ResponseCacheStore:
+    """Return the store for `config`, shared by every LLM client configured with the same cache."""
+    store_key = (config.path, config.ttl, config.max_size_bytes)
+    with _stores_lock:
+        if store_key not in _stores:
+            _stores[store_key] = ResponseCacheStore(config.path, config.ttl, config.max_size_bytes)
+        return _stores[store_key]
+
+
+class _RecordingStream(httpx.AsyncByteStream):
+    """Passes a response body through, storing it in the cache once it has been read completely."""
+
+    def __init__(self,
+                 stream: httpx.AsyncByteStream,
+                 on_complete: typing.Callable[[bytes], typing.Awaitable[None]],
+                 max_size_bytes: int):
+        self._stream = stream
+        self._on_complete = on_complete
+        self._max_size_bytes = max_size_bytes
+        self._chunks: list[bytes] | None = []
+        self._size = 0
+        self._complete = False
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            if self._chunks is not None:
+                self._size += len(chunk)
+                if self._size > self._max_size_bytes:
+                    # Too large to cache, stop recording
+                    self._chunks = None
+                else:
+                    self._chunks.append(chunk)
+            yield chunk
+        self._complete = True
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+        if self._complete and self._chunks is not None:
+            body = b"".join(self._chunks)
+            self._chunks = None
+            await self._on_complete(body)
+
+
+class ResponseCacheTransport(httpx.AsyncBaseTransport):
+    """
+    Transport wrapper that serves repeated LLM requests from a cache.
+
+    Only JSON POST requests with a successful response are cached, and by default only requests sampled with a
+    temperature of 0. A response is stored once it has been read completely, so a stream abandoned by the client is
+    not cached. Responses served from the cache carry an `x-nat-cache: hit` header.
+
+    Args:
+        transport: The transport used for requests that are not served from the cache.
+        config: The cache configuration.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, config: LLMResponseCacheConfig):
+        self._transport = transport
+        self._config = config
+        self._store = get_response_cache_store(config)
+        self._embedding_client: httpx.AsyncClient | None = None
+
+    def _get_cache_key(self, request: httpx.Request, content: bytes) -> _CacheKey | None:
+        if request.method != "POST" or not content:
+            return None
+        try:
+            body = json.loads(content)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None
+        if not isinstance(body, dict):
+            return None
+        if not self._config.cache_nondeterministic and body.get("temperature") != 0:
+            return None
+
+        params = {key: value for key, value in body.items() if key not in _IGNORED_BODY_FIELDS | _PROMPT_FIELDS}
+        prompt = {key: _normalize_prompt(body[key]) for key in _PROMPT_FIELDS if key in body}
+        # The partition only holds a digest of the URL and the credentials, neither is stored in the cache
+        credentials = [request.headers.get(name) for name in _CREDENTIAL_HEADERS]
+        partition = _hash({"url": str(request.url), "credentials": credentials, "params": params})
+        key = _hash({"partition": partition, "prompt": prompt})
+        prompt_text = _prompt_text([prompt[name] for name in sorted(prompt)])
+        return _CacheKey(key=key, partition=partition, prompt_text=prompt_text)
+
+    async def _embed(self, text: str) -> np.ndarray | None:
+        similarity = self._config.similarity
+        assert similarity is not None
+        if self._embedding_client is None:
+            headers = {}
+            if (api_key := get_secret_value(similarity.api_key)):
+                headers["Authorization"] = f"Bearer {api_key}"
+            self._embedding_client = httpx.AsyncClient(base_url=similarity.embedding_base_url, headers=headers)
+
+        try:
+            response = await self._embedding_client.post("embeddings",
+                                                         json={
+                                                             "model": similarity.embedding_model, "input": text
+                                                         })
+            response.raise_for_status()
+            embedding = np.asarray(response.json()["data"][0]["embedding"], dtype=np.float32)
+        except Exception:
+            logger.warning("Failed to embed prompt for LLM response cache similarity matching", exc_info=True)
+            return None
+
+        norm = np.linalg.norm(embedding)
+        return embedding / norm if norm > 0 else None
+
+    def _replay(self, request: httpx.Request, cached: CachedResponse) -> httpx.Response:
+        return httpx.Response(status_code=cached.status_code,
+                              headers=[*cached.headers, (CACHE_HEADER, "hit")],
+                              stream=httpx.ByteStream(cached.body),
+                              request=request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        cache_key = self._get_cache_key(request, await request.aread())
+        if cache_key is None:
+            return await self._transport.handle_async_request(request)
+
+        cached = await asyncio.to_thread(self._store.get, cache_key.key)
+        if cached is not None:
+            logger.debug("Serving LLM response from cache")
+            return self._replay(request, cached)
+
+        embedding = None
+        if self._config.similarity is not None and cache_key.prompt_text:
+            embedding = await self._embed(cache_key.prompt_text)
+            if embedding is not None:
+                cached = await asyncio.to_thread(self._store.find_similar,
+                                                 cache_key.partition,
+                                                 embedding,
+                                                 self._config.similarity.threshold,
+                                                 self._config.similarity.max_candidates)
+                if cached is not None:
+                    logger.debug("Serving LLM response for a similar prompt from cache")
+                    return self._replay(request, cached)
+
+        response = await self._transport.handle_async_request(request)
+        if response.status_code != 200:
+            return response
+
+        headers = [(name, value) for name, value in response.headers.multi_items()
+                   if name.lower() not in _IGNORED_RESPONSE_HEADERS]
+
+        async def _store_response(body: bytes) -> None:
+            try:
+                await asyncio.to_thread(self._store.put,
+                                        cache_key,
+                                        CachedResponse(status_code=response.status_code, headers=headers, body=body),
+                                        embedding)
+            except Exception:
+                logger.warning("Failed to store LLM response in cache", exc_info=True)
+
+        return httpx.Response(status_code=response.status_code,
+                              headers=response.headers,
+                              stream=_RecordingStream(response.stream, _store_response, self._config.max_size_bytes),
+                              extensions=response.extensions,
+                              request=request)
+
+    async def aclose(self) -> None:
+        """Close the underlying transport."""
+        if self._embedding_client is not None:
+            await self._embedding_client.aclose()
+        await self._transport.aclose()
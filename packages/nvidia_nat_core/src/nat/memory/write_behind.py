@@ -0,0 +1,181 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextvars
+import json
+import logging
+import typing
+from dataclasses import dataclass
+
+from nat.builder.context import Context
+
+from .interfaces import MemoryEditor
+from .models import MemoryItem
+
+logger = logging.getLogger(__name__)
+
+
+class _BatchKey(typing.NamedTuple):
+    user_id: str | None
+    conversation_id: str | None
+    add_kwargs: str
+
+
+@dataclass
+class _PendingBatch:
+    items: list[MemoryItem]
+    add_kwargs: dict[str, typing.Any]
+    # The context of the first caller, so the wrapped editor sees the same runtime context (for example the
+    # conversation ID) as it would have if it were called directly
+    context: contextvars.Context
+    timer: asyncio.TimerHandle | None = None
+
+
+class WriteBehindMemoryEditor(MemoryEditor):
+    """
+    Wraps a MemoryEditor so that adding items does not wait for the memory backend.
+
+    `add_items` returns as soon as the items are queued. Items added for the same user and conversation, with the same
+    keyword arguments, within `flush_interval` seconds are written with a single `add_items` call on the wrapped
+    editor, in the runtime context of the first caller. Failed writes are retried with exponential backoff, and writes
+    for the same user and conversation are applied in the order they were added.
+
+    Searches first wait for the pending writes of the searched user, so a search always sees items added before it,
+    and `remove_items` waits for every pending write. Call `aclose` on shutdown to write any queued items.
+
+    Args:
+        editor (MemoryEditor): The memory editor to write to.
+        flush_interval (float): Seconds to collect items into a batch before writing it.
+        max_batch_size (int): Number of items after which a batch is written without waiting for `flush_interval`.
+        max_retries (int): Number of times a failed write is retried before the items are dropped.
+        retry_backoff (float): Seconds to wait before the first retry, doubled for each further retry.
+        flush_before_search (bool): Whether searches wait for the searched user's pending writes.
+    """
+
+    def __init__(self,
+                 editor: MemoryEditor,
+                 *,
+                 flush_interval: float = 0.05,
+                 max_batch_size: int = 50,
+                 max_retries: int = 3,
+                 retry_backoff: float = 0.5,
+                 flush_before_search: bool = True) -> None:
+        self._editor = editor
+        self._flush_interval = flush_interval
+        self._max_batch_size = max_batch_size
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff
+        self._flush_before_search = flush_before_search
+
+        self._pending: dict[_BatchKey, _PendingBatch] = {}
+        # The most recent write for each batch key, later writes for the same key wait for it to finish
+        self._writes: dict[_BatchKey, asyncio.Task] = {}
+        self._closed = False
+
+    async def add_items(self, items: list[MemoryItem], **kwargs) -> None:
+        """
+        Queue items to be added to the wrapped editor, returning without waiting for them to be written.
+
+        Args:
+            items (list[MemoryItem]): The items to be added.
+            kwargs (dict): Keyword arguments passed to the wrapped editor's `add_items`.
+        """
+        if self._closed:
+            await self._editor.add_items(items, **kwargs)
+            return
+
+        conversation_id = Context.get().conversation_id
+        add_kwargs = json.dumps(kwargs, sort_keys=True, default=str)
+        for item in items:
+            key = _BatchKey(item.user_id, conversation_id, add_kwargs)
+            batch = self._pending.get(key)
+            if batch is None:
+                batch = _PendingBatch(items=[], add_kwargs=kwargs, context=contextvars.copy_context())
+                batch.timer = asyncio.get_running_loop().call_later(self._flush_interval, self._write_batch, key)
+                self._pending[key] = batch
+
+            batch.items.append(item)
+            if len(batch.items) >= self._max_batch_size:
+                self._write_batch(key)
+
+    async def search(self, query: str, top_k: int = 5, **kwargs) -> list[MemoryItem]:
+        if self._flush_before_search:
+            await self.flush(user_id=kwargs.get("user_id"))
+        return await self._editor.search(query, top_k=top_k, **kwargs)
+
+    async def remove_items(self, **kwargs) -> None:
+        await self.flush()
+        await self._editor.remove_items(**kwargs)
+
+    async def flush(self, user_id: str | None = None) -> None:
+        """
+        Write queued items now and wait until they, and any writes already in progress, have finished.
+
+        Args:
+            user_id (str | None): Only flush the items of this user. If None, all items are flushed.
+        """
+        for key in [key for key in self._pending if user_id is None or key.user_id == user_id]:
+            self._write_batch(key)
+
+        writes = [write for key, write in self._writes.items() if user_id is None or key.user_id == user_id]
+        if writes:
+            await asyncio.wait(writes)
+
+    async def aclose(self) -> None:
+        """Write all queued items. Items added afterwards are written directly to the wrapped editor."""
+        self._closed = True
+        await self.flush()
+
+    def _write_batch(self, key: _BatchKey) -> None:
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+
+        previous_write = self._writes.get(key)
+        write = asyncio.create_task(self._write_with_retries(batch, previous_write),
+                                    name="memory_write_behind",
+                                    context=batch.context)
+        self._writes[key] = write
+
+        def _forget(done: asyncio.Task):
+            if self._writes.get(key) is done:
+                del self._writes[key]
+
+        write.add_done_callback(_forget)
+
+    async def _write_with_retries(self, batch: _PendingBatch, previous_write: asyncio.Task | None) -> None:
+        if previous_write is not None:
+            await asyncio.wait([previous_write])
+
+        for attempt in range(self._max_retries + 1):
+            try:
+                await self._editor.add_items(batch.items, **batch.add_kwargs)
+                return
+            except Exception:
+                if attempt == self._max_retries:
+                    logger.exception("Failed to write %d memory item(s) after %d attempt(s), dropping them",
+                                     len(batch.items),
+                                     attempt + 1)
+                    return
+
+                delay = self._retry_backoff * (2**attempt)
+                logger.warning("Failed to write %d memory item(s), retrying in %.2fs",
+                               len(batch.items),
+                               delay,
+                               exc_info=True)
+                await asyncio.sleep(delay)
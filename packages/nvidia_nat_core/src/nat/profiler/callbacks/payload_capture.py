@@ -0,0 +1,183 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import hashlib
+import typing
+
+from pydantic import BaseModel
+
+from nat.data_models.profiler_callback import LargePayloadMode
+from nat.data_models.profiler_callback import PayloadCaptureConfig
+
+# Containers nested deeper than this are shared with the payload rather than copied
+_MAX_DEPTH = 64
+_NON_TEXT_LEAF_TYPES = (int, float, bytes, type(None))
+_LEAF_TYPES = (str, *_NON_TEXT_LEAF_TYPES)
+
+
+class _PayloadTooLarge(Exception):
+    pass
+
+
+class _Snapshot:
+    """
+    A single snapshot of a payload, limited to `max_size` characters of text. If `truncate` is False, the snapshot is
+    abandoned with `_PayloadTooLarge` as soon as the limit is exceeded.
+    """
+
+    def __init__(self, max_size: int | None, truncate: bool):
+        self.remaining = max_size
+        self._truncate = truncate
+        # Values of these types are shared with the payload, text is only shared when it does not need truncating
+        self._shared_types = _LEAF_TYPES if max_size is None else _NON_TEXT_LEAF_TYPES
+
+    def copy(self, value: typing.Any, depth: int = 0) -> typing.Any:
+        if isinstance(value, str):
+            return self._copy_text(value)
+        if depth >= _MAX_DEPTH:
+            return value
+        if isinstance(value, list):
+            copied = value.copy()
+            for index, item in enumerate(copied):
+                if not isinstance(item, self._shared_types):
+                    copied[index] = self.copy(item, depth + 1)
+            return copied
+        if type(value) is tuple:
+            return tuple(item if isinstance(item, self._shared_types) else self.copy(item, depth + 1) for item in value)
+        if isinstance(value, dict):
+            return self._copy_values(value.copy(), depth)
+        if isinstance(value, BaseModel):
+            # A shallow copy has its own field dictionary, whose values are then copied like those of a dict
+            copied = copy.copy(value)
+            self._copy_values(copied.__dict__, depth)
+            return copied
+        return value
+
+    def _copy_values(self, values: dict, depth: int) -> dict:
+        for key, item in values.items():
+            if not isinstance(item, self._shared_types):
+                values[key] = self.copy(item, depth + 1)
+        return values
+
+    def _copy_text(self, text: str) -> str:
+        if self.remaining is None:
+            return text
+        if len(text) <= self.remaining:
+            self.remaining -= len(text)
+            return text
+
+        if not self._truncate:
+            raise _PayloadTooLarge()
+        kept = self.remaining
+        self.remaining = 0
+        return f"{text[:kept]}... [{len(text) - kept} characters truncated]"
+
+
+def _hash_payload(value: typing.Any) -> dict[str, typing.Any]:
+    digest = hashlib.sha256()
+    size = 0
+    stack = [(value, 0)]
+    while stack:
+        item, depth = stack.pop()
+        if isinstance(item, str):
+            size += len(item)
+            digest.update(item.encode("utf-8", errors="surrogatepass"))
+        elif depth >= _MAX_DEPTH:
+            digest.update(type(item).__qualname__.encode())
+        elif isinstance(item, list | tuple):
+            stack.extend((child, depth + 1) for child in reversed(item))
+        elif isinstance(item, dict):
+            for key, child in reversed(list(item.items())):
+                stack.append((child, depth + 1))
+                digest.update(str(key).encode("utf-8", errors="surrogatepass"))
+        elif isinstance(item, BaseModel):
+            stack.extend((child, depth + 1) for child in reversed(list(item.__dict__.values())))
+        elif item is None or isinstance(item, int | float):
+            digest.update(repr(item).encode())
+        else:
+            # The representation of arbitrary objects may not be stable, only their type is part of the digest
+            digest.update(type(item).__qualname__.encode())
+    return {"size": size, "sha256": digest.hexdigest()}
+
+
+class PayloadCapture:
+    """
+    Captures the prompts, messages and tool inputs seen by framework callback handlers for intermediate steps.
+
+    A captured payload is a snapshot which copies the lists, plain tuples, dicts and pydantic models of the payload,
+    so later changes to them, for example a framework appending to its message history, do not change the snapshot.
+    Strings and all other values are shared with the payload rather than copied.
+
+    Frameworks pass the whole message history to every LLM call, so the snapshots of the items of a list or tuple
+    payload are kept until the next capture. An item that is still equal to its previous snapshot reuses it, so
+    capturing a history that only had messages appended to it copies just the new messages.
+
+    Payloads with more than `max_size` characters of text are truncated, or replaced with their size and a digest of
+    their text, according to the configuration.
+
+    Args:
+        config: The capture configuration. If None, payloads are captured in full.
+    """
+
+    def __init__(self, config: PayloadCaptureConfig | None = None):
+        self._config = config or PayloadCaptureConfig()
+        # Maps the id of each item of the last captured list or tuple to the item and its snapshot. The item is kept
+        # so that its id cannot be reused by another object.
+        self._item_snapshots: dict[int, tuple[typing.Any, typing.Any]] = {}
+
+    @property
+    def config(self) -> PayloadCaptureConfig:
+        return self._config
+
+    def capture(self, payload: typing.Any) -> typing.Any:
+        """
+        Capture a snapshot of a payload.
+
+        Args:
+            payload: The payload to capture.
+
+        Returns:
+            The snapshot of the payload, or a dictionary with its `size` and `sha256` digest if it is too large and
+            large payloads are hashed.
+        """
+        snapshot = _Snapshot(self._config.max_size, truncate=self._config.large_payloads == LargePayloadMode.TRUNCATE)
+        # Truncating depends on the text captured before an item, so snapshots of items are only reused when uncapped
+        if self._config.max_size is None and (isinstance(payload, list) or type(payload) is tuple):
+            return self._capture_items(payload, snapshot)
+        try:
+            return snapshot.copy(payload)
+        except _PayloadTooLarge:
+            return _hash_payload(payload)
+
+    def _capture_items(self, payload: list | tuple, snapshot: _Snapshot) -> list | tuple:
+        previous = self._item_snapshots
+        item_snapshots = {}
+        copied = []
+        for item in payload:
+            if isinstance(item, _LEAF_TYPES):
+                copied.append(item)
+                continue
+
+            seen = previous.get(id(item))
+            if seen is not None and seen[0] is item and seen[1] == item:
+                item_snapshot = seen[1]
+            else:
+                item_snapshot = snapshot.copy(item, depth=1)
+            item_snapshots[id(item)] = (item, item_snapshot)
+            copied.append(item_snapshot)
+
+        self._item_snapshots = item_snapshots
+        return copied if isinstance(payload, list) else tuple(copied)
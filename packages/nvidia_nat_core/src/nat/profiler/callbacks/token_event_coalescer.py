@@ -0,0 +1,125 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import typing
+from dataclasses import dataclass
+from dataclasses import field
+
+from nat.data_models.profiler_callback import TokenEventMode
+from nat.data_models.profiler_callback import TokenEventsConfig
+
+
+class TokenBatch(typing.NamedTuple):
+    """Tokens of an LLM call to be reported as a single `LLM_NEW_TOKEN` intermediate step."""
+
+    text: str
+    chunks: list[typing.Any]
+
+
+@dataclass
+class _PendingTokens:
+    last_report: float
+    tokens: list[str] = field(default_factory=list)
+    chunks: list[typing.Any] = field(default_factory=list)
+
+
+class TokenEventCoalescer:
+    """
+    Groups the tokens streamed by LLM calls into batches according to a `TokenEventsConfig`.
+
+    Framework callback handlers call `add` for every streamed token and report the batch it returns, if any, as an
+    `LLM_NEW_TOKEN` intermediate step. When the LLM call ends they call `flush` and report the remaining tokens before
+    the `LLM_END` step, or call `discard` if the call failed. No timers are used, so in `interval` mode the tokens
+    received during an interval are reported when the next token arrives or the call ends.
+
+    Args:
+        config: The coalescing configuration. If None, the default configuration is used.
+    """
+
+    def __init__(self, config: TokenEventsConfig | None = None):
+        self._config = config or TokenEventsConfig()
+        self._pending: dict[str, _PendingTokens] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def config(self) -> TokenEventsConfig:
+        return self._config
+
+    def add(self, run_id: str, token: str, chunk: typing.Any = None) -> TokenBatch | None:
+        """
+        Add a token streamed by an LLM call.
+
+        Args:
+            run_id: Identifier of the LLM call.
+            token: The token text.
+            chunk: The framework specific chunk the token was received in, if any.
+
+        Returns:
+            The batch to report now, or None if the token is held back.
+        """
+        mode = self._config.mode
+        if mode == TokenEventMode.OFF:
+            return None
+        if mode == TokenEventMode.EVERY_TOKEN:
+            return TokenBatch(text=token, chunks=[chunk] if chunk is not None else [])
+
+        now = time.monotonic()
+        with self._lock:
+            pending = self._pending.get(run_id)
+            if pending is None:
+                # The first token is reported immediately, so the time to the first token can be measured
+                self._pending[run_id] = _PendingTokens(last_report=now)
+                return TokenBatch(text=token, chunks=[chunk] if chunk is not None else [])
+
+            pending.tokens.append(token)
+            if chunk is not None:
+                pending.chunks.append(chunk)
+
+            if mode == TokenEventMode.COUNT:
+                ready = len(pending.tokens) >= self._config.tokens_per_event
+            else:
+                ready = now - pending.last_report >= self._config.interval
+            if not ready:
+                return None
+
+            pending.last_report = now
+            return self._take(pending)
+
+    def flush(self, run_id: str) -> TokenBatch | None:
+        """
+        Finish an LLM call, returning its tokens which have not been reported yet, if any.
+
+        Args:
+            run_id: Identifier of the LLM call.
+        """
+        with self._lock:
+            pending = self._pending.pop(run_id, None)
+        if pending is None or not pending.tokens:
+            return None
+        return self._take(pending)
+
+    def discard(self, run_id: str) -> None:
+        """Forget the unreported tokens of an LLM call."""
+        with self._lock:
+            self._pending.pop(run_id, None)
+
+    @staticmethod
+    def _take(pending: _PendingTokens) -> TokenBatch:
+        batch = TokenBatch(text="".join(pending.tokens), chunks=pending.chunks)
+        pending.tokens = []
+        pending.chunks = []
+        return batch
@@ -12,10 +12,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""Per-user workflow resource usage monitoring models and collector."""
+"""Per-user workflow and HTTP connection pool resource usage monitoring models and collectors."""
 
 from __future__ import annotations
 
+import dataclasses
 import logging
 from datetime import datetime
 from typing import TYPE_CHECKING
@@ -64,12 +65,62 @@ class PerUserResourceUsage(BaseModel):
     memory: PerUserMemoryMetrics = Field(description="Memory/resource count metrics")
 
 
+class PerUserBuilderPoolMetrics(BaseModel):
+    """Capacity and lifecycle metrics for the per-user workflows of a single workflow entry point."""
+
+    entry_function: str | None = Field(description="Entry function of the workflow, None for the default workflow")
+    max_workflows: int | None = Field(description="Maximum number of per-user workflows, None if unlimited")
+    workflows: int = Field(ge=0, description="Number of per-user workflows")
+    active_workflows: int = Field(ge=0, description="Number of per-user workflows serving requests")
+    waiting_requests: int = Field(ge=0, description="Number of requests waiting for a per-user workflow to be free")
+    created: int = Field(ge=0, description="Number of per-user workflows created")
+    avg_build_time_ms: float = Field(ge=0, description="Average time to create a per-user workflow in milliseconds")
+    expired: int = Field(ge=0, description="Number of per-user workflows removed after being inactive")
+    evicted: int = Field(ge=0, description="Number of idle per-user workflows evicted to make room for a new user")
+    admissions_waited: int = Field(ge=0, description="Number of requests that waited for a free per-user workflow")
+    admissions_rejected: int = Field(ge=0, description="Number of requests rejected after waiting")
+
+
 class PerUserMonitorResponse(BaseModel):
     """Response model for the /monitor/users endpoint."""
 
     timestamp: datetime = Field(default_factory=datetime.now, description="When the metrics were collected")
     total_active_users: int = Field(ge=0, description="Number of users with active per-user workflows")
     users: list[PerUserResourceUsage] = Field(default_factory=list, description="Per-user resource usage details")
+    pools: list[PerUserBuilderPoolMetrics] = Field(
+        default_factory=list, description="Capacity and lifecycle metrics for each per-user workflow entry point")
+
+
+class HTTPConnectionPoolMetrics(BaseModel):
+    """Utilization metrics for an HTTP connection pool shared by LLM and embedder clients."""
+
+    origin: str | None = Field(description="Endpoint the pool sends requests to, None for the default endpoint")
+    is_async: bool = Field(description="Whether the pool is used by async clients")
+    http2: bool = Field(description="Whether HTTP/2 is enabled")
+    clients: int = Field(ge=0, description="Number of clients sharing the pool")
+    max_connections: int | None = Field(description="Maximum number of connections, None if unlimited")
+    connections: int = Field(ge=0, description="Number of open connections")
+    active_connections: int = Field(ge=0, description="Number of connections serving requests")
+    idle_connections: int = Field(ge=0, description="Number of idle keep-alive connections")
+    queued_requests: int = Field(ge=0, description="Number of requests waiting for a connection")
+
+
+class HTTPConnectionPoolMonitorResponse(BaseModel):
+    """Response model for the /monitor/http_connection_pools endpoint."""
+
+    timestamp: datetime = Field(default_factory=datetime.now, description="When the metrics were collected")
+    pools: list[HTTPConnectionPoolMetrics] = Field(default_factory=list,
+                                                   description="Utilization of each shared connection pool")
+
+
+def collect_http_connection_pool_metrics() -> HTTPConnectionPoolMonitorResponse:
+    """Collect utilization metrics for the HTTP connection pools shared by LLM and embedder clients."""
+    from nat.llm.utils.connection_pool import get_connection_pool_stats
+
+    return HTTPConnectionPoolMonitorResponse(
+        timestamp=datetime.now(),
+        pools=[HTTPConnectionPoolMetrics(**dataclasses.asdict(stats)) for stats in get_connection_pool_stats()],
+    )
 
 
 class PerUserMetricsCollector:
@@ -123,6 +174,32 @@ class PerUserMetricsCollector:
             timestamp=datetime.now(),
             total_active_users=len(users),
             users=users,
+            pools=[await self.collect_pool_metrics()],
+        )
+
+    async def collect_pool_metrics(self) -> PerUserBuilderPoolMetrics:
+        """Collect capacity and lifecycle metrics for the per-user workflows.
+
+        Returns:
+            PerUserBuilderPoolMetrics for the SessionManager
+        """
+        session_manager = self._session_manager
+        async with session_manager._per_user_builders_lock:
+            builders = list(session_manager._per_user_builders.values())
+            stats = session_manager._per_user_pool_stats.model_copy()
+
+        return PerUserBuilderPoolMetrics(
+            entry_function=session_manager._entry_function,
+            max_workflows=session_manager._max_per_user_builders or None,
+            workflows=len(builders),
+            active_workflows=sum(1 for builder_info in builders if builder_info.ref_count > 0),
+            waiting_requests=stats.waiting_requests,
+            created=stats.created,
+            avg_build_time_ms=round(stats.total_build_time_ms / stats.created if stats.created > 0 else 0.0, 2),
+            expired=stats.expired,
+            evicted=stats.evicted,
+            admissions_waited=stats.admissions_waited,
+            admissions_rejected=stats.admissions_rejected,
         )
 
     def _build_user_metrics(self, user_id: str, builder_info) -> PerUserResourceUsage:
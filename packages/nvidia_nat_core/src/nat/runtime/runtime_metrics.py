@@ -0,0 +1,268 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+In-process latency histograms and counters for workflow runs, exported in the Prometheus text format.
+
+The metrics are fed from the intermediate step stream of each run, so recording them only costs a few dictionary
+lookups per step. To keep the number of series bounded, each metric keeps at most ``max_series`` distinct label
+combinations; later values of its first label (a workflow, function, LLM or tool name) are reported as ``__other__``.
+"""
+
+import threading
+import time
+import typing
+from abc import ABC
+from abc import abstractmethod
+from contextlib import asynccontextmanager
+
+from nat.data_models.intermediate_step import IntermediateStep
+from nat.data_models.intermediate_step import IntermediateStepCategory
+from nat.data_models.intermediate_step import IntermediateStepState
+
+if typing.TYPE_CHECKING:
+    from nat.builder.context import ContextState
+
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (0.005,
+                                              0.01,
+                                              0.025,
+                                              0.05,
+                                              0.1,
+                                              0.25,
+                                              0.5,
+                                              1.0,
+                                              2.5,
+                                              5.0,
+                                              10.0,
+                                              30.0,
+                                              60.0,
+                                              120.0,
+                                              300.0)
+DEFAULT_MAX_SERIES: int = 100
+OTHER_LABEL_VALUE: str = "__other__"
+
+_STEP_CATEGORIES = {
+    IntermediateStepCategory.FUNCTION: "function",
+    IntermediateStepCategory.LLM: "llm",
+    IntermediateStepCategory.TOOL: "tool",
+}
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_labels(label_names: tuple[str, ...], label_values: tuple[str, ...], extra: str = "") -> str:
+    labels = [f'{name}="{_escape_label_value(value)}"' for name, value in zip(label_names, label_values)]
+    if extra:
+        labels.append(extra)
+    return "{" + ",".join(labels) + "}" if labels else ""
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _Metric(ABC):
+    """Base class for a metric with a fixed set of label names and a bounded number of series."""
+
+    metric_type: str = ""
+
+    def __init__(self, name: str, description: str, label_names: tuple[str, ...], max_series: int) -> None:
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self._max_series = max_series
+        self._series: dict[tuple[str, ...], typing.Any] = {}
+        self._lock = threading.Lock()
+
+    def _series_key(self, label_values: tuple[str, ...]) -> tuple[str, ...]:
+        if label_values in self._series or len(self._series) < self._max_series:
+            return label_values
+        return (OTHER_LABEL_VALUE, ) + label_values[1:]
+
+    @abstractmethod
+    def _render_series(self, label_values: tuple[str, ...], series: typing.Any) -> list[str]:
+        """Render the Prometheus sample lines of one series."""
+        pass
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.metric_type}"]
+        with self._lock:
+            for label_values, series in sorted(self._series.items()):
+                lines.extend(self._render_series(label_values, series))
+        return lines
+
+
+class Counter(_Metric):
+    """A monotonically increasing counter."""
+
+    metric_type = "counter"
+
+    def inc(self, amount: float, *label_values: str) -> None:
+        with self._lock:
+            key = self._series_key(label_values)
+            self._series[key] = self._series.get(key, 0) + amount
+
+    def value(self, *label_values: str) -> float:
+        with self._lock:
+            return self._series.get(label_values, 0)
+
+    def _render_series(self, label_values: tuple[str, ...], series: float) -> list[str]:
+        return [f"{self.name}{_format_labels(self.label_names, label_values)} {_format_value(series)}"]
+
+
+class _HistogramSeries:
+    __slots__ = ("bucket_counts", "sum", "count")
+
+    def __init__(self, num_buckets: int) -> None:
+        self.bucket_counts = [0] * num_buckets
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(_Metric):
+    """A histogram of observed values with fixed bucket upper bounds."""
+
+    metric_type = "histogram"
+
+    def __init__(self,
+                 name: str,
+                 description: str,
+                 label_names: tuple[str, ...],
+                 max_series: int,
+                 buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> None:
+        super().__init__(name, description, label_names, max_series)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *label_values: str) -> None:
+        with self._lock:
+            key = self._series_key(label_values)
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _HistogramSeries(len(self.buckets))
+            for i, upper_bound in enumerate(self.buckets):
+                if value <= upper_bound:
+                    series.bucket_counts[i] += 1
+                    break
+            series.sum += value
+            series.count += 1
+
+    def count(self, *label_values: str) -> int:
+        with self._lock:
+            series = self._series.get(label_values)
+            return series.count if series is not None else 0
+
+    def _render_series(self, label_values: tuple[str, ...], series: _HistogramSeries) -> list[str]:
+        lines = []
+        cumulative = 0
+        for upper_bound, bucket_count in zip(self.buckets, series.bucket_counts):
+            cumulative += bucket_count
+            labels = _format_labels(self.label_names, label_values, f'le="{_format_value(upper_bound)}"')
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        inf_labels = _format_labels(self.label_names, label_values, 'le="+Inf"')
+        lines.append(f"{self.name}_bucket{inf_labels} {series.count}")
+        labels = _format_labels(self.label_names, label_values)
+        lines.append(f"{self.name}_sum{labels} {_format_value(series.sum)}")
+        lines.append(f"{self.name}_count{labels} {series.count}")
+        return lines
+
+
+class RuntimeMetrics:
+    """
+    Registry of the request, queue wait, step latency and token metrics of workflow runs.
+
+    Parameters
+    ----------
+    max_series: int, optional, default=100
+        Maximum number of label combinations kept by each metric.
+    buckets: tuple[float, ...], optional
+        Upper bounds, in seconds, of the latency histogram buckets.
+    """
+
+    def __init__(self,
+                 max_series: int = DEFAULT_MAX_SERIES,
+                 buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.requests = Counter("nat_requests_total",
+                                "Number of workflow runs, by outcome.", ("workflow", "status"),
+                                max_series)
+        self.request_duration = Histogram("nat_request_duration_seconds",
+                                          "Duration of workflow runs, excluding the time waiting to start.",
+                                          ("workflow", ),
+                                          max_series,
+                                          buckets)
+        self.queue_wait = Histogram("nat_request_queue_wait_seconds",
+                                    "Time workflow runs waited for a concurrency slot before starting.", ("workflow", ),
+                                    max_series,
+                                    buckets)
+        self.step_duration = Histogram("nat_step_duration_seconds",
+                                       "Duration of function, LLM and tool calls made by workflow runs.",
+                                       ("name", "category"),
+                                       max_series,
+                                       buckets)
+        self.llm_tokens = Counter("nat_llm_tokens_total",
+                                  "Number of tokens processed by LLM calls, by type.", ("name", "type"),
+                                  max_series)
+
+    def observe_step(self, step: IntermediateStep) -> None:
+        """Record the duration, and for LLM calls the token usage, of a completed function, LLM or tool call."""
+        if step.event_state != IntermediateStepState.END or step.span_event_timestamp is None:
+            return
+
+        category = _STEP_CATEGORIES.get(step.event_category)
+        if category is None:
+            return
+
+        name = step.name or "unknown"
+        self.step_duration.observe(max(0.0, step.event_timestamp - step.span_event_timestamp), name, category)
+
+        if step.event_category == IntermediateStepCategory.LLM and step.usage_info is not None:
+            token_usage = step.usage_info.token_usage
+            if token_usage.prompt_tokens:
+                self.llm_tokens.inc(token_usage.prompt_tokens, name, "prompt")
+            if token_usage.completion_tokens:
+                self.llm_tokens.inc(token_usage.completion_tokens, name, "completion")
+
+    @asynccontextmanager
+    async def track_run(self, workflow: str, context_state: "ContextState", queue_wait: float):
+        """
+        Record the queue wait, duration and outcome of a workflow run, and the steps it emits. Must be entered after
+        the run has started, so the event stream of the run is set in ``context_state``.
+        """
+        self.queue_wait.observe(queue_wait, workflow)
+        subscription = context_state.event_stream.get().subscribe(on_next=self.observe_step)
+        started_at = time.perf_counter()
+        status = "error"
+        try:
+            yield
+            status = "success"
+        finally:
+            subscription.unsubscribe()
+            self.request_duration.observe(time.perf_counter() - started_at, workflow)
+            self.requests.inc(1, workflow, status)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        for metric in (self.requests, self.request_duration, self.queue_wait, self.step_duration, self.llm_tokens):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+_runtime_metrics = RuntimeMetrics()
+
+
+def get_runtime_metrics() -> RuntimeMetrics:
+    """Return the process-wide runtime metrics registry."""
+    return _runtime_metrics
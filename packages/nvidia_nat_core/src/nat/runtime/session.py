@@ -44,6 +44,7 @@ from nat.data_models.interactive import HumanResponse
 from nat.data_models.interactive import InteractionPrompt
 from nat.data_models.runtime_enum import RuntimeTypeEnum
 from nat.data_models.user_info import UserInfo
+from nat.runtime.runtime_metrics import get_runtime_metrics
 from nat.runtime.user_manager import UserManager
 
 if typing.TYPE_CHECKING:
@@ -91,6 +92,35 @@ class PerUserBuilderInfo(BaseModel):
             self.error_count += 1
 
 
+class PerUserBuilderPoolStats(BaseModel):
+    """Counters of per-user builder lifecycle events, reported by the per-user monitoring endpoint."""
+
+    created: int = Field(default=0, ge=0, description="Number of per-user builders created")
+    total_build_time_ms: float = Field(default=0.0,
+                                       ge=0,
+                                       description="Total time spent creating per-user builders in milliseconds")
+    expired: int = Field(default=0, ge=0, description="Number of builders removed after `per_user_workflow_timeout`")
+    evicted: int = Field(default=0,
+                         ge=0,
+                         description="Number of idle builders evicted to stay within `max_per_user_workflows`")
+    admissions_waited: int = Field(default=0, ge=0, description="Number of requests that waited for a free builder")
+    admissions_rejected: int = Field(default=0,
+                                     ge=0,
+                                     description="Number of requests rejected after waiting for a free builder")
+    waiting_requests: int = Field(default=0, ge=0, description="Number of requests currently waiting")
+
+
+class PerUserWorkflowCapacityError(RuntimeError):
+    """
+    Raised when a per-user workflow cannot be created for a new user, because `max_per_user_workflows` are in use and
+    none became idle within `per_user_workflow_admission_timeout`.
+    """
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class Session:
     """
     Represents an active session with access to workflow and builders.
@@ -162,10 +192,19 @@ class Session:
             token_parent_id = context_state.workflow_parent_id.set(parent_id)
         if parent_name is not None:
             token_parent_name = context_state.workflow_parent_name.set(parent_name)
+        runtime_metrics = self._session_manager._runtime_metrics
         try:
+            queued_at = time.perf_counter()
             async with self._semaphore:
+                queue_wait = time.perf_counter() - queued_at
                 async with self._workflow.run(message, runtime_type=runtime_type) as runner:
-                    yield runner
+                    if runtime_metrics is None:
+                        yield runner
+                    else:
+                        async with runtime_metrics.track_run(self._session_manager._entry_function or "default",
+                                                             context_state,
+                                                             queue_wait=queue_wait):
+                            yield runner
         finally:
             if token_parent_id is not None:
                 context_state.workflow_parent_id.reset(token_parent_id)
@@ -190,6 +229,8 @@ class SessionManager:
         - One SessionManager per FastAPI server
         - Creates/caches PerUserWorkflowBuilder instances per user
         - Cleans up inactive builders based on timeout
+        - Optionally caps the number of builders, evicting the least recently used idle builder and making requests
+          for new users wait when every builder is in use
 
         Parameters
         ----------
@@ -240,6 +281,12 @@ class SessionManager:
         self._per_user_builders_cleanup_task: asyncio.Task | None = None
         self._per_user_session_timeout = config.general.per_user_workflow_timeout
         self._per_user_session_cleanup_interval = config.general.per_user_workflow_cleanup_interval
+        self._max_per_user_builders = config.general.max_per_user_workflows
+        self._per_user_admission_timeout = config.general.per_user_workflow_admission_timeout
+        # Notified when a per-user builder becomes idle, for requests waiting for a free builder
+        self._per_user_builder_released = asyncio.Condition(self._per_user_builders_lock)
+        self._per_user_pool_stats = PerUserBuilderPoolStats()
+        self._runtime_metrics = get_runtime_metrics() if config.general.enable_runtime_metrics else None
         self._shutdown_event = asyncio.Event()
 
         # Cache schemas for per-user workflows
@@ -379,6 +426,7 @@ class SessionManager:
                     # Remove from dict and add to cleanup list
                     builders_to_cleanup.append((user_id, builder_info))
                     del self._per_user_builders[user_id]
+                    self._per_user_pool_stats.expired += 1
                     logger.debug(f"Marked per-user builder for user {user_id} for cleanup "
                                  f"(inactive since {builder_info.last_activity.isoformat()})")
         # Cleanup builders (outside lock to avoid blocking)
@@ -407,49 +455,120 @@ class SessionManager:
             logger.debug(f"Could not extract user_id from context: {e}")
             return None
 
-    async def _get_or_create_per_user_builder(self, user_id: str) -> tuple["PerUserWorkflowBuilder", Workflow]:
+    async def _make_room_for_per_user_builder(self, user_id: str) -> list[tuple[str, PerUserBuilderInfo]]:
+        """
+        Make room for a new per-user builder when `max_per_user_workflows` is reached, by evicting the least recently
+        used idle builder. When every builder is in use, wait for one to become idle, up to the admission timeout.
+
+        Must be called with the per-user builders lock held. The builder for ``user_id`` may have been created by
+        another request while waiting. The evicted builders are removed from the pool and returned, the caller cleans
+        them up with `_cleanup_evicted_per_user_builders` once the lock is released.
+        """
+        max_builders = self._max_per_user_builders
+        evicted: list[tuple[str, PerUserBuilderInfo]] = []
+        if max_builders <= 0:
+            return evicted
+
+        def _has_room() -> bool:
+            return (user_id in self._per_user_builders or len(self._per_user_builders) < max_builders
+                    or any(info.ref_count == 0 for info in self._per_user_builders.values()))
+
+        if not _has_room():
+            self._per_user_pool_stats.admissions_waited += 1
+            self._per_user_pool_stats.waiting_requests += 1
+            timeout = self._per_user_admission_timeout.total_seconds()
+            try:
+                await asyncio.wait_for(self._per_user_builder_released.wait_for(_has_room), timeout=timeout)
+            except TimeoutError as e:
+                self._per_user_pool_stats.admissions_rejected += 1
+                raise PerUserWorkflowCapacityError(
+                    f"All {max_builders} per-user workflows are in use, could not create one for user {user_id}",
+                    retry_after=max(1, round(timeout))) from e
+            finally:
+                self._per_user_pool_stats.waiting_requests -= 1
+
+        while user_id not in self._per_user_builders and len(self._per_user_builders) >= max_builders:
+            lru_user_id, lru_info = min(((uid, info) for uid, info in self._per_user_builders.items()
+                                         if info.ref_count == 0),
+                                        key=lambda item: item[1].last_activity)
+            del self._per_user_builders[lru_user_id]
+            self._per_user_pool_stats.evicted += 1
+            evicted.append((lru_user_id, lru_info))
+
+        return evicted
+
+    async def _cleanup_evicted_per_user_builders(self, evicted: list[tuple[str, PerUserBuilderInfo]]) -> None:
+        for user_id, builder_info in evicted:
+            try:
+                await builder_info.builder.__aexit__(None, None, None)
+                logger.info(f"Evicted least recently used per-user builder for user={user_id} "
+                            f"(inactive since {builder_info.last_activity.isoformat()})")
+            except Exception:
+                logger.exception(f"Error cleaning up evicted per-user builder for user {user_id}")
+
+    async def _get_or_create_per_user_builder(self,
+                                              user_id: str,
+                                              acquire: bool = False) -> tuple["PerUserWorkflowBuilder", Workflow]:
+        """
+        Get the per-user builder and workflow of a user, creating them if needed. When ``acquire`` is set, the
+        reference count of the builder is incremented before the lock is released, so it cannot be evicted before the
+        caller starts using it.
+        """
         from nat.builder.per_user_workflow_builder import PerUserWorkflowBuilder
 
-        async with self._per_user_builders_lock:
-            if user_id in self._per_user_builders:
-                builder_info = self._per_user_builders[user_id]
-                builder_info.last_activity = datetime.now()
+        evicted: list[tuple[str, PerUserBuilderInfo]] = []
+        try:
+            async with self._per_user_builders_lock:
+                evicted = await self._make_room_for_per_user_builder(user_id)
 
-                return builder_info.builder, builder_info.workflow
+                if user_id in self._per_user_builders:
+                    builder_info = self._per_user_builders[user_id]
+                    builder_info.last_activity = datetime.now()
+                    if acquire:
+                        async with builder_info.lock:
+                            builder_info.ref_count += 1
 
-            logger.info(f"Creating per-user builder for user={user_id}, entry_function={self._entry_function}")
-            builder = PerUserWorkflowBuilder(user_id=user_id, shared_builder=self._shared_builder)
-            # Enter the builder's context manually to avoid exiting the context manager
-            # Exit the context when cleaning up the builder
-            await builder.__aenter__()
+                    return builder_info.builder, builder_info.workflow
+
+                logger.info(f"Creating per-user builder for user={user_id}, entry_function={self._entry_function}")
+                builder = PerUserWorkflowBuilder(user_id=user_id, shared_builder=self._shared_builder)
+                # Enter the builder's context manually to avoid exiting the context manager
+                # Exit the context when cleaning up the builder
+                build_start_time = time.perf_counter()
+                await builder.__aenter__()
 
-            try:
-                await builder.populate_builder(self._config)
-                workflow = await builder.build(entry_function=self._entry_function)
-
-                # Create per-user semaphore for concurrency control
-                if self._max_concurrency > 0:
-                    per_user_semaphore = asyncio.Semaphore(self._max_concurrency)
-                else:
-                    per_user_semaphore = nullcontext()
-
-                builder_info = PerUserBuilderInfo(builder=builder,
-                                                  workflow=workflow,
-                                                  semaphore=per_user_semaphore,
-                                                  last_activity=datetime.now(),
-                                                  ref_count=0,
-                                                  lock=asyncio.Lock())
-                self._per_user_builders[user_id] = builder_info
-                logger.info(
-                    f"Created per-user builder for user={user_id} (total users: {len(self._per_user_builders)})")
-                return builder_info.builder, builder_info.workflow
-            except Exception:
-                logger.exception(f"Error creating per-user builder for user {user_id}")
                 try:
-                    await builder.__aexit__(None, None, None)
+                    await builder.populate_builder(self._config)
+                    workflow = await builder.build(entry_function=self._entry_function)
+
+                    # Create per-user semaphore for concurrency control
+                    if self._max_concurrency > 0:
+                        per_user_semaphore = asyncio.Semaphore(self._max_concurrency)
+                    else:
+                        per_user_semaphore = nullcontext()
+
+                    builder_info = PerUserBuilderInfo(builder=builder,
+                                                      workflow=workflow,
+                                                      semaphore=per_user_semaphore,
+                                                      last_activity=datetime.now(),
+                                                      ref_count=1 if acquire else 0,
+                                                      lock=asyncio.Lock())
+                    self._per_user_builders[user_id] = builder_info
+                    self._per_user_pool_stats.created += 1
+                    self._per_user_pool_stats.total_build_time_ms += (time.perf_counter() - build_start_time) * 1000
+                    logger.info(
+                        f"Created per-user builder for user={user_id} (total users: {len(self._per_user_builders)})")
+                    return builder_info.builder, builder_info.workflow
                 except Exception:
-                    logger.exception("Error during builder cleanup after failed creation")
-                raise
+                    logger.exception(f"Error creating per-user builder for user {user_id}")
+                    try:
+                        await builder.__aexit__(None, None, None)
+                    except Exception:
+                        logger.exception("Error during builder cleanup after failed creation")
+                    raise
+        finally:
+            # Cleanup evicted builders (outside lock to avoid blocking)
+            await self._cleanup_evicted_per_user_builders(evicted)
 
     @asynccontextmanager
     async def session(self,
@@ -511,11 +630,9 @@ class SessionManager:
 
             if self._is_workflow_per_user:
                 logger.debug(f"Getting or creating per-user builder for user {user_id}")
-                _, workflow = await self._get_or_create_per_user_builder(user_id)
+                _, workflow = await self._get_or_create_per_user_builder(user_id, acquire=True)
                 builder_info = self._per_user_builders[user_id]
-                async with builder_info.lock:
-                    builder_info.ref_count += 1
-                    logger.debug(f"Incremented ref_count for user {user_id} to {builder_info.ref_count}")
+                logger.debug(f"Incremented ref_count for user {user_id} to {builder_info.ref_count}")
                 semaphore = builder_info.semaphore
                 request_start_time = time.perf_counter()
             else:
@@ -541,6 +658,11 @@ class SessionManager:
                         latency_ms = (time.perf_counter() - request_start_time) * 1000
                         builder_info.record_request(latency_ms, request_success)
 
+                # Wake up requests waiting for a free per-user builder
+                if builder_info.ref_count == 0 and self._per_user_pool_stats.waiting_requests > 0:
+                    async with self._per_user_builder_released:
+                        self._per_user_builder_released.notify_all()
+
             if token_workflow_parent_name is not None:
                 self._context_state.workflow_parent_name.reset(token_workflow_parent_name)
             if token_workflow_parent_id is not None:
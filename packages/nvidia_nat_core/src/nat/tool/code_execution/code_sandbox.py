@@ -13,14 +13,14 @@
 # limitations under the License.
 
 import abc
+import asyncio
 import json
 import logging
 import textwrap
 from typing import Any
 from urllib.parse import urljoin
 
-import requests
-import requests.adapters
+import httpx
 from pydantic import HttpUrl
 
 from nat.utils.type_utils import override
@@ -41,35 +41,80 @@ class Sandbox(abc.ABC):
             Can also be specified through NEMO_SKILLS_SSH_SERVER env var.
         ssh_key_path: Optional[str] = None - Path to the ssh key for tunneling.
             Can also be specified through NEMO_SKILLS_SSH_KEY_PATH env var.
+        max_concurrent_requests: int = 16 - Maximum number of requests sent to the sandbox server at once,
+            further requests wait for one of them to finish.
+        max_response_bytes: int = 10MB - Maximum size of a response. Responses are read incrementally and
+            reading stops once this size is exceeded.
+
+    The sandbox keeps a pool of keep-alive connections to the server, call `aclose` when it is no longer needed.
     """
 
     def __init__(
         self,
         *,
         uri: HttpUrl,
+        max_concurrent_requests: int = 16,
+        max_response_bytes: int = 10 * 1024 * 1024,
     ):
         self.url: str = self._get_execute_url(uri)
-        session = requests.Session()
-        adapter = requests.adapters.HTTPAdapter(pool_maxsize=1500, pool_connections=1500, max_retries=3)
-        session.mount('http://', adapter)
-        session.mount('https://', adapter)
-        self.http_session: requests.Session = session
-
-    def _send_request(self, request: dict[str, Any], timeout_seconds: float) -> dict[str, str]:
-        output = self.http_session.post(
-            url=self.url,
-            data=json.dumps(request),
-            timeout=timeout_seconds,
-            headers={"Content-Type": "application/json"},
-        )
-        # retrying 502 errors
-        if output.status_code == 502:
-            raise requests.exceptions.Timeout
-
-        return self._parse_request_output(output)
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_response_bytes = max_response_bytes
+        self._http_client: httpx.AsyncClient | None = None
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        if self._http_client is None:
+            # Connection errors are retried, like the previous synchronous client did
+            transport = httpx.AsyncHTTPTransport(retries=3,
+                                                 limits=httpx.Limits(
+                                                     max_connections=self.max_concurrent_requests,
+                                                     max_keepalive_connections=self.max_concurrent_requests))
+            self._http_client = httpx.AsyncClient(transport=transport)
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """Close the connections to the sandbox server."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _send_request(self, request: dict[str, Any], timeout_seconds: float) -> dict[str, str]:
+        async with self._semaphore, self._get_http_client().stream(
+                "POST",
+                self.url,
+                content=json.dumps(request),
+                timeout=timeout_seconds,
+                headers={"Content-Type": "application/json"},
+        ) as output:
+            # retrying 502 errors
+            if output.status_code == 502:
+                raise httpx.TimeoutException("Bad gateway", request=output.request)
+
+            content = bytearray()
+            async for chunk in output.aiter_bytes():
+                content.extend(chunk)
+                if len(content) > self.max_response_bytes:
+                    logger.error("Sandbox response exceeded %d bytes, discarding it", self.max_response_bytes)
+                    return {
+                        "process_status": "error",
+                        "stdout": "",
+                        "stderr": f"Output too large, the sandbox response exceeded {self.max_response_bytes} bytes\n"
+                    }
+
+        # The content is already decoded, so the encoding headers of the streamed response no longer apply to it
+        headers = [(name, value) for name, value in output.headers.multi_items()
+                   if name.lower() not in ("content-encoding", "content-length")]
+        return self._parse_request_output(
+            httpx.Response(output.status_code, headers=headers, content=bytes(content), request=output.request))
 
     @abc.abstractmethod
-    def _parse_request_output(self, output: requests.Response) -> dict[str, str]:
+    def _parse_request_output(self, output: httpx.Response) -> dict[str, str]:
         pass
 
     @abc.abstractmethod
@@ -131,28 +176,51 @@ class Sandbox(abc.ABC):
         """).strip()
         request = self._prepare_request(code_to_execute, timeout_seconds)
         try:
-            return self._send_request(request, timeout_seconds)
-        except requests.exceptions.Timeout:
+            return await self._send_request(request, timeout_seconds)
+        except httpx.TimeoutException:
             return {"process_status": "timeout", "stdout": "", "stderr": "Timed out\n"}
 
+    async def execute_many(
+        self,
+        generated_codes: list[str],
+        timeout_seconds: float = 10.0,
+        language: str = "python",
+        max_output_characters: int = 1000,
+    ) -> list[dict[str, str]]:
+        """
+        Execute several pieces of code concurrently, at most `max_concurrent_requests` at a time.
+
+        Each piece of code runs independently. The results are returned in the order of `generated_codes`, and a
+        request that fails is reported as an error result instead of failing the whole batch.
+        """
+
+        async def _execute(generated_code: str) -> dict[str, str]:
+            try:
+                return await self.execute_code(generated_code,
+                                               timeout_seconds=timeout_seconds,
+                                               language=language,
+                                               max_output_characters=max_output_characters)
+            except Exception as e:
+                logger.exception("Error when executing code in the sandbox, %s", e)
+                return {"process_status": "error", "stdout": "", "stderr": str(e)}
+
+        return list(await asyncio.gather(*(_execute(generated_code) for generated_code in generated_codes)))
+
 
 class LocalSandbox(Sandbox):
     """Locally hosted sandbox."""
 
-    def __init__(self, *, uri: HttpUrl):
-        super().__init__(uri=uri)
-
     @override
     def _get_execute_url(self, uri: HttpUrl) -> str:
         return urljoin(str(uri), "execute")
 
     @override
-    def _parse_request_output(self, output: requests.Response) -> dict[str, str]:
+    def _parse_request_output(self, output: httpx.Response) -> dict[str, str]:
         try:
             output_json = output.json()
             assert isinstance(output_json, dict)
             return output_json
-        except (requests.exceptions.JSONDecodeError, AssertionError) as e:
+        except (json.JSONDecodeError, AssertionError) as e:
             logger.exception("Error parsing output: %s. %s", output.text, e)
             return {'process_status': 'error', 'stdout': '', 'stderr': f'Unknown error: {e} \"{output.text}\"'}
 
@@ -215,8 +283,8 @@ class LocalSandbox(Sandbox):
         # Our server already handles stdout/stderr capture and error handling
         request = self._prepare_request(actual_code, timeout_seconds, language)
         try:
-            return self._send_request(request, timeout_seconds)
-        except requests.exceptions.Timeout:
+            return await self._send_request(request, timeout_seconds)
+        except httpx.TimeoutException:
             return {"process_status": "timeout", "stdout": "", "stderr": "Timed out\n"}
 
 
@@ -228,7 +296,7 @@ class PistonSandbox(Sandbox):
         return urljoin(str(uri), "execute")
 
     @override
-    def _parse_request_output(self, output: requests.Response) -> dict[str, str]:
+    def _parse_request_output(self, output: httpx.Response) -> dict[str, str]:
         output_json = output.json()
         assert isinstance(output_json, dict)
         assert 'run' in output_json
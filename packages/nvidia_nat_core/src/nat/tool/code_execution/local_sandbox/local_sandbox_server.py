@@ -14,13 +14,22 @@
 
 from __future__ import annotations
 
+import atexit
 import contextlib
+import functools
+import importlib
 import logging
 import multiprocessing
 import os
+import queue
 import resource
+import threading
+import time
+from dataclasses import dataclass
 from enum import StrEnum
 from io import StringIO
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
 
 from flask import Flask
 from flask import Request
@@ -77,68 +86,314 @@ def add_hsts_header(response):
     return response
 
 
-def execute_python(generated_code: str, timeout: float) -> CodeExecutionResult:
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+# Number of warm worker processes per server process
+POOL_SIZE = _env_int("SANDBOX_POOL_SIZE", 4)
+# Number of executions after which a worker is replaced by a fresh one, set to 1 to run every execution in a fresh
+# process
+MAX_RUNS_PER_WORKER = _env_int("SANDBOX_MAX_RUNS_PER_WORKER", 20)
+# need to memory-limit to avoid common errors of allocating too much
+# 10gb - somehow with a smaller limit the server dies when numpy is used
+MEMORY_LIMIT_BYTES = _env_int("SANDBOX_MEMORY_LIMIT_BYTES", 1024 * 1024 * 1024 * 10)
+# Maximum number of seconds a request waits for a free worker
+ACQUIRE_TIMEOUT = _env_int("SANDBOX_ACQUIRE_TIMEOUT", 60)
+# Modules imported by each worker before it accepts work, so executions that use them skip the import cost
+PREIMPORT_MODULES = tuple(module.strip()
+                          for module in os.environ.get("SANDBOX_PREIMPORT_MODULES", "numpy,pandas").split(",")
+                          if module.strip())
+
+# Sent by a worker once it is ready to accept work
+_WORKER_READY = "ready"
+# Number of attempts to start a worker before giving up, and the delay before the first retry in seconds
+_WORKER_START_ATTEMPTS = 3
+_WORKER_START_RETRY_DELAY = 1.0
+
+
+def _set_resource_limits(memory_limit: int) -> None:
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+        resource.setrlimit(resource.RLIMIT_DATA, (memory_limit, memory_limit))
+    except Exception as e:
+        logger.exception("Failed to set resource limits, PID: %s, error: %s", os.getpid(), e)
+
+
+def run_code(generated_code: str) -> CodeExecutionResult:
     """
-    Execute Python code in a subprocess.
+    Execute code in the current process, capturing its output.
 
     Args:
         generated_code: The code to execute
-        timeout: The timeout for the execution
 
     Returns:
         CodeExecutionResult object containing the execution result
     """
+    stdout_capture = StringIO()
+    stderr_capture = StringIO()
+    try:
+        with contextlib.redirect_stdout(stdout_capture), contextlib.redirect_stderr(stderr_capture):
+            exec(generated_code, {})
+        return CodeExecutionResult(stdout=stdout_capture.getvalue(), stderr=stderr_capture.getvalue())
+    except (Exception, SystemExit) as e:
+        import traceback
+        with contextlib.redirect_stderr(stderr_capture):
+            traceback.print_exc()
+        logger.debug("Code execution failed, PID: %s, error: %s", os.getpid(), e)
+        return CodeExecutionResult(process_status=CodeExecutionStatus.ERROR,
+                                   stdout=stdout_capture.getvalue(),
+                                   stderr=stderr_capture.getvalue())
 
-    # running in a separate process to ensure any kind of crashes are properly handled
-    queue = multiprocessing.Queue()
-    process = multiprocessing.Process(target=execute_code_subprocess, args=(generated_code, queue))
 
-    process.start()
-    # wait until the process finishes or the timeout expires
-    process.join(timeout=timeout)
-    if process.exitcode is None:
-        process.kill()
-        return CodeExecutionResult(process_status=CodeExecutionStatus.TIMEOUT, stdout="", stderr="Timed out\n")
+def _worker_main(conn: Connection, memory_limit: int, preimport_modules: tuple[str, ...]) -> None:
+    """
+    Entry point of a pool worker process: sets resource limits and imports common modules once, then runs the code
+    it receives until the connection is closed. Each execution gets fresh globals and the working directory is
+    restored afterwards.
+    """
+    logger.debug("Sandbox worker started, PID: %s", os.getpid())
+    _set_resource_limits(memory_limit)
+
+    for module in preimport_modules:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            logger.debug("Failed to pre-import %s, PID: %s, error: %s", module, os.getpid(), e)
+
+    cwd = os.getcwd()
+    conn.send(_WORKER_READY)
+    while True:
+        try:
+            generated_code = conn.recv()
+        except EOFError:
+            return
+
+        result = run_code(generated_code)
+        with contextlib.suppress(OSError):
+            os.chdir(cwd)
+        conn.send(result.model_dump())
+
+
+# Compared by identity, so workers can be kept in a set
+@dataclass(eq=False)
+class _PoolWorker:
+    process: BaseProcess
+    conn: Connection
+    runs: int = 0
+
+    def stop(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+
+class ExecutionWorkerPool:
+    """
+    A pool of warm worker processes that execute code.
 
-    return queue.get()
+    Workers are started ahead of time with resource limits applied and common modules imported, so an execution only
+    pays for running the code. A worker runs one execution at a time. It is replaced by a fresh worker after
+    `max_runs_per_worker` executions, when an execution times out, and when it crashes. Replacement workers are
+    started in the background, and a worker that fails to start is retried a few times. When no worker is alive or
+    starting, executions fail immediately and the missing workers are started again.
 
+    Args:
+        size: Number of worker processes
+        max_runs_per_worker: Number of executions after which a worker is replaced
+        memory_limit: Address space limit of each worker, in bytes
+        preimport_modules: Modules imported by each worker before it accepts work
+        acquire_timeout: Maximum number of seconds to wait for a free worker
+    """
 
-# need to memory-limit to avoid common errors of allocating too much
-# but this has to be done in a subprocess to not crush server itself
-def execute_code_subprocess(generated_code: str, queue):
+    def __init__(self,
+                 size: int = POOL_SIZE,
+                 max_runs_per_worker: int = MAX_RUNS_PER_WORKER,
+                 memory_limit: int = MEMORY_LIMIT_BYTES,
+                 preimport_modules: tuple[str, ...] = PREIMPORT_MODULES,
+                 acquire_timeout: float = ACQUIRE_TIMEOUT):
+        self._max_runs_per_worker = max_runs_per_worker
+        self._memory_limit = memory_limit
+        self._preimport_modules = preimport_modules
+        self._acquire_timeout = acquire_timeout
+
+        self._size = size
+        self._context = multiprocessing.get_context()
+        self._idle: queue.Queue[_PoolWorker] = queue.Queue()
+        self._closed = False
+        self._workers: set[_PoolWorker] = set()
+        self._starting = 0
+        self._lock = threading.Lock()
+
+        self._fill()
+
+    def _try_start_worker(self) -> _PoolWorker | None:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(target=_worker_main,
+                                        args=(child_conn, self._memory_limit, self._preimport_modules))
+        process.start()
+        child_conn.close()
+        worker = _PoolWorker(process=process, conn=parent_conn)
+
+        try:
+            # Only hand out the worker once it has finished starting up
+            if parent_conn.recv() == _WORKER_READY:
+                return worker
+        except (EOFError, OSError):
+            pass
+
+        worker.stop()
+        logger.warning("Sandbox worker failed to start, exit code: %s", process.exitcode)
+        return None
+
+    def _start_worker(self) -> None:
+        worker = None
+        try:
+            for attempt in range(_WORKER_START_ATTEMPTS):
+                if self._closed:
+                    return
+                if attempt > 0:
+                    time.sleep(_WORKER_START_RETRY_DELAY * 2**(attempt - 1))
+                worker = self._try_start_worker()
+                if worker is not None:
+                    break
+            else:
+                logger.error("Giving up on starting a sandbox worker after %d attempts", _WORKER_START_ATTEMPTS)
+                return
+
+            with self._lock:
+                if self._closed:
+                    worker.stop()
+                    return
+                self._workers.add(worker)
+            self._idle.put(worker)
+        finally:
+            with self._lock:
+                self._starting -= 1
+
+    def _add_worker_in_background(self) -> None:
+        with self._lock:
+            self._starting += 1
+        threading.Thread(target=self._start_worker, name="sandbox_worker_start", daemon=True).start()
+
+    def _fill(self) -> None:
+        """Start workers in the background until the pool is back to its size."""
+        with self._lock:
+            missing = self._size - len(self._workers) - self._starting
+        for _ in range(missing):
+            self._add_worker_in_background()
+
+    def _has_workers(self) -> bool:
+        with self._lock:
+            return bool(self._workers) or self._starting > 0
+
+    def _replace_worker(self, worker: _PoolWorker) -> None:
+        with self._lock:
+            self._workers.discard(worker)
+        worker.stop()
+        if not self._closed:
+            self._add_worker_in_background()
+
+    def _acquire_worker(self) -> _PoolWorker | None:
+        """Wait for a free worker. Returns None when none is alive or starting, or when the wait times out."""
+        deadline = time.monotonic() + self._acquire_timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                return self._idle.get(timeout=max(0.0, min(remaining, 1.0)))
+            except queue.Empty:
+                pass
+            if not self._has_workers() or remaining <= 0:
+                return None
+
+    def execute(self, generated_code: str, timeout: float) -> CodeExecutionResult:
+        """
+        Execute code on a free worker, waiting for one if they are all busy.
+
+        Args:
+            generated_code: The code to execute
+            timeout: The timeout for the execution
+
+        Returns:
+            CodeExecutionResult object containing the execution result
+        """
+        worker = self._acquire_worker()
+        if worker is None:
+            if not self._has_workers():
+                # Every worker failed to start, try again for the next executions
+                self._fill()
+                return CodeExecutionResult(process_status=CodeExecutionStatus.ERROR,
+                                           stdout="",
+                                           stderr="No sandbox worker is available\n")
+            return CodeExecutionResult(process_status=CodeExecutionStatus.TIMEOUT,
+                                       stdout="",
+                                       stderr="Timed out waiting for a free worker\n")
+
+        try:
+            worker.conn.send(generated_code)
+            # wait until the execution finishes or the timeout expires
+            if not worker.conn.poll(timeout):
+                self._replace_worker(worker)
+                return CodeExecutionResult(process_status=CodeExecutionStatus.TIMEOUT, stdout="", stderr="Timed out\n")
+            result = CodeExecutionResult.model_validate(worker.conn.recv())
+        except (EOFError, OSError):
+            # The worker died during the execution, for example by exceeding its memory limit
+            worker.process.join(timeout=5)
+            exitcode = worker.process.exitcode
+            self._replace_worker(worker)
+            return CodeExecutionResult(process_status=CodeExecutionStatus.ERROR,
+                                       stdout="",
+                                       stderr=f"Execution process exited unexpectedly with exit code {exitcode}\n")
+
+        worker.runs += 1
+        if worker.runs >= self._max_runs_per_worker:
+            self._replace_worker(worker)
+        else:
+            self._idle.put(worker)
+        return result
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers)
+            self._workers.clear()
+        for worker in workers:
+            worker.stop()
+
+
+_pool_lock = threading.Lock()
+
+
+@functools.cache
+def _create_worker_pool() -> ExecutionWorkerPool:
+    pool = ExecutionWorkerPool()
+    atexit.register(pool.close)
+    return pool
+
+
+def get_worker_pool() -> ExecutionWorkerPool:
+    """Return the server's worker pool, starting it on first use."""
+    # functools.cache may call the function more than once when called concurrently
+    with _pool_lock:
+        return _create_worker_pool()
+
+
+def execute_python(generated_code: str, timeout: float) -> CodeExecutionResult:
     """
-    Execute code in a subprocess.
+    Execute Python code in a worker process.
 
     Args:
         generated_code: The code to execute
-        queue: The queue to put the result in
-    """
-
-    logger.debug("execute_code_subprocess started, PID: %s", os.getpid())
+        timeout: The timeout for the execution
 
-    try:
-        limit = 1024 * 1024 * 1024 * 10  # 10gb - somehow with a smaller limit the server dies when numpy is used
-        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
-        resource.setrlimit(resource.RLIMIT_DATA, (limit, limit))
-    except Exception as e:
-        logger.exception("Failed to set resource limits, PID: %s, error: %s", os.getpid(), e)
+    Returns:
+        CodeExecutionResult object containing the execution result
+    """
 
-    stdout_capture = StringIO()
-    stderr_capture = StringIO()
-    try:
-        with contextlib.redirect_stdout(stdout_capture), contextlib.redirect_stderr(stderr_capture):
-            exec(generated_code, {})
-        logger.debug("execute_code_subprocess finished, PID: %s", os.getpid())
-        queue.put(CodeExecutionResult(stdout=stdout_capture.getvalue(), stderr=stderr_capture.getvalue()))
-    except Exception as e:
-        import traceback
-        with contextlib.redirect_stderr(stderr_capture):
-            traceback.print_exc()
-        logger.debug("execute_code_subprocess failed, PID: %s, error: %s", os.getpid(), e)
-        queue.put(
-            CodeExecutionResult(process_status=CodeExecutionStatus.ERROR,
-                                stdout=stdout_capture.getvalue(),
-                                stderr=stderr_capture.getvalue()))
+    # running in a separate process to ensure any kind of crashes are properly handled
+    return get_worker_pool().execute(generated_code, timeout)
 
 
 def do_execute(request: Request) -> CodeExecutionResponse:
@@ -196,6 +451,8 @@ def execute():
 
 @app.route("/", methods=["GET"])
 def status() -> tuple[dict[str, str], int]:
+    # Health checks start the worker pool, so it is warm before the first execution
+    get_worker_pool()
     return ({"status": "ok"}, 200)
 
 
@@ -24,6 +24,10 @@ SANDBOX_NAME=${1:-'local-sandbox'}
 # UWSGI_PROCESSES sets the maximum number of uWSGI worker processes
 UWSGI_CHEAPER=${UWSGI_CHEAPER:-5}
 UWSGI_PROCESSES=${UWSGI_PROCESSES:-10}
+# UWSGI_THREADS sets the number of request threads per uWSGI worker process
+# SANDBOX_POOL_SIZE sets the number of warm code execution processes per uWSGI worker process
+UWSGI_THREADS=${UWSGI_THREADS:-2}
+SANDBOX_POOL_SIZE=${SANDBOX_POOL_SIZE:-2}
 
 # Get the output_data directory path for mounting
 # Priority: command line argument > environment variable > default path (current directory)
@@ -44,6 +48,8 @@ if ! ${DOCKER_COMMAND} images ${SANDBOX_NAME} | grep -q "${SANDBOX_NAME}"; then
     ${DOCKER_COMMAND} build --tag=${SANDBOX_NAME} \
         --build-arg="UWSGI_PROCESSES=${UWSGI_PROCESSES}" \
         --build-arg="UWSGI_CHEAPER=${UWSGI_CHEAPER}" \
+        --build-arg="UWSGI_THREADS=${UWSGI_THREADS}" \
+        --build-arg="SANDBOX_POOL_SIZE=${SANDBOX_POOL_SIZE}" \
         -f Dockerfile.sandbox .
 else
     echo "Using existing Docker image: ${SANDBOX_NAME}"
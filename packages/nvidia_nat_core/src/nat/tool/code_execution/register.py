@@ -37,6 +37,10 @@ class CodeExecutionToolConfig(FunctionBaseConfig, name="code_execution"):
     sandbox_type: Literal["local", "piston"] = Field(default="local", description="The type of code execution sandbox")
     timeout: float = Field(default=10.0, description="Number of seconds to wait for a code execution request")
     max_output_characters: int = Field(default=1000, description="Maximum number of characters that can be returned")
+    max_concurrent_requests: int = Field(default=16,
+                                         ge=1,
+                                         description="Maximum number of code execution requests sent to the sandbox "
+                                         "server at once")
 
 
 @register_function(config_type=CodeExecutionToolConfig)
@@ -47,7 +51,7 @@ async def code_execution_tool(config: CodeExecutionToolConfig, builder: Builder)
         generated_code: str = Field(description="String containing the code to be executed")
 
     # Create sandbox without working_directory
-    sandbox_kwargs = {"uri": config.uri}
+    sandbox_kwargs = {"uri": config.uri, "max_concurrent_requests": config.max_concurrent_requests}
 
     sandbox = get_sandbox(sandbox_type=config.sandbox_type, **sandbox_kwargs)
     logger.info(f"[DEBUG] Created sandbox of type: {config.sandbox_type}")
@@ -66,9 +70,13 @@ async def code_execution_tool(config: CodeExecutionToolConfig, builder: Builder)
             return {"process_status": "error", "stdout": "", "stderr": str(e)}
         return output
 
-    yield FunctionInfo.from_fn(
+    function_info = FunctionInfo.from_fn(
         fn=_execute_code,
         input_schema=CodeExecutionInputSchema,
         description="""Executes the provied 'generated_code' in a python sandbox environment and returns
         a dictionary containing stdout, stderr, and the execution status, as well as a session_id. The
         session_id can be used to append to code that was previously executed.""")
+    try:
+        yield function_info
+    finally:
+        await sandbox.aclose()
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import time
 from typing import Any
 
@@ -143,12 +144,14 @@ class _MockAsyncHTTPClient:
 
 class _MockAsyncOAuth2Client:
 
+    instances = 0
     call_count = 0
     response: dict[str, Any] | _MockHTTPResponse = {}
     last_kwargs: dict[str, Any] = {}
     last_endpoint: str | None = None
 
     def __init__(self, *args, **kwargs):
+        _MockAsyncOAuth2Client.instances += 1
         _MockAsyncOAuth2Client.last_kwargs = kwargs
 
     async def __aenter__(self):
@@ -186,6 +189,7 @@ def patch_httpx_and_oauth(monkeypatch, jwks_from_private):
         raising=True,
     )
 
+    _MockAsyncOAuth2Client.instances = 0
     _MockAsyncOAuth2Client.call_count = 0
     _MockAsyncOAuth2Client.response = {}
     _MockAsyncOAuth2Client.last_kwargs = {}
@@ -493,3 +497,95 @@ async def test_routing_uses_opaque_when_non_jwt(validator_both):
     non_jwt = "opaque-not-jwt-123456"
     res = await validator_both.verify(non_jwt)
     assert res.active is True  # verified via introspection
+
+
+# ========= Caching and pooling =========
+def _active_introspection_response(exp_offset_secs: int = 600) -> dict[str, Any]:
+    return {
+        "active": True,
+        "client_id": "client-abc",
+        "token_type": "access_token",
+        "exp": int(time.time()) + exp_offset_secs,
+        "aud": [AUDIENCE],
+        "iss": ISSUER,
+        "scope": "read write",
+    }
+
+
+async def test_validated_jwt_is_served_from_cache(validator_with_jwks, rsa_private_pem, monkeypatch):
+    token = _make_jwt(rsa_private_pem, exp_offset_secs=300, scopes=SCOPES)
+    first = await validator_with_jwks.verify(token)
+
+    async def fail_if_called(*args, **kwargs):
+        raise AssertionError("cached token should not be verified again")
+
+    monkeypatch.setattr(validator_with_jwks, "_verify_jwt_token", fail_if_called)
+    second = await validator_with_jwks.verify(f"Bearer {token}")
+
+    assert second is first
+
+
+async def test_cache_is_keyed_by_full_token(validator_opaque):
+    _MockAsyncOAuth2Client.response = _active_introspection_response()
+    await validator_opaque.verify("shared-prefix-token-a")
+
+    _MockAsyncOAuth2Client.response = {"active": False}
+    res = await validator_opaque.verify("shared-prefix-token-b")
+
+    assert res.active is False
+    assert _MockAsyncOAuth2Client.call_count == 2
+
+
+async def test_introspection_cache_is_capped_and_evicts_lru(monkeypatch):
+    validator = BearerTokenValidator(
+        introspection_endpoint=INTROSPECTION_ENDPOINT,
+        client_id="client-abc",
+        client_secret="secret-xyz",
+        validated_token_cache_size=2,
+        introspection_cache_ttl=60,
+    )
+    _MockAsyncOAuth2Client.response = _active_introspection_response(exp_offset_secs=3600)
+
+    for token in ("token-1", "token-2", "token-1", "token-3"):
+        await validator.verify(token)
+    # token-2 was the least recently used entry when token-3 was added
+    assert _MockAsyncOAuth2Client.call_count == 3
+    await validator.verify("token-1")
+    assert _MockAsyncOAuth2Client.call_count == 3
+    await validator.verify("token-2")
+    assert _MockAsyncOAuth2Client.call_count == 4
+
+    # Introspection results are reused for at most introspection_cache_ttl, even for long-lived tokens
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    await validator.verify("token-1")
+    assert _MockAsyncOAuth2Client.call_count == 5
+
+
+async def test_introspection_reuses_one_client(validator_opaque):
+    _MockAsyncOAuth2Client.response = _active_introspection_response()
+
+    for i in range(3):
+        assert (await validator_opaque.verify(f"opaque-token-{i}")).active is True
+
+    assert _MockAsyncOAuth2Client.call_count == 3
+    assert _MockAsyncOAuth2Client.instances == 1
+
+
+async def test_concurrent_cold_jwks_fetch_is_single_flight(validator_with_jwks, rsa_private_pem, monkeypatch):
+    fetches = 0
+    orig_get = _MockAsyncHTTPClient.get
+
+    async def slow_get(self, url: str, *args, **kwargs):
+        nonlocal fetches
+        fetches += 1
+        await asyncio.sleep(0.01)
+        return await orig_get(self, url, *args, **kwargs)
+
+    monkeypatch.setattr(_MockAsyncHTTPClient, "get", slow_get)
+    tokens = [_make_jwt(rsa_private_pem, exp_offset_secs=300 + i, scopes=SCOPES) for i in range(5)]
+
+    results = await asyncio.gather(*(validator_with_jwks.verify(token) for token in tokens))
+
+    assert all(res.active for res in results)
+    assert fetches == 1
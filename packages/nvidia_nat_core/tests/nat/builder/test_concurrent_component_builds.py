@@ -0,0 +1,215 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+
+import pytest
+
+from nat.builder.builder import Builder
+from nat.builder.component_utils import WORKFLOW_COMPONENT_NAME
+from nat.builder.component_utils import build_dependency_map
+from nat.builder.llm import LLMProviderInfo
+from nat.builder.workflow_builder import WorkflowBuilder
+from nat.cli.register_workflow import register_function
+from nat.cli.register_workflow import register_llm_provider
+from nat.data_models.component_ref import FunctionRef
+from nat.data_models.component_ref import LLMRef
+from nat.data_models.component_ref import generate_instance_id
+from nat.data_models.config import Config
+from nat.data_models.config import GeneralConfig
+from nat.data_models.function import FunctionBaseConfig
+from nat.data_models.llm import LLMBaseConfig
+
+
+class _BuildRecorder:
+    """Tracks build overlap, build completion order and teardown order across registered components."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+        self.built: list[str] = []
+        self.torn_down: list[str] = []
+
+    def reset(self):
+        self.__init__()
+
+
+recorder = _BuildRecorder()
+
+
+class SlowLLMConfig(LLMBaseConfig, name="concurrent_build_slow_llm"):
+    tag: str
+    delay: float = 0.05
+    raise_error: bool = False
+
+
+class SlowFunctionConfig(FunctionBaseConfig, name="concurrent_build_slow_function"):
+    tag: str
+    delay: float = 0.05
+    llm: LLMRef | None = None
+    depends_on: list[FunctionRef] = []
+    raise_error: bool = False
+
+
+async def _build(tag: str, delay: float, raise_error: bool):
+    recorder.in_flight += 1
+    recorder.peak = max(recorder.peak, recorder.in_flight)
+    try:
+        await asyncio.sleep(delay)
+        if raise_error:
+            raise ValueError(f"{tag} failed")
+    finally:
+        recorder.in_flight -= 1
+    recorder.built.append(tag)
+
+
+@pytest.fixture(scope="module", autouse=True)
+async def _register():
+
+    @register_llm_provider(config_type=SlowLLMConfig)
+    async def slow_llm(config: SlowLLMConfig, b: Builder):
+        await _build(config.tag, config.delay, config.raise_error)
+        try:
+            yield LLMProviderInfo(config=config, description="A slow test LLM.")
+        finally:
+            recorder.torn_down.append(config.tag)
+
+    @register_function(config_type=SlowFunctionConfig)
+    async def slow_function(config: SlowFunctionConfig, b: Builder):
+        await _build(config.tag, config.delay, config.raise_error)
+        for name in config.depends_on:
+            await b.get_function(name)
+
+        async def _inner(some_input: str) -> str:
+            return some_input
+
+        try:
+            yield _inner
+        finally:
+            recorder.torn_down.append(config.tag)
+
+
+@pytest.fixture(autouse=True)
+def _reset_recorder():
+    recorder.reset()
+
+
+def _config(max_concurrent_component_builds: int, **components) -> Config:
+    return Config(general=GeneralConfig(max_concurrent_component_builds=max_concurrent_component_builds),
+                  workflow=SlowFunctionConfig(tag="workflow", delay=0),
+                  **components)
+
+
+def _independent_llms(count: int) -> dict:
+    return {"llms": {f"llm_{i}": SlowLLMConfig(tag=f"llm_{i}") for i in range(count)}}
+
+
+@pytest.mark.parametrize("max_concurrent_component_builds, expected_peak", [(1, 1), (3, 3), (10, 6)])
+async def test_independent_components_build_up_to_the_limit(max_concurrent_component_builds: int, expected_peak: int):
+    config = _config(max_concurrent_component_builds, **_independent_llms(6))
+
+    async with WorkflowBuilder() as builder:
+        await builder.populate_builder(config)
+
+        assert recorder.peak == expected_peak
+        assert len(builder.completed_components) == 7
+        assert builder.remaining_components == []
+
+
+async def test_components_wait_for_their_dependencies():
+    config = _config(
+        4,
+        llms={"llm": SlowLLMConfig(tag="llm", delay=0.05)},
+        functions={
+            "base": SlowFunctionConfig(tag="base", delay=0.05),
+            "uses_base": SlowFunctionConfig(tag="uses_base", delay=0, depends_on=["base"]),
+            "uses_llm": SlowFunctionConfig(tag="uses_llm", delay=0, llm="llm"),
+            "independent": SlowFunctionConfig(tag="independent", delay=0),
+        },
+    )
+
+    async with WorkflowBuilder() as builder:
+        await builder.populate_builder(config)
+
+    built = recorder.built
+    assert built.index("base") < built.index("uses_base")
+    assert built.index("llm") < built.index("uses_llm")
+    # Functions never start before every LLM is built, matching the sequential group order
+    assert built.index("llm") < built.index("independent")
+    assert built[-1] == "workflow"
+
+
+async def test_teardown_follows_dependency_order_not_completion_order():
+    # llm_0 finishes last, but must still be torn down as if it had been built first
+    config = _config(3,
+                     llms={
+                         "llm_0": SlowLLMConfig(tag="llm_0", delay=0.1),
+                         "llm_1": SlowLLMConfig(tag="llm_1", delay=0.01),
+                         "llm_2": SlowLLMConfig(tag="llm_2", delay=0.05),
+                     })
+
+    async with WorkflowBuilder() as builder:
+        await builder.populate_builder(config)
+        assert recorder.built[:3] == ["llm_1", "llm_2", "llm_0"]
+
+    assert recorder.torn_down == ["workflow", "llm_2", "llm_1", "llm_0"]
+
+
+async def test_failure_cancels_pending_builds_and_tears_down_built_components(caplog):
+    config = _config(2,
+                     llms={
+                         "ok": SlowLLMConfig(tag="ok", delay=0),
+                         "broken": SlowLLMConfig(tag="broken", delay=0.01, raise_error=True),
+                         "slow": SlowLLMConfig(tag="slow", delay=10),
+                     })
+
+    with caplog.at_level(logging.ERROR):
+        async with WorkflowBuilder() as builder:
+            with pytest.raises(ValueError, match="broken failed"):
+                await builder.populate_builder(config)
+
+    assert "slow" not in recorder.built
+    assert recorder.torn_down == ["ok"]
+    assert "Failed to initialize component broken (llms)" in caplog.text
+
+
+async def test_build_times_are_recorded(caplog):
+    config = _config(2, **_independent_llms(2))
+
+    with caplog.at_level(logging.INFO, logger="nat.builder.workflow_builder"):
+        async with WorkflowBuilder() as builder:
+            await builder.populate_builder(config)
+
+    recorded = {(name, group) for name, group, _ in builder.component_build_times}
+    assert recorded == {("llm_0", "llms"), ("llm_1", "llms"), (WORKFLOW_COMPONENT_NAME, "workflow")}
+    assert all(seconds >= 0 for _, _, seconds in builder.component_build_times)
+    assert "Built 3 components" in caplog.text
+
+
+def test_build_dependency_map_lists_direct_references():
+    config = _config(1,
+                     llms={"llm": SlowLLMConfig(tag="llm")},
+                     functions={
+                         "base": SlowFunctionConfig(tag="base"),
+                         "uses_both": SlowFunctionConfig(tag="uses_both", llm="llm", depends_on=["base"]),
+                     })
+
+    dependency_map = build_dependency_map(config)
+
+    assert dependency_map[generate_instance_id(config.functions["uses_both"])] == {
+        generate_instance_id(config.llms["llm"]), generate_instance_id(config.functions["base"])
+    }
+    assert generate_instance_id(config.functions["base"]) not in dependency_map
@@ -0,0 +1,226 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+import pytest
+
+from nat.data_models.ttc_strategy import TTCStrategyBaseConfig
+from nat.experimental.test_time_compute.functions.execute_score_select_function import ExecuteScoreSelectFunctionConfig
+from nat.experimental.test_time_compute.functions.execute_score_select_function import execute_score_select_function
+from nat.experimental.test_time_compute.models.scoring_config import LLMBasedPlanScoringConfig
+from nat.experimental.test_time_compute.models.search_config import MultiLLMPlanConfig
+from nat.experimental.test_time_compute.models.stage_enums import PipelineTypeEnum
+from nat.experimental.test_time_compute.models.stage_enums import StageTypeEnum
+from nat.experimental.test_time_compute.models.strategy_base import StrategyBase
+from nat.experimental.test_time_compute.models.ttc_item import TTCItem
+from nat.experimental.test_time_compute.scoring.llm_based_plan_scorer import LLMBasedPlanScorer
+from nat.experimental.test_time_compute.scoring.score_cache import ScoreCache
+from nat.experimental.test_time_compute.search.multi_llm_planner import MultiLLMPlanner
+
+
+class _StaticConfig(TTCStrategyBaseConfig, name="static_ttc_test_config"):
+    pass
+
+
+class _TableScorer(StrategyBase):
+    """Scores outputs from a lookup table and records every scored output."""
+
+    def __init__(self, table: dict[str, float]):
+        super().__init__(_StaticConfig())
+        self.table = table
+        self.scored: list[str] = []
+
+    async def build_components(self, builder):
+        pass
+
+    async def ainvoke(self, items, original_prompt=None, agent_context=None, **kwargs):
+        for item in items:
+            self.scored.append(item.output)
+            item.score = self.table.get(item.output, 0.0)
+        return items
+
+    def supported_pipeline_types(self):
+        return [PipelineTypeEnum.AGENT_EXECUTION]
+
+    def stage_type(self):
+        return StageTypeEnum.SCORING
+
+
+class _BestScoreSelector(_TableScorer):
+
+    def __init__(self):
+        super().__init__({})
+
+    async def ainvoke(self, items, original_prompt=None, agent_context=None, **kwargs):
+        return [max(items, key=lambda item: item.score or 0.0)]
+
+    def stage_type(self):
+        return StageTypeEnum.SELECTION
+
+
+class _ScriptedFunction:
+    """Stands in for the augmented function: returns scripted (delay, output) pairs in launch order."""
+
+    input_type = str
+    single_output_type = str
+    has_streaming_output = False
+
+    def __init__(self, script: list[tuple[float, str]]):
+        self.script = list(script)
+        self.launched = 0
+        self.cancelled = 0
+
+    async def ainvoke(self, value: str) -> str:
+        delay, output = self.script[self.launched]
+        self.launched += 1
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return output
+
+
+async def _run(config: ExecuteScoreSelectFunctionConfig, fn: _ScriptedFunction, scorer: _TableScorer | None) -> str:
+    builder = MagicMock()
+    builder.get_function = AsyncMock(return_value=fn)
+    strategies = {"scorer": scorer, "selector": _BestScoreSelector()}
+    builder.get_ttc_strategy = AsyncMock(side_effect=lambda strategy_name, **_: strategies[strategy_name])
+
+    async with execute_score_select_function(config, builder) as info:
+        return await info.single_fn("question")
+
+
+def _config(**kwargs) -> ExecuteScoreSelectFunctionConfig:
+    return ExecuteScoreSelectFunctionConfig(selector="selector", augmented_fn="fn", **kwargs)
+
+
+async def test_execute_score_select_runs_all_and_scores_duplicates_once():
+    fn = _ScriptedFunction([(0, "a"), (0, "b"), (0, "a"), (0, "c")])
+    scorer = _TableScorer({"a": 1.0, "b": 5.0, "c": 2.0})
+
+    result = await _run(_config(scorer="scorer", num_executions=4), fn, scorer)
+
+    assert result == "b"
+    assert fn.launched == 4
+    assert sorted(scorer.scored) == ["a", "b", "c"]
+
+
+async def test_execute_score_select_early_stop_limits_executions():
+    fn = _ScriptedFunction([(0, "weak"), (0, "strong"), (0, "other"), (0, "other")])
+    scorer = _TableScorer({"weak": 2.0, "strong": 9.0})
+
+    result = await _run(_config(scorer="scorer", num_executions=4, max_concurrency=1, early_stop_score=8.0), fn, scorer)
+
+    assert result == "strong"
+    assert fn.launched == 2
+
+
+async def test_execute_score_select_early_stop_cancels_in_flight():
+    fn = _ScriptedFunction([(0, "strong"), (10, "slow"), (10, "slow")])
+    scorer = _TableScorer({"strong": 9.0})
+
+    result = await _run(_config(scorer="scorer", num_executions=3, early_stop_score=8.0), fn, scorer)
+
+    assert result == "strong"
+    assert fn.cancelled == 2
+    assert scorer.scored == ["strong"]
+
+
+async def test_execute_score_select_latency_budget_selects_completed_outputs():
+    fn = _ScriptedFunction([(0, "fast"), (10, "slow"), (10, "slow")])
+
+    result = await _run(_config(num_executions=3, max_latency_seconds=0.05), fn, None)
+
+    assert result == "fast"
+    assert fn.cancelled == 2
+
+
+def test_execute_score_select_early_stop_requires_scorer():
+    with pytest.raises(ValueError, match="requires a `scorer`"):
+        _config(early_stop_score=5.0)
+
+
+def test_score_cache_evicts_least_recently_used():
+    cache = ScoreCache(max_size=2)
+    cache.put("a", 1.0)
+    cache.put("b", 2.0)
+    assert cache.get("a") == 1.0
+    cache.put("c", 3.0)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1.0
+    assert len(cache) == 2
+
+    disabled = ScoreCache(max_size=0)
+    disabled.put("a", 1.0)
+    assert disabled.get("a") is None
+
+
+async def test_plan_scorer_bounds_concurrency_and_reuses_scores(monkeypatch):
+    scorer = LLMBasedPlanScorer(LLMBasedPlanScoringConfig(scoring_llm="llm", max_concurrency=2))
+    in_flight = 0
+    peak = 0
+    calls = []
+
+    async def fake_score_single(original_prompt, agent_context, planning_item):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        calls.append(planning_item.plan)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return float(len(planning_item.plan))
+
+    monkeypatch.setattr(scorer, "score_single", fake_score_single)
+
+    items = [TTCItem(plan=plan) for plan in ["p1", "p22", "p1", "p333", "p4444"]]
+    scored = await scorer.ainvoke(items, original_prompt="q", agent_context="ctx")
+    assert [item.score for item in scored] == [2.0, 3.0, 2.0, 4.0, 5.0]
+    assert sorted(calls) == ["p1", "p22", "p333", "p4444"]
+    assert peak == 2
+
+    # A second round for the same prompt and context is served from the cache
+    await scorer.ainvoke([TTCItem(plan="p22")], original_prompt="q", agent_context="ctx")
+    assert len(calls) == 4
+
+
+async def test_multi_llm_planner_bounds_generation_concurrency():
+    in_flight = 0
+    peak = 0
+
+    class _FakeLLM:
+
+        def bind(self, **kwargs):
+            return self
+
+        async def ainvoke(self, prompt):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock(content="PLAN: do it")
+
+    planner = MultiLLMPlanner(MultiLLMPlanConfig(llms=["a", "b"], plans_per_llm=3, max_concurrency=2))
+    planner.llms_bound = [_FakeLLM(), _FakeLLM()]
+
+    plans = await planner.ainvoke([], original_prompt="q", agent_context="ctx")
+
+    assert [plan.plan for plan in plans] == ["do it"] * 6
+    assert peak == 2
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
@@ -28,6 +29,7 @@ from nat.data_models.finetuning import TrainerConfig
 from nat.data_models.finetuning import TrainingJobRef
 from nat.data_models.finetuning import TrainingJobStatus
 from nat.data_models.finetuning import TrainingStatusEnum
+from nat.data_models.finetuning import Trajectory
 from nat.data_models.finetuning import TrajectoryCollection
 from nat.finetuning.interfaces.finetuning_runner import Trainer
 from nat.finetuning.interfaces.trainer_adapter import TrainerAdapter
@@ -74,6 +76,51 @@ class ConcreteTrainer(Trainer):
         self.logged_progress.append({"epoch": epoch, "metrics": metrics, "output_dir": output_dir})
 
 
+class PipelinedTrainer(ConcreteTrainer):
+    """Trainer collecting one trajectory per epoch, recording when collections start and end."""
+
+    def __init__(self, trainer_config: TrainerConfig, events: list[tuple[str, int]], **kwargs):
+        super().__init__(trainer_config, **kwargs)
+        self.events = events
+
+    async def collect_trajectories(self, epoch: int, run_id: str) -> TrajectoryCollection | None:
+        self.events.append(("collect_start", epoch))
+        await asyncio.sleep(0.02)
+        self.events.append(("collect_end", epoch))
+        trajectory = Trajectory(episode=[], reward=1.0, metadata={"epoch": epoch})
+        return TrajectoryCollection(trajectories=[[trajectory]], run_id=run_id)
+
+
+class InProcessTrainerAdapter(TrainerAdapter):
+    """Trainer adapter training in-process, recording when training jobs start and end."""
+
+    def __init__(self, events: list[tuple[str, int]], fail_epoch: int | None = None):
+        super().__init__(adapter_config=MagicMock())
+        self.events = events
+        self.fail_epoch = fail_epoch
+
+    async def is_healthy(self) -> bool:
+        return True
+
+    async def submit(self, trajectories: TrajectoryCollection) -> TrainingJobRef:
+        epoch = trajectories.trajectories[0][0].metadata["epoch"]
+        self.events.append(("train_start", epoch))
+        return TrainingJobRef(run_id=trajectories.run_id, backend="in_process", metadata={"epoch": epoch})
+
+    async def status(self, ref: TrainingJobRef) -> TrainingJobStatus:
+        epoch = ref.metadata["epoch"]
+        status = TrainingStatusEnum.FAILED if epoch == self.fail_epoch else TrainingStatusEnum.COMPLETED
+        return TrainingJobStatus(run_id=ref.run_id, backend=ref.backend, status=status, metadata=ref.metadata)
+
+    async def wait_until_complete(self, ref: TrainingJobRef, poll_interval: float = 10.0) -> TrainingJobStatus:
+        await asyncio.sleep(0.05)
+        self.events.append(("train_end", ref.metadata["epoch"]))
+        return await self.status(ref)
+
+    def log_progress(self, ref: TrainingJobRef, metrics: dict[str, Any], output_dir: str | None = None) -> None:
+        pass
+
+
 class TestTrainer:
     """Tests for the Trainer interface."""
 
@@ -313,3 +360,41 @@ class TestTrainer:
 
         config = TestTrainerConfigNoReward()
         assert config.reward is None
+
+    async def test_trainer_run_pipelined_overlaps_collection_and_training(self, trainer_config):
+        """Test that the next epoch is collected while the current epoch trains."""
+        events: list[tuple[str, int]] = []
+        trainer = PipelinedTrainer(trainer_config=trainer_config, events=events)
+        await trainer.bind_components(MagicMock(spec=TrajectoryBuilder), InProcessTrainerAdapter(events))
+
+        statuses = await trainer.run_pipelined(num_epochs=3, run_id="test_run", max_staleness=1)
+
+        assert [status.status for status in statuses] == [TrainingStatusEnum.COMPLETED] * 3
+        assert events.index(("collect_start", 1)) < events.index(("train_end", 0))
+        # The third epoch is only collected once the first epoch is trained
+        assert events.index(("collect_start", 2)) > events.index(("train_end", 0))
+        assert [e for e in events if e[0] == "train_start"] == [("train_start", 0), ("train_start", 1),
+                                                                ("train_start", 2)]
+        assert trainer.pipeline_metrics["overlap_seconds"] > 0
+        assert trainer.pipeline_metrics["training_idle_seconds"] < trainer.pipeline_metrics["wall_time_seconds"]
+
+    async def test_trainer_run_pipelined_stops_on_failure(self, trainer_config):
+        """Test that a failed training job ends the pipelined run."""
+        events: list[tuple[str, int]] = []
+        trainer = PipelinedTrainer(trainer_config=trainer_config, events=events)
+        await trainer.bind_components(MagicMock(spec=TrajectoryBuilder), InProcessTrainerAdapter(events, fail_epoch=0))
+
+        statuses = await trainer.run_pipelined(num_epochs=3, run_id="test_run")
+
+        assert [status.status for status in statuses] == [TrainingStatusEnum.FAILED]
+        assert ("train_start", 1) not in events
+
+    async def test_trainer_run_pipelined_not_implemented(self, trainer):
+        """Test that pipelined runs fail for trainers not collecting trajectories separately."""
+        trainer.trainer_adapter = MagicMock(spec=TrainerAdapter)
+
+        statuses = await trainer.run_pipelined(num_epochs=2, run_id="test_run")
+
+        assert len(statuses) == 1
+        assert statuses[0].status == TrainingStatusEnum.FAILED
+        trainer.trainer_adapter.submit.assert_not_called()
@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
+
 import pytest
 
 from nat.data_models.interactive import BinaryHumanPromptOption
@@ -152,6 +154,32 @@ async def test_first_outcome_is_set_on_completed():
     assert record.first_outcome.is_set()
 
 
+class _FailingPersistStore(ExecutionStore):
+
+    async def _persist(self, record):
+        if record.status != ExecutionStatus.RUNNING:
+            raise RuntimeError("database unavailable")
+
+
+@pytest.mark.parametrize("set_outcome",
+                         [
+                             lambda store, eid: store.set_completed(eid, result="done"),
+                             lambda store, eid: store.set_failed(eid, error="boom"),
+                             lambda store, eid: store.set_interaction_required(eid, HumanPromptText(text="Q?")),
+                             lambda store, eid: store.set_oauth_required(eid, "https://auth.example.com", "abc"),
+                         ],
+                         ids=["completed", "failed", "interaction_required", "oauth_required"])
+async def test_first_outcome_is_set_when_persist_fails(set_outcome, caplog):
+    store = _FailingPersistStore()
+    record = await store.create_execution()
+
+    with caplog.at_level(logging.ERROR):
+        await set_outcome(store, record.execution_id)
+
+    assert record.first_outcome.is_set()
+    assert "Failed to persist" in caplog.text
+
+
 # ---------------------------------------------------------------------------
 # Interaction resolution
 # ---------------------------------------------------------------------------
@@ -17,6 +17,7 @@ import io
 import os
 import time
 import typing
+from contextlib import asynccontextmanager
 from pathlib import Path
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
@@ -45,6 +46,8 @@ from nat.front_ends.fastapi.routes.generate import _GenerateEndpointType
 from nat.front_ends.fastapi.routes.generate import add_generate_route
 from nat.front_ends.fastapi.routes.v1_chat_completions import add_v1_chat_completions_route
 from nat.object_store.in_memory_object_store import InMemoryObjectStoreConfig
+from nat.runtime.session import PerUserWorkflowCapacityError
+from nat.runtime.session import SessionManager
 from nat.test.functions import EchoFunctionConfig
 from nat.test.functions import HeaderCaptureFunctionConfig
 from nat.test.functions import StreamingEchoFunctionConfig
@@ -490,3 +493,36 @@ async def test_v1_chat_completions_hitl_pause_returns_202():
     assert body.prompt == HumanPromptText(text="Confirm?")
     assert body.status_url == f"/executions/{record.execution_id}"
     assert body.response_url == f"/executions/{record.execution_id}/interactions/int-1/response"
+
+
+@asynccontextmanager
+async def _session_without_capacity(*_args, **_kwargs):
+    raise PerUserWorkflowCapacityError("All 1 per-user workflows are in use", retry_after=7)
+    yield
+
+
+@pytest.mark.parametrize("path, stream",
+                         [
+                             ("/v1/workflow", False),
+                             ("/v1/workflow/stream", False),
+                             ("/v1/workflow/full", False),
+                             ("/v1/chat", False),
+                             ("/v1/chat/stream", False),
+                             ("/v1/chat/completions", False),
+                             ("/v1/chat/completions", True),
+                         ])
+async def test_per_user_capacity_error_returns_503(path: str, stream: bool):
+    """Interactive endpoints reject a request with 503 when no per-user workflow is available for the user."""
+    config = Config(
+        general=GeneralConfig(front_end=FastApiFrontEndConfig(enable_interactive_extensions=True)),
+        workflow=EchoFunctionConfig(use_openai_api=True),
+    )
+    payload = ChatRequest(messages=[Message(content="Hello", role="user")], stream=stream).model_dump()
+
+    async with build_nat_client(config) as client:
+        with patch.object(SessionManager, "session", _session_without_capacity):
+            response = await client.post(path, json=payload)
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "7"
+    assert response.json() == {"detail": "All 1 per-user workflows are in use"}
@@ -753,3 +753,178 @@ async def test_job_info_default_time_fields(db_engine: "AsyncEngine", dask_sched
     job = await job_store.get_job(job_id)
     assert job.status == JobStatus.RUNNING
     assert job.updated_at > initial_updated_at
+
+
+async def slow_job_function(delay: float) -> float:
+    """Function that takes a while, for testing non-blocking waits."""
+    await asyncio.sleep(delay)
+    return delay
+
+
+@pytest.mark.usefixtures("setup_db")
+async def test_submit_job_sync_timeout_does_not_block_event_loop(db_engine: "AsyncEngine", dask_scheduler_address: str):
+    """Test that waiting for a job with sync_timeout leaves the event loop free to serve other requests."""
+    from nat.front_ends.fastapi.async_jobs import JobStore
+
+    job_store = JobStore(scheduler_address=dask_scheduler_address, db_engine=db_engine)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker_task = asyncio.create_task(ticker())
+    try:
+        job_id, job_info = await job_store.submit_job(job_fn=slow_job_function, job_args=[0.5], sync_timeout=5)
+    finally:
+        ticker_task.cancel()
+
+    assert job_info is not None
+    assert job_info.job_id == job_id
+    assert ticks >= 10
+
+
+@pytest.mark.usefixtures("setup_db")
+async def test_wait_for_status_change_is_woken_by_update(db_engine: "AsyncEngine", dask_scheduler_address: str):
+    """Test that status updates through the job store wake waiting clients without waiting for the poll interval."""
+    from nat.front_ends.fastapi.async_jobs import JobStatus
+    from nat.front_ends.fastapi.async_jobs import JobStore
+
+    job_store = JobStore(scheduler_address=dask_scheduler_address, db_engine=db_engine, status_poll_interval=60)
+    job_id = await job_store._create_job()
+
+    waiters = [asyncio.create_task(job_store.wait_for_status_change(job_id, timeout=10)) for _ in range(5)]
+    await asyncio.sleep(0.05)
+    await job_store.update_status(job_id, JobStatus.RUNNING)
+
+    jobs = await asyncio.wait_for(asyncio.gather(*waiters), timeout=5)
+
+    assert [job.status for job in jobs] == [JobStatus.RUNNING] * 5
+    assert job_store._job_watches == {}
+
+
+@pytest.mark.usefixtures("setup_db")
+async def test_wait_for_status_change_sees_updates_from_other_processes(db_engine: "AsyncEngine",
+                                                                        dask_scheduler_address: str):
+    """Test that status changes made elsewhere, such as by a Dask worker, are picked up by the periodic refresh."""
+    from nat.front_ends.fastapi.async_jobs import JobStatus
+    from nat.front_ends.fastapi.async_jobs import JobStore
+
+    job_store = JobStore(scheduler_address=dask_scheduler_address, db_engine=db_engine, status_poll_interval=0.05)
+    other_store = JobStore(scheduler_address=dask_scheduler_address, db_engine=db_engine)
+    job_id = await job_store._create_job()
+
+    waiter = asyncio.create_task(job_store.wait_for_status_change(job_id, timeout=10, last_status=JobStatus.SUBMITTED))
+    await asyncio.sleep(0.05)
+    await other_store.update_status(job_id, JobStatus.SUCCESS, output={"value": 1})
+
+    job = await asyncio.wait_for(waiter, timeout=5)
+    assert job.status == JobStatus.SUCCESS
+
+
+@pytest.mark.usefixtures("setup_db")
+async def test_wait_for_status_change_returns_on_timeout_or_when_finished(db_engine: "AsyncEngine",
+                                                                          dask_scheduler_address: str):
+    """Test the long-poll returns the unchanged job on timeout, and finished or missing jobs immediately."""
+    from nat.front_ends.fastapi.async_jobs import JobStatus
+    from nat.front_ends.fastapi.async_jobs import JobStore
+
+    job_store = JobStore(scheduler_address=dask_scheduler_address, db_engine=db_engine)
+    job_id = await job_store._create_job()
+
+    job = await job_store.wait_for_status_change(job_id, timeout=0.1)
+    assert job.status == JobStatus.SUBMITTED
+
+    # The client last saw "submitted", but the job has moved on since
+    await job_store.update_status(job_id, JobStatus.FAILURE, error="boom")
+    job = await asyncio.wait_for(job_store.wait_for_status_change(job_id, timeout=60, last_status=JobStatus.SUBMITTED),
+                                 timeout=1)
+    assert job.status == JobStatus.FAILURE
+
+    assert await job_store.wait_for_status_change("missing-job", timeout=60) is None
+
+
+@pytest.mark.usefixtures("setup_db")
+async def test_wait_for_status_change_does_not_regress_to_stale_status(db_engine: "AsyncEngine",
+                                                                       dask_scheduler_address: str):
+    """Test a client joining a watch that has not seen the latest status does not get the older status back."""
+    from nat.front_ends.fastapi.async_jobs import JobStatus
+    from nat.front_ends.fastapi.async_jobs import JobStore
+
+    job_store = JobStore(scheduler_address=dask_scheduler_address, db_engine=db_engine, status_poll_interval=60)
+    other_store = JobStore(scheduler_address=dask_scheduler_address, db_engine=db_engine)
+    job_id = await job_store._create_job()
+
+    first_waiter = asyncio.create_task(job_store.wait_for_status_change(job_id, timeout=10))
+    await asyncio.sleep(0.05)
+    await other_store.update_status(job_id, JobStatus.RUNNING)
+
+    job = await job_store.wait_for_status_change(job_id, timeout=0.1, last_status=JobStatus.RUNNING)
+    assert job.status == JobStatus.RUNNING
+
+    job = await asyncio.wait_for(first_waiter, timeout=1)
+    assert job.status == JobStatus.RUNNING
+
+
+@pytest.mark.parametrize("status, error", [("finished", None), ("error", ValueError("boom"))])
+async def test_job_completion_does_not_fetch_result(status: str, error: Exception | None):
+    """Test the completion of a job only uses the outcome of the Dask future, not its result."""
+    from nat.front_ends.fastapi.async_jobs import JobStore
+
+    class _DoneFuture:
+
+        def __init__(self):
+            self.status = status
+
+        def result(self):
+            raise AssertionError("The result of the job should not be fetched")
+
+        def exception(self):
+            return error
+
+        def add_done_callback(self, callback):
+            callback(self)
+
+    completion = JobStore._wrap_dask_future(_DoneFuture())
+    if error is None:
+        assert await completion is None
+    else:
+        with pytest.raises(ValueError, match="boom"):
+            await completion
+
+
+@pytest.mark.usefixtures("setup_db")
+async def test_cleanup_expired_jobs_paginates(db_engine: "AsyncEngine",
+                                              dask_scheduler_address: str,
+                                              tmp_path: Path,
+                                              monkeypatch: pytest.MonkeyPatch):
+    """Test cleanup expires every eligible job across several pages, still keeping the most recent one."""
+    from nat.front_ends.fastapi.async_jobs import JobStatus
+    from nat.front_ends.fastapi.async_jobs import JobStore
+
+    with monkeypatch.context() as monkey_context:
+        monkey_context.setattr(JobStore, "MIN_EXPIRY", 0.01, raising=True)
+
+        job_store = JobStore(scheduler_address=dask_scheduler_address, db_engine=db_engine, cleanup_page_size=2)
+
+        # The database file lives in tmp_path as well
+        output_dir = tmp_path / "outputs"
+        output_dir.mkdir()
+
+        job_ids = []
+        for i in range(5):
+            output_file = output_dir / f"output_{i}.json"
+            output_file.write_text("{}")
+            job_id = await job_store._create_job(expiry_seconds=0.01)
+            await job_store.update_status(job_id, JobStatus.SUCCESS, output_path=str(output_file))
+            job_ids.append(job_id)
+
+        await asyncio.sleep(0.1)
+
+        assert await job_store.cleanup_expired_jobs() == 4
+
+        jobs = [await job_store.get_job(job_id) for job_id in job_ids]
+        assert [job.is_expired for job in jobs] == [True, True, True, True, False]
+        assert sorted(path.name for path in output_dir.iterdir()) == ["output_4.json"]
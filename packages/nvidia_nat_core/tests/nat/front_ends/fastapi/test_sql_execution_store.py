@@ -0,0 +1,112 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextlib
+import typing
+
+import pytest
+
+from nat.data_models.interactive import HumanPromptText
+from nat.data_models.interactive import HumanResponseText
+from nat.data_models.interactive_http import ExecutionStatus
+from nat.front_ends.fastapi.sql_execution_store import SQLExecutionStore
+
+if typing.TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+@contextlib.asynccontextmanager
+async def _worker_stores(db_engine: "AsyncEngine", **kwargs):
+    """Two stores sharing a database, each standing in for a separate server worker."""
+    owner = SQLExecutionStore(db_engine=db_engine, poll_interval=0.01, **kwargs)
+    other = SQLExecutionStore(db_engine=db_engine, poll_interval=0.01)
+    try:
+        yield owner, other
+    finally:
+        await owner.close()
+        await other.close()
+
+
+async def test_get_from_other_worker(db_engine: "AsyncEngine"):
+    async with _worker_stores(db_engine) as (owner, other):
+        record = await owner.create_execution()
+        prompt = HumanPromptText(text="Name?", required=True)
+        pending = await owner.set_interaction_required(record.execution_id, prompt)
+
+        fetched = await other.get(record.execution_id)
+        assert fetched is not None
+        assert fetched.status == ExecutionStatus.INTERACTION_REQUIRED
+        assert fetched.pending_interaction.interaction_id == pending.interaction_id
+        assert fetched.pending_interaction.prompt == prompt
+
+        await owner.set_running(record.execution_id)
+        await owner.set_completed(record.execution_id, {"answer": 42})
+        fetched = await other.get(record.execution_id)
+        assert fetched.status == ExecutionStatus.COMPLETED
+        assert fetched.result == {"answer": 42}
+        assert fetched.pending_interaction is None
+
+        assert await other.get("nonexistent") is None
+
+
+async def test_resolve_interaction_from_other_worker(db_engine: "AsyncEngine"):
+    async with _worker_stores(db_engine) as (owner, other):
+        record = await owner.create_execution()
+        pending = await owner.set_interaction_required(record.execution_id,
+                                                       HumanPromptText(text="Name?", required=True))
+
+        await other.resolve_interaction(record.execution_id, pending.interaction_id, HumanResponseText(text="Alice"))
+        response = await asyncio.wait_for(pending.future, timeout=5)
+        assert response == HumanResponseText(text="Alice")
+
+        with pytest.raises(ValueError, match="already been resolved"):
+            await other.resolve_interaction(record.execution_id, pending.interaction_id, HumanResponseText(text="Bob"))
+        with pytest.raises(KeyError):
+            await other.resolve_interaction(record.execution_id, "wrong-id", HumanResponseText(text="Bob"))
+        with pytest.raises(KeyError):
+            await other.resolve_interaction("nonexistent", pending.interaction_id, HumanResponseText(text="Bob"))
+
+
+async def test_forward_oauth_redirect(db_engine: "AsyncEngine"):
+    async with _worker_stores(db_engine) as (owner, other):
+        record = await owner.create_execution()
+        pending = await owner.set_oauth_required(record.execution_id, auth_url="https://auth", oauth_state="state-1")
+
+        assert not await other.forward_oauth_redirect("unknown-state", "https://app/callback?state=unknown-state")
+        assert await other.forward_oauth_redirect("state-1", "https://app/callback?code=abc&state=state-1")
+        assert await asyncio.wait_for(pending.redirect, timeout=5) == "https://app/callback?code=abc&state=state-1"
+
+        # A redirect is only forwarded once
+        assert not await other.forward_oauth_redirect("state-1", "https://app/callback?code=def&state=state-1")
+
+
+async def test_cleanup_expired_and_remove(db_engine: "AsyncEngine"):
+    async with _worker_stores(db_engine, ttl_seconds=0) as (owner, other):
+        completed = await owner.create_execution()
+        running = await owner.create_execution()
+        await owner.set_completed(completed.execution_id, "done")
+
+        assert await owner.cleanup_expired() == 1
+        assert await other.get(completed.execution_id) is None
+        assert await other.get(running.execution_id) is not None
+
+        await owner.remove(running.execution_id)
+        assert await other.get(running.execution_id) is None
+
+
+def test_requires_engine_or_url():
+    with pytest.raises(ValueError, match="db_engine or db_url"):
+        SQLExecutionStore()
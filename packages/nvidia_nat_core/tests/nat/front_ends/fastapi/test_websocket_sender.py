@@ -0,0 +1,197 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from nat.data_models.api_server import SystemIntermediateStepContent
+from nat.data_models.api_server import SystemResponseContent
+from nat.data_models.api_server import WebSocketMessageStatus
+from nat.data_models.api_server import WebSocketMessageType
+from nat.data_models.api_server import WebSocketSystemIntermediateStepMessage
+from nat.data_models.api_server import WebSocketSystemResponseTokenMessage
+from nat.front_ends.fastapi.fastapi_front_end_config import FastApiFrontEndConfig
+from nat.front_ends.fastapi.websocket_sender import JSON_BATCH_SUBPROTOCOL
+from nat.front_ends.fastapi.websocket_sender import JSON_SUBPROTOCOL
+from nat.front_ends.fastapi.websocket_sender import SLOW_CONSUMER_CLOSE_CODE
+from nat.front_ends.fastapi.websocket_sender import WebSocketSender
+from nat.front_ends.fastapi.websocket_sender import negotiate_subprotocol
+
+
+class _SlowSocket:
+    """Records text frames, taking `delay` seconds to write each one."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.frames: list[str] = []
+        self.close_code: int | None = None
+
+    async def send_text(self, data: str):
+        await asyncio.sleep(self.delay)
+        self.frames.append(data)
+
+    async def close(self, code: int = 1000, reason: str | None = None):
+        self.close_code = code
+
+    def messages(self, batched: bool = False) -> list[dict]:
+        if batched:
+            return [message for frame in self.frames for message in json.loads(frame)]
+        return [json.loads(frame) for frame in self.frames]
+
+
+def _token(i: int) -> WebSocketSystemResponseTokenMessage:
+    return WebSocketSystemResponseTokenMessage(type=WebSocketMessageType.RESPONSE_MESSAGE,
+                                               id=str(i),
+                                               content=SystemResponseContent(text=f"token {i}"),
+                                               status=WebSocketMessageStatus.IN_PROGRESS)
+
+
+def _step(i: int) -> WebSocketSystemIntermediateStepMessage:
+    return WebSocketSystemIntermediateStepMessage(type=WebSocketMessageType.INTERMEDIATE_STEP_MESSAGE,
+                                                  id=str(i),
+                                                  content=SystemIntermediateStepContent(name=f"step {i}", payload=""),
+                                                  status=WebSocketMessageStatus.IN_PROGRESS)
+
+
+@pytest.mark.parametrize("offered, expected",
+                         [([], None), (["other"], None), ([JSON_SUBPROTOCOL], JSON_SUBPROTOCOL),
+                          (["other", JSON_BATCH_SUBPROTOCOL, JSON_SUBPROTOCOL], JSON_BATCH_SUBPROTOCOL)])
+def test_negotiate_subprotocol(offered: list[str], expected: str | None):
+    socket = MagicMock()
+    socket.scope = {"subprotocols": offered}
+    assert negotiate_subprotocol(socket) == expected
+
+
+async def test_sender_writes_one_frame_per_message_in_order():
+    socket = _SlowSocket()
+    sender = WebSocketSender(socket, FastApiFrontEndConfig.WebSocketSettings())
+    sender.start()
+
+    for i in range(20):
+        await sender.send(_token(i))
+    await sender.aclose()
+
+    assert [message["id"] for message in socket.messages()] == [str(i) for i in range(20)]
+
+
+async def test_sender_coalesces_messages_with_batched_subprotocol():
+    socket = _SlowSocket()
+    settings = FastApiFrontEndConfig.WebSocketSettings(flush_interval=0.05, max_batch_size=8)
+    sender = WebSocketSender(socket, settings, subprotocol=JSON_BATCH_SUBPROTOCOL)
+    sender.start()
+
+    for i in range(20):
+        await sender.send(_token(i))
+    await sender.aclose()
+
+    assert len(socket.frames) == 3
+    assert all(len(json.loads(frame)) <= 8 for frame in socket.frames)
+    assert [message["id"] for message in socket.messages(batched=True)] == [str(i) for i in range(20)]
+
+
+async def test_sender_does_not_block_producer_until_queue_is_full():
+    socket = _SlowSocket(delay=0.1)
+    sender = WebSocketSender(socket, FastApiFrontEndConfig.WebSocketSettings(send_queue_size=100))
+    sender.start()
+
+    start = time.monotonic()
+    for i in range(50):
+        await sender.send(_step(i))
+    assert time.monotonic() - start < 0.1
+
+    await sender.aclose(flush_timeout=0)
+
+
+async def test_sender_drop_intermediate_policy():
+    socket = _SlowSocket(delay=0.05)
+    settings = FastApiFrontEndConfig.WebSocketSettings(send_queue_size=2, slow_consumer_policy="drop_intermediate")
+    sender = WebSocketSender(socket, settings)
+    sender.start()
+
+    for i in range(10):
+        await sender.send(_step(i))
+    # Responses are never dropped, they wait for room in the queue instead
+    await sender.send(_token(10))
+    await sender.aclose(flush_timeout=5)
+
+    messages = socket.messages()
+    assert sender.num_dropped > 0
+    assert len(messages) == 11 - sender.num_dropped
+    assert messages[-1]["type"] == WebSocketMessageType.RESPONSE_MESSAGE
+
+
+async def test_sender_disconnect_policy():
+    socket = _SlowSocket(delay=10)
+    settings = FastApiFrontEndConfig.WebSocketSettings(send_queue_size=2, slow_consumer_policy="disconnect")
+    sender = WebSocketSender(socket, settings)
+    sender.start()
+
+    for i in range(5):
+        await sender.send(_token(i))
+
+    assert sender.closed
+    assert socket.close_code == SLOW_CONSUMER_CLOSE_CODE
+    await sender.aclose()
+
+
+async def test_sender_releases_blocked_producers_when_socket_fails():
+
+    class _FailingSocket(_SlowSocket):
+
+        async def send_text(self, data: str):
+            await asyncio.sleep(0.05)
+            raise RuntimeError("connection closed")
+
+    sender = WebSocketSender(_FailingSocket(), FastApiFrontEndConfig.WebSocketSettings(send_queue_size=1))
+    sender.start()
+
+    await asyncio.wait_for(asyncio.gather(*(sender.send(_token(i)) for i in range(10))), timeout=5)
+    assert sender.closed
+    await sender.aclose()
+
+
+@pytest.mark.slow
+async def test_sender_load_many_concurrent_clients():
+    """
+    Many clients with slow sockets, each receiving a burst of small messages: producers must not be paced by the
+    socket writes, and every client must receive every message in order.
+    """
+    num_clients = 500
+    num_messages = 200
+    settings = FastApiFrontEndConfig.WebSocketSettings(send_queue_size=num_messages, flush_interval=0.01)
+
+    sockets = [_SlowSocket(delay=0.001) for _ in range(num_clients)]
+    senders = [WebSocketSender(socket, settings, subprotocol=JSON_BATCH_SUBPROTOCOL) for socket in sockets]
+    for sender in senders:
+        sender.start()
+
+    async def produce(sender: WebSocketSender) -> float:
+        start = time.monotonic()
+        for i in range(num_messages):
+            await sender.send(_step(i))
+        return time.monotonic() - start
+
+    produce_times = await asyncio.gather(*(produce(sender) for sender in senders))
+    await asyncio.gather(*(sender.aclose(flush_timeout=30) for sender in senders))
+
+    # Writing each message as its own frame would take at least num_messages * delay per client
+    assert max(produce_times) < num_messages * 0.001
+    for socket in sockets:
+        assert [message["id"] for message in socket.messages(batched=True)] == [str(i) for i in range(num_messages)]
+        assert len(socket.frames) < num_messages
@@ -0,0 +1,253 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for adaptive concurrency limiting of LLM requests."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from nat.data_models.adaptive_concurrency_mixin import AdaptiveConcurrencyConfig
+from nat.llm.openai_llm import OpenAIModelConfig
+from nat.llm.utils import concurrency
+from nat.llm.utils.concurrency import AdaptiveConcurrencyLimiter
+from nat.llm.utils.concurrency import AdaptiveConcurrencyTransport
+from nat.llm.utils.concurrency import get_endpoint_limiters
+from nat.llm.utils.http_client import _create_http_client
+
+
+@pytest.fixture(autouse=True)
+def clear_endpoints():
+    concurrency._endpoints.clear()
+    yield
+    concurrency._endpoints.clear()
+
+
+class _RateLimitedEndpoint:
+    """Fake LLM endpoint which rejects requests with a 429 once more than `capacity` are in flight."""
+
+    def __init__(self, capacity: int, delay: float = 0.02):
+        self.capacity = capacity
+        self.delay = delay
+        self.in_flight = 0
+        self.num_requests = 0
+        self.num_rejected = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.num_requests += 1
+        if self.in_flight >= self.capacity:
+            self.num_rejected += 1
+            return httpx.Response(429, json={"error": "Too Many Requests"})
+
+        self.in_flight += 1
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return httpx.Response(200, json={"choices": [{"message": {"content": "ok"}}]})
+
+
+def _chat(content: str = "Hello", **kwargs) -> dict:
+    return {"model": "test-model", "messages": [{"role": "user", "content": content}], "temperature": 0.0, **kwargs}
+
+
+async def test_limiter_blocks_above_limit():
+    limiter = AdaptiveConcurrencyLimiter(AdaptiveConcurrencyConfig(initial_limit=2, latency_tolerance=None))
+    await limiter.acquire()
+    await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+    assert limiter.num_waiting == 1
+
+    limiter.release(latency=0.01)
+    await asyncio.wait_for(waiter, timeout=1)
+    assert limiter.in_flight == 2
+
+
+async def test_limiter_cancelled_waiter_does_not_leak_slot():
+    limiter = AdaptiveConcurrencyLimiter(AdaptiveConcurrencyConfig(initial_limit=1, latency_tolerance=None))
+    await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    limiter.release(latency=0.01)
+    assert limiter.in_flight == 0
+    assert limiter.num_waiting == 0
+
+
+def test_limiter_backs_off_once_per_overload():
+    limiter = AdaptiveConcurrencyLimiter(AdaptiveConcurrencyConfig(initial_limit=16, latency_tolerance=None))
+    # Establish a latency, so overloads within one latency of each other count once
+    limiter._in_flight = 1
+    limiter.release(latency=10.0)
+
+    for _ in range(5):
+        limiter._in_flight = 1
+        limiter.release(overloaded=True)
+    assert limiter.limit == 8
+
+
+def test_limiter_grows_when_saturated():
+    limiter = AdaptiveConcurrencyLimiter(AdaptiveConcurrencyConfig(initial_limit=4, max_limit=5,
+                                                                   latency_tolerance=None))
+    for _ in range(20):
+        limiter._in_flight = limiter.limit
+        limiter.release(latency=0.01)
+    assert limiter.limit == 5
+
+    # The limit does not grow while it is not in use
+    limiter = AdaptiveConcurrencyLimiter(AdaptiveConcurrencyConfig(initial_limit=4, latency_tolerance=None))
+    for _ in range(20):
+        limiter._in_flight = 1
+        limiter.release(latency=0.01)
+    assert limiter.limit == 4
+
+
+def test_limiter_backs_off_when_latency_rises():
+    limiter = AdaptiveConcurrencyLimiter(AdaptiveConcurrencyConfig(initial_limit=16, latency_tolerance=2.0))
+    for latency in [0.01] * 5 + [1.0] * 10:
+        limiter._in_flight = 1
+        limiter.release(latency=latency)
+    assert limiter.limit < 16
+
+
+async def test_limiter_holds_under_variable_uncongested_latency():
+    """Latency varying with the output length of each request does not reduce the limit by default."""
+    num_requests = 0
+
+    async def endpoint(request: httpx.Request) -> httpx.Response:
+        nonlocal num_requests
+        num_requests += 1
+        # Short and long completions from an endpoint with unbounded capacity
+        await asyncio.sleep(0.3 if num_requests % 4 == 0 else 0.02)
+        return httpx.Response(200, json={"choices": [{"message": {"content": "ok"}}]})
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        for _ in range(8):
+            response = await client.post("chat/completions", json=_chat())
+            assert response.status_code == 200
+
+    transport = AdaptiveConcurrencyTransport(httpx.MockTransport(endpoint), AdaptiveConcurrencyConfig(initial_limit=16))
+    async with httpx.AsyncClient(transport=transport, base_url="http://llm/v1") as client:
+        await asyncio.gather(*(worker(client) for _ in range(32)))
+
+    limiter = get_endpoint_limiters()[("http://llm", "test-model")]
+    assert limiter.limit >= 16
+
+
+async def _send_with_retries(client: httpx.AsyncClient, retry_delay: float = 0.01) -> None:
+    while True:
+        response = await client.post("chat/completions", json=_chat())
+        if response.status_code != 429:
+            assert response.status_code == 200
+            return
+        await asyncio.sleep(retry_delay)
+
+
+async def test_limiter_avoids_retry_storm_against_rate_limited_endpoint():
+    num_requests = 200
+
+    unlimited_endpoint = _RateLimitedEndpoint(capacity=4)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(unlimited_endpoint), base_url="http://llm/v1") as client:
+        await asyncio.gather(*(_send_with_retries(client) for _ in range(num_requests)))
+
+    limited_endpoint = _RateLimitedEndpoint(capacity=4)
+    transport = AdaptiveConcurrencyTransport(httpx.MockTransport(limited_endpoint),
+                                             AdaptiveConcurrencyConfig(initial_limit=32, latency_tolerance=None))
+    async with httpx.AsyncClient(transport=transport, base_url="http://llm/v1") as client:
+        await asyncio.gather(*(_send_with_retries(client) for _ in range(num_requests)))
+
+    assert limited_endpoint.num_requests - limited_endpoint.num_rejected == num_requests
+    assert limited_endpoint.num_rejected < unlimited_endpoint.num_rejected / 4
+
+    limiter = get_endpoint_limiters()[("http://llm", "test-model")]
+    assert limiter.limit <= 8
+    assert limiter.in_flight == 0
+
+
+async def test_limiter_shared_per_endpoint_and_model():
+    endpoint = _RateLimitedEndpoint(capacity=100)
+    config = AdaptiveConcurrencyConfig(initial_limit=4)
+    clients = [
+        httpx.AsyncClient(transport=AdaptiveConcurrencyTransport(httpx.MockTransport(endpoint), config),
+                          base_url="http://llm/v1") for _ in range(2)
+    ]
+
+    for client in clients:
+        await client.post("chat/completions", json=_chat())
+        await client.post("chat/completions", json={**_chat(), "model": "other-model"})
+        await client.aclose()
+
+    assert set(get_endpoint_limiters()) == {("http://llm", "test-model"), ("http://llm", "other-model")}
+
+
+async def test_streaming_response_holds_slot_until_closed():
+    endpoint = _RateLimitedEndpoint(capacity=100, delay=0)
+    transport = AdaptiveConcurrencyTransport(httpx.MockTransport(endpoint), AdaptiveConcurrencyConfig())
+    async with httpx.AsyncClient(transport=transport, base_url="http://llm/v1") as client:
+        async with client.stream("POST", "chat/completions", json=_chat(stream=True)):
+            limiter = get_endpoint_limiters()[("http://llm", "test-model")]
+            assert limiter.in_flight == 1
+        assert limiter.in_flight == 0
+
+
+async def test_identical_requests_coalesced():
+    endpoint = _RateLimitedEndpoint(capacity=100, delay=0.05)
+    transport = AdaptiveConcurrencyTransport(httpx.MockTransport(endpoint),
+                                             AdaptiveConcurrencyConfig(coalesce_identical_requests=True))
+    async with httpx.AsyncClient(transport=transport, base_url="http://llm/v1") as client:
+        responses = await asyncio.gather(*(client.post("chat/completions", json=_chat()) for _ in range(10)))
+        assert endpoint.num_requests == 1
+        assert all(response.json() == responses[0].json() for response in responses)
+
+        # Sampled and streaming requests are sent individually
+        await asyncio.gather(*(client.post("chat/completions", json=_chat(temperature=0.7)) for _ in range(3)))
+        assert endpoint.num_requests == 4
+        await asyncio.gather(*(client.post("chat/completions", json=_chat(stream=True)) for _ in range(3)))
+        assert endpoint.num_requests == 7
+
+
+async def test_coalesced_requests_share_errors():
+
+    async def failing_endpoint(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        raise httpx.ConnectError("connection refused")
+
+    transport = AdaptiveConcurrencyTransport(httpx.MockTransport(failing_endpoint),
+                                             AdaptiveConcurrencyConfig(coalesce_identical_requests=True))
+    async with httpx.AsyncClient(transport=transport, base_url="http://llm/v1") as client:
+        results = await asyncio.gather(*(client.post("chat/completions", json=_chat()) for _ in range(3)),
+                                       return_exceptions=True)
+
+    assert all(isinstance(result, httpx.ConnectError) for result in results)
+    assert get_endpoint_limiters()[("http://llm", "test-model")].in_flight == 0
+
+
+def test_create_http_client_installs_limiter():
+    config = OpenAIModelConfig(model_name="test-model", adaptive_concurrency=AdaptiveConcurrencyConfig())
+    client = _create_http_client(llm_config=config)
+    assert isinstance(client._transport, AdaptiveConcurrencyTransport)
+    assert "adaptive_concurrency" not in config.model_dump()
+
+
+def test_config_validates_limits():
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyConfig(initial_limit=10, max_limit=5)
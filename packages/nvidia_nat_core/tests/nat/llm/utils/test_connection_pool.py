@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for HTTP connection pools shared by model clients."""
+
+import httpx
+import pytest
+
+from nat.data_models.http_connection_pool_mixin import HTTPConnectionPoolConfig
+from nat.embedder.openai_embedder import OpenAIEmbedderModelConfig
+from nat.llm.openai_llm import OpenAIModelConfig
+from nat.llm.utils import connection_pool
+from nat.llm.utils.http_client import _create_http_client
+from nat.llm.utils.http_client import async_http_client
+from nat.llm.utils.http_client import http_clients
+from nat.runtime.metrics import collect_http_connection_pool_metrics
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_transports():
+    connection_pool._shared_transports.clear()
+    yield
+    connection_pool._shared_transports.clear()
+
+
+def _llm_config(**kwargs) -> OpenAIModelConfig:
+    return OpenAIModelConfig(model_name="test-model", base_url="https://llm.example.com/v1", **kwargs)
+
+
+async def test_clients_share_connection_pool():
+    async with async_http_client(_llm_config()) as first, async_http_client(_llm_config(temperature=0.5)) as second:
+        assert first._transport is not second._transport
+        assert first._transport._shared is second._transport._shared
+        assert first._transport._shared.ref_count == 2
+
+    assert not connection_pool._shared_transports
+
+
+async def test_llm_and_embedder_of_same_endpoint_share_connection_pool():
+    embedder_config = OpenAIEmbedderModelConfig(model_name="test-embedder", base_url="https://llm.example.com/v1")
+    async with http_clients(_llm_config()) as llm_clients, http_clients(embedder_config) as embedder_clients:
+        assert len(connection_pool._shared_transports) == 2
+        assert (llm_clients["async_http_client"]._transport._shared
+                is embedder_clients["async_http_client"]._transport._shared)
+        assert llm_clients["http_client"]._transport._shared is embedder_clients["http_client"]._transport._shared
+
+
+@pytest.mark.parametrize("other_config",
+                         [
+                             _llm_config(verify_ssl=False),
+                             OpenAIModelConfig(model_name="test-model", base_url="https://other.example.com/v1"),
+                             _llm_config(http_connection_pool=HTTPConnectionPoolConfig(max_connections=10)),
+                         ],
+                         ids=["verify_ssl", "endpoint", "limits"])
+async def test_different_settings_use_separate_pools(other_config: OpenAIModelConfig):
+    async with async_http_client(_llm_config()) as first, async_http_client(other_config) as second:
+        assert first._transport._shared is not second._transport._shared
+        assert len(connection_pool._shared_transports) == 2
+
+
+async def test_proxy_is_part_of_pool_key():
+    async with async_http_client(_llm_config()) as first, \
+            async_http_client(_llm_config(), proxy="http://proxy.example.com:3128") as second:
+        assert first._transport._shared is not second._transport._shared
+        assert second._transport._shared.key.proxy == "http://proxy.example.com:3128"
+
+
+@pytest.fixture(name="environment_proxy")
+def environment_proxy_fixture(monkeypatch: pytest.MonkeyPatch) -> str:
+    for name in ("HTTP_PROXY", "ALL_PROXY", "http_proxy", "https_proxy", "all_proxy", "no_proxy"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example.com:3128")
+    monkeypatch.setenv("NO_PROXY", "internal.example.com")
+    return "http://proxy.example.com:3128"
+
+
+async def test_environment_proxies_are_mounted(environment_proxy: str):
+    async with async_http_client(_llm_config()) as first, async_http_client(_llm_config()) as second:
+        proxied = first._transport_for_url(httpx.URL("https://llm.example.com/v1/chat/completions"))
+        assert proxied._shared.key.proxy == environment_proxy
+        assert proxied._shared is second._transport_for_url(httpx.URL("https://llm.example.com/v1"))._shared
+
+        # Hosts excluded with NO_PROXY use the transport without a proxy
+        assert first._transport_for_url(httpx.URL("https://internal.example.com/v1")) is first._transport
+        assert first._transport._shared.key.proxy is None
+
+    assert not connection_pool._shared_transports
+
+
+async def test_environment_proxies_ignored_without_trust_env(environment_proxy: str):
+    async with async_http_client(_llm_config(), trust_env=False) as client:
+        assert not client._mounts
+
+
+def test_unshared_pool():
+    client = _create_http_client(_llm_config(http_connection_pool=HTTPConnectionPoolConfig(shared=False)))
+    assert not isinstance(client._transport, connection_pool._AsyncTransportHandle)
+    assert not connection_pool._shared_transports
+    assert "http_connection_pool" not in _llm_config().model_dump()
+
+
+async def test_closing_client_twice_releases_once():
+    first = _create_http_client(_llm_config())
+    second = _create_http_client(_llm_config())
+    await first.aclose()
+    await first._transport.aclose()
+    assert second._transport._shared.ref_count == 1
+    await second.aclose()
+    assert not connection_pool._shared_transports
+
+
+async def test_pool_metrics():
+    pool_config = HTTPConnectionPoolConfig(max_connections=42)
+    async with async_http_client(_llm_config(http_connection_pool=pool_config)), \
+            async_http_client(_llm_config(http_connection_pool=pool_config)):
+        response = collect_http_connection_pool_metrics()
+
+    assert len(response.pools) == 1
+    pool = response.pools[0]
+    assert pool.origin == "https://llm.example.com"
+    assert pool.is_async
+    assert pool.clients == 2
+    assert pool.max_connections == 42
+    assert pool.connections == 0
+    assert pool.queued_requests == 0
@@ -0,0 +1,274 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for the LLM response cache."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import numpy as np
+import pytest
+
+from nat.data_models.http_connection_pool_mixin import HTTPConnectionPoolConfig
+from nat.data_models.response_cache_mixin import LLMResponseCacheConfig
+from nat.data_models.response_cache_mixin import SimilarityMatchConfig
+from nat.llm.openai_llm import OpenAIModelConfig
+from nat.llm.utils.http_client import _create_http_client
+from nat.llm.utils.response_cache import CACHE_HEADER
+from nat.llm.utils.response_cache import CachedResponse
+from nat.llm.utils.response_cache import ResponseCacheStore
+from nat.llm.utils.response_cache import ResponseCacheTransport
+from nat.llm.utils.response_cache import _CacheKey
+
+_SSE_BODY = (b'data: {"choices": [{"delta": {"content": "Hel"}}]}\n\n'
+             b'data: {"choices": [{"delta": {"content": "lo"}}]}\n\n'
+             b'data: [DONE]\n\n')
+
+
+class _Upstream:
+    """Mock LLM endpoint recording the requests it receives."""
+
+    def __init__(self):
+        self.requests: list[dict] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        self.requests.append(body)
+        if body.get("stream"):
+            return httpx.Response(200, headers={"content-type": "text/event-stream"}, content=_SSE_BODY)
+        return httpx.Response(200, json={"choices": [{"message": {"content": f"response {len(self.requests)}"}}]})
+
+
+@pytest.fixture(name="cache_config")
+def fixture_cache_config(tmp_path: Path) -> LLMResponseCacheConfig:
+    return LLMResponseCacheConfig(path=str(tmp_path / "cache.db"))
+
+
+def _client(upstream: _Upstream,
+            config: LLMResponseCacheConfig,
+            base_url: str = "http://llm/v1",
+            headers: dict[str, str] | None = None) -> httpx.AsyncClient:
+    transport = ResponseCacheTransport(httpx.MockTransport(upstream), config)
+    return httpx.AsyncClient(transport=transport, base_url=base_url, headers=headers)
+
+
+def _chat(content: str, temperature: float = 0.0, **kwargs) -> dict:
+    return {
+        "model": "test-model", "messages": [{
+            "role": "user", "content": content
+        }], "temperature": temperature, **kwargs
+    }
+
+
+async def test_repeated_request_served_from_cache(cache_config: LLMResponseCacheConfig):
+    upstream = _Upstream()
+    async with _client(upstream, cache_config) as client:
+        first = await client.post("chat/completions", json=_chat("Hello"))
+        second = await client.post("chat/completions", json=_chat("Hello"))
+
+    assert len(upstream.requests) == 1
+    assert CACHE_HEADER not in first.headers
+    assert second.headers[CACHE_HEADER] == "hit"
+    assert second.json() == first.json()
+
+
+async def test_prompt_whitespace_is_normalized(cache_config: LLMResponseCacheConfig):
+    upstream = _Upstream()
+    async with _client(upstream, cache_config) as client:
+        await client.post("chat/completions", json=_chat("Hello\r\nworld  "))
+        second = await client.post("chat/completions", json=_chat("  Hello\nworld"))
+
+    assert len(upstream.requests) == 1
+    assert second.headers[CACHE_HEADER] == "hit"
+
+
+@pytest.mark.parametrize("other_request",
+                         [_chat("Goodbye"), _chat("Hello", max_tokens=10), {
+                             **_chat("Hello"), "model": "other-model"
+                         }],
+                         ids=["prompt", "sampling_params", "model"])
+async def test_different_requests_are_not_shared(cache_config: LLMResponseCacheConfig, other_request: dict):
+    upstream = _Upstream()
+    async with _client(upstream, cache_config) as client:
+        await client.post("chat/completions", json=_chat("Hello"))
+        response = await client.post("chat/completions", json=other_request)
+
+    assert len(upstream.requests) == 2
+    assert CACHE_HEADER not in response.headers
+
+
+@pytest.mark.parametrize("base_url, api_key", [("http://other-llm/v1", "key"), ("https://llm/v1", "key"),
+                                               ("http://llm/v1", "other-key")],
+                         ids=["host", "scheme", "credentials"])
+async def test_different_endpoints_are_not_shared(cache_config: LLMResponseCacheConfig, base_url: str, api_key: str):
+    upstream = _Upstream()
+    async with _client(upstream, cache_config, headers={"Authorization": "Bearer key"}) as client:
+        await client.post("chat/completions", json=_chat("Hello"))
+    async with _client(upstream, cache_config, base_url=base_url,
+                       headers={"Authorization": f"Bearer {api_key}"}) as other_client:
+        response = await other_client.post("chat/completions", json=_chat("Hello"))
+
+    assert len(upstream.requests) == 2
+    assert CACHE_HEADER not in response.headers
+
+
+async def test_nondeterministic_requests_not_cached_by_default(tmp_path: Path):
+    upstream = _Upstream()
+    async with _client(upstream, LLMResponseCacheConfig(path=str(tmp_path / "cache.db"))) as client:
+        for _ in range(2):
+            await client.post("chat/completions", json=_chat("Hello", temperature=0.7))
+    assert len(upstream.requests) == 2
+
+    upstream = _Upstream()
+    config = LLMResponseCacheConfig(path=str(tmp_path / "all.db"), cache_nondeterministic=True)
+    async with _client(upstream, config) as client:
+        for _ in range(2):
+            await client.post("chat/completions", json=_chat("Hello", temperature=0.7))
+    assert len(upstream.requests) == 1
+
+
+async def test_streaming_response_replayed(cache_config: LLMResponseCacheConfig):
+    upstream = _Upstream()
+    chunks = []
+    async with _client(upstream, cache_config) as client:
+        for _ in range(2):
+            async with client.stream("POST", "chat/completions", json=_chat("Hello", stream=True)) as response:
+                assert response.headers["content-type"] == "text/event-stream"
+                chunks.append(b"".join([chunk async for chunk in response.aiter_bytes()]))
+
+    assert len(upstream.requests) == 1
+    assert chunks == [_SSE_BODY, _SSE_BODY]
+
+
+async def test_abandoned_stream_not_cached(cache_config: LLMResponseCacheConfig):
+    upstream = _Upstream()
+    async with _client(upstream, cache_config) as client:
+        async with client.stream("POST", "chat/completions", json=_chat("Hello", stream=True)):
+            pass
+        await client.post("chat/completions", json=_chat("Hello", stream=True))
+
+    assert len(upstream.requests) == 2
+
+
+async def test_error_responses_not_cached(cache_config: LLMResponseCacheConfig):
+    calls = 0
+
+    def failing_upstream(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(500, json={"error": "server error"})
+
+    transport = ResponseCacheTransport(httpx.MockTransport(failing_upstream), cache_config)
+    async with httpx.AsyncClient(transport=transport, base_url="http://llm/v1") as client:
+        for _ in range(2):
+            await client.post("chat/completions", json=_chat("Hello"))
+
+    assert calls == 2
+
+
+async def test_similar_prompt_served_from_cache(tmp_path: Path):
+    config = LLMResponseCacheConfig(path=str(tmp_path / "cache.db"),
+                                    similarity=SimilarityMatchConfig(embedding_base_url="http://embedder/v1",
+                                                                     embedding_model="test-embedder",
+                                                                     threshold=0.9))
+    embeddings = {
+        "user: What is the capital of France?": np.array([1.0, 0.0, 0.0], dtype=np.float32),
+        "user: What's the capital of France?": np.array([0.99, 0.1, 0.0], dtype=np.float32),
+        "user: How tall is Mount Everest?": np.array([0.0, 1.0, 0.0], dtype=np.float32),
+    }
+
+    async def embed(self, text: str) -> np.ndarray:
+        return embeddings[text] / np.linalg.norm(embeddings[text])
+
+    upstream = _Upstream()
+    with patch.object(ResponseCacheTransport, "_embed", embed):
+        async with _client(upstream, config) as client:
+            await client.post("chat/completions", json=_chat("What is the capital of France?"))
+            similar = await client.post("chat/completions", json=_chat("What's the capital of France?"))
+            different = await client.post("chat/completions", json=_chat("How tall is Mount Everest?"))
+
+    assert len(upstream.requests) == 2
+    assert similar.headers[CACHE_HEADER] == "hit"
+    assert CACHE_HEADER not in different.headers
+
+
+def _put(store: ResponseCacheStore, key: str, body: bytes):
+    store.put(_CacheKey(key=key, partition="partition", prompt_text=""),
+              CachedResponse(status_code=200, headers=[("content-type", "application/json")], body=body))
+
+
+def test_store_persists_to_disk(tmp_path: Path):
+    path = str(tmp_path / "cache.db")
+    _put(ResponseCacheStore(path, ttl=None, max_size_bytes=1024), "key", b"body")
+
+    cached = ResponseCacheStore(path, ttl=None, max_size_bytes=1024).get("key")
+    assert cached is not None
+    assert cached.body == b"body"
+    assert cached.headers == [("content-type", "application/json")]
+
+
+def test_store_expires_entries():
+    store = ResponseCacheStore(None, ttl=60, max_size_bytes=1024)
+    with patch("nat.llm.utils.response_cache.time.time", return_value=1000.0):
+        _put(store, "key", b"body")
+        assert store.get("key") is not None
+    with patch("nat.llm.utils.response_cache.time.time", return_value=1061.0):
+        assert store.get("key") is None
+
+
+def test_store_evicts_least_recently_used():
+    store = ResponseCacheStore(None, ttl=None, max_size_bytes=100)
+    with patch("nat.llm.utils.response_cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0, 5.0]):
+        _put(store, "a", b"x" * 40)
+        _put(store, "b", b"x" * 40)
+        # Reading "a" makes "b" the least recently used entry
+        assert store.get("a") is not None
+        _put(store, "c", b"x" * 40)
+
+    assert store.get("a") is not None
+    assert store.get("b") is None
+    assert store.get("c") is not None
+
+
+def test_create_http_client_installs_cache(cache_config: LLMResponseCacheConfig):
+    config = OpenAIModelConfig(model_name="test-model", response_cache=cache_config)
+    client = _create_http_client(llm_config=config)
+    assert isinstance(client._transport, ResponseCacheTransport)
+    # The cache configuration is not passed on to LLM clients
+    assert "response_cache" not in config.model_dump()
+
+    client = _create_http_client(llm_config=OpenAIModelConfig(model_name="test-model"))
+    assert not isinstance(client._transport, ResponseCacheTransport)
+
+
+@pytest.mark.parametrize("shared", [True, False], ids=["shared_pool", "unshared_pool"])
+def test_create_http_client_caches_proxied_requests(cache_config: LLMResponseCacheConfig,
+                                                    monkeypatch: pytest.MonkeyPatch,
+                                                    shared: bool):
+    for name in ("HTTP_PROXY", "ALL_PROXY", "http_proxy", "https_proxy", "all_proxy", "no_proxy"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example.com:3128")
+    monkeypatch.setenv("NO_PROXY", "localhost")
+    config = OpenAIModelConfig(model_name="test-model",
+                               response_cache=cache_config,
+                               http_connection_pool=HTTPConnectionPoolConfig(shared=shared))
+
+    client = _create_http_client(llm_config=config)
+
+    proxied_transport = client._transport_for_url(httpx.URL("https://api.example.com/v1/chat/completions"))
+    assert isinstance(proxied_transport, ResponseCacheTransport)
+    assert proxied_transport is not client._transport
+    assert client._transport_for_url(httpx.URL("https://localhost/v1/chat/completions")) is client._transport
@@ -0,0 +1,128 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from nat.builder.context import Context
+from nat.builder.context import ContextState
+from nat.memory.models import MemoryItem
+from nat.memory.write_behind import WriteBehindMemoryEditor
+
+
+def _item(user_id: str, content: str) -> MemoryItem:
+    return MemoryItem(conversation=[{"role": "user", "content": content}], user_id=user_id)
+
+
+class _SlowEditor:
+    """Records each add_items call, with the conversation ID it saw, after a delay."""
+
+    def __init__(self, delay: float = 0.0, failures: int = 0):
+        self.delay = delay
+        self.failures = failures
+        self.calls: list[tuple[str | None, list[str]]] = []
+        self.search = AsyncMock(return_value=[])
+        self.remove_items = AsyncMock()
+
+    async def add_items(self, items: list[MemoryItem], **kwargs):
+        await asyncio.sleep(self.delay)
+        if self.failures > 0:
+            self.failures -= 1
+            raise RuntimeError("backend unavailable")
+        self.calls.append((Context.get().conversation_id, [item.conversation[0]["content"] for item in items]))
+
+
+@pytest.fixture(name="conversation_id")
+def conversation_id_fixture():
+    token = ContextState.get().conversation_id.set("conversation-1")
+    yield "conversation-1"
+    ContextState.get().conversation_id.reset(token)
+
+
+async def test_add_items_returns_before_write(conversation_id: str):
+    inner = _SlowEditor(delay=0.2)
+    editor = WriteBehindMemoryEditor(inner, flush_interval=0.01)
+
+    await asyncio.wait_for(editor.add_items([_item("user-1", "hello")]), timeout=0.05)
+    assert inner.calls == []
+
+    await editor.aclose()
+    assert inner.calls == [(conversation_id, ["hello"])]
+
+
+async def test_items_are_batched_per_user_and_conversation(conversation_id: str):
+    inner = _SlowEditor()
+    editor = WriteBehindMemoryEditor(inner, flush_interval=0.05)
+
+    await editor.add_items([_item("user-1", "a")])
+    await editor.add_items([_item("user-2", "b")])
+    await editor.add_items([_item("user-1", "c")])
+
+    # A different conversation is written with its own context, even though it is flushed by the same editor
+    token = ContextState.get().conversation_id.set("conversation-2")
+    try:
+        await editor.add_items([_item("user-1", "d")])
+    finally:
+        ContextState.get().conversation_id.reset(token)
+
+    await editor.flush()
+
+    assert sorted(inner.calls) == [("conversation-1", ["a", "c"]), ("conversation-1", ["b"]), ("conversation-2", ["d"])]
+
+
+async def test_failed_writes_are_retried_in_order(conversation_id: str):
+    inner = _SlowEditor(failures=2)
+    editor = WriteBehindMemoryEditor(inner, flush_interval=0, max_retries=3, retry_backoff=0.01)
+
+    await editor.add_items([_item("user-1", "first")])
+    # Let the first batch be written before the second item is added
+    await asyncio.sleep(0.01)
+    await editor.add_items([_item("user-1", "second")])
+    await editor.flush()
+
+    assert inner.calls == [(conversation_id, ["first"]), (conversation_id, ["second"])]
+
+
+async def test_failed_writes_are_dropped_after_max_retries(conversation_id: str):
+    inner = _SlowEditor(failures=10)
+    editor = WriteBehindMemoryEditor(inner, flush_interval=0, max_retries=1, retry_backoff=0.01)
+
+    await editor.add_items([_item("user-1", "lost")])
+    await editor.flush()
+
+    assert inner.calls == []
+    assert inner.failures == 8
+
+
+async def test_search_waits_for_pending_writes_of_user(conversation_id: str):
+    inner = _SlowEditor(delay=0.05)
+    editor = WriteBehindMemoryEditor(inner, flush_interval=10)
+
+    await editor.add_items([_item("user-1", "remember me")])
+    await editor.search("what do you remember?", user_id="user-1")
+
+    assert inner.calls == [(conversation_id, ["remember me"])]
+    inner.search.assert_awaited_once_with("what do you remember?", top_k=5, user_id="user-1")
+
+
+async def test_add_items_after_close_writes_directly(conversation_id: str):
+    inner = _SlowEditor()
+    editor = WriteBehindMemoryEditor(inner, flush_interval=10)
+    await editor.aclose()
+
+    await editor.add_items([_item("user-1", "late")])
+    assert inner.calls == [(conversation_id, ["late"])]
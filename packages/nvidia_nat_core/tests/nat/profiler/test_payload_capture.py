@@ -0,0 +1,134 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for capturing the payloads of LLM and tool calls in intermediate steps."""
+
+import copy
+import tracemalloc
+
+import pytest
+from pydantic import BaseModel
+
+from nat.data_models.profiler_callback import LargePayloadMode
+from nat.data_models.profiler_callback import PayloadCaptureConfig
+from nat.profiler.callbacks.payload_capture import PayloadCapture
+
+
+class _Message(BaseModel):
+    role: str
+    content: str | list[dict]
+    additional_kwargs: dict = {}
+
+
+def _history(num_messages: int, message_size: int = 500) -> list[_Message]:
+    messages = []
+    for i in range(num_messages):
+        tool_calls = [{"name": "search", "args": {"query": f"query {i}"}}]
+        messages.append(
+            _Message(role="user" if i % 2 == 0 else "assistant",
+                     content=f"message {i} " + "x" * message_size,
+                     additional_kwargs={"tool_calls": tool_calls}))
+    return messages
+
+
+def test_snapshot_is_isolated_from_later_changes():
+    tool_calls = [{"name": "search", "args": {"query": "weather"}}]
+    messages = [{"role": "user", "content": "hello", "tool_calls": tool_calls}, _Message(role="ai", content="hi")]
+    snapshot = PayloadCapture().capture(messages)
+
+    messages.append({"role": "user", "content": "again"})
+    messages[0]["content"] = "changed"
+    tool_calls[0]["args"]["query"] = "changed"
+    messages[1].content = "changed"
+
+    assert len(snapshot) == 2
+    assert snapshot[0]["content"] == "hello"
+    assert snapshot[0]["tool_calls"][0]["args"]["query"] == "weather"
+    assert snapshot[1].content == "hi"
+
+
+def test_snapshot_shares_strings():
+    content = "x" * 1000
+    snapshot = PayloadCapture().capture([{"content": content}])
+    assert snapshot[0]["content"] is content
+
+
+def test_large_payload_truncated():
+    capture = PayloadCapture(PayloadCaptureConfig(max_size=10))
+    truncated = capture.capture(["abcdef", {"text": "ghijklmnop"}, "qrs"])
+    assert truncated[0] == "abcdef"
+    assert truncated[1]["text"] == "ghij... [6 characters truncated]"
+    assert truncated[2] == "... [3 characters truncated]"
+    assert capture.capture("short") == "short"
+
+
+def test_large_payload_hashed():
+    capture = PayloadCapture(PayloadCaptureConfig(max_size=10, large_payloads=LargePayloadMode.HASH))
+    hashed = capture.capture([{"content": "abcdef"}, {"content": "ghijklmnop"}])
+    assert hashed["size"] == 16
+    assert hashed == capture.capture([{"content": "abcdef"}, {"content": "ghijklmnop"}])
+    assert hashed != capture.capture([{"content": "abcdef"}, {"content": "ghijklmnoq"}])
+    assert capture.capture({"content": "small"}) == {"content": "small"}
+
+
+def test_unchanged_messages_reuse_snapshots():
+    messages = _history(num_messages=3)
+    capture = PayloadCapture()
+    first = capture.capture(messages)
+
+    messages.append(_Message(role="user", content="new"))
+    messages[1].additional_kwargs["tool_calls"][0]["args"]["query"] = "changed"
+    second = capture.capture(messages)
+
+    assert second is not first
+    assert second[0] is first[0]
+    assert second[2] is first[2]
+    assert second[1] is not first[1]
+    assert first[1].additional_kwargs["tool_calls"][0]["args"]["query"] == "query 1"
+    assert second == messages
+
+
+def test_truncated_messages_do_not_reuse_snapshots():
+    messages = [{"content": "abcdef"}]
+    capture = PayloadCapture(PayloadCaptureConfig(max_size=10))
+    assert capture.capture(messages) == [{"content": "abcdef"}]
+
+    messages.insert(0, {"content": "ghijklmnop"})
+    assert capture.capture(messages) == [{"content": "ghijklmnop"}, {"content": "... [6 characters truncated]"}]
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+def test_capture_long_message_history_benchmark():
+    # About 100K tokens of message history
+    messages = _history(num_messages=800, message_size=500)
+    capture = PayloadCapture()
+    capture.capture(messages)
+    messages.append(_Message(role="user", content="next question"))
+
+    tracemalloc.start()
+    try:
+        copy.deepcopy(messages)
+        deepcopy_allocated = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+        tracemalloc.clear_traces()
+
+        snapshot = capture.capture(messages)
+        capture_allocated = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    assert snapshot == messages
+    # Only the new message is copied, the rest of the allocations are for the list and the snapshots kept for reuse
+    assert capture_allocated * 5 < deepcopy_allocated
@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for coalescing streamed LLM tokens into intermediate steps."""
+
+from unittest.mock import patch
+
+from nat.data_models.profiler_callback import TokenEventMode
+from nat.data_models.profiler_callback import TokenEventsConfig
+from nat.profiler.callbacks.token_event_coalescer import TokenBatch
+from nat.profiler.callbacks.token_event_coalescer import TokenEventCoalescer
+
+
+def _stream(coalescer: TokenEventCoalescer, tokens: list[str], run_id: str = "run") -> list[str]:
+    batches = [coalescer.add(run_id, token) for token in tokens] + [coalescer.flush(run_id)]
+    return [batch.text for batch in batches if batch is not None]
+
+
+def test_every_token_mode():
+    coalescer = TokenEventCoalescer(TokenEventsConfig(mode=TokenEventMode.EVERY_TOKEN))
+    assert _stream(coalescer, ["a", "b", "c"]) == ["a", "b", "c"]
+
+
+def test_count_mode_reports_first_token_then_batches():
+    coalescer = TokenEventCoalescer(TokenEventsConfig(mode=TokenEventMode.COUNT, tokens_per_event=3))
+    assert _stream(coalescer, [str(i) for i in range(8)]) == ["0", "123", "456", "7"]
+
+
+def test_interval_mode_batches_by_time():
+    coalescer = TokenEventCoalescer(TokenEventsConfig(mode=TokenEventMode.INTERVAL, interval=1.0))
+    times = [0.0, 0.1, 0.5, 1.2, 1.3, 1.4]
+    with patch("nat.profiler.callbacks.token_event_coalescer.time.monotonic", side_effect=times):
+        assert _stream(coalescer, list("abcdef")) == ["a", "bcd", "ef"]
+
+
+def test_off_mode_reports_nothing():
+    coalescer = TokenEventCoalescer(TokenEventsConfig(mode=TokenEventMode.OFF))
+    assert _stream(coalescer, ["a", "b"]) == []
+
+
+def test_runs_are_batched_separately():
+    coalescer = TokenEventCoalescer(TokenEventsConfig(mode=TokenEventMode.COUNT, tokens_per_event=2))
+    for run_id in ("first", "second"):
+        coalescer.add(run_id, "start", chunk=run_id)
+    assert coalescer.add("first", "a", chunk="first-a") is None
+    assert coalescer.add("second", "b", chunk="second-b") is None
+    assert coalescer.add("first", "c", chunk="first-c") == TokenBatch(text="ac", chunks=["first-a", "first-c"])
+    assert coalescer.flush("second") == TokenBatch(text="b", chunks=["second-b"])
+    assert coalescer.flush("first") is None
+
+
+def test_discard_forgets_pending_tokens():
+    coalescer = TokenEventCoalescer(TokenEventsConfig(mode=TokenEventMode.COUNT, tokens_per_event=10))
+    coalescer.add("run", "a")
+    coalescer.add("run", "b")
+    coalescer.discard("run")
+    assert coalescer.flush("run") is None
@@ -0,0 +1,126 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from nat.data_models.intermediate_step import IntermediateStep
+from nat.data_models.intermediate_step import IntermediateStepPayload
+from nat.data_models.intermediate_step import IntermediateStepType
+from nat.data_models.intermediate_step import UsageInfo
+from nat.data_models.invocation_node import InvocationNode
+from nat.data_models.token_usage import TokenUsageBaseModel
+from nat.runtime.runtime_metrics import Counter
+from nat.runtime.runtime_metrics import Histogram
+from nat.runtime.runtime_metrics import RuntimeMetrics
+from nat.utils.reactive.subject import Subject
+
+
+def _make_step(event_type: IntermediateStepType,
+               name: str,
+               duration: float | None = None,
+               usage_info: UsageInfo | None = None) -> IntermediateStep:
+    payload = IntermediateStepPayload(event_type=event_type,
+                                      name=name,
+                                      event_timestamp=100.0,
+                                      span_event_timestamp=100.0 - duration if duration is not None else None,
+                                      usage_info=usage_info)
+    return IntermediateStep(parent_id="root",
+                            function_ancestry=InvocationNode(function_id="root", function_name="root"),
+                            payload=payload)
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("latency_seconds", "Latency.", ("name", ), max_series=10, buckets=(0.1, 1.0))
+    histogram.observe(0.05, "a")
+    histogram.observe(0.5, "a")
+    histogram.observe(5.0, "a")
+
+    assert histogram.render() == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{name="a",le="0.1"} 1',
+        'latency_seconds_bucket{name="a",le="1"} 2',
+        'latency_seconds_bucket{name="a",le="+Inf"} 3',
+        'latency_seconds_sum{name="a"} 5.55',
+        'latency_seconds_count{name="a"} 3',
+    ]
+
+
+def test_counter_escapes_label_values():
+    counter = Counter("calls_total", "Calls.", ("name", ), max_series=10)
+    counter.inc(2, 'say "hi"\n')
+
+    assert counter.render()[-1] == 'calls_total{name="say \\"hi\\"\\n"} 2'
+
+
+def test_label_cardinality_is_bounded():
+    counter = Counter("calls_total", "Calls.", ("name", "type"), max_series=2)
+    counter.inc(1, "a", "x")
+    counter.inc(1, "b", "x")
+    counter.inc(1, "c", "x")
+    counter.inc(1, "d", "x")
+    counter.inc(1, "a", "x")
+
+    assert counter.value("a", "x") == 2
+    assert counter.value("c", "x") == 0
+    assert counter.value("__other__", "x") == 2
+
+
+def test_observe_step_records_durations_and_tokens():
+    metrics = RuntimeMetrics()
+    usage_info = UsageInfo(token_usage=TokenUsageBaseModel(prompt_tokens=10, completion_tokens=4))
+
+    metrics.observe_step(_make_step(IntermediateStepType.LLM_START, "nim"))
+    metrics.observe_step(_make_step(IntermediateStepType.LLM_END, "nim", duration=0.5, usage_info=usage_info))
+    metrics.observe_step(_make_step(IntermediateStepType.TOOL_END, "search", duration=0.2))
+    metrics.observe_step(_make_step(IntermediateStepType.FUNCTION_END, "agent", duration=1.0))
+    metrics.observe_step(_make_step(IntermediateStepType.WORKFLOW_END, "workflow", duration=1.0))
+
+    assert metrics.step_duration.count("nim", "llm") == 1
+    assert metrics.step_duration.count("search", "tool") == 1
+    assert metrics.step_duration.count("agent", "function") == 1
+    assert metrics.step_duration.count("workflow", "workflow") == 0
+    assert metrics.llm_tokens.value("nim", "prompt") == 10
+    assert metrics.llm_tokens.value("nim", "completion") == 4
+
+
+async def test_track_run_records_steps_and_outcome():
+    metrics = RuntimeMetrics()
+    event_stream = Subject()
+    context_state = MagicMock()
+    context_state.event_stream.get.return_value = event_stream
+
+    async with metrics.track_run("default", context_state, queue_wait=0.25):
+        event_stream.on_next(_make_step(IntermediateStepType.TOOL_END, "search", duration=0.2))
+
+    with pytest.raises(RuntimeError):
+        async with metrics.track_run("default", context_state, queue_wait=0.0):
+            raise RuntimeError("workflow failed")
+
+    # Steps emitted after the run are not recorded
+    event_stream.on_next(_make_step(IntermediateStepType.TOOL_END, "search", duration=0.2))
+
+    assert metrics.requests.value("default", "success") == 1
+    assert metrics.requests.value("default", "error") == 1
+    assert metrics.request_duration.count("default") == 2
+    assert metrics.queue_wait.count("default") == 2
+    assert metrics.step_duration.count("search", "tool") == 1
+
+    rendered = metrics.render()
+    assert 'nat_requests_total{workflow="default",status="success"} 1' in rendered
+    assert 'nat_request_queue_wait_seconds_bucket{workflow="default",le="0.1"} 1' in rendered
+    assert 'nat_request_queue_wait_seconds_bucket{workflow="default",le="0.25"} 2' in rendered
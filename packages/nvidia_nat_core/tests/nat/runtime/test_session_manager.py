@@ -27,7 +27,9 @@ from nat.builder.context import ContextState
 from nat.data_models.config import Config
 from nat.data_models.config import GeneralConfig
 from nat.data_models.runtime_enum import RuntimeTypeEnum
+from nat.runtime.metrics import PerUserMetricsCollector
 from nat.runtime.session import PerUserBuilderInfo
+from nat.runtime.session import PerUserWorkflowCapacityError
 from nat.runtime.session import Session
 from nat.runtime.session import SessionManager
 
@@ -116,6 +118,9 @@ def create_mock_config(is_per_user: bool = False) -> Config:
     config.general = MagicMock(spec=GeneralConfig)
     config.general.per_user_workflow_timeout = timedelta(minutes=30)
     config.general.per_user_workflow_cleanup_interval = timedelta(minutes=5)
+    config.general.max_per_user_workflows = 0
+    config.general.per_user_workflow_admission_timeout = timedelta(seconds=30)
+    config.general.enable_runtime_metrics = False
     config.workflow = MagicMock()
     return config
 
@@ -541,6 +546,114 @@ class TestSessionManagerCleanup:
             assert "user123" in sm._per_user_builders
 
 
+class TestSessionManagerCapacity:
+    """Tests for the per-user builder limit, LRU eviction and admission control."""
+
+    @staticmethod
+    def _create_session_manager(mock_registry, max_per_user_workflows: int, admission_timeout: timedelta):
+        mock_registry.get.return_value.get_function.return_value = create_mock_function_registration(is_per_user=True)
+
+        config = create_mock_config()
+        config.general.max_per_user_workflows = max_per_user_workflows
+        config.general.per_user_workflow_admission_timeout = admission_timeout
+
+        return SessionManager(config=config,
+                              shared_builder=MockWorkflowBuilder(),
+                              entry_function=None,
+                              shared_workflow=None)
+
+    @patch('nat.builder.per_user_workflow_builder.PerUserWorkflowBuilder', MockPerUserWorkflowBuilder)
+    @patch('nat.cli.type_registry.GlobalTypeRegistry')
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_idle_builder(self, mock_registry):
+        """Test creating a builder beyond the limit evicts the idle builder that was used the longest time ago."""
+        sm = self._create_session_manager(mock_registry, max_per_user_workflows=2, admission_timeout=timedelta(1))
+
+        async with sm.session(user_id="user1"):
+            pass
+        async with sm.session(user_id="user2"):
+            pass
+        sm._per_user_builders["user2"].last_activity = datetime.now() - timedelta(minutes=1)
+        user2_builder = sm._per_user_builders["user2"].builder
+
+        async with sm.session(user_id="user3"):
+            assert set(sm._per_user_builders) == {"user1", "user3"}
+
+        assert user2_builder._exited
+        assert sm._per_user_pool_stats.evicted == 1
+        assert sm._per_user_pool_stats.created == 3
+
+    @patch('nat.builder.per_user_workflow_builder.PerUserWorkflowBuilder', MockPerUserWorkflowBuilder)
+    @patch('nat.cli.type_registry.GlobalTypeRegistry')
+    @pytest.mark.asyncio
+    async def test_evicted_builder_cleaned_up_outside_lock(self, mock_registry):
+        """Test an evicted builder is cleaned up after the per-user builders lock is released."""
+        sm = self._create_session_manager(mock_registry, max_per_user_workflows=1, admission_timeout=timedelta(1))
+
+        async with sm.session(user_id="user1"):
+            pass
+        user1_builder = sm._per_user_builders["user1"].builder
+        lock_held_on_exit = []
+
+        async def _aexit(*args):
+            lock_held_on_exit.append(sm._per_user_builders_lock.locked())
+
+        user1_builder.__aexit__ = _aexit
+
+        async with sm.session(user_id="user2"):
+            assert set(sm._per_user_builders) == {"user2"}
+
+        assert lock_held_on_exit == [False]
+
+    @patch('nat.builder.per_user_workflow_builder.PerUserWorkflowBuilder', MockPerUserWorkflowBuilder)
+    @patch('nat.cli.type_registry.GlobalTypeRegistry')
+    @pytest.mark.asyncio
+    async def test_waits_for_builder_to_become_idle(self, mock_registry):
+        """Test a request for a new user waits while every builder is in use, then evicts the released builder."""
+        sm = self._create_session_manager(mock_registry, max_per_user_workflows=1, admission_timeout=timedelta(1))
+
+        async def _second_user_session():
+            async with sm.session(user_id="user2"):
+                return set(sm._per_user_builders)
+
+        async with sm.session(user_id="user1"):
+            second_user_task = asyncio.create_task(_second_user_session())
+            await asyncio.sleep(0.05)
+            assert not second_user_task.done()
+            assert sm._per_user_pool_stats.waiting_requests == 1
+
+            # Requests for a user with a builder are not held back
+            async with sm.session(user_id="user1"):
+                assert sm._per_user_builders["user1"].ref_count == 2
+
+        assert await asyncio.wait_for(second_user_task, timeout=5) == {"user2"}
+        assert sm._per_user_pool_stats.admissions_waited == 1
+        assert sm._per_user_pool_stats.waiting_requests == 0
+
+    @patch('nat.builder.per_user_workflow_builder.PerUserWorkflowBuilder', MockPerUserWorkflowBuilder)
+    @patch('nat.cli.type_registry.GlobalTypeRegistry')
+    @pytest.mark.asyncio
+    async def test_rejects_after_admission_timeout(self, mock_registry):
+        """Test a request for a new user is rejected when no builder becomes idle in time."""
+        sm = self._create_session_manager(mock_registry,
+                                          max_per_user_workflows=1,
+                                          admission_timeout=timedelta(milliseconds=50))
+
+        async with sm.session(user_id="user1"):
+            with pytest.raises(PerUserWorkflowCapacityError) as exc_info:
+                async with sm.session(user_id="user2"):
+                    pass
+
+        assert exc_info.value.retry_after == 1
+        assert "user2" not in sm._per_user_builders
+        assert sm._per_user_builders["user1"].ref_count == 0
+
+        pool_metrics = await PerUserMetricsCollector(sm).collect_pool_metrics()
+        assert pool_metrics.max_workflows == 1
+        assert pool_metrics.workflows == 1
+        assert pool_metrics.admissions_rejected == 1
+
+
 class TestSessionRunCrossWorkflowObservability:
     """Tests for Session.run() with parent_id/parent_name (cross-workflow observability)."""
 
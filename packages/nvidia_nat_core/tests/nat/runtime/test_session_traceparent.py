@@ -51,6 +51,9 @@ def _create_mock_config() -> Config:
     config.general = MagicMock(spec=GeneralConfig)
     config.general.per_user_workflow_timeout = timedelta(minutes=30)
     config.general.per_user_workflow_cleanup_interval = timedelta(minutes=5)
+    config.general.max_per_user_workflows = 0
+    config.general.per_user_workflow_admission_timeout = timedelta(seconds=30)
+    config.general.enable_runtime_metrics = False
     config.workflow = MagicMock()
     return config
 
@@ -755,6 +755,7 @@ class TestPerUserBuilderUserIdWiring:
     def _make_session_manager(self):
         from nat.builder.context import ContextState
         from nat.runtime.session import PerUserBuilderInfo
+        from nat.runtime.session import PerUserBuilderPoolStats
         from nat.runtime.session import SessionManager
 
         sm = object.__new__(SessionManager)
@@ -771,6 +772,11 @@ class TestPerUserBuilderUserIdWiring:
         sm._max_concurrency = 1
         sm._per_user_session_timeout = MagicMock(total_seconds=MagicMock(return_value=60))
         sm._per_user_session_cleanup_interval = MagicMock(total_seconds=MagicMock(return_value=30))
+        sm._max_per_user_builders = 0
+        sm._per_user_admission_timeout = MagicMock(total_seconds=MagicMock(return_value=30))
+        sm._per_user_builder_released = asyncio.Condition(sm._per_user_builders_lock)
+        sm._per_user_pool_stats = PerUserBuilderPoolStats()
+        sm._runtime_metrics = None
         sm._shutdown_event = asyncio.Event()
         return sm, PerUserBuilderInfo
 
@@ -1270,6 +1270,44 @@ async def test_restore_execution_state_sends_prompt_with_remaining_timeout():
     assert sent_content.timeout == 7
 
 
+async def test_handler_sends_through_connection_queue_and_hands_it_over_on_reconnect():
+    """Messages go through the per-connection sender, which a reconnect hands to the disconnected handler."""
+    from nat.front_ends.fastapi.fastapi_front_end_config import FastApiFrontEndConfig
+    from nat.front_ends.fastapi.websocket_sender import JSON_BATCH_SUBPROTOCOL
+
+    mock_socket = AsyncMock()
+    mock_socket.scope = {"subprotocols": [JSON_BATCH_SUBPROTOCOL]}
+    mock_socket.query_params = {"conversation_id": "conv1"}
+    mock_worker = MagicMock()
+    mock_worker.front_end_config = FastApiFrontEndConfig()
+    disconnected_mock = MagicMock()
+    disconnected_mock._conversation_id = "conv1"
+    disconnected_mock._user_interaction = None
+    disconnected_mock._message_parent_id = "parent"
+    disconnected_mock._workflow_schema_type = "chat"
+    disconnected_mock._running_workflow_task = None
+    mock_worker.get_conversation_handler.return_value = disconnected_mock
+
+    handler = WebSocketMessageHandler(
+        socket=mock_socket,
+        session_manager=MagicMock(),
+        step_adaptor=MagicMock(),
+        worker=mock_worker,
+    )
+
+    async with handler:
+        mock_socket.accept.assert_awaited_once_with(subprotocol=JSON_BATCH_SUBPROTOCOL)
+        assert disconnected_mock._sender is handler._sender
+
+        await handler.create_websocket_message(data_model=SystemResponseContent(text="hello"),
+                                               message_type=WebSocketMessageType.RESPONSE_MESSAGE)
+
+    mock_socket.send_json.assert_not_called()
+    mock_socket.send_text.assert_awaited_once()
+    [message] = json.loads(mock_socket.send_text.call_args[0][0])
+    assert message["content"]["text"] == "hello"
+
+
 async def test_process_workflow_request_cancels_in_flight_task():
     """A new workflow request cancels any in-flight task before creating a replacement."""
     mock_socket = AsyncMock()
@@ -13,16 +13,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import gzip
+import json
 import logging
 import multiprocessing
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 
+import httpx
 import pytest
-import requests
 from pytest_httpserver import HTTPServer
 
 from nat.tool.code_execution import code_sandbox
+from nat.tool.code_execution.local_sandbox.local_sandbox_server import CodeExecutionStatus
+from nat.tool.code_execution.local_sandbox.local_sandbox_server import ExecutionWorkerPool
 from nat.tool.code_execution.local_sandbox.local_sandbox_server import do_execute
+from nat.tool.code_execution.local_sandbox.local_sandbox_server import run_code
 
 logger = logging.getLogger(__name__)
 
@@ -65,7 +74,7 @@ async def test_bad_response(httpserver: HTTPServer):
     client = code_sandbox.get_sandbox("local", uri="http://localhost:9999")
 
     # Test that connection error is raised when the service is unavailable
-    with pytest.raises(requests.exceptions.ConnectionError):
+    with pytest.raises(httpx.ConnectError):
         _ = await client.execute_code(generated_code='print("Hello World")')
 
     # Test for JSON parsing error
@@ -125,3 +134,163 @@ print(5+5)
     assert resp.get("process_status") == "completed"
     assert resp.get("stdout").rstrip() == "10"
     assert resp.get("stderr") == ""
+
+
+async def test_execute_many(httpserver: HTTPServer):
+    client = code_sandbox.get_sandbox("local", uri=httpserver.url_for("/execute"), max_concurrent_requests=2)
+    httpserver.expect_request("/execute", method="POST").respond_with_handler(do_execute)
+
+    async with client:
+        results = await client.execute_many([f"print({i})" for i in range(5)] + ["print(1/0)"])
+
+    assert [result["stdout"].rstrip() for result in results[:5]] == [str(i) for i in range(5)]
+    assert all(result["process_status"] == "completed" for result in results[:5])
+    assert results[5]["process_status"] == "error"
+
+
+async def test_handle_compressed_response(httpserver: HTTPServer):
+    client = code_sandbox.get_sandbox("local", uri=httpserver.url_for("/execute"))
+    body = json.dumps({"process_status": "completed", "stdout": "Hello World", "stderr": ""}).encode()
+    httpserver.expect_request("/execute", method="POST").respond_with_data(gzip.compress(body),
+                                                                           content_type="application/json",
+                                                                           headers={"Content-Encoding": "gzip"})
+
+    async with client:
+        resp = await client.execute_code(generated_code='print("Hello World")')
+
+    assert resp == {"process_status": "completed", "stdout": "Hello World", "stderr": ""}
+
+
+async def test_response_size_limit(httpserver: HTTPServer):
+    client = code_sandbox.get_sandbox("local", uri=httpserver.url_for("/execute"), max_response_bytes=1024)
+    httpserver.expect_request("/execute", method="POST").respond_with_json({
+        "process_status": "completed", "stdout": "x" * 4096, "stderr": ""
+    })
+
+    async with client:
+        resp = await client.execute_code(generated_code='print("x" * 4096)')
+
+    assert resp.get("process_status") == "error"
+    assert resp.get("stderr").startswith("Output too large")
+
+
+async def test_execute_code_does_not_block_event_loop(httpserver: HTTPServer):
+
+    def slow_handler(request):
+        time.sleep(0.5)
+        return do_execute(request)
+
+    client = code_sandbox.get_sandbox("local", uri=httpserver.url_for("/execute"))
+    httpserver.expect_request("/execute", method="POST").respond_with_handler(slow_handler)
+
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker = asyncio.create_task(tick())
+    async with client:
+        resp = await client.execute_code(generated_code='print("Hello World")')
+    ticker.cancel()
+
+    assert resp.get("process_status") == "completed"
+    # The event loop kept running while the request was in flight
+    assert ticks > 10
+
+
+def test_worker_pool_recovers_from_timeouts_and_crashes():
+    pool = ExecutionWorkerPool(size=1, max_runs_per_worker=2, preimport_modules=())
+    try:
+        result = pool.execute("x = 1\nprint(x)", timeout=30)
+        assert result.process_status == CodeExecutionStatus.COMPLETED
+        assert result.stdout.rstrip() == "1"
+
+        # Every execution gets fresh globals
+        result = pool.execute("print(x)", timeout=30)
+        assert result.process_status == CodeExecutionStatus.ERROR
+        assert "NameError" in result.stderr
+
+        result = pool.execute("import time; time.sleep(10)", timeout=0.5)
+        assert result.process_status == CodeExecutionStatus.TIMEOUT
+
+        result = pool.execute("import os; os._exit(3)", timeout=30)
+        assert result.process_status == CodeExecutionStatus.ERROR
+        assert "exit code 3" in result.stderr
+
+        # The replacement worker is usable
+        result = pool.execute('print("ok")', timeout=30)
+        assert result.process_status == CodeExecutionStatus.COMPLETED
+        assert result.stdout.rstrip() == "ok"
+    finally:
+        pool.close()
+
+
+def test_worker_pool_fails_fast_when_workers_cannot_start(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    from nat.tool.code_execution.local_sandbox import local_sandbox_server
+
+    # Workers exit while importing this module, before they are ready
+    (tmp_path / "exit_on_import.py").write_text("import os\nos._exit(7)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(local_sandbox_server, "_WORKER_START_RETRY_DELAY", 0.0)
+
+    pool = ExecutionWorkerPool(size=1, preimport_modules=("exit_on_import", ), acquire_timeout=60)
+    try:
+        start = time.monotonic()
+        result = pool.execute('print("ok")', timeout=30)
+        assert result.process_status == CodeExecutionStatus.ERROR
+        assert "No sandbox worker is available" in result.stderr
+        assert time.monotonic() - start < 30
+
+        # Once workers can start again, the pool recovers
+        pool._preimport_modules = ()
+        deadline = time.monotonic() + 60
+        while result.process_status != CodeExecutionStatus.COMPLETED and time.monotonic() < deadline:
+            result = pool.execute('print("ok")', timeout=30)
+        assert result.process_status == CodeExecutionStatus.COMPLETED
+    finally:
+        pool.close()
+
+
+@pytest.mark.slow
+def test_worker_pool_benchmark():
+    """
+    Compare the worker pool against starting a new process for every execution, the sandbox's previous behavior.
+    """
+    code = "import json; print(json.dumps(sum(range(1000))))"
+    num_executions = 100
+    concurrency = 4
+
+    def spawn_per_execution() -> None:
+        process = multiprocessing.Process(target=run_code, args=(code, ))
+        process.start()
+        process.join()
+
+    pool = ExecutionWorkerPool(size=concurrency, preimport_modules=())
+    try:
+        # Wait for the workers to start
+        pool.execute(code, timeout=60)
+
+        def pooled_execution() -> None:
+            assert pool.execute(code, timeout=60).process_status == CodeExecutionStatus.COMPLETED
+
+        results = {}
+        for name, execute in (("spawn", spawn_per_execution), ("pool", pooled_execution)):
+
+            def timed(_: int, execute=execute) -> float:
+                start = time.perf_counter()
+                execute()
+                return time.perf_counter() - start
+
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                latencies = list(executor.map(timed, range(num_executions)))
+            results[name] = (statistics.median(latencies), num_executions / (time.perf_counter() - start))
+            logger.info("%s: p50 latency %.2f ms, %.1f executions/s", name, results[name][0] * 1000, results[name][1])
+    finally:
+        pool.close()
+
+    assert results["pool"][0] < results["spawn"][0]
+    assert results["pool"][1] > results["spawn"][1]
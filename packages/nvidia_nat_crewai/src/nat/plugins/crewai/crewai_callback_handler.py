@@ -13,7 +13,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
 import logging
 import threading
 import time
@@ -31,7 +30,9 @@ from nat.data_models.intermediate_step import StreamEventData
 from nat.data_models.intermediate_step import TraceMetadata
 from nat.data_models.intermediate_step import UsageInfo
 from nat.data_models.profiler_callback import BaseProfilerCallback
+from nat.data_models.profiler_callback import PayloadCaptureConfig
 from nat.data_models.token_usage import TokenUsageBaseModel
+from nat.profiler.callbacks.payload_capture import PayloadCapture
 
 logger = logging.getLogger(__name__)
 
@@ -46,11 +47,12 @@ class CrewAIProfilerHandler(BaseProfilerCallback):
     and store them in NAT's usage_stats queue for subsequent analysis.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, payload_capture: PayloadCaptureConfig | None = None) -> None:
         super().__init__()
         self._lock = threading.Lock()
         self.last_call_ts = time.time()
         self.step_manager = Context.get().intermediate_step_manager
+        self._payload_capture = PayloadCapture(payload_capture)
 
         # Original references to CrewAI methods (for uninstrumenting if needed)
         self._original_tool_use = None
@@ -162,7 +164,7 @@ class CrewAIProfilerHandler(BaseProfilerCallback):
             except Exception as e:
                 logger.exception("Error getting model input: %s", e)
 
-            model_input = "".join(model_input)
+            model_input = self._payload_capture.capture("".join(model_input))
 
             # Record the start event
             input_stats = IntermediateStepPayload(
@@ -170,7 +172,7 @@ class CrewAIProfilerHandler(BaseProfilerCallback):
                 framework=LLMFrameworkEnum.CREWAI,
                 name=model_name,
                 data=StreamEventData(input=model_input),
-                metadata=TraceMetadata(chat_inputs=copy.deepcopy(kwargs.get('messages', []))),
+                metadata=TraceMetadata(chat_inputs=self._payload_capture.capture(kwargs.get('messages', []))),
                 usage_info=UsageInfo(token_usage=TokenUsageBaseModel(),
                                      num_llm_calls=1,
                                      seconds_between_calls=seconds_between_calls))
@@ -48,6 +48,8 @@ class DFWElasticsearchExporter(ElasticsearchMixin, DFWExporter):
             - index: The elasticsearch index name.
             - elasticsearch_auth: The elasticsearch authentication credentials.
             - headers: The elasticsearch headers.
+            - http_compress, max_chunk_bytes, max_chunk_docs, max_concurrent_requests, max_retries,
+              spill_dir: Bulk-indexing settings (see ElasticsearchMixin).
         """
         # Initialize both mixins - ElasticsearchMixin expects elasticsearch_kwargs,
         # DFWExporter expects the standard exporter parameters
@@ -65,8 +67,8 @@ class DFWElasticsearchExporter(ElasticsearchMixin, DFWExporter):
     async def export_processed(self, item: dict | list[dict]) -> None:
         """Export processed DFW records to Elasticsearch.
 
-        Delegates to ElasticsearchMixin.export_processed() which handles
-        bulk operations for lists and single document indexing for individual records.
+        Delegates to ElasticsearchMixin.export_processed() which indexes single
+        records and batches alike through the bulk indexer.
 
         Args:
             item (dict | list[dict]): Single dictionary or batch of dictionaries to export
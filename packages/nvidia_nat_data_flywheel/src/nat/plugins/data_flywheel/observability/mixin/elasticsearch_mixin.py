@@ -14,9 +14,12 @@
 # limitations under the License.
 
 import logging
+from pathlib import Path
 
 from elasticsearch import AsyncElasticsearch
 
+from nat.plugins.data_flywheel.observability.utils.elasticsearch_bulk import ElasticsearchBulkIndexer
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,6 +28,8 @@ class ElasticsearchMixin:
 
     This mixin provides elasticsearch-specific functionality for SpanExporter exporters.
     It handles elasticsearch-specific resource tagging and uses the AsyncElasticsearch client.
+    Documents are written through an :class:`ElasticsearchBulkIndexer`, which splits batches into
+    size-bounded bulk requests, retries rejected documents and spills undeliverable ones to disk.
     """
 
     def __init__(self,
@@ -33,6 +38,12 @@ class ElasticsearchMixin:
                  index: str,
                  elasticsearch_auth: tuple[str, str],
                  headers: dict[str, str] | None = None,
+                 http_compress: bool = True,
+                 max_chunk_bytes: int = 5 * 1024 * 1024,
+                 max_chunk_docs: int = 500,
+                 max_concurrent_requests: int = 2,
+                 max_retries: int = 3,
+                 spill_dir: str | Path | None = None,
                  **kwargs):
         """Initialize the elasticsearch exporter.
 
@@ -41,12 +52,28 @@ class ElasticsearchMixin:
             index (str): The elasticsearch index.
             elasticsearch_auth (tuple[str, str]): The elasticsearch authentication credentials.
             headers (dict[str, str] | None): The elasticsearch headers.
+            http_compress (bool): Whether to gzip request bodies.
+            max_chunk_bytes (int): Upper bound on the body size of a single bulk request.
+            max_chunk_docs (int): Upper bound on the number of documents in a single bulk request.
+            max_concurrent_requests (int): Number of bulk requests allowed in flight at once.
+            max_retries (int): Retries for rejected documents or an unavailable cluster before spilling.
+            spill_dir (str | Path | None): Directory for the disk spill queue. ``None`` disables spilling.
         """
         if headers is None:
             headers = {"Accept": "application/vnd.elasticsearch+json; compatible-with=8"}
 
-        self._elastic_client = AsyncElasticsearch(endpoint, basic_auth=elasticsearch_auth, headers=headers)
+        self._elastic_client = AsyncElasticsearch(endpoint,
+                                                  basic_auth=elasticsearch_auth,
+                                                  headers=headers,
+                                                  http_compress=http_compress)
         self._index = index
+        self._bulk_indexer = ElasticsearchBulkIndexer(self._elastic_client,
+                                                      index,
+                                                      max_chunk_bytes=max_chunk_bytes,
+                                                      max_chunk_docs=max_chunk_docs,
+                                                      max_concurrent_requests=max_concurrent_requests,
+                                                      max_retries=max_retries,
+                                                      spill_dir=spill_dir)
         super().__init__(*args, **kwargs)
 
     async def export_processed(self, item: dict | list[dict]) -> None:
@@ -55,21 +82,20 @@ class ElasticsearchMixin:
         Args:
             item (dict | list[dict]): Dictionary or list of dictionaries to export to Elasticsearch.
         """
-        if isinstance(item, list):
+        if isinstance(item, dict):
+            item = [item]
+        elif isinstance(item, list):
             if not item:  # Empty list
                 return
             if not all(isinstance(doc, dict) for doc in item):
                 raise ValueError("All items in list must be dictionaries")
-
-            # Format for bulk operations: each document needs an action/metadata line
-            bulk_operations = []
-            for doc in item:
-                bulk_operations.append({"index": {"_index": self._index}})  # action/metadata with index
-                bulk_operations.append(doc)  # document
-
-            await self._elastic_client.bulk(operations=bulk_operations)
-        elif isinstance(item, dict):
-            # Single document export
-            await self._elastic_client.index(index=self._index, document=item)
         else:
             raise ValueError(f"Invalid item type: {type(item)}. Expected dict or list[dict]")
+
+        result = await self._bulk_indexer.index(item)
+        if result.failed or result.spilled:
+            logger.warning("Elasticsearch export to index '%s': %d indexed, %d failed, %d spilled to disk",
+                           self._index,
+                           result.indexed,
+                           result.failed,
+                           result.spilled)
@@ -40,6 +40,19 @@ class DFWElasticsearchTelemetryExporter(TelemetryExporterBaseConfig,
     username: str | None = Field(default=None, description="The elasticsearch username.")
     password: OptionalSecretStr = Field(default=None, description="The elasticsearch password.")
     headers: dict | None = Field(default=None, description="Additional headers for elasticsearch requests.")
+    http_compress: bool = Field(default=True, description="Whether to gzip elasticsearch request bodies.")
+    max_chunk_bytes: int = Field(default=5 * 1024 * 1024,
+                                 gt=0,
+                                 description="Maximum size in bytes of a single bulk request body.")
+    max_chunk_docs: int = Field(default=500, gt=0, description="Maximum number of documents in a single bulk request.")
+    max_concurrent_requests: int = Field(default=2, gt=0, description="Number of bulk requests allowed in flight.")
+    max_retries: int = Field(default=3,
+                             ge=0,
+                             description="Retries, with exponential backoff, for documents rejected with a retryable "
+                             "status (such as 429) or for an unavailable cluster.")
+    spill_dir: str | None = Field(default=None,
+                                  description="Directory where undeliverable documents are queued on disk and "
+                                  "replayed on the next export. Disabled when unset.")
 
 
 @register_telemetry_exporter(config_type=DFWElasticsearchTelemetryExporter)
@@ -54,6 +67,12 @@ async def dfw_elasticsearch_telemetry_exporter(config: DFWElasticsearchTelemetry
                                    endpoint=config.endpoint,
                                    elasticsearch_auth=elasticsearch_auth,
                                    headers=config.headers,
+                                   http_compress=config.http_compress,
+                                   max_chunk_bytes=config.max_chunk_bytes,
+                                   max_chunk_docs=config.max_chunk_docs,
+                                   max_concurrent_requests=config.max_concurrent_requests,
+                                   max_retries=config.max_retries,
+                                   spill_dir=config.spill_dir,
                                    contract_version=config.contract_version,
                                    batch_size=config.batch_size,
                                    flush_interval=config.flush_interval,
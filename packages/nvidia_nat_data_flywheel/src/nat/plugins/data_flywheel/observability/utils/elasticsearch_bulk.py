@@ -0,0 +1,274 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from elasticsearch import ApiError
+from elasticsearch import AsyncElasticsearch
+from elasticsearch import TransportError
+from elasticsearch.serializer import JsonSerializer
+
+logger = logging.getLogger(__name__)
+
+# Statuses that mean "try again later" rather than "this document is bad"
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+
+
+@dataclass
+class BulkIndexResult:
+    """Outcome of a call to :meth:`ElasticsearchBulkIndexer.index`.
+
+    Attributes:
+        indexed: Documents acknowledged by Elasticsearch.
+        failed: Documents rejected permanently, or dropped after retries with no spill queue to hold them.
+        spilled: Documents written to the disk spill queue for a later attempt.
+    """
+    indexed: int = 0
+    failed: int = 0
+    spilled: int = 0
+
+    def add(self, other: "BulkIndexResult") -> None:
+        self.indexed += other.indexed
+        self.failed += other.failed
+        self.spilled += other.spilled
+
+
+class ElasticsearchBulkIndexer:
+    """Bulk-indexing engine for a single Elasticsearch index.
+
+    Documents are serialized once into NDJSON ``index`` operations and packed into chunks bounded by both
+    ``max_chunk_bytes`` and ``max_chunk_docs``. Up to ``max_concurrent_requests`` chunks are in flight at once.
+    Documents the cluster rejects with a retryable status (429 and friends) are resent on their own with
+    exponential backoff and jitter; all other per-document failures are logged and counted.
+
+    When ``spill_dir`` is set, chunks that still cannot be delivered because the cluster is unreachable or
+    overloaded are written to disk as NDJSON files, and replayed in order at the start of the next
+    :meth:`index` call. The spill queue is bounded by ``max_spill_bytes``; once full, new chunks are dropped.
+    Request body compression is configured on the client (``http_compress``).
+    """
+
+    def __init__(self,
+                 client: AsyncElasticsearch,
+                 index: str,
+                 *,
+                 max_chunk_bytes: int = 5 * 1024 * 1024,
+                 max_chunk_docs: int = 500,
+                 max_concurrent_requests: int = 2,
+                 max_retries: int = 3,
+                 initial_backoff: float = 0.5,
+                 max_backoff: float = 30.0,
+                 spill_dir: str | Path | None = None,
+                 max_spill_bytes: int = 256 * 1024 * 1024):
+        """Initialize the bulk indexer.
+
+        Args:
+            client (AsyncElasticsearch): The client used to send bulk requests.
+            index (str): The index every document is written to.
+            max_chunk_bytes (int): Upper bound on the NDJSON body size of a single bulk request.
+            max_chunk_docs (int): Upper bound on the number of documents in a single bulk request.
+            max_concurrent_requests (int): Number of bulk requests allowed in flight at once.
+            max_retries (int): Retries for retryable failures before a chunk is spilled or dropped.
+            initial_backoff (float): Delay in seconds before the first retry; doubles on each retry.
+            max_backoff (float): Upper bound in seconds on a single retry delay.
+            spill_dir (str | Path | None): Directory for the disk spill queue. ``None`` disables spilling.
+            max_spill_bytes (int): Upper bound on the total size of the spill queue.
+        """
+        if max_chunk_bytes < 1 or max_chunk_docs < 1 or max_concurrent_requests < 1:
+            raise ValueError("max_chunk_bytes, max_chunk_docs and max_concurrent_requests must be positive")
+        if max_retries < 0:
+            raise ValueError("max_retries must be non-negative")
+
+        self._client = client
+        self._index = index
+        self._max_chunk_bytes = max_chunk_bytes
+        self._max_chunk_docs = max_chunk_docs
+        self._max_retries = max_retries
+        self._initial_backoff = initial_backoff
+        self._max_backoff = max_backoff
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
+        self._serializer = JsonSerializer()
+        self._action_line = self._serializer.dumps({"index": {"_index": index}}) + b"\n"
+
+        self._spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self._max_spill_bytes = max_spill_bytes
+        self._spill_seq = 0
+        self._replay_lock = asyncio.Lock()
+        if self._spill_dir is not None:
+            self._spill_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def spilled_files(self) -> list[Path]:
+        """Spill queue files, oldest first."""
+        if self._spill_dir is None:
+            return []
+        return sorted(self._spill_dir.glob("*.ndjson"))
+
+    async def index(self, documents: list[dict[str, Any]]) -> BulkIndexResult:
+        """Index a batch of documents.
+
+        Any previously spilled chunks are replayed first. Non-retryable client errors propagate; retryable
+        failures that outlast ``max_retries`` are spilled to disk when a spill queue is configured.
+
+        Args:
+            documents (list[dict[str, Any]]): The documents to index.
+
+        Returns:
+            BulkIndexResult: Counts of indexed, failed and spilled documents for this call, including replays.
+        """
+        result = await self.replay_spilled()
+        operations = [self._action_line + self._serializer.dumps(doc) + b"\n" for doc in documents]
+        chunks = list(self._chunk(operations))
+        if chunks:
+            for chunk_result in await asyncio.gather(*(self._send_chunk(chunk) for chunk in chunks)):
+                result.add(chunk_result)
+        return result
+
+    async def replay_spilled(self) -> BulkIndexResult:
+        """Resend spilled chunks, oldest first, stopping at the first chunk that cannot be delivered yet.
+
+        Returns:
+            BulkIndexResult: Counts for the replayed documents.
+        """
+        result = BulkIndexResult()
+        if self._spill_dir is None:
+            return result
+
+        async with self._replay_lock:
+            for path in self.spilled_files:
+                operations = path.read_bytes().splitlines(keepends=True)
+                # Pair each action line back up with its document line
+                operations = [operations[i] + operations[i + 1] for i in range(0, len(operations) - 1, 2)]
+                try:
+                    chunk_result = await self._send_chunk(operations, replay=True)
+                except ApiError as e:
+                    if e.status_code in RETRYABLE_STATUSES:
+                        logger.info("Elasticsearch still overloaded; keeping spilled chunks: %s", e)
+                        break
+                    # A chunk the cluster will never accept must not block the rest of the queue
+                    logger.error("Dropping spilled chunk %s rejected with status %d: %s", path, e.status_code, e)
+                    path.unlink()
+                    result.failed += len(operations)
+                    continue
+                except TransportError as e:
+                    logger.info("Elasticsearch still unavailable; keeping spilled chunks: %s", e)
+                    break
+                path.unlink()
+                result.add(chunk_result)
+        return result
+
+    def _chunk(self, operations: list[bytes]):
+        chunk: list[bytes] = []
+        chunk_bytes = 0
+        for op in operations:
+            if chunk and (chunk_bytes + len(op) > self._max_chunk_bytes or len(chunk) >= self._max_chunk_docs):
+                yield chunk
+                chunk = []
+                chunk_bytes = 0
+            chunk.append(op)
+            chunk_bytes += len(op)
+        if chunk:
+            yield chunk
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self._max_backoff, self._initial_backoff * (2**attempt))
+        return random.uniform(delay / 2, delay)
+
+    async def _send_chunk(self, operations: list[bytes], replay: bool = False) -> BulkIndexResult:
+        """Send one chunk, retrying the whole request or just the rejected documents as needed.
+
+        A ``replay`` of a spilled chunk makes a single attempt and raises if the cluster is unavailable, so a
+        dead cluster does not hold up new documents for a full backoff schedule per spilled chunk.
+        """
+        result = BulkIndexResult()
+        pending = operations
+        attempt = 0
+        max_retries = 0 if replay else self._max_retries
+        while True:
+            try:
+                async with self._semaphore:
+                    response = await self._client.bulk(operations=b"".join(pending))
+            except (TransportError, ApiError) as e:
+                if isinstance(e, ApiError) and e.status_code not in RETRYABLE_STATUSES:
+                    raise
+                if attempt >= max_retries:
+                    if replay:
+                        raise
+                    logger.warning("Bulk request of %d document(s) failed after %d retries: %s",
+                                   len(pending),
+                                   attempt,
+                                   e)
+                    self._spill(pending, result)
+                    return result
+                await asyncio.sleep(self._backoff(attempt))
+                attempt += 1
+                continue
+
+            retry = self._partition_response(response, pending, result)
+            if not retry:
+                return result
+            if attempt >= max_retries:
+                logger.warning("%d document(s) still rejected after %d retries", len(retry), attempt)
+                self._spill(retry, result)
+                return result
+            await asyncio.sleep(self._backoff(attempt))
+            attempt += 1
+            pending = retry
+
+    def _partition_response(self, response: Any, operations: list[bytes], result: BulkIndexResult) -> list[bytes]:
+        """Record per-document outcomes of a bulk response and return the operations worth retrying."""
+        body = getattr(response, "body", response)
+        if not isinstance(body, Mapping) or not body.get("errors"):
+            result.indexed += len(operations)
+            return []
+
+        retry: list[bytes] = []
+        for op, item in zip(operations, body.get("items", [])):
+            outcome = next(iter(item.values()), {})
+            status = outcome.get("status", 500)
+            if status < 300:
+                result.indexed += 1
+            elif status in RETRYABLE_STATUSES:
+                retry.append(op)
+            else:
+                result.failed += 1
+                logger.error("Elasticsearch rejected document with status %d: %s", status, outcome.get("error"))
+        return retry
+
+    def _spill(self, operations: list[bytes], result: BulkIndexResult) -> None:
+        if self._spill_dir is None:
+            result.failed += len(operations)
+            return
+
+        payload = b"".join(operations)
+        spilled_bytes = sum(path.stat().st_size for path in self.spilled_files)
+        if spilled_bytes + len(payload) > self._max_spill_bytes:
+            logger.error("Spill queue is full (%d bytes); dropping %d document(s)", spilled_bytes, len(operations))
+            result.failed += len(operations)
+            return
+
+        self._spill_seq += 1
+        path = self._spill_dir / f"{time.time_ns():020d}-{self._spill_seq:06d}.ndjson"
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(payload)
+        tmp_path.replace(path)
+        result.spilled += len(operations)
+        logger.warning("Spilled %d document(s) to %s", len(operations), path)
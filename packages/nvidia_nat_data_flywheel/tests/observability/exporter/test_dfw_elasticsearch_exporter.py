@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 from unittest.mock import AsyncMock
 from unittest.mock import Mock
 from unittest.mock import patch
@@ -25,6 +26,11 @@ from nat.plugins.data_flywheel.observability.exporter.dfw_elasticsearch_exporter
 from nat.plugins.data_flywheel.observability.schema.sink.elasticsearch import ContractVersion
 
 
+def bulk_operations(bulk_call) -> list[dict]:
+    """Decode the NDJSON body of a recorded ``bulk`` call back into action and document dicts."""
+    return [json.loads(line) for line in bulk_call.kwargs['operations'].splitlines()]
+
+
 class MockContractSchema(BaseModel):
     """Mock contract schema for testing."""
     test_field: str
@@ -59,7 +65,8 @@ class TestDFWElasticsearchExporter:
         mock_elasticsearch.assert_called_once_with(
             'http://localhost:9200',
             basic_auth=('user', 'pass'),
-            headers={"Accept": "application/vnd.elasticsearch+json; compatible-with=8"})
+            headers={"Accept": "application/vnd.elasticsearch+json; compatible-with=8"},
+            http_compress=True)
 
     @patch('nat.plugins.data_flywheel.observability.mixin.elasticsearch_mixin.AsyncElasticsearch')
     def test_elasticsearch_exporter_initialization_custom_params(self, mock_elasticsearch):
@@ -94,7 +101,8 @@ class TestDFWElasticsearchExporter:
         # Verify elasticsearch client was initialized with custom parameters
         mock_elasticsearch.assert_called_once_with('https://es.example.com:9200',
                                                    basic_auth=('admin', 'secret'),
-                                                   headers=custom_headers)
+                                                   headers=custom_headers,
+                                                   http_compress=True)
 
     @patch('nat.plugins.data_flywheel.observability.mixin.elasticsearch_mixin.AsyncElasticsearch')
     def test_export_contract_property(self, mock_elasticsearch):
@@ -165,8 +173,10 @@ class TestDFWElasticsearchExporter:
         test_doc = {"field": "value", "timestamp": 123456789}
         await exporter.export_processed(test_doc)
 
-        # Verify the elasticsearch client's index method was called
-        mock_elasticsearch_client.index.assert_called_once_with(index='test_index', document=test_doc)
+        # Verify the document was sent through the elasticsearch client's bulk method
+        mock_elasticsearch_client.bulk.assert_called_once()
+        expected_operations = [{"index": {"_index": "test_index"}}, test_doc]
+        assert bulk_operations(mock_elasticsearch_client.bulk.call_args) == expected_operations
 
     @patch('nat.plugins.data_flywheel.observability.mixin.elasticsearch_mixin.AsyncElasticsearch')
     async def test_export_processed_bulk_operations(self, mock_elasticsearch):
@@ -200,7 +210,8 @@ class TestDFWElasticsearchExporter:
         }, {
             "field": "value2", "timestamp": 123456790
         }]
-        mock_elasticsearch_client.bulk.assert_called_once_with(operations=expected_operations)
+        mock_elasticsearch_client.bulk.assert_called_once()
+        assert bulk_operations(mock_elasticsearch_client.bulk.call_args) == expected_operations
 
     @patch('nat.plugins.data_flywheel.observability.mixin.elasticsearch_mixin.AsyncElasticsearch')
     def test_elasticsearch_exporter_with_none_context_state(self, mock_elasticsearch):
@@ -238,7 +249,8 @@ class TestDFWElasticsearchExporter:
         mock_elasticsearch.assert_called_once_with(
             'http://localhost:9200',
             basic_auth=('user', 'pass'),
-            headers={"Accept": "application/vnd.elasticsearch+json; compatible-with=8"})
+            headers={"Accept": "application/vnd.elasticsearch+json; compatible-with=8"},
+            http_compress=True)
 
     def test_missing_required_elasticsearch_parameters(self):
         """Test that missing required elasticsearch parameters raise appropriate errors."""
@@ -324,7 +336,7 @@ class TestDFWElasticsearchExporterErrorCases:
         # Setup mocks
 
         mock_elasticsearch_client = AsyncMock()
-        mock_elasticsearch_client.index.side_effect = Exception("Elasticsearch connection error")
+        mock_elasticsearch_client.bulk.side_effect = Exception("Elasticsearch connection error")
         mock_elasticsearch.return_value = mock_elasticsearch_client
 
         elasticsearch_kwargs = {
@@ -380,7 +392,8 @@ class TestDFWElasticsearchExporterIntegration:
         # Verify elasticsearch client initialization
         mock_elasticsearch.assert_called_once_with('http://integration.test:9200',
                                                    basic_auth=('test_user', 'test_pass'),
-                                                   headers={'X-Test': 'integration'})
+                                                   headers={'X-Test': 'integration'},
+                                                   http_compress=True)
 
     def test_multiple_exporter_instances_independence(self):
         """Test that multiple exporter instances are independent."""
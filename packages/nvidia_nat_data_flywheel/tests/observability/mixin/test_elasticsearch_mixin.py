@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 from unittest.mock import AsyncMock
 from unittest.mock import patch
 
@@ -21,6 +22,11 @@ import pytest
 from nat.plugins.data_flywheel.observability.mixin.elasticsearch_mixin import ElasticsearchMixin
 
 
+def bulk_operations(bulk_call) -> list[dict]:
+    """Decode the NDJSON body of a recorded ``bulk`` call back into action and document dicts."""
+    return [json.loads(line) for line in bulk_call.kwargs['operations'].splitlines()]
+
+
 class MockParentClass:
     """Mock parent class for testing mixin inheritance."""
 
@@ -60,7 +66,8 @@ class TestElasticsearchMixin:
         mock_elasticsearch.assert_called_once_with(
             'http://localhost:9200',
             basic_auth=('user', 'pass'),
-            headers={"Accept": "application/vnd.elasticsearch+json; compatible-with=8"})
+            headers={"Accept": "application/vnd.elasticsearch+json; compatible-with=8"},
+            http_compress=True)
 
     @patch('nat.plugins.data_flywheel.observability.mixin.elasticsearch_mixin.AsyncElasticsearch')
     def test_elasticsearch_mixin_initialization_custom_headers(self, mock_elasticsearch):
@@ -85,7 +92,8 @@ class TestElasticsearchMixin:
         # Verify AsyncElasticsearch was called with custom headers
         mock_elasticsearch.assert_called_once_with('https://es.example.com:9200',
                                                    basic_auth=('admin', 'secret'),
-                                                   headers=custom_headers)
+                                                   headers=custom_headers,
+                                                   http_compress=True)
 
     @patch('nat.plugins.data_flywheel.observability.mixin.elasticsearch_mixin.AsyncElasticsearch')
     def test_elasticsearch_mixin_initialization_with_parent_args(self, mock_elasticsearch):
@@ -125,8 +133,10 @@ class TestElasticsearchMixin:
         test_doc = {"field1": "value1", "field2": "value2", "timestamp": 123456789}
         await mixin.export_processed(test_doc)
 
-        # Verify elasticsearch client's index method was called
-        mock_client.index.assert_called_once_with(index='test_index', document=test_doc)
+        # Single documents go through the bulk indexer too
+        mock_client.index.assert_not_called()
+        mock_client.bulk.assert_called_once()
+        assert bulk_operations(mock_client.bulk.call_args) == [{"index": {"_index": "test_index"}}, test_doc]
 
     @patch('nat.plugins.data_flywheel.observability.mixin.elasticsearch_mixin.AsyncElasticsearch')
     async def test_export_processed_bulk_documents(self, mock_elasticsearch):
@@ -169,7 +179,8 @@ class TestElasticsearchMixin:
         }, {
             "field": "value3", "timestamp": 123456791
         }]
-        mock_client.bulk.assert_called_once_with(operations=expected_operations)
+        mock_client.bulk.assert_called_once()
+        assert bulk_operations(mock_client.bulk.call_args) == expected_operations
 
     @patch('nat.plugins.data_flywheel.observability.mixin.elasticsearch_mixin.AsyncElasticsearch')
     async def test_export_processed_empty_list(self, mock_elasticsearch):
@@ -282,10 +293,10 @@ class TestElasticsearchMixinErrorHandling:
 
     @patch('nat.plugins.data_flywheel.observability.mixin.elasticsearch_mixin.AsyncElasticsearch')
     async def test_elasticsearch_client_index_exception(self, mock_elasticsearch):
-        """Test behavior when elasticsearch client.index() raises an exception."""
+        """Test behavior when the bulk request for a single document raises an exception."""
         # Setup mock with exception
         mock_client = AsyncMock()
-        mock_client.index.side_effect = Exception("Elasticsearch index error")
+        mock_client.bulk.side_effect = Exception("Elasticsearch index error")
         mock_elasticsearch.return_value = mock_client
 
         mixin = ConcreteElasticsearchMixin(endpoint='http://localhost:9200',
@@ -339,7 +350,8 @@ class TestElasticsearchMixinErrorHandling:
         await mixin.export_processed(complex_doc)
 
         # Verify elasticsearch client was called with the complex document
-        mock_client.index.assert_called_once_with(index='complex_index', document=complex_doc)
+        mock_client.bulk.assert_called_once()
+        assert bulk_operations(mock_client.bulk.call_args) == [{"index": {"_index": "complex_index"}}, complex_doc]
 
     @patch('nat.plugins.data_flywheel.observability.mixin.elasticsearch_mixin.AsyncElasticsearch')
     async def test_export_processed_bulk_operations_formatting(self, mock_elasticsearch):
@@ -413,7 +425,8 @@ class TestElasticsearchMixinErrorHandling:
             }  # Doc 4
         ]
 
-        mock_client.bulk.assert_called_once_with(operations=expected_operations)
+        mock_client.bulk.assert_called_once()
+        assert bulk_operations(mock_client.bulk.call_args) == expected_operations
 
 
 class TestElasticsearchMixinIntegration:
@@ -478,31 +491,13 @@ class TestElasticsearchMixinIntegration:
         await mixin.export_processed([])  # Empty list
         await mixin.export_processed([{"operation": 5}])
 
-        # Verify all operations were called correctly
-        assert mock_client.index.call_count == 2  # Two single document calls
-        assert mock_client.bulk.call_count == 2  # Two bulk calls (empty list skipped)
-
-        # Verify individual calls
-        index_calls = mock_client.index.call_args_list
-        assert index_calls[0][1] == {'index': 'sequential_test', 'document': {"operation": 1}}
-        assert index_calls[1][1] == {'index': 'sequential_test', 'document': {"operation": 4}}
-
-        # Verify bulk calls
+        # Every non-empty export is a bulk request (empty list skipped)
+        mock_client.index.assert_not_called()
         bulk_calls = mock_client.bulk.call_args_list
-        assert len(bulk_calls) == 2
-        # First bulk call (operations 2 and 3)
-        assert bulk_calls[0][1]['operations'] == [{
-            "index": {
-                "_index": "sequential_test"
-            }
-        }, {
-            "operation": 2
-        }, {
-            "index": {
-                "_index": "sequential_test"
-            }
-        }, {
-            "operation": 3
-        }]
-        # Second bulk call (operation 5)
-        assert bulk_calls[1][1]['operations'] == [{"index": {"_index": "sequential_test"}}, {"operation": 5}]
+        assert len(bulk_calls) == 4
+
+        action = {"index": {"_index": "sequential_test"}}
+        assert bulk_operations(bulk_calls[0]) == [action, {"operation": 1}]
+        assert bulk_operations(bulk_calls[1]) == [action, {"operation": 2}, action, {"operation": 3}]
+        assert bulk_operations(bulk_calls[2]) == [action, {"operation": 4}]
+        assert bulk_operations(bulk_calls[3]) == [action, {"operation": 5}]
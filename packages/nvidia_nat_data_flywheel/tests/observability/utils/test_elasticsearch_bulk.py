@@ -0,0 +1,179 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import gzip
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+from elasticsearch import AsyncElasticsearch
+from pytest_httpserver import HTTPServer
+from werkzeug import Request
+from werkzeug import Response
+
+from nat.plugins.data_flywheel.observability.utils.elasticsearch_bulk import ElasticsearchBulkIndexer
+
+
+class StandInCluster:
+    """Minimal stand-in for the Elasticsearch ``_bulk`` endpoint.
+
+    Records every request's documents and lets tests make the cluster unavailable or reject chosen documents.
+    """
+
+    def __init__(self):
+        self.available = True
+        self.reject_once: dict[int, int] = {}  # doc id -> status returned the first time it is seen
+        self.requests: list[list[dict]] = []
+        self.gzipped: list[bool] = []
+        self.indexed: list[int] = []
+
+    def handle(self, request: Request) -> Response:
+        headers = {"X-Elastic-Product": "Elasticsearch", "Content-Type": "application/json"}
+        if not self.available:
+            return Response(json.dumps({"error": "unavailable", "status": 503}), status=503, headers=headers)
+
+        body = request.get_data()
+        self.gzipped.append(request.headers.get("Content-Encoding") == "gzip")
+        if self.gzipped[-1]:
+            body = gzip.decompress(body)
+        docs = [json.loads(line) for line in body.splitlines()[1::2]]
+        self.requests.append(docs)
+
+        items = []
+        for doc in docs:
+            status = self.reject_once.pop(doc["id"], 201)
+            if status < 300:
+                self.indexed.append(doc["id"])
+            items.append({"index": {"status": status, "error": None if status < 300 else {"type": "rejected"}}})
+        errors = any(item["index"]["status"] >= 300 for item in items)
+        return Response(json.dumps({"took": 1, "errors": errors, "items": items}), status=200, headers=headers)
+
+
+@pytest.fixture(name="cluster")
+def cluster_fixture(httpserver: HTTPServer) -> StandInCluster:
+    cluster = StandInCluster()
+    httpserver.expect_request("/_bulk", method="PUT").respond_with_handler(cluster.handle)
+    return cluster
+
+
+@pytest.fixture(name="es_client")
+async def es_client_fixture(httpserver: HTTPServer):
+    # Transport-level retries are disabled so the indexer's own retry policy is what gets exercised
+    client = AsyncElasticsearch(httpserver.url_for("/"), http_compress=True, max_retries=0)
+    yield client
+    await client.close()
+
+
+def _docs(count: int) -> list[dict]:
+    return [{"id": i, "payload": "x" * 100} for i in range(count)]
+
+
+async def test_chunks_are_bounded_by_docs_and_bytes(cluster: StandInCluster, es_client: AsyncElasticsearch):
+    indexer = ElasticsearchBulkIndexer(es_client, "spans", max_chunk_docs=10)
+    result = await indexer.index(_docs(45))
+
+    assert result.indexed == 45
+    assert [len(docs) for docs in cluster.requests] == [10, 10, 10, 10, 5]
+    assert all(cluster.gzipped)
+
+    cluster.requests.clear()
+    # Each operation is a little over 150 bytes, so a 1000 byte bound fits six of them
+    indexer = ElasticsearchBulkIndexer(es_client, "spans", max_chunk_bytes=1000)
+    result = await indexer.index(_docs(12))
+
+    assert result.indexed == 12
+    assert [len(docs) for docs in cluster.requests] == [6, 6]
+
+
+async def test_rejected_documents_are_retried_individually(cluster: StandInCluster, es_client: AsyncElasticsearch):
+    cluster.reject_once = {3: 429, 7: 429, 8: 400}
+    indexer = ElasticsearchBulkIndexer(es_client, "spans", initial_backoff=0)
+
+    result = await indexer.index(_docs(10))
+
+    assert (result.indexed, result.failed, result.spilled) == (9, 1, 0)
+    # Only the 429 documents are resent; the 400 is a permanent failure
+    assert [[doc["id"] for doc in docs] for docs in cluster.requests] == [list(range(10)), [3, 7]]
+    assert sorted(cluster.indexed) == [0, 1, 2, 3, 4, 5, 6, 7, 9]
+
+
+async def test_unavailable_cluster_spills_and_replays(cluster: StandInCluster, es_client: AsyncElasticsearch, tmp_path):
+    indexer = ElasticsearchBulkIndexer(es_client,
+                                       "spans",
+                                       max_chunk_docs=4,
+                                       max_retries=1,
+                                       initial_backoff=0,
+                                       spill_dir=tmp_path)
+    cluster.available = False
+
+    result = await indexer.index(_docs(6))
+
+    assert (result.indexed, result.spilled) == (0, 6)
+    assert len(indexer.spilled_files) == 2
+
+    # Still down: the queue is kept, and new documents join it
+    result = await indexer.index([{"id": 6}])
+    assert (result.indexed, result.spilled) == (0, 1)
+    assert len(indexer.spilled_files) == 3
+
+    cluster.available = True
+    result = await indexer.index([{"id": 7}])
+
+    assert (result.indexed, result.spilled, result.failed) == (8, 0, 0)
+    assert indexer.spilled_files == []
+    # Spilled chunks are replayed oldest first, ahead of the new documents
+    assert cluster.indexed == list(range(8))
+
+
+async def test_spill_queue_is_bounded(cluster: StandInCluster, es_client: AsyncElasticsearch, tmp_path):
+    indexer = ElasticsearchBulkIndexer(es_client, "spans", max_retries=0, spill_dir=tmp_path, max_spill_bytes=500)
+    cluster.available = False
+
+    first = await indexer.index(_docs(2))
+    second = await indexer.index(_docs(2))
+
+    assert first.spilled == 2
+    assert (second.spilled, second.failed) == (0, 2)
+
+
+async def test_concurrent_requests_are_capped():
+    in_flight = 0
+    peak = 0
+
+    async def bulk(operations):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"errors": False, "items": []}
+
+    client = AsyncMock()
+    client.bulk.side_effect = bulk
+    indexer = ElasticsearchBulkIndexer(client, "spans", max_chunk_docs=1, max_concurrent_requests=3)
+
+    result = await indexer.index(_docs(10))
+
+    assert result.indexed == 10
+    assert client.bulk.call_count == 10
+    assert peak == 3
+
+
+def test_rejects_invalid_settings():
+    with pytest.raises(ValueError):
+        ElasticsearchBulkIndexer(AsyncMock(), "spans", max_chunk_docs=0)
+    with pytest.raises(ValueError):
+        ElasticsearchBulkIndexer(AsyncMock(), "spans", max_retries=-1)
@@ -149,6 +149,9 @@ class EvalCallback(Protocol):
     async def a_on_evaluator_score(self, *, eval_output: Any, evaluator_name: str) -> None:
         ...
 
+    async def a_on_evaluator_item_scores(self, *, eval_output: Any, evaluator_name: str) -> None:
+        ...
+
     async def a_on_export_flush(self) -> None:
         ...
 
@@ -237,6 +240,17 @@ class EvalCallbackManager:
             except Exception:
                 logger.exception("EvalCallback %s.a_on_evaluator_score failed", type(cb).__name__)
 
+    async def a_on_evaluator_item_scores(self, *, eval_output: Any, evaluator_name: str) -> None:
+        """Report the scores of some of the items, produced while the workflow is still running on the others."""
+        for cb in self._callbacks:
+            fn = getattr(cb, "a_on_evaluator_item_scores", None)
+            if not fn:
+                continue
+            try:
+                await fn(eval_output=eval_output, evaluator_name=evaluator_name)
+            except Exception:
+                logger.exception("EvalCallback %s.a_on_evaluator_item_scores failed", type(cb).__name__)
+
     async def a_on_export_flush(self) -> None:
         for cb in self._callbacks:
             fn = getattr(cb, "a_on_export_flush", None)
@@ -16,6 +16,7 @@
 import typing
 
 from pydantic import BaseModel
+from pydantic import Field
 
 from nat.data_models.evaluate_runtime import EvaluationRunConfig
 from nat.data_models.evaluate_runtime import EvaluationRunOutput
@@ -25,10 +26,19 @@ class MultiEvaluationRunConfig(BaseModel):
     """
     Parameters used for a multi-evaluation run.
     This includes a dict of configs. The key is an id of any type.
-    Each pass loads the config, applies the overrides and runs to completion
+    Each pass loads the config and applies the overrides. Up to `max_concurrent_runs`
+    passes run at the same time; the default of 1 runs each pass to completion
     before the next pass starts.
     """
     configs: dict[typing.Any, EvaluationRunConfig]
+    max_concurrent_runs: int = Field(default=1,
+                                     ge=1,
+                                     description="Maximum number of evaluation runs executed concurrently.")
+    max_total_concurrency: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum number of workflow requests in flight across all concurrent runs. This budget is "
+        "shared by every run in addition to each run's own `eval.general.max_concurrency`. 0 disables the limit.")
 
 
 class MultiEvaluationRunOutput(BaseModel):
@@ -13,14 +13,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import copy
+import logging
 import typing
+from collections.abc import AsyncIterator
 
 from nat.data_models.evaluate_runtime import EvaluationRunConfig
 from nat.data_models.evaluate_runtime import EvaluationRunOutput
 from nat.plugins.eval.runners.config import MultiEvaluationRunConfig
 from nat.plugins.eval.runtime.evaluate import EvaluationRun
 
+logger = logging.getLogger(__name__)
+
 
 class MultiEvaluationRunner:
     """
@@ -33,22 +38,68 @@ class MultiEvaluationRunner:
         """
         self.config = config
         self.evaluation_run_outputs: dict[typing.Any, EvaluationRunOutput] = {}
+        self._request_limiter: asyncio.Semaphore | None = None
 
     async def run_all(self):
         """
         Run all evaluations defined by the overrides.
         """
-        for id, config in self.config.configs.items():
-            output = await self.run_single_evaluation(id, config)
-            self.evaluation_run_outputs[id] = output
+        async for _ in self.iter_results():
+            pass
 
         return self.evaluation_run_outputs
 
+    async def iter_results(self) -> AsyncIterator[tuple[typing.Any, EvaluationRunOutput]]:
+        """
+        Run all evaluations and yield `(id, output)` pairs in completion order.
+
+        At most `max_concurrent_runs` evaluations are in flight at a time. A new evaluation is only started when a
+        running one finishes, so with the default of one run the evaluations execute sequentially in config order.
+        If any evaluation fails, the remaining in-flight evaluations are cancelled and the error is re-raised.
+        """
+        if self.config.max_total_concurrency > 0:
+            self._request_limiter = asyncio.Semaphore(self.config.max_total_concurrency)
+
+        pending_configs = iter(self.config.configs.items())
+        in_flight: dict[asyncio.Task, typing.Any] = {}
+
+        def launch_next() -> bool:
+            next_config = next(pending_configs, None)
+            if next_config is None:
+                return False
+            id, config = next_config
+            in_flight[asyncio.create_task(self.run_single_evaluation(id, config))] = id
+            return True
+
+        try:
+            while len(in_flight) < self.config.max_concurrent_runs and launch_next():
+                pass
+
+            while in_flight:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    id = in_flight.pop(task)
+                    output = task.result()
+                    self.evaluation_run_outputs[id] = output
+                    logger.info("Evaluation run '%s' completed (%d/%d)",
+                                id,
+                                len(self.evaluation_run_outputs),
+                                len(self.config.configs))
+                    yield id, output
+
+                while len(in_flight) < self.config.max_concurrent_runs and launch_next():
+                    pass
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
     async def run_single_evaluation(self, id: typing.Any, config: EvaluationRunConfig) -> EvaluationRunOutput:
         """
         Run a single evaluation and return the output.
         """
         # copy the config in case the caller is using the same config for multiple evaluations
         config_copy = copy.deepcopy(config)
-        evaluation_run = EvaluationRun(config_copy)
+        evaluation_run = EvaluationRun(config_copy, request_limiter=self._request_limiter)
         return await evaluation_run.run_and_evaluate()
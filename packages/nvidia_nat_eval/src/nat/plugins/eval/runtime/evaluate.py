@@ -19,6 +19,7 @@ import json
 import logging
 import shutil
 from collections.abc import Awaitable
+from collections.abc import Callable
 from contextlib import nullcontext
 from datetime import UTC
 from datetime import datetime
@@ -81,6 +82,7 @@ if TYPE_CHECKING:
     from nat.plugins.eval.eval_callbacks import EvalCallbackManager
     from nat.plugins.eval.evaluator.atif_evaluator import AtifEvalSampleList
     from nat.plugins.eval.exporters.file_eval_callback import FileEvalCallback
+    from nat.plugins.eval.runtime.result_cache import EvalResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -94,15 +96,22 @@ class EvaluationRun:
         Future versions may introduce breaking changes without notice.
     """
 
-    def __init__(self, config: EvaluationRunConfig, callback_manager: "EvalCallbackManager | None" = None):
+    def __init__(self,
+                 config: EvaluationRunConfig,
+                 callback_manager: "EvalCallbackManager | None" = None,
+                 request_limiter: asyncio.Semaphore | None = None):
         """
         Initialize an EvaluationRun with configuration.
+
+        An optional `request_limiter` bounds the number of workflow requests in flight. It is intended to be shared
+        between concurrent evaluation runs that target the same endpoints.
         """
         from nat.plugins.eval.utils.intermediate_step_adapter import IntermediateStepAdapter
 
         # Run-specific configuration
         self.config: EvaluationRunConfig = config
         self.callback_manager: EvalCallbackManager = callback_manager or EvalCallbackManager()
+        self.request_limiter: asyncio.Semaphore | None = request_limiter
         if self.config.write_output:
             from nat.plugins.eval.exporters.file_eval_callback import FileEvalCallback
             if not any(isinstance(cb, FileEvalCallback) for cb in self.callback_manager._callbacks):
@@ -141,6 +150,12 @@ class EvaluationRun:
         # Pre-generated OTEL root span_ids for eager trace linking (item_id -> span_id)
         self._item_span_ids: dict[str, int] = {}
 
+        # Cache of workflow outputs and evaluator scores, opened by `run_and_evaluate` when enabled
+        self.result_cache: EvalResultCache | None = None
+        self._workflow_config_hash: str | None = None
+        # Ids of the items whose workflow output was served from the result cache
+        self._cached_item_ids: set = set()
+
     def _compute_usage_stats(self, item: EvalInputItem):
         """Compute usage stats for a single item using the intermediate steps"""
         usage_stats_per_llm = {}
@@ -198,9 +213,13 @@ class EvaluationRun:
 
     async def run_workflow_local(self,
                                  session_manager: SessionManager,
-                                 http_connection: "HTTPConnection | None" = None):
+                                 http_connection: "HTTPConnection | None" = None,
+                                 on_item_complete: Callable[[EvalInputItem], Awaitable[None]] | None = None):
         '''
         Launch the workflow with the specified questions and extract the output using the jsonpath
+
+        If provided, `on_item_complete` is awaited with each item once its workflow run has finished, whether or not
+        it succeeded. The item keeps its slot of `max_concurrency` until `on_item_complete` returns.
         '''
         # import function level dependencies
         from jsonpath_ng import parse
@@ -215,6 +234,9 @@ class EvaluationRun:
             if stop_event.is_set():
                 return "", []
 
+            if await self._load_cached_workflow_output(item):
+                return
+
             # Only pre-generate root span_ids when callbacks need them
             # (e.g. LangSmith eager linking). This avoids touching core
             # observability code paths for non-LangSmith eval runs.
@@ -300,13 +322,26 @@ class EvaluationRun:
                         if self.callback_manager:
                             self.callback_manager.on_prediction(item=item, output=output)
                             await self.callback_manager.a_on_usage_stats(item=item, usage_stats_item=usage_stats_item)
+                        await self._store_workflow_output(item)
             finally:
                 if root_span_token is not None:
                     ctx_state._root_span_id.reset(root_span_token)
 
+        # An item takes a slot of this run before one of the request limiter shared with other runs, so it does not
+        # hold a shared slot while waiting for its own run's concurrency limit
+        max_concurrency = self.eval_config.general.max_concurrency
+        run_slots = asyncio.Semaphore(max_concurrency) if max_concurrency > 0 else nullcontext()
+        request_limiter = self.request_limiter or nullcontext()
+
         async def wrapped_run(item: EvalInputItem) -> None:
-            await run_one(item)
-            pbar.update(1)
+            async with run_slots:
+                async with request_limiter:
+                    await run_one(item)
+                pbar.update(1)
+                # Completing the item keeps the run's slot, so while `on_item_complete` waits, for example for space
+                # in a full scoring queue, the next item is not started
+                if on_item_complete is not None:
+                    await on_item_complete(item)
 
         # if self.config.skip_complete is set skip eval_input_items with a non-empty output_obj
         if self.config.skip_completed_entries:
@@ -324,9 +359,66 @@ class EvaluationRun:
         await asyncio.gather(*[wrapped_run(item) for item in eval_input_items])
         pbar.close()
 
+    async def _load_cached_workflow_output(self, item: EvalInputItem) -> bool:
+        """Populate the output and trajectory of an item from the result cache, returning whether they were found."""
+        if self.result_cache is None or self._workflow_config_hash is None:
+            return False
+
+        from nat.plugins.eval.runtime.result_cache import workflow_output_key
+        cached = await asyncio.to_thread(self.result_cache.get_workflow_output,
+                                         workflow_output_key(item, self._workflow_config_hash))
+        if cached is None:
+            return False
+        item.output_obj, intermediate_steps = cached
+        item.trajectory = self.intermediate_step_adapter.validate_intermediate_steps(intermediate_steps)
+        self._cached_item_ids.add(item.id)
+        # The usage stats are those of the run which produced the cached output
+        usage_stats_item = self._compute_usage_stats(item)
+        if self.callback_manager:
+            self.callback_manager.on_prediction(item=item, output=item.output_obj)
+            await self.callback_manager.a_on_usage_stats(item=item, usage_stats_item=usage_stats_item)
+        return True
+
+    async def _store_workflow_output(self, item: EvalInputItem) -> None:
+        if self.result_cache is None or self._workflow_config_hash is None:
+            return
+
+        from nat.plugins.eval.runtime.result_cache import workflow_output_key
+        try:
+            trajectory = [step.model_dump(mode="json") for step in item.trajectory]
+            await asyncio.to_thread(self.result_cache.put_workflow_output,
+                                    workflow_output_key(item, self._workflow_config_hash),
+                                    item.output_obj,
+                                    trajectory)
+        except Exception:
+            logger.warning("Failed to store the workflow output of item %s in the result cache", item.id, exc_info=True)
+
+    def _open_result_cache(self, config: Config, evaluators: dict[str, Any]) -> dict[str, Any]:
+        """Open the result cache, returning the evaluators wrapped to serve cached scores when enabled."""
+        from nat.plugins.eval.runtime.result_cache import CachedEvaluator
+        from nat.plugins.eval.runtime.result_cache import EvalResultCache
+        from nat.plugins.eval.runtime.result_cache import evaluator_config_hash
+        from nat.plugins.eval.runtime.result_cache import workflow_config_hash
+
+        cache_config = self.eval_config.general.result_cache
+        self.result_cache = EvalResultCache(cache_config.path)
+        if cache_config.workflow_outputs:
+            self._workflow_config_hash = workflow_config_hash(config)
+        if not cache_config.scores:
+            return evaluators
+
+        cached_evaluators: dict[str, Any] = {}
+        for name, evaluator in evaluators.items():
+            if isinstance(evaluator, AtifEvaluator | LegacyEvaluator):
+                evaluator = CachedEvaluator(name, evaluator, evaluator_config_hash(config, name), self.result_cache)
+            cached_evaluators[name] = evaluator
+        return cached_evaluators
+
     async def run_workflow_remote(self):
         from nat.plugins.eval.runtime.remote_workflow import EvaluationRemoteWorkflowHandler
-        handler = EvaluationRemoteWorkflowHandler(self.config, self.eval_config.general.max_concurrency)
+        handler = EvaluationRemoteWorkflowHandler(self.config,
+                                                  self.eval_config.general.max_concurrency,
+                                                  request_limiter=self.request_limiter)
         await handler.run_workflow_remote(self.eval_input)
         for item in self.eval_input.eval_input_items:
             usage_stats_item = self._compute_usage_stats(item)
@@ -334,6 +426,61 @@ class EvaluationRun:
                 self.callback_manager.on_prediction(item=item, output=item.output_obj)
                 await self.callback_manager.a_on_usage_stats(item=item, usage_stats_item=usage_stats_item)
 
+    async def run_workflow_local_and_evaluate(self,
+                                              session_manager: SessionManager,
+                                              dataset_handler: DatasetHandler,
+                                              evaluators: dict[str, Any],
+                                              http_connection: "HTTPConnection | None" = None):
+        '''
+        Run the workflow locally, scoring each item with the evaluators as soon as its workflow run finishes.
+
+        Items are pre-evaluation processed one at a time before being scored. Items the workflow is not run on, such
+        as skipped completed entries, are scored once the workflow has finished, so the evaluators are given the same
+        items as when they are run after the workflow.
+        '''
+        from nat.plugins.eval.runtime.pipelined_scoring import PipelinedScorer
+
+        items = self.eval_input.eval_input_items
+        positions = {id(item): index for index, item in enumerate(items)}
+        processed_items: list[EvalInputItem | None] = [None] * len(items)
+
+        async with PipelinedScorer(evaluators, self.eval_config.general.pipelined_scoring,
+                                   self.callback_manager) as scorer:
+
+            async def score_item(item: EvalInputItem) -> None:
+                index = positions[id(item)]
+                if processed_items[index] is not None:
+                    return
+                processed_item = dataset_handler.pre_eval_process_eval_input(
+                    EvalInput(eval_input_items=[item])).eval_input_items[0]
+                processed_items[index] = processed_item
+                sample = None
+                if scorer.needs_atif_samples:
+                    sample = self.atif_adapter.build_samples(EvalInput(eval_input_items=[processed_item]))[0]
+                await scorer.submit(index, processed_item, sample)
+
+            await self.run_workflow_local(session_manager, http_connection=http_connection, on_item_complete=score_item)
+            for item in items:
+                await score_item(item)
+            results = await scorer.finish()
+
+        self.eval_input = EvalInput(eval_input_items=processed_items)
+        if scorer.needs_atif_samples or (self.eval_config.general.output
+                                         and self.eval_config.general.output.write_atif_workflow_output):
+            self.atif_eval_samples = self.atif_adapter.build_samples(self.eval_input)
+        else:
+            self.atif_eval_samples = []
+
+        try:
+            for evaluator_name, eval_output in results:
+                self.evaluation_results.append((evaluator_name, eval_output))
+                if self.callback_manager:
+                    await self.callback_manager.a_on_evaluator_score(eval_output=eval_output,
+                                                                     evaluator_name=evaluator_name)
+        finally:
+            if self.callback_manager:
+                await self.callback_manager.a_on_export_flush()
+
     async def profile_workflow(self) -> ProfilerResults:
         """
         Profile a dataset
@@ -836,6 +983,10 @@ class EvaluationRun:
                 # Run workflow
                 local_session_manager: SessionManager | None = None
                 try:
+                    evaluators = {name: eval_workflow.get_evaluator(name) for name in self.eval_config.evaluators}
+                    if self.eval_config.general.result_cache is not None:
+                        evaluators = self._open_result_cache(config, evaluators)
+                    evaluated = False
                     if self.config.endpoint:
                         await self.run_workflow_remote()
                     elif not self.config.skip_workflow:
@@ -845,21 +996,29 @@ class EvaluationRun:
                                 shared_builder=eval_workflow,
                                 max_concurrency=self.eval_config.general.max_concurrency)
                             local_session_manager = session_manager
-                        await self.run_workflow_local(session_manager, http_connection=http_connection)
-
-                    # Pre-evaluation process the workflow output
-                    self.eval_input = dataset_handler.pre_eval_process_eval_input(self.eval_input)
-                    evaluators = {name: eval_workflow.get_evaluator(name) for name in self.eval_config.evaluators}
-                    needs_atif = (any(isinstance(ev, AtifEvaluator) for ev in evaluators.values())
-                                  or (self.eval_config.general.output
-                                      and self.eval_config.general.output.write_atif_workflow_output))
-                    if needs_atif:
-                        self.atif_eval_samples = self.atif_adapter.build_samples(self.eval_input)
-                    else:
-                        self.atif_eval_samples = []
+                        if self.eval_config.general.pipelined_scoring is not None:
+                            # Score the items while the workflow is running
+                            await self.run_workflow_local_and_evaluate(session_manager,
+                                                                       dataset_handler,
+                                                                       evaluators,
+                                                                       http_connection=http_connection)
+                            evaluated = True
+                        else:
+                            await self.run_workflow_local(session_manager, http_connection=http_connection)
+
+                    if not evaluated:
+                        # Pre-evaluation process the workflow output
+                        self.eval_input = dataset_handler.pre_eval_process_eval_input(self.eval_input)
+                        needs_atif = (any(isinstance(ev, AtifEvaluator) for ev in evaluators.values())
+                                      or (self.eval_config.general.output
+                                          and self.eval_config.general.output.write_atif_workflow_output))
+                        if needs_atif:
+                            self.atif_eval_samples = self.atif_adapter.build_samples(self.eval_input)
+                        else:
+                            self.atif_eval_samples = []
 
-                    # Evaluate
-                    await self.run_evaluators(evaluators)
+                        # Evaluate
+                        await self.run_evaluators(evaluators)
 
                     # Wait for all trace export tasks to complete (local workflows only)
                     if session_manager and not self.config.endpoint:
@@ -867,15 +1026,21 @@ class EvaluationRun:
                 finally:
                     if local_session_manager is not None:
                         await local_session_manager.shutdown()
+                    if self.result_cache is not None:
+                        self.result_cache.log_stats()
+                        self.result_cache.close()
 
         # Profile the workflow
         profiler_results = await self.profile_workflow()
 
-        # compute total runtime
-        if self.usage_stats.usage_stats_items:
-            self.usage_stats.total_runtime = max(self.usage_stats.usage_stats_items.values(),
-                                                 key=lambda x: x.max_timestamp).max_timestamp - \
-                min(self.usage_stats.usage_stats_items.values(), key=lambda x: x.min_timestamp).min_timestamp
+        # compute total runtime, leaving out the items whose cached workflow output was produced by an earlier run
+        run_stats_items = [
+            usage_stats_item for item_id, usage_stats_item in self.usage_stats.usage_stats_items.items()
+            if item_id not in self._cached_item_ids
+        ]
+        if run_stats_items:
+            self.usage_stats.total_runtime = max(run_stats_items, key=lambda x: x.max_timestamp).max_timestamp - \
+                min(run_stats_items, key=lambda x: x.min_timestamp).min_timestamp
         else:
             self.usage_stats.total_runtime = 0.0
 
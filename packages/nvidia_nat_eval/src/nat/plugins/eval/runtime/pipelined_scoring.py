@@ -0,0 +1,208 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Pipelined scoring of eval items.
+
+Rather than waiting for the workflow to run on the whole dataset, the scorer passes each item to the evaluators as soon
+as its workflow run finishes, so LLM-judge evaluators work while the workflow is still generating outputs for the rest
+of the dataset.
+
+Example:
+    ```python
+    async with PipelinedScorer(evaluators, PipelinedScoringConfig()) as scorer:
+        for index, item in enumerate(finished_items):
+            await scorer.submit(index, item)
+        results = await scorer.finish()
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
+
+from nat.data_models.evaluate_config import PipelinedScoringConfig
+from nat.data_models.evaluator import EvalInput
+from nat.data_models.evaluator import EvalInputItem
+from nat.plugins.eval.data_models.evaluator_io import EvalOutput
+from nat.plugins.eval.data_models.evaluator_io import EvalOutputItem
+from nat.plugins.eval.evaluator.atif_evaluator import AtifEvalSample
+from nat.plugins.eval.evaluator.atif_evaluator import AtifEvaluator
+from nat.plugins.eval.evaluator.atif_evaluator import LegacyEvaluator
+
+if TYPE_CHECKING:
+    from nat.plugins.eval.eval_callbacks import EvalCallbackManager
+
+logger = logging.getLogger(__name__)
+
+
+class _QueuedItem(NamedTuple):
+    index: int
+    item: EvalInputItem
+    sample: AtifEvalSample | None
+
+
+class _EvaluatorLane:
+    """The queue and the scores of a single evaluator."""
+
+    def __init__(self, name: str, evaluator: AtifEvaluator | LegacyEvaluator, queue_size: int):
+        self.name = name
+        self.evaluator = evaluator
+        self.queue: asyncio.Queue[_QueuedItem | None] = asyncio.Queue(maxsize=queue_size)
+        self.scored_items: list[tuple[int, EvalOutputItem]] = []
+        self.failed = False
+
+
+class PipelinedScorer:
+    """
+    Scores eval items with each evaluator as they are submitted, rather than once the whole dataset is available.
+
+    Every evaluator has a bounded queue of items waiting to be scored. The items waiting in a queue are passed to the
+    evaluator in batches of up to `batch_size` items, with up to `max_concurrent_batches` calls in progress per
+    evaluator. ATIF evaluators are called with the ATIF samples of the batch, legacy evaluators with an `EvalInput`
+    holding its items. Once all items have been submitted, `finish` merges the scores of each evaluator in the order
+    of the dataset.
+
+    As with the evaluators run on the whole dataset, an evaluator raising an error is logged and produces no result.
+
+    Args:
+        evaluators: The evaluators keyed by name.
+        config: The pipelined scoring configuration.
+        callback_manager: If provided, receives the scores of each batch as they are produced.
+    """
+
+    def __init__(self,
+                 evaluators: dict[str, Any],
+                 config: PipelinedScoringConfig,
+                 callback_manager: EvalCallbackManager | None = None):
+        self._config = config
+        self._callback_manager = callback_manager
+        self._lanes: list[_EvaluatorLane] = []
+        for name, evaluator in evaluators.items():
+            if not evaluator:
+                continue
+            if isinstance(evaluator, AtifEvaluator | LegacyEvaluator):
+                self._lanes.append(_EvaluatorLane(name, evaluator, config.queue_size))
+            else:
+                logger.warning("Skipping evaluator %s: missing ATIF and legacy evaluator interfaces", name)
+        self._workers: list[asyncio.Task] = []
+
+    @property
+    def needs_atif_samples(self) -> bool:
+        """Whether any of the evaluators requires the ATIF samples of the submitted items."""
+        return any(isinstance(lane.evaluator, AtifEvaluator) for lane in self._lanes)
+
+    async def __aenter__(self) -> PipelinedScorer:
+        self._workers = [asyncio.create_task(self._run_lane(lane)) for lane in self._lanes]
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        # Only has an effect when leaving before `finish`, for example when the workflow fails
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+
+    async def submit(self, index: int, item: EvalInputItem, sample: AtifEvalSample | None = None) -> None:
+        """
+        Queue an item to be scored by every evaluator, waiting while the queue of an evaluator is full.
+
+        Args:
+            index: Position of the item in the dataset.
+            item: The item, with the output of its workflow run.
+            sample: The ATIF sample of the item, required if any of the evaluators is an ATIF evaluator.
+        """
+        queued_item = _QueuedItem(index, item, sample)
+        for lane in self._lanes:
+            await lane.queue.put(queued_item)
+
+    async def finish(self) -> list[tuple[str, EvalOutput]]:
+        """
+        Wait for the submitted items to be scored.
+
+        Returns:
+            The output of each evaluator which did not fail, with its items in the order of the dataset and its
+            average score computed over all of them.
+        """
+        for lane in self._lanes:
+            await lane.queue.put(None)
+        await asyncio.gather(*self._workers)
+
+        results: list[tuple[str, EvalOutput]] = []
+        for lane in self._lanes:
+            if lane.failed:
+                continue
+            output_items = [output_item for _, output_item in sorted(lane.scored_items, key=lambda entry: entry[0])]
+            numeric_scores = [item.score for item in output_items if isinstance(item.score, int | float)]
+            average_score = round(sum(numeric_scores) / len(numeric_scores), 2) if numeric_scores else None
+            results.append((lane.name, EvalOutput(average_score=average_score, eval_output_items=output_items)))
+        return results
+
+    async def _run_lane(self, lane: _EvaluatorLane) -> None:
+        batch_slots = asyncio.Semaphore(self._config.max_concurrent_batches)
+        batch_tasks: set[asyncio.Task] = set()
+
+        def on_batch_done(task: asyncio.Task) -> None:
+            batch_tasks.discard(task)
+            batch_slots.release()
+
+        finished = False
+        try:
+            while not finished:
+                # Items stay in the queue until a call can be made, so they are batched while the evaluator is busy
+                await batch_slots.acquire()
+                # Wait for one item, then take the items already waiting without blocking
+                batch: list[_QueuedItem] = []
+                while len(batch) < self._config.batch_size and (not batch or not lane.queue.empty()):
+                    queued_item = await lane.queue.get()
+                    if queued_item is None:
+                        finished = True
+                        break
+                    batch.append(queued_item)
+                if not batch:
+                    batch_slots.release()
+                    continue
+
+                task = asyncio.create_task(self._score_batch(lane, batch))
+                batch_tasks.add(task)
+                task.add_done_callback(on_batch_done)
+
+            await asyncio.gather(*batch_tasks)
+        finally:
+            for task in batch_tasks:
+                task.cancel()
+
+    async def _score_batch(self, lane: _EvaluatorLane, batch: list[_QueuedItem]) -> None:
+        if lane.failed:
+            return
+        try:
+            if isinstance(lane.evaluator, AtifEvaluator):
+                eval_output = await lane.evaluator.evaluate_atif_fn([queued_item.sample for queued_item in batch])
+            else:
+                eval_output = await lane.evaluator.evaluate_fn(
+                    EvalInput(eval_input_items=[queued_item.item for queued_item in batch]))
+        except Exception:
+            logger.exception("An error occurred while running evaluator %s", lane.name)
+            lane.failed = True
+            return
+
+        indices = {str(queued_item.item.id): queued_item.index for queued_item in batch}
+        for position, output_item in enumerate(eval_output.eval_output_items):
+            index = indices.get(str(output_item.id), batch[min(position, len(batch) - 1)].index)
+            lane.scored_items.append((index, output_item))
+
+        if self._callback_manager:
+            await self._callback_manager.a_on_evaluator_item_scores(eval_output=eval_output, evaluator_name=lane.name)
@@ -16,6 +16,7 @@
 import asyncio
 import json
 import logging
+from contextlib import nullcontext
 
 import aiohttp
 from pydantic import ValidationError
@@ -38,10 +39,15 @@ INTERMEDIATE_DATA_PREFIX = "intermediate_data: "
 
 class EvaluationRemoteWorkflowHandler:
 
-    def __init__(self, config: EvaluationRunConfig, max_concurrency: int):
+    def __init__(self,
+                 config: EvaluationRunConfig,
+                 max_concurrency: int,
+                 request_limiter: asyncio.Semaphore | None = None):
         self.config = config
         # Run metadata
         self.semaphore = asyncio.Semaphore(max_concurrency)
+        # Optional budget shared with other concurrent evaluation runs
+        self.request_limiter = request_limiter or nullcontext()
 
     async def run_workflow_remote_single(self, session: aiohttp.ClientSession, item: EvalInputItem) -> None:
         """
@@ -124,7 +130,7 @@ class EvaluationRemoteWorkflowHandler:
         """
         Sends limited number of concurrent requests to a remote workflow and retrieves responses.
         """
-        async with self.semaphore:
+        async with self.semaphore, self.request_limiter:
             await self.run_workflow_remote_single(session=session, item=item)
             progress_bar.update(1)
 
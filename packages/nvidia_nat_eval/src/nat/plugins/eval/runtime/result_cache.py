@@ -0,0 +1,320 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Content-addressed cache of workflow outputs and evaluator scores.
+
+The cache lets repeated evaluation runs skip the work a change did not affect. Workflow outputs are keyed on the
+dataset item and a hash of the configuration outside of the `eval` section, scores are keyed on the scored item, its
+workflow output and trajectory included, and a hash of the evaluator configuration and the components it references.
+The ids and timestamps which differ between runs are left out of the trajectory in the score key. Changing one
+evaluator only rescores with that evaluator, and changing a prompt re-runs the workflow, while items whose output did
+not change keep their scores.
+
+Example:
+    ```python
+    with EvalResultCache(".tmp/nat/eval_cache.db") as cache:
+        evaluator = CachedEvaluator("accuracy", evaluator, evaluator_config_hash(config, "accuracy"), cache)
+        eval_output = await evaluator.evaluate_fn(eval_input)
+        cache.log_stats()
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import logging
+import math
+import sqlite3
+import threading
+import time
+from collections.abc import Awaitable
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+from pydantic import BaseModel
+
+from nat.builder.component_utils import recursive_componentref_discovery
+from nat.data_models.evaluator import EvalInput
+from nat.data_models.evaluator import EvalInputItem
+from nat.plugins.eval.data_models.evaluator_io import EvalOutput
+from nat.plugins.eval.data_models.evaluator_io import EvalOutputItem
+from nat.plugins.eval.evaluator.atif_evaluator import AtifEvalSample
+from nat.plugins.eval.evaluator.atif_evaluator import AtifEvalSampleList
+from nat.plugins.eval.evaluator.atif_evaluator import AtifEvaluator
+from nat.plugins.eval.evaluator.atif_evaluator import LegacyEvaluator
+
+if TYPE_CHECKING:
+    from nat.data_models.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Name under which the workflow output hits and misses are counted
+WORKFLOW_STATS_NAME = "workflow"
+
+# Fields of intermediate steps and ATIF trajectories which differ between two runs producing the same trajectory
+_RUN_SPECIFIC_FIELDS = frozenset({
+    "UUID",
+    "event_timestamp",
+    "span_event_timestamp",
+    "seconds_between_calls",
+    "parent_id",
+    "function_id",
+    "session_id",
+    "timestamp",
+    "start_timestamp",
+    "end_timestamp",
+    "invocation_id",
+    "tool_call_id",
+    "source_call_id",
+})
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json", fallback=str)
+    return str(value)
+
+
+def _hash(value: Any) -> str:
+    serialized = json.dumps(value, sort_keys=True, separators=(",", ":"), default=_to_json)
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def workflow_config_hash(config: Config) -> str:
+    """Hash of the configuration the workflow outputs depend on, that is everything outside of the `eval` section."""
+    return _hash(config.model_dump(mode="json", exclude={"eval"}, fallback=str))
+
+
+def evaluator_config_hash(config: Config, evaluator_name: str) -> str:
+    """Hash of the configuration of an evaluator, including the configuration of the components it references."""
+    evaluator_config = config.eval.evaluators[evaluator_name]
+    components: dict[str, Any] = {}
+    pending = [evaluator_config]
+    while pending:
+        instance_config = pending.pop()
+        for field_name, field_info in type(instance_config).model_fields.items():
+            for _, ref_node in recursive_componentref_discovery(instance_config,
+                                                                getattr(instance_config, field_name),
+                                                                field_info.annotation):
+                component_key = f"{ref_node.component_group}/{ref_node.ref_name}"
+                component_config = getattr(config, ref_node.component_group, {}).get(ref_node.ref_name)
+                if component_key in components or component_config is None:
+                    continue
+                components[component_key] = component_config
+                pending.append(component_config)
+    return _hash({"evaluator": evaluator_config, "components": components})
+
+
+def _without_run_specific_fields(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: _without_run_specific_fields(child)
+            for key, child in value.items() if key not in _RUN_SPECIFIC_FIELDS
+        }
+    if isinstance(value, list):
+        return [_without_run_specific_fields(child) for child in value]
+    return value
+
+
+def workflow_output_key(item: EvalInputItem, workflow_hash: str) -> str:
+    """Cache key of the workflow output of an item."""
+    return _hash({"id": item.id, "input": item.input_obj, "workflow": workflow_hash})
+
+
+def score_key(unit: EvalInputItem | AtifEvalSample, config_hash: str) -> str:
+    """Cache key of the score of an item or ATIF sample, which ignores the ids and timestamps of its trajectory."""
+    item = unit.model_dump(mode="json", fallback=str)
+    item["trajectory"] = _without_run_specific_fields(item["trajectory"])
+    return _hash({"item": item, "evaluator": config_hash})
+
+
+@dataclasses.dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+
+class EvalResultCache:
+    """
+    SQLite backed store of workflow outputs and evaluator scores.
+
+    The methods are blocking, callers running in the event loop use `asyncio.to_thread`. The number of hits and
+    misses of each lookup is counted per evaluator, and for the workflow outputs, in `stats`.
+
+    Args:
+        path: Path of the database file, or None to keep the cache in memory.
+    """
+
+    def __init__(self, path: str | Path | None):
+        if path is not None:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path) if path is not None else ":memory:",
+                                     check_same_thread=False,
+                                     isolation_level=None)
+        self.stats: dict[str, CacheStats] = {}
+        with self._lock:
+            if path is not None:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS workflow_outputs (key TEXT PRIMARY KEY, "
+                               "output TEXT NOT NULL, trajectory TEXT NOT NULL, created REAL NOT NULL)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS scores (key TEXT PRIMARY KEY, output_item TEXT NOT NULL, "
+                               "created REAL NOT NULL)")
+
+    def __enter__(self) -> EvalResultCache:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _record(self, name: str, hits: int, misses: int) -> None:
+        stats = self.stats.setdefault(name, CacheStats())
+        stats.hits += hits
+        stats.misses += misses
+
+    def get_workflow_output(self, key: str) -> tuple[Any, list[dict]] | None:
+        """Return the output and the serialized intermediate steps of a cached workflow run."""
+        with self._lock:
+            row = self._conn.execute("SELECT output, trajectory FROM workflow_outputs WHERE key = ?",
+                                     (key, )).fetchone()
+            self._record(WORKFLOW_STATS_NAME, hits=int(row is not None), misses=int(row is None))
+        if row is None:
+            return None
+        return json.loads(row[0]), json.loads(row[1])
+
+    def put_workflow_output(self, key: str, output: Any, trajectory: list[dict]) -> None:
+        row = (key, json.dumps(output), json.dumps(trajectory), time.time())
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO workflow_outputs VALUES (?, ?, ?, ?)", row)
+
+    def get_scores(self, evaluator_name: str, keys: list[str]) -> dict[str, dict]:
+        """Return the cached output items found for `keys`, without their ids."""
+        found: dict[str, dict] = {}
+        with self._lock:
+            for key in set(keys):
+                row = self._conn.execute("SELECT output_item FROM scores WHERE key = ?", (key, )).fetchone()
+                if row is not None:
+                    found[key] = json.loads(row[0])
+            num_hits = sum(key in found for key in keys)
+            self._record(evaluator_name, hits=num_hits, misses=len(keys) - num_hits)
+        return found
+
+    def put_scores(self, entries: list[tuple[str, dict]]) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO scores VALUES (?, ?, ?)",
+                                   [(key, json.dumps(output_item), now) for key, output_item in entries])
+
+    def log_stats(self) -> None:
+        """Log the number of hits and misses of the lookups made so far."""
+        for name, stats in self.stats.items():
+            label = "workflow outputs" if name == WORKFLOW_STATS_NAME else f"evaluator {name}"
+            logger.info("Eval result cache, %s: %d hits, %d misses", label, stats.hits, stats.misses)
+
+
+class CachedEvaluator:
+    """
+    Evaluator wrapper serving the scores of items scored before from an `EvalResultCache`.
+
+    The wrapper exposes the same interfaces as the wrapped evaluator. Each call only passes the items without a cached
+    score to the wrapped evaluator, and stores the scores it returns, except for failed or NaN scores. When some of the
+    scores are served from the cache, the average score is the mean of the numeric item scores.
+
+    Args:
+        name: The evaluator name, used for the cache statistics.
+        evaluator: The wrapped evaluator.
+        config_hash: Hash of the evaluator configuration, see `evaluator_config_hash`.
+        cache: The cache.
+    """
+
+    def __init__(self, name: str, evaluator: AtifEvaluator | LegacyEvaluator, config_hash: str, cache: EvalResultCache):
+        self._name = name
+        self._evaluator = evaluator
+        self._config_hash = config_hash
+        self._cache = cache
+        # Only expose the interfaces of the wrapped evaluator, so the wrapper is run the same way it would be
+        if isinstance(evaluator, AtifEvaluator):
+            self.evaluate_atif_fn = self._evaluate_atif
+        if isinstance(evaluator, LegacyEvaluator):
+            self.evaluate_fn = self._evaluate
+
+    async def _evaluate_atif(self, atif_samples: AtifEvalSampleList) -> EvalOutput:
+
+        async def evaluate_misses(positions: list[int]) -> EvalOutput:
+            return await self._evaluator.evaluate_atif_fn([atif_samples[position] for position in positions])
+
+        return await self._score([sample.item_id for sample in atif_samples], list(atif_samples), evaluate_misses)
+
+    async def _evaluate(self, eval_input: EvalInput) -> EvalOutput:
+        items = eval_input.eval_input_items
+
+        async def evaluate_misses(positions: list[int]) -> EvalOutput:
+            return await self._evaluator.evaluate_fn(
+                EvalInput(eval_input_items=[items[position] for position in positions]))
+
+        return await self._score([item.id for item in items], items, evaluate_misses)
+
+    async def _score(self,
+                     ids: list[Any],
+                     units: list[EvalInputItem | AtifEvalSample],
+                     evaluate_misses: Callable[[list[int]], Awaitable[EvalOutput]]) -> EvalOutput:
+        keys = [score_key(unit, self._config_hash) for unit in units]
+        cached = await asyncio.to_thread(self._cache.get_scores, self._name, keys)
+        misses = [position for position, key in enumerate(keys) if key not in cached]
+        if not cached:
+            eval_output = await evaluate_misses(misses)
+            await self._store(eval_output, ids, keys, misses)
+            return eval_output
+
+        output_items: list[EvalOutputItem | None] = [None] * len(keys)
+        for position, key in enumerate(keys):
+            if key in cached:
+                output_items[position] = EvalOutputItem.model_validate({**cached[key], "id": ids[position]})
+        if misses:
+            eval_output = await evaluate_misses(misses)
+            await self._store(eval_output, ids, keys, misses)
+            positions = {str(ids[position]): position for position in misses}
+            for index, output_item in enumerate(eval_output.eval_output_items):
+                position = positions.get(str(output_item.id), misses[min(index, len(misses) - 1)])
+                output_items[position] = output_item
+
+        scored_items = [output_item for output_item in output_items if output_item is not None]
+        numeric_scores = [item.score for item in scored_items if isinstance(item.score, int | float)]
+        average_score = round(sum(numeric_scores) / len(numeric_scores), 2) if numeric_scores else None
+        return EvalOutput(average_score=average_score, eval_output_items=scored_items)
+
+    async def _store(self, eval_output: EvalOutput, ids: list[Any], keys: list[str], positions: list[int]) -> None:
+        keys_by_id = {str(ids[position]): keys[position] for position in positions}
+        entries = []
+        for output_item in eval_output.eval_output_items:
+            key = keys_by_id.get(str(output_item.id))
+            if key is None or output_item.error is not None:
+                continue
+            if isinstance(output_item.score, float) and math.isnan(output_item.score):
+                continue
+            try:
+                entries.append((key, output_item.model_dump(mode="json", exclude={"id"})))
+            except Exception:
+                logger.debug("Not caching unserializable score of evaluator %s", self._name, exc_info=True)
+        if entries:
+            await asyncio.to_thread(self._cache.put_scores, entries)
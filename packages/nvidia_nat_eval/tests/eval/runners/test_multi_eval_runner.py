@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import copy
 from pathlib import Path
 from unittest.mock import AsyncMock
@@ -132,3 +133,90 @@ async def test_run_all_partial_failure(multi_eval_config, mock_evaluation_run_ou
         # Verify only the first result was stored before the exception
         assert len(runner.evaluation_run_outputs) == 1
         assert "concurrency_1" in runner.evaluation_run_outputs
+
+
+async def test_run_all_sequential_by_default(multi_eval_config, mock_evaluation_run_output):
+    """Test that only one evaluation is in flight when max_concurrent_runs is not set."""
+    runner = MultiEvaluationRunner(multi_eval_config)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_run_single(id, config):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return mock_evaluation_run_output
+
+    with patch.object(runner, "run_single_evaluation", side_effect=fake_run_single):
+        await runner.run_all()
+
+    assert max_in_flight == 1
+    assert list(runner.evaluation_run_outputs) == ["concurrency_1", "concurrency_2", "concurrency_4"]
+
+
+async def test_iter_results_concurrent_completion_order(multi_eval_config, mock_evaluation_run_output):
+    """Test that concurrent runs overlap and results are yielded as each run finishes."""
+    multi_eval_config.max_concurrent_runs = 3
+    runner = MultiEvaluationRunner(multi_eval_config)
+    delays = {"concurrency_1": 0.06, "concurrency_2": 0.01, "concurrency_4": 0.03}
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_run_single(id, config):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(delays[id])
+        in_flight -= 1
+        return mock_evaluation_run_output
+
+    with patch.object(runner, "run_single_evaluation", side_effect=fake_run_single):
+        completed = [id async for id, _ in runner.iter_results()]
+
+    assert max_in_flight == 3
+    assert completed == ["concurrency_2", "concurrency_4", "concurrency_1"]
+
+
+async def test_iter_results_cancels_in_flight_on_failure(multi_eval_config):
+    """Test that a failing run cancels the other in-flight runs."""
+    multi_eval_config.max_concurrent_runs = 3
+    runner = MultiEvaluationRunner(multi_eval_config)
+    cancelled = []
+
+    async def fake_run_single(id, config):
+        if id == "concurrency_2":
+            raise RuntimeError("scenario failed")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(id)
+            raise
+
+    with patch.object(runner, "run_single_evaluation", side_effect=fake_run_single):
+        with pytest.raises(RuntimeError, match="scenario failed"):
+            await runner.run_all()
+
+    assert sorted(cancelled) == ["concurrency_1", "concurrency_4"]
+    assert not runner.evaluation_run_outputs
+
+
+async def test_run_single_evaluation_shares_request_limiter(multi_eval_config, mock_evaluation_run_output):
+    """Test that every evaluation run receives the same shared request limiter."""
+    multi_eval_config.max_total_concurrency = 4
+    runner = MultiEvaluationRunner(multi_eval_config)
+    limiters = []
+
+    def fake_evaluation_run(config, request_limiter=None):
+        limiters.append(request_limiter)
+        evaluation_run = AsyncMock()
+        evaluation_run.run_and_evaluate.return_value = mock_evaluation_run_output
+        return evaluation_run
+
+    with patch("nat.plugins.eval.runners.multi_eval_runner.EvaluationRun", side_effect=fake_evaluation_run):
+        await runner.run_all()
+
+    assert len(limiters) == 3
+    assert isinstance(limiters[0], asyncio.Semaphore)
+    assert all(limiter is limiters[0] for limiter in limiters)
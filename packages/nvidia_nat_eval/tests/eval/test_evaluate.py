@@ -36,6 +36,7 @@ from nat.data_models.evaluate_config import EvalConfig
 from nat.data_models.evaluate_config import EvalOutputConfig
 from nat.data_models.evaluate_config import JobEvictionPolicy
 from nat.data_models.evaluate_config import JobManagementConfig
+from nat.data_models.evaluate_config import PipelinedScoringConfig
 from nat.data_models.evaluate_runtime import EvaluationRunConfig
 from nat.data_models.evaluate_runtime import ProfilerResults
 from nat.data_models.evaluator import EvalInput
@@ -49,6 +50,9 @@ from nat.plugins.eval.data_models.evaluator_io import EvalOutput
 from nat.plugins.eval.data_models.evaluator_io import EvalOutputItem
 from nat.plugins.eval.exporters.file_eval_callback import FileEvalCallback
 from nat.plugins.eval.runtime.evaluate import EvaluationRun
+from nat.plugins.eval.runtime.result_cache import WORKFLOW_STATS_NAME
+from nat.plugins.eval.runtime.result_cache import CacheStats
+from nat.plugins.eval.runtime.result_cache import EvalResultCache
 from nat.runtime.session import SessionManager
 
 # pylint: disable=unused-argument # arguments are passed to setup the fixtures
@@ -633,6 +637,170 @@ async def test_run_evaluators_partial_failure(evaluation_run, mock_evaluator, ev
         "Error message should indicate evaluator failure"
 
 
+async def test_run_workflow_local_and_evaluate(evaluation_run,
+                                               session_manager,
+                                               mock_evaluator,
+                                               eval_output,
+                                               generated_answer):
+    """Items are scored as their workflow runs finish, and the merged evaluator output is reported at the end."""
+    evaluation_run.eval_config.general.pipelined_scoring = PipelinedScoringConfig()
+    callback = SimpleNamespace(a_on_evaluator_item_scores=AsyncMock(), a_on_evaluator_score=AsyncMock())
+    evaluation_run.callback_manager.register(callback)
+    dataset_handler = MagicMock()
+    dataset_handler.pre_eval_process_eval_input.side_effect = lambda eval_input: eval_input
+
+    evaluators = {"MockEvaluator": mock_evaluator}
+    await evaluation_run.run_workflow_local_and_evaluate(session_manager, dataset_handler, evaluators)
+
+    assert evaluation_run.eval_input.eval_input_items[0].output_obj == generated_answer
+    scored_input = mock_evaluator.evaluate_fn.await_args.args[0]
+    assert [item.output_obj for item in scored_input.eval_input_items] == [generated_answer]
+    assert evaluation_run.evaluation_results == [("MockEvaluator", eval_output)]
+    callback.a_on_evaluator_item_scores.assert_awaited_once_with(eval_output=eval_output,
+                                                                 evaluator_name="MockEvaluator")
+    callback.a_on_evaluator_score.assert_awaited_once_with(eval_output=eval_output, evaluator_name="MockEvaluator")
+
+
+async def test_full_scoring_queue_stops_new_workflow_runs(evaluation_run, session_manager, mock_pull_intermediate):
+    """Once the scoring queue is full, a finished workflow run keeps its slot, so the next item is not started."""
+
+    class BlockedEvaluator:
+
+        def __init__(self):
+            self.release = asyncio.Event()
+
+        async def evaluate_fn(self, eval_input: EvalInput) -> EvalOutput:
+            await self.release.wait()
+            items = [EvalOutputItem(id=item.id, score=1.0, reasoning=None) for item in eval_input.eval_input_items]
+            return EvalOutput(average_score=1.0, eval_output_items=items)
+
+    item = evaluation_run.eval_input.eval_input_items[0]
+    evaluation_run.eval_input = EvalInput(
+        eval_input_items=[item.model_copy(update={"id": index}) for index in range(5)])
+    evaluation_run.eval_config.general.pipelined_scoring = PipelinedScoringConfig(queue_size=1,
+                                                                                  batch_size=1,
+                                                                                  max_concurrent_batches=1)
+    dataset_handler = MagicMock()
+    dataset_handler.pre_eval_process_eval_input.side_effect = lambda eval_input: eval_input
+    evaluator = BlockedEvaluator()
+
+    evaluation_task = asyncio.create_task(
+        evaluation_run.run_workflow_local_and_evaluate(session_manager, dataset_handler, {"judge": evaluator}))
+    await asyncio.sleep(0.05)
+    # The first item is being scored, the second waits in the queue and the third waits for space in the queue
+    assert mock_pull_intermediate.call_count == 3
+
+    evaluator.release.set()
+    await evaluation_task
+    assert mock_pull_intermediate.call_count == 5
+    assert [item.id for item in evaluation_run.evaluation_results[0][1].eval_output_items] == [0, 1, 2, 3, 4]
+
+
+async def test_run_workflow_local_uses_result_cache(evaluation_run,
+                                                    session_manager,
+                                                    mock_pull_intermediate,
+                                                    generated_answer):
+    """A cached workflow output is reused instead of running the workflow again."""
+    evaluation_run.result_cache = EvalResultCache(None)
+    evaluation_run._workflow_config_hash = "workflow-config"
+
+    await evaluation_run.run_workflow_local(session_manager)
+    item = evaluation_run.eval_input.eval_input_items[0]
+    trajectory = item.trajectory
+    item.output_obj = None
+    item.trajectory = []
+
+    await evaluation_run.run_workflow_local(session_manager)
+
+    assert mock_pull_intermediate.await_count == 1
+    assert item.output_obj == generated_answer
+    assert item.trajectory == trajectory
+    assert evaluation_run.result_cache.stats[WORKFLOW_STATS_NAME] == CacheStats(hits=1, misses=1)
+
+
+async def test_cached_workflow_output_reports_usage_stats(evaluation_run, session_manager):
+    """Items with a cached workflow output report its usage stats."""
+    evaluation_run.result_cache = EvalResultCache(None)
+    evaluation_run._workflow_config_hash = "workflow-config"
+    callback = SimpleNamespace(on_prediction=MagicMock(), a_on_usage_stats=AsyncMock())
+    evaluation_run.callback_manager.register(callback)
+
+    await evaluation_run.run_workflow_local(session_manager)
+    item = evaluation_run.eval_input.eval_input_items[0]
+    usage_stats_item = evaluation_run.usage_stats.usage_stats_items.pop(item.id)
+
+    await evaluation_run.run_workflow_local(session_manager)
+
+    assert evaluation_run.usage_stats.usage_stats_items[item.id] == usage_stats_item
+    assert evaluation_run._cached_item_ids == {item.id}
+    assert callback.a_on_usage_stats.await_count == 2
+
+
+def _tracking_session_manager(in_flight: dict[str, int], peaks: dict[str, int], name: str, answer: str):
+    """A session manager whose workflow runs record the peak number of runs in flight, per name and in total."""
+
+    async def result():
+        in_flight[name] += 1
+        peaks[name] = max(peaks[name], in_flight[name])
+        peaks["total"] = max(peaks["total"], sum(in_flight.values()))
+        await asyncio.sleep(0.01)
+        in_flight[name] -= 1
+        return answer
+
+    runner = MagicMock()
+    runner.result = result
+    runner.convert = MagicMock(return_value=answer)
+
+    @asynccontextmanager
+    async def run(_message, runtime_type=None):
+        yield runner
+
+    session = MagicMock()
+    session.run = run
+    session.workflow = MockWorkflow()
+
+    @asynccontextmanager
+    async def session_cm(http_connection=None, user_id=None):
+        yield session
+
+    session_manager = MagicMock(spec=SessionManager)
+    session_manager.session = session_cm
+    return session_manager
+
+
+async def test_concurrent_runs_share_request_limiter(default_eval_run_config, mock_pull_intermediate, generated_answer):
+    """Each run is held to its own max_concurrency before it takes a slot of the request limiter shared by the runs."""
+    request_limiter = asyncio.Semaphore(2)
+    in_flight = {"narrow": 0, "wide": 0}
+    peaks = {"narrow": 0, "wide": 0, "total": 0}
+
+    def make_run(name: str, max_concurrency: int) -> EvaluationRun:
+        evaluation_run = EvaluationRun(default_eval_run_config, request_limiter=request_limiter)
+        evaluation_run.eval_config = EvalConfig()
+        evaluation_run.eval_config.general.max_concurrency = max_concurrency
+        evaluation_run.eval_input = EvalInput(eval_input_items=[
+            EvalInputItem(id=index,
+                          input_obj=f"{name} question {index}",
+                          expected_output_obj="answer",
+                          output_obj=None,
+                          expected_trajectory=[],
+                          trajectory=[],
+                          full_dataset_entry={}) for index in range(4)
+        ])
+        return evaluation_run
+
+    narrow_run = make_run("narrow", max_concurrency=1)
+    wide_run = make_run("wide", max_concurrency=4)
+    await asyncio.gather(
+        narrow_run.run_workflow_local(_tracking_session_manager(in_flight, peaks, "narrow", generated_answer)),
+        wide_run.run_workflow_local(_tracking_session_manager(in_flight, peaks, "wide", generated_answer)))
+
+    assert peaks["narrow"] == 1
+    assert peaks["total"] == 2
+    assert all(item.output_obj == generated_answer for item in narrow_run.eval_input.eval_input_items)
+    assert all(item.output_obj == generated_answer for item in wide_run.eval_input.eval_input_items)
+
+
 # Batch-3: Tests for running eval and writing results
 def test_write_output(evaluation_run, default_eval_config, eval_input, eval_output, generated_answer):
     """Test writing the workflow and evaluation results."""
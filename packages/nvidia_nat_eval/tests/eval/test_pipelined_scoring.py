@@ -0,0 +1,150 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from unittest.mock import patch
+
+from nat.data_models.evaluate_config import PipelinedScoringConfig
+from nat.data_models.evaluator import EvalInput
+from nat.data_models.evaluator import EvalInputItem
+from nat.plugins.eval.data_models.evaluator_io import EvalOutput
+from nat.plugins.eval.data_models.evaluator_io import EvalOutputItem
+from nat.plugins.eval.eval_callbacks import EvalCallbackManager
+from nat.plugins.eval.runtime.pipelined_scoring import PipelinedScorer
+
+
+def _item(item_id: int) -> EvalInputItem:
+    return EvalInputItem(id=item_id,
+                         input_obj=f"question {item_id}",
+                         expected_output_obj="answer",
+                         output_obj="answer",
+                         trajectory=[],
+                         expected_trajectory=[],
+                         full_dataset_entry={})
+
+
+class _LegacyEvaluator:
+    """Scores each item with its id divided by 10, recording the items of each call."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls: list[list[int]] = []
+
+    async def evaluate_fn(self, eval_input: EvalInput) -> EvalOutput:
+        self.calls.append([item.id for item in eval_input.eval_input_items])
+        await asyncio.sleep(self.delay)
+        items = [EvalOutputItem(id=item.id, score=item.id / 10, reasoning={}) for item in eval_input.eval_input_items]
+        return EvalOutput(average_score=None, eval_output_items=items)
+
+
+async def test_items_scored_before_all_are_submitted():
+    evaluator = _LegacyEvaluator()
+    callback_manager = EvalCallbackManager()
+    callback = AsyncMock()
+    callback_manager.register(callback)
+
+    async with PipelinedScorer({"judge": evaluator}, PipelinedScoringConfig(), callback_manager) as scorer:
+        await scorer.submit(0, _item(1))
+        await asyncio.sleep(0.01)
+        # The first item is scored while the second one is still being generated
+        assert evaluator.calls == [[1]]
+        callback.a_on_evaluator_item_scores.assert_awaited_once()
+
+        await scorer.submit(1, _item(2))
+        results = await scorer.finish()
+
+    assert evaluator.calls == [[1], [2]]
+    assert [name for name, _ in results] == ["judge"]
+    assert [item.id for item in results[0][1].eval_output_items] == [1, 2]
+    assert results[0][1].average_score == 0.15
+
+
+async def test_results_in_dataset_order_and_batched():
+    evaluator = _LegacyEvaluator(delay=0.02)
+    config = PipelinedScoringConfig(batch_size=3, max_concurrent_batches=1)
+
+    async with PipelinedScorer({"judge": evaluator}, config) as scorer:
+        # Submitted in the order the workflow runs finish, not in the order of the dataset
+        await scorer.submit(4, _item(4))
+        await asyncio.sleep(0.005)
+        for index in [0, 3, 1, 2, 5]:
+            await scorer.submit(index, _item(index))
+        results = await scorer.finish()
+
+    # The first item is scored on its own, the rest wait for the evaluator and are batched
+    assert evaluator.calls == [[4], [0, 3, 1], [2, 5]]
+    assert [item.id for item in results[0][1].eval_output_items] == [0, 1, 2, 3, 4, 5]
+    assert results[0][1].average_score == 0.25
+
+
+async def test_queue_is_bounded():
+    evaluator = _LegacyEvaluator(delay=0.1)
+    config = PipelinedScoringConfig(queue_size=1, batch_size=1, max_concurrent_batches=1)
+
+    async with PipelinedScorer({"judge": evaluator}, config) as scorer:
+        await scorer.submit(0, _item(0))
+        await asyncio.sleep(0.01)
+        await scorer.submit(1, _item(1))
+        # The evaluator is busy with the first item and the second one fills the queue
+        blocked_submit = asyncio.create_task(scorer.submit(2, _item(2)))
+        await asyncio.sleep(0.02)
+        assert not blocked_submit.done()
+
+        await blocked_submit
+        results = await scorer.finish()
+
+    assert len(results[0][1].eval_output_items) == 3
+
+
+async def test_failed_evaluator_produces_no_result():
+    good_evaluator = _LegacyEvaluator()
+    bad_evaluator = SimpleNamespace(evaluate_fn=AsyncMock(side_effect=RuntimeError("boom")))
+    config = PipelinedScoringConfig(queue_size=1, batch_size=1)
+
+    with patch("nat.plugins.eval.runtime.pipelined_scoring.logger.exception") as mock_log_exception:
+        async with PipelinedScorer({"good": good_evaluator, "bad": bad_evaluator}, config) as scorer:
+            # Items are still taken from the queue of the failed evaluator
+            for index in range(5):
+                await scorer.submit(index, _item(index))
+            results = await scorer.finish()
+
+    assert [name for name, _ in results] == ["good"]
+    mock_log_exception.assert_called_once()
+
+
+async def test_atif_evaluator_receives_samples():
+    samples = [object(), object()]
+    eval_output = EvalOutput(average_score=1.0, eval_output_items=[EvalOutputItem(id=0, score=1.0, reasoning={})])
+    evaluator = SimpleNamespace(evaluate_atif_fn=AsyncMock(return_value=eval_output))
+
+    async with PipelinedScorer({"atif": evaluator}, PipelinedScoringConfig(batch_size=1)) as scorer:
+        assert scorer.needs_atif_samples
+        for index, sample in enumerate(samples):
+            await scorer.submit(index, _item(index), sample)
+        await scorer.finish()
+
+    assert [call.args[0] for call in evaluator.evaluate_atif_fn.await_args_list] == [[samples[0]], [samples[1]]]
+
+
+async def test_leaving_early_cancels_scoring():
+    evaluator = _LegacyEvaluator(delay=10)
+
+    async with PipelinedScorer({"judge": evaluator}, PipelinedScoringConfig()) as scorer:
+        await scorer.submit(0, _item(0))
+        await asyncio.sleep(0.01)
+
+    assert all(worker.done() for worker in scorer._workers)
@@ -0,0 +1,223 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import uuid
+from datetime import UTC
+from datetime import datetime
+from types import SimpleNamespace
+
+from nat.data_models.component_ref import LLMRef
+from nat.data_models.config import Config
+from nat.data_models.evaluate_config import EvalConfig
+from nat.data_models.evaluator import EvalInput
+from nat.data_models.evaluator import EvalInputItem
+from nat.data_models.evaluator import EvaluatorBaseConfig
+from nat.data_models.intermediate_step import IntermediateStep
+from nat.data_models.intermediate_step import IntermediateStepPayload
+from nat.data_models.intermediate_step import IntermediateStepType
+from nat.data_models.intermediate_step import StreamEventData
+from nat.data_models.invocation_node import InvocationNode
+from nat.llm.openai_llm import OpenAIModelConfig
+from nat.plugins.eval.data_models.evaluator_io import EvalOutput
+from nat.plugins.eval.data_models.evaluator_io import EvalOutputItem
+from nat.plugins.eval.evaluator.atif_evaluator import AtifEvalSample
+from nat.plugins.eval.evaluator.atif_evaluator import AtifEvaluator
+from nat.plugins.eval.evaluator.atif_evaluator import LegacyEvaluator
+from nat.plugins.eval.runtime.result_cache import CachedEvaluator
+from nat.plugins.eval.runtime.result_cache import CacheStats
+from nat.plugins.eval.runtime.result_cache import EvalResultCache
+from nat.plugins.eval.runtime.result_cache import evaluator_config_hash
+from nat.plugins.eval.runtime.result_cache import workflow_config_hash
+
+
+class _JudgeConfig(EvaluatorBaseConfig, name="test_result_cache_judge"):
+    llm_name: LLMRef
+    rubric: str = "default"
+
+
+def _item(item_id: int, output: str = "answer", trajectory: list[IntermediateStep] | None = None) -> EvalInputItem:
+    return EvalInputItem(id=item_id,
+                         input_obj=f"question {item_id}",
+                         expected_output_obj="answer",
+                         output_obj=output,
+                         trajectory=trajectory or [],
+                         expected_trajectory=[],
+                         full_dataset_entry={})
+
+
+def _trajectory(tool_output: str = "result") -> list[IntermediateStep]:
+    """A trajectory as a new workflow run records it, with new ids and timestamps."""
+    payload = IntermediateStepPayload(event_type=IntermediateStepType.TOOL_END,
+                                      name="search",
+                                      data=StreamEventData(input="query", output=tool_output))
+    return [
+        IntermediateStep(parent_id=str(uuid.uuid4()),
+                         function_ancestry=InvocationNode(function_name="search", function_id=str(uuid.uuid4())),
+                         payload=payload)
+    ]
+
+
+class _LegacyEvaluator:
+    """Scores each item with `score`, or 1.0 if its output is the expected one, recording the items of each call."""
+
+    def __init__(self, score=None):
+        self.score = score
+        self.calls: list[list[int]] = []
+
+    async def evaluate_fn(self, eval_input: EvalInput) -> EvalOutput:
+        self.calls.append([item.id for item in eval_input.eval_input_items])
+        items = [
+            EvalOutputItem(
+                id=item.id,
+                score=self.score if self.score is not None else float(item.output_obj == item.expected_output_obj),
+                reasoning={"output": item.output_obj}) for item in eval_input.eval_input_items
+        ]
+        return EvalOutput(average_score=0.0, eval_output_items=items)
+
+
+async def test_only_changed_items_are_rescored():
+    evaluator = _LegacyEvaluator()
+    with EvalResultCache(None) as cache:
+        cached_evaluator = CachedEvaluator("judge", evaluator, "judge-config", cache)
+        first = await cached_evaluator.evaluate_fn(EvalInput(eval_input_items=[_item(1), _item(2), _item(3)]))
+        second = await cached_evaluator.evaluate_fn(
+            EvalInput(eval_input_items=[_item(1), _item(2, output="wrong"), _item(3)]))
+
+        assert evaluator.calls == [[1, 2, 3], [2]]
+        assert cache.stats["judge"] == CacheStats(hits=2, misses=4)
+
+    # The output of the evaluator is returned unchanged when nothing is cached
+    assert first.average_score == 0.0
+    assert [item.id for item in second.eval_output_items] == [1, 2, 3]
+    assert [item.score for item in second.eval_output_items] == [1.0, 0.0, 1.0]
+    assert second.eval_output_items[0].reasoning == {"output": "answer"}
+    assert second.average_score == 0.67
+
+
+async def test_scores_ignore_ids_and_timestamps_of_trajectory():
+    evaluator = _LegacyEvaluator()
+    with EvalResultCache(None) as cache:
+        cached_evaluator = CachedEvaluator("judge", evaluator, "judge-config", cache)
+        await cached_evaluator.evaluate_fn(EvalInput(eval_input_items=[_item(1, trajectory=_trajectory())]))
+        await cached_evaluator.evaluate_fn(EvalInput(eval_input_items=[_item(1, trajectory=_trajectory())]))
+        await cached_evaluator.evaluate_fn(
+            EvalInput(eval_input_items=[_item(1, trajectory=_trajectory(tool_output="other result"))]))
+
+    assert evaluator.calls == [[1], [1]]
+
+
+async def test_changed_evaluator_config_rescores_all_items():
+    evaluator = _LegacyEvaluator()
+    eval_input = EvalInput(eval_input_items=[_item(1), _item(2)])
+    with EvalResultCache(None) as cache:
+        await CachedEvaluator("judge", evaluator, "judge-config", cache).evaluate_fn(eval_input)
+        await CachedEvaluator("judge", evaluator, "new-judge-config", cache).evaluate_fn(eval_input)
+
+    assert evaluator.calls == [[1, 2], [1, 2]]
+
+
+async def test_failed_scores_are_not_cached():
+    evaluator = _LegacyEvaluator(score=math.nan)
+    eval_input = EvalInput(eval_input_items=[_item(1)])
+    with EvalResultCache(None) as cache:
+        cached_evaluator = CachedEvaluator("judge", evaluator, "judge-config", cache)
+        await cached_evaluator.evaluate_fn(eval_input)
+        await cached_evaluator.evaluate_fn(eval_input)
+
+    assert evaluator.calls == [[1], [1]]
+
+
+async def test_atif_evaluator_scores_cached_per_sample():
+
+    class AtifJudge:
+
+        def __init__(self):
+            self.calls: list[list[int]] = []
+
+        async def evaluate_atif_fn(self, atif_samples) -> EvalOutput:
+            self.calls.append([sample.item_id for sample in atif_samples])
+            items = [EvalOutputItem(id=sample.item_id, score=1.0, reasoning=None) for sample in atif_samples]
+            return EvalOutput(average_score=1.0, eval_output_items=items)
+
+    def sample(item_id: int, output: str = "answer") -> AtifEvalSample:
+        step = {
+            "step_id": 1,
+            "timestamp": datetime.now(UTC).isoformat(),
+            "source": "agent",
+            "message": output,
+            "tool_calls": [{
+                "tool_call_id": str(uuid.uuid4()), "function_name": "search", "arguments": {}
+            }],
+        }
+        return AtifEvalSample(item_id=item_id,
+                              trajectory={
+                                  "session_id": str(uuid.uuid4()),
+                                  "agent": {
+                                      "name": "agent", "version": "1"
+                                  },
+                                  "steps": [step],
+                              },
+                              output_obj=output)
+
+    evaluator = AtifJudge()
+    with EvalResultCache(None) as cache:
+        cached_evaluator = CachedEvaluator("trajectory", evaluator, "trajectory-config", cache)
+        assert isinstance(cached_evaluator, AtifEvaluator)
+        assert not isinstance(cached_evaluator, LegacyEvaluator)
+
+        await cached_evaluator.evaluate_atif_fn([sample(1), sample(2)])
+        eval_output = await cached_evaluator.evaluate_atif_fn([sample(1), sample(2, output="other")])
+
+    assert evaluator.calls == [[1, 2], [2]]
+    assert [item.id for item in eval_output.eval_output_items] == [1, 2]
+
+
+async def test_cache_persists_on_disk(tmp_path):
+    path = tmp_path / "cache" / "eval_cache.db"
+    evaluator = _LegacyEvaluator()
+    eval_input = EvalInput(eval_input_items=[_item(1)])
+    with EvalResultCache(path) as cache:
+        cache.put_workflow_output("item-1", {"answer": 42}, [{"step": 1}])
+        await CachedEvaluator("judge", evaluator, "judge-config", cache).evaluate_fn(eval_input)
+
+    with EvalResultCache(path) as cache:
+        assert cache.get_workflow_output("item-1") == ({"answer": 42}, [{"step": 1}])
+        assert cache.get_workflow_output("item-2") is None
+        await CachedEvaluator("judge", evaluator, "judge-config", cache).evaluate_fn(eval_input)
+
+    assert evaluator.calls == [[1]]
+
+
+def test_workflow_config_hash_ignores_eval_section():
+    config = Config()
+    config_with_eval = Config(eval=EvalConfig(general={"max_concurrency": 2}))
+    config_with_llm = Config(llms={"judge": OpenAIModelConfig(model_name="judge-model")})
+
+    assert workflow_config_hash(config) == workflow_config_hash(config_with_eval)
+    assert workflow_config_hash(config) != workflow_config_hash(config_with_llm)
+
+
+def test_evaluator_config_hash_includes_referenced_components():
+
+    def make_config(rubric: str = "default", judge_model: str = "judge-model", other_model: str = "other-model"):
+        evaluators = {"judge": _JudgeConfig(llm_name="judge", rubric=rubric)}
+        llms = {"judge": OpenAIModelConfig(model_name=judge_model), "other": OpenAIModelConfig(model_name=other_model)}
+        return SimpleNamespace(eval=SimpleNamespace(evaluators=evaluators), llms=llms)
+
+    base_hash = evaluator_config_hash(make_config(), "judge")
+    assert evaluator_config_hash(make_config(other_model="new-model"), "judge") == base_hash
+    assert evaluator_config_hash(make_config(judge_model="new-model"), "judge") != base_hash
+    assert evaluator_config_hash(make_config(rubric="strict"), "judge") != base_hash
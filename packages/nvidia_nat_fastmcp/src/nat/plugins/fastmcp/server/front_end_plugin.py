@@ -109,6 +109,8 @@ class FastMCPFrontEndPlugin(FrontEndBase[FastMCPFrontEndConfig]):
                                         log_level=self.front_end_config.log_level.lower())
             except KeyboardInterrupt:
                 logger.info("FastMCP server shutdown requested (Ctrl+C). Shutting down gracefully.")
+            finally:
+                await worker.cleanup()
 
     async def _run_with_mount(self, mcp: "FastMCP", worker: FastMCPFrontEndPluginWorkerBase) -> None:
         """Run FastMCP server mounted at configured base_path using FastAPI wrapper.
@@ -30,6 +30,8 @@ from fastmcp import FastMCP
 if TYPE_CHECKING:
     from fastapi import FastAPI
 
+    from nat.plugins.fastmcp.server.token_verifier import NATFastMCPTokenVerifier
+
 from nat.builder.function import Function
 from nat.builder.function_base import FunctionBase
 from nat.builder.workflow import Workflow
@@ -53,6 +55,9 @@ class FastMCPFrontEndPluginWorkerBase(ABC):
         self.full_config = config
         self.front_end_config: FastMCPFrontEndConfig = config.general.front_end
 
+        # Token verifier created by `create_mcp_server` when server auth is configured, closed by `cleanup`
+        self._token_verifier: NATFastMCPTokenVerifier | None = None
+
     def _setup_health_endpoint(self, mcp: FastMCP):
         """Set up the HTTP health endpoint that exercises FastMCP ping handler."""
 
@@ -105,6 +110,12 @@ class FastMCPFrontEndPluginWorkerBase(ABC):
         """
         ...
 
+    async def cleanup(self) -> None:
+        """Release the resources held by the worker once the FastMCP server has stopped."""
+        token_verifier, self._token_verifier = self._token_verifier, None
+        if token_verifier is not None:
+            await token_verifier.aclose()
+
     async def _default_add_routes(self, mcp: FastMCP, builder: WorkflowBuilder) -> None:
         """Default implementation for adding routes to FastMCP."""
         from nat.plugins.fastmcp.server.tool_converter import register_function_with_mcp
@@ -305,6 +316,7 @@ class FastMCPFrontEndPluginWorker(FastMCPFrontEndPluginWorkerBase):
                 host = "localhost"
             base_url = f"http://{host}:{self.front_end_config.port}"
             verifier = NATFastMCPTokenVerifier(server_auth, base_url=base_url)
+            self._token_verifier = verifier
             auth_provider = RemoteAuthProvider(
                 token_verifier=verifier,
                 authorization_servers=[server_auth.issuer_url],
@@ -62,3 +62,7 @@ class NATFastMCPTokenVerifier(TokenVerifier):
             expires_at=validation_result.expires_at,
             claims=claims,
         )
+
+    async def aclose(self) -> None:
+        """Close the HTTP clients used to fetch signing keys and introspect tokens."""
+        await self._bearer_token_validator.aclose()
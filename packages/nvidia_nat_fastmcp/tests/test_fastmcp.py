@@ -183,6 +183,26 @@ async def test_fastmcp_auth_introspection_exposes_metadata():
     assert any(route.path.startswith("/.well-known/oauth-protected-resource") for route in routes)
 
 
+async def test_fastmcp_worker_cleanup_closes_token_verifier(monkeypatch: pytest.MonkeyPatch):
+    server_auth = OAuth2ResourceServerConfig(
+        issuer_url="http://localhost:8080/realms/master",
+        introspection_endpoint="http://localhost:8080/realms/master/protocol/openid-connect/token/introspect",
+        client_id="test-client",
+        client_secret=SecretStr("secret"),
+    )
+    config = Config(general=GeneralConfig(front_end=FastMCPFrontEndConfig(server_auth=server_auth)))
+    worker = FastMCPFrontEndPluginWorker(config)
+
+    mcp = await worker.create_mcp_server()
+    aclose = AsyncMock()
+    monkeypatch.setattr(mcp.auth.token_verifier._bearer_token_validator, "aclose", aclose)
+
+    await worker.cleanup()
+    await worker.cleanup()
+
+    aclose.assert_awaited_once()
+
+
 async def test_fastmcp_nat_token_verifier_adapts_active_result(monkeypatch: pytest.MonkeyPatch):
     server_auth = OAuth2ResourceServerConfig(
         issuer_url="http://localhost:8080/realms/master",
@@ -89,6 +89,19 @@ class AutoMemoryAgentConfig(AgentBaseConfig, name="auto_memory_agent"):
                      "Set to false for save-only mode or when using tool-based retrieval."))
     save_ai_messages_to_memory: bool = Field(
         default=True, description="Automatically save AI agent responses to memory after generation")
+    write_memory_in_background: bool = Field(
+        default=True,
+        description=("Save messages to memory in the background instead of waiting for the memory backend on every "
+                     "turn. Messages are batched per user and conversation, retried on failure, and written before "
+                     "the next memory retrieval for the same user and on shutdown."))
+    memory_write_flush_interval: float = Field(
+        default=0.05,
+        ge=0,
+        description="Seconds to collect messages into a batch before writing it, with write_memory_in_background.")
+    memory_write_max_retries: int = Field(
+        default=3,
+        ge=0,
+        description="Number of times a failed background memory write is retried before the messages are dropped.")
 
     # Memory retrieval configuration
     search_params: dict[str, Any] = Field(
@@ -126,12 +139,19 @@ async def auto_memory_agent(config: AutoMemoryAgentConfig, builder: Builder) ->
     from langchain_core.messages.human import HumanMessage
     from langgraph.graph.state import CompiledStateGraph
 
+    from nat.memory.write_behind import WriteBehindMemoryEditor
     from nat.plugins.langchain.agent.auto_memory_wrapper.agent import AutoMemoryWrapperGraph
     from nat.plugins.langchain.agent.auto_memory_wrapper.state import AutoMemoryWrapperState
     from nat.plugins.langchain.agent.base import AGENT_LOG_PREFIX
 
     # Get memory editor from builder
     memory_editor = await builder.get_memory_client(config.memory_name)
+    write_behind_editor: WriteBehindMemoryEditor | None = None
+    if config.write_memory_in_background:
+        write_behind_editor = WriteBehindMemoryEditor(memory_editor,
+                                                      flush_interval=config.memory_write_flush_interval,
+                                                      max_retries=config.memory_write_max_retries)
+        memory_editor = write_behind_editor
 
     # Get inner agent as a Function (not a dict config)
     # This gives us a function that accepts ChatRequest with multiple messages
@@ -225,3 +245,5 @@ async def auto_memory_agent(config: AutoMemoryAgentConfig, builder: Builder) ->
         raise
     finally:
         logger.debug("%s Cleaning up auto_memory_agent workflow.", AGENT_LOG_PREFIX)
+        if write_behind_editor is not None:
+            await write_behind_editor.aclose()
@@ -15,8 +15,9 @@
 
 from __future__ import annotations
 
-import copy
+import functools
 import logging
+import operator
 import threading
 import time
 from typing import Any
@@ -41,7 +42,12 @@ from nat.data_models.intermediate_step import ToolSchema
 from nat.data_models.intermediate_step import TraceMetadata
 from nat.data_models.intermediate_step import UsageInfo
 from nat.data_models.profiler_callback import BaseProfilerCallback
+from nat.data_models.profiler_callback import PayloadCaptureConfig
+from nat.data_models.profiler_callback import TokenEventsConfig
 from nat.data_models.token_usage import TokenUsageBaseModel
+from nat.profiler.callbacks.payload_capture import PayloadCapture
+from nat.profiler.callbacks.token_event_coalescer import TokenBatch
+from nat.profiler.callbacks.token_event_coalescer import TokenEventCoalescer
 
 logger = logging.getLogger(__name__)
 
@@ -90,7 +96,9 @@ class LangchainProfilerHandler(AsyncCallbackHandler, BaseProfilerCallback):
     raise_error = True  # Override to raise error and run inline
     run_inline = True
 
-    def __init__(self) -> None:
+    def __init__(self,
+                 token_events: TokenEventsConfig | None = None,
+                 payload_capture: PayloadCaptureConfig | None = None) -> None:
         super().__init__()
         self._lock = threading.Lock()
         self.last_call_ts = time.time()
@@ -102,6 +110,8 @@ class LangchainProfilerHandler(AsyncCallbackHandler, BaseProfilerCallback):
         self._run_id_to_llm_input = {}
         self._run_id_to_tool_input = {}
         self._run_id_to_start_time = {}
+        self._token_coalescer = TokenEventCoalescer(token_events)
+        self._payload_capture = PayloadCapture(payload_capture)
 
     def __repr__(self) -> str:
         return (f"Tokens Used: {self.total_tokens}\n"
@@ -119,6 +129,8 @@ class LangchainProfilerHandler(AsyncCallbackHandler, BaseProfilerCallback):
         # remove unpicklable entries
         del state["_lock"]
         del state["step_manager"]
+        state["_token_coalescer"] = self._token_coalescer.config
+        state["_payload_capture"] = self._payload_capture.config
         return state
 
     def __setstate__(self, state):
@@ -130,6 +142,8 @@ class LangchainProfilerHandler(AsyncCallbackHandler, BaseProfilerCallback):
 
         with self._lock:
             self.__dict__.update(state)
+            self._token_coalescer = TokenEventCoalescer(state.get("_token_coalescer"))
+            self._payload_capture = PayloadCapture(state.get("_payload_capture"))
 
             if (getattr(self, "step_manager", None) is None):
                 setattr(self, "step_manager", Context.get().intermediate_step_manager)
@@ -171,8 +185,8 @@ class LangchainProfilerHandler(AsyncCallbackHandler, BaseProfilerCallback):
                                         framework=LLMFrameworkEnum.LANGCHAIN,
                                         name=model_name,
                                         UUID=run_id,
-                                        data=StreamEventData(input=prompts[-1]),
-                                        metadata=TraceMetadata(chat_inputs=copy.deepcopy(prompts)),
+                                        data=StreamEventData(input=self._payload_capture.capture(prompts[-1])),
+                                        metadata=TraceMetadata(chat_inputs=self._payload_capture.capture(prompts)),
                                         usage_info=UsageInfo(token_usage=TokenUsageBaseModel(),
                                                              num_llm_calls=1,
                                                              seconds_between_calls=int(time.time() -
@@ -205,13 +219,14 @@ class LangchainProfilerHandler(AsyncCallbackHandler, BaseProfilerCallback):
         run_id = str(run_id)
         self._run_id_to_model_name[run_id] = model_name
 
+        chat_inputs = self._payload_capture.capture(messages[0])
         stats = IntermediateStepPayload(
             event_type=IntermediateStepType.LLM_START,
             framework=LLMFrameworkEnum.LANGCHAIN,
             name=model_name,
             UUID=run_id,
-            data=StreamEventData(input=copy.deepcopy(messages[0])),
-            metadata=TraceMetadata(chat_inputs=copy.deepcopy(messages[0]),
+            data=StreamEventData(input=chat_inputs),
+            metadata=TraceMetadata(chat_inputs=chat_inputs,
                                    tools_schema=_extract_tools_schema(kwargs.get("invocation_params", {}))),
             usage_info=UsageInfo(token_usage=TokenUsageBaseModel(),
                                  num_llm_calls=1,
@@ -224,35 +239,53 @@ class LangchainProfilerHandler(AsyncCallbackHandler, BaseProfilerCallback):
         self._run_id_to_start_time[run_id] = time.time()
 
     async def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
-        """Collect stats for just the token"""
-        model_name = ""
-        try:
-            model_name = self._run_id_to_model_name.get(str(kwargs.get("run_id", "")), "")
-        except Exception as e:
-            logger.exception("Error getting model name: %s", e)
+        """Collect stats for the streamed tokens, coalesced according to the token events configuration"""
+        run_id = str(kwargs.get("run_id", ""))
+        batch = self._token_coalescer.add(run_id, token, kwargs.get("chunk"))
+        if batch is not None:
+            self._push_token_batch(run_id, batch)
+
+    async def on_llm_error(self, error: BaseException, **kwargs: Any) -> None:
+        self._token_coalescer.discard(str(kwargs.get("run_id", "")))
+
+    def _push_token_batch(self, run_id: str, batch: TokenBatch) -> None:
+        model_name = self._run_id_to_model_name.get(run_id, "")
+
+        chunk = None
+        if batch.chunks:
+            try:
+                # LangChain chunks support concatenation, which also sums their usage metadata
+                chunk = functools.reduce(operator.add, batch.chunks)
+            except TypeError:
+                chunk = batch.chunks[-1]
 
         usage_metadata = {}
         try:
-            usage_metadata = kwargs.get("chunk").message.usage_metadata if kwargs.get("chunk") else {}
+            usage_metadata = chunk.message.usage_metadata if chunk is not None else {}
         except Exception as e:
             logger.exception("Error getting usage metadata: %s", e)
 
-        stats = IntermediateStepPayload(
-            event_type=IntermediateStepType.LLM_NEW_TOKEN,
-            framework=LLMFrameworkEnum.LANGCHAIN,
-            name=model_name,
-            UUID=str(kwargs.get("run_id", str(uuid4()))),
-            data=StreamEventData(input=self._run_id_to_llm_input.get(str(kwargs.get("run_id", "")), ""), chunk=token),
-            usage_info=UsageInfo(token_usage=self._extract_token_base_model(usage_metadata),
-                                 num_llm_calls=1,
-                                 seconds_between_calls=int(time.time() - self.last_call_ts)),
-            metadata=TraceMetadata(chat_responses=[kwargs.get("chunk")] if kwargs.get("chunk") else []))
+        # The input is not repeated here, it is part of the LLM_START step with the same UUID
+        stats = IntermediateStepPayload(event_type=IntermediateStepType.LLM_NEW_TOKEN,
+                                        framework=LLMFrameworkEnum.LANGCHAIN,
+                                        name=model_name,
+                                        UUID=run_id or str(uuid4()),
+                                        data=StreamEventData(chunk=batch.text),
+                                        usage_info=UsageInfo(token_usage=self._extract_token_base_model(usage_metadata),
+                                                             num_llm_calls=1,
+                                                             seconds_between_calls=int(time.time() -
+                                                                                       self.last_call_ts)),
+                                        metadata=TraceMetadata(chat_responses=[chunk] if chunk is not None else []))
 
         self.step_manager.push_intermediate_step(stats)
 
     async def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
         """Collect token usage."""
 
+        remaining_tokens = self._token_coalescer.flush(str(kwargs.get("run_id", "")))
+        if remaining_tokens is not None:
+            self._push_token_batch(str(kwargs.get("run_id", "")), remaining_tokens)
+
         usage_metadata = {}
 
         model_name = ""
@@ -339,9 +372,9 @@ class LangchainProfilerHandler(AsyncCallbackHandler, BaseProfilerCallback):
                                         framework=LLMFrameworkEnum.LANGCHAIN,
                                         name=serialized.get("name", ""),
                                         UUID=str(run_id),
-                                        data=StreamEventData(input=input_str),
-                                        metadata=TraceMetadata(tool_inputs=copy.deepcopy(inputs),
-                                                               tool_info=copy.deepcopy(serialized)),
+                                        data=StreamEventData(input=self._payload_capture.capture(input_str)),
+                                        metadata=TraceMetadata(tool_inputs=self._payload_capture.capture(inputs),
+                                                               tool_info=self._payload_capture.capture(serialized)),
                                         usage_info=UsageInfo(token_usage=TokenUsageBaseModel()))
 
         self.step_manager.push_intermediate_step(stats)
@@ -61,6 +61,15 @@ def _get_langchain_oci_chat_model():
     return ChatOCIGenAI
 
 
+def _warn_http_client_options_unsupported(llm_config: "LLMBaseConfig") -> None:
+    # These clients do not send their requests through the toolkit's HTTP clients, where these options are applied
+    for option in ("response_cache", "adaptive_concurrency"):
+        if getattr(llm_config, option, None) is not None:
+            logger.warning("The LangChain client for LLM type `%s` does not support `%s`, it will be ignored",
+                           llm_config.static_type(),
+                           option)
+
+
 def _patch_llm_based_on_config(client: ModelType, llm_config: "LLMBaseConfig") -> ModelType:
 
     from langchain_core.language_models import LanguageModelInput
@@ -179,6 +188,7 @@ async def nim_langchain(llm_config: NIMModelConfig, _builder: Builder):
     from langchain_nvidia_ai_endpoints import Model
 
     validate_no_responses_api(llm_config, LLMFrameworkEnum.LANGCHAIN)
+    _warn_http_client_options_unsupported(llm_config)
 
     # TODO: Remove after upgrading to a langchain-nvidia-ai-endpoints release
     # that includes https://github.com/langchain-ai/langchain-nvidia/pull/282.
@@ -341,6 +351,7 @@ async def litellm_langchain(llm_config: LiteLlmModelConfig, _builder: Builder):
 
     validate_no_responses_api(llm_config, LLMFrameworkEnum.LANGCHAIN)
     _handle_litellm_verify_ssl(llm_config)
+    _warn_http_client_options_unsupported(llm_config)
 
     client = ChatLiteLLM(**llm_config.model_dump(
         exclude={"type", "thinking", "api_type"}, by_alias=True, exclude_none=True, exclude_unset=True))
@@ -17,7 +17,13 @@ import asyncio
 import logging
 from uuid import uuid4
 
+from langchain_core.messages import AIMessage
+from langchain_core.messages import HumanMessage
+
 from nat.data_models.intermediate_step import IntermediateStepType
+from nat.data_models.profiler_callback import PayloadCaptureConfig
+from nat.data_models.profiler_callback import TokenEventMode
+from nat.data_models.profiler_callback import TokenEventsConfig
 from nat.plugins.langchain.callback_handler import LangchainProfilerHandler
 from nat.plugins.langchain.callback_handler import _extract_tools_schema
 from nat.utils.reactive.subject import Subject
@@ -278,3 +284,69 @@ def test_extract_tools_schema_empty_and_none():
     assert _extract_tools_schema({}) == []
     assert _extract_tools_schema({"tools": []}) == []
     assert _extract_tools_schema(None) == []
+
+
+async def _stream_tokens(handler: LangchainProfilerHandler, tokens: list[str]) -> None:
+    from langchain_core.messages import AIMessage
+    from langchain_core.messages import AIMessageChunk
+    from langchain_core.outputs import ChatGeneration
+    from langchain_core.outputs import ChatGenerationChunk
+    from langchain_core.outputs import LLMResult
+
+    run_id = str(uuid4())
+    await handler.on_llm_start(serialized={}, prompts=["a long prompt"], run_id=run_id)
+    for token in tokens:
+        await handler.on_llm_new_token(token,
+                                       run_id=run_id,
+                                       chunk=ChatGenerationChunk(message=AIMessageChunk(content=token)))
+    llm_result = LLMResult(generations=[[ChatGeneration(message=AIMessage(content="".join(tokens)))]])
+    await handler.on_llm_end(response=llm_result, run_id=run_id)
+
+
+async def test_langchain_handler_coalesces_tokens(reactive_stream: Subject):
+    all_stats = []
+    handler = LangchainProfilerHandler(token_events=TokenEventsConfig(mode=TokenEventMode.COUNT, tokens_per_event=4))
+    _ = reactive_stream.subscribe(all_stats.append)
+
+    tokens = [f"t{i} " for i in range(10)]
+    await _stream_tokens(handler, tokens)
+
+    token_events = [stat for stat in all_stats if stat.event_type == IntermediateStepType.LLM_NEW_TOKEN]
+    assert [event.payload.data.chunk for event in token_events] == ["t0 ", "t1 t2 t3 t4 ", "t5 t6 t7 t8 ", "t9 "]
+    assert all_stats[-1].event_type == IntermediateStepType.LLM_END
+
+    for event in token_events:
+        # The prompt is only part of the LLM_START step
+        assert event.payload.data.input is None
+        # The chunks of a batch are merged into one response
+        assert len(event.payload.metadata.chat_responses) == 1
+        assert event.payload.metadata.chat_responses[0].text == event.payload.data.chunk
+
+
+async def test_langchain_handler_token_events_off(reactive_stream: Subject):
+    all_stats = []
+    handler = LangchainProfilerHandler(token_events=TokenEventsConfig(mode=TokenEventMode.OFF))
+    _ = reactive_stream.subscribe(all_stats.append)
+
+    await _stream_tokens(handler, ["hello", " world"])
+
+    assert [stat.event_type for stat in all_stats] == [IntermediateStepType.LLM_START, IntermediateStepType.LLM_END]
+    assert all_stats[-1].payload.data.output == "hello world"
+
+
+async def test_langchain_handler_captures_message_snapshot(reactive_stream: Subject):
+    all_stats = []
+    handler = LangchainProfilerHandler(payload_capture=PayloadCaptureConfig(max_size=20))
+    _ = reactive_stream.subscribe(all_stats.append)
+
+    messages = [HumanMessage(content="What is the weather?"), AIMessage(content="Let me check the forecast.")]
+    await handler.on_chat_model_start(serialized={},
+                                      messages=[messages],
+                                      run_id=uuid4(),
+                                      metadata={"ls_model_name": "test-model"})
+    # The framework changing its message history does not change the captured step
+    messages.append(HumanMessage(content="And tomorrow?"))
+    messages[0].content = "changed"
+
+    chat_inputs = all_stats[0].payload.metadata.chat_inputs
+    assert [message.content for message in chat_inputs] == ["What is the weather?", "... [26 characters truncated]"]
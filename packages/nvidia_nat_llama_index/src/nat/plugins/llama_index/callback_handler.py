@@ -15,7 +15,6 @@
 
 from __future__ import annotations
 
-import copy
 import logging
 import threading
 import time
@@ -35,7 +34,9 @@ from nat.data_models.intermediate_step import StreamEventData
 from nat.data_models.intermediate_step import TraceMetadata
 from nat.data_models.intermediate_step import UsageInfo
 from nat.data_models.profiler_callback import BaseProfilerCallback
+from nat.data_models.profiler_callback import PayloadCaptureConfig
 from nat.data_models.token_usage import TokenUsageBaseModel
+from nat.profiler.callbacks.payload_capture import PayloadCapture
 
 logger = logging.getLogger(__name__)
 
@@ -53,13 +54,14 @@ class LlamaIndexProfilerHandler(BaseCallbackHandler, BaseProfilerCallback):
     and appends them to ContextState.usage_stats.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, payload_capture: PayloadCaptureConfig | None = None) -> None:
         BaseCallbackHandler.__init__(self, event_starts_to_ignore=[], event_ends_to_ignore=[])
         BaseProfilerCallback.__init__(self)
         self._lock = threading.Lock()
         self.last_call_ts = time.time()
         self._last_tool_map: dict[str, str] = {}
         self.step_manager = Context.get().intermediate_step_manager
+        self._payload_capture = PayloadCapture(payload_capture)
 
         self._run_id_to_llm_input = {}
         self._run_id_to_tool_input = {}
@@ -118,14 +120,16 @@ class LlamaIndexProfilerHandler(BaseCallbackHandler, BaseProfilerCallback):
                 logger.exception("Error getting model name: %s", e)
 
             llm_text_input = " ".join(prompts_or_messages) if prompts_or_messages else ""
+            llm_text_input = self._payload_capture.capture(llm_text_input)
 
             if prompts_or_messages:
+                chat_inputs = self._payload_capture.capture(prompts_or_messages)
                 stats = IntermediateStepPayload(event_type=IntermediateStepType.LLM_START,
                                                 framework=LLMFrameworkEnum.LLAMA_INDEX,
                                                 name=model_name,
                                                 UUID=event_id,
                                                 data=StreamEventData(input=llm_text_input),
-                                                metadata=TraceMetadata(chat_inputs=copy.deepcopy(prompts_or_messages)),
+                                                metadata=TraceMetadata(chat_inputs=chat_inputs),
                                                 usage_info=UsageInfo(token_usage=TokenUsageBaseModel(),
                                                                      num_llm_calls=1,
                                                                      seconds_between_calls=seconds_between_calls))
@@ -142,17 +146,16 @@ class LlamaIndexProfilerHandler(BaseCallbackHandler, BaseProfilerCallback):
                 "fn_schema_str": tool_metadata.fn_schema_str if hasattr(tool_metadata, "fn_schema_str") else "",
                 "name": tool_metadata.name if hasattr(tool_metadata, "name") else "",
             }
-            stats = IntermediateStepPayload(
-                event_type=IntermediateStepType.TOOL_START,
-                framework=LLMFrameworkEnum.LLAMA_INDEX,
-                name=payload.get(EventPayload.TOOL).name,
-                UUID=event_id,
-                data=StreamEventData(input=copy.deepcopy(payload.get(EventPayload.FUNCTION_CALL))),
-                metadata=TraceMetadata(tool_inputs=copy.deepcopy(payload.get(EventPayload.FUNCTION_CALL)),
-                                       tool_info=tool_metadata),
-                usage_info=UsageInfo(token_usage=TokenUsageBaseModel()))
-
-            self._run_id_to_tool_input[event_id] = copy.deepcopy(payload.get(EventPayload.FUNCTION_CALL))
+            tool_input = self._payload_capture.capture(payload.get(EventPayload.FUNCTION_CALL))
+            stats = IntermediateStepPayload(event_type=IntermediateStepType.TOOL_START,
+                                            framework=LLMFrameworkEnum.LLAMA_INDEX,
+                                            name=payload.get(EventPayload.TOOL).name,
+                                            UUID=event_id,
+                                            data=StreamEventData(input=tool_input),
+                                            metadata=TraceMetadata(tool_inputs=tool_input, tool_info=tool_metadata),
+                                            usage_info=UsageInfo(token_usage=TokenUsageBaseModel()))
+
+            self._run_id_to_tool_input[event_id] = tool_input
             self._last_tool_map[event_id] = payload.get(EventPayload.TOOL).name
             self.step_manager.push_intermediate_step(stats)
             self._run_id_to_timestamp[event_id] = time.time()
@@ -217,14 +220,13 @@ class LlamaIndexProfilerHandler(BaseCallbackHandler, BaseProfilerCallback):
                     self.step_manager.push_intermediate_step(stats)
 
         elif event_type == CBEventType.FUNCTION_CALL and payload:
+            tool_output = self._payload_capture.capture(payload.get(EventPayload.FUNCTION_OUTPUT))
             stats = IntermediateStepPayload(event_type=IntermediateStepType.TOOL_END,
                                             span_event_timestamp=self._run_id_to_timestamp.get(event_id),
                                             framework=LLMFrameworkEnum.LLAMA_INDEX,
                                             name=self._last_tool_map.get(event_id),
                                             UUID=event_id,
-                                            data=StreamEventData(
-                                                output=copy.deepcopy(payload.get(EventPayload.FUNCTION_OUTPUT)),
-                                                payload=copy.deepcopy(payload.get(EventPayload.FUNCTION_OUTPUT))),
+                                            data=StreamEventData(output=tool_output, payload=tool_output),
                                             usage_info=UsageInfo(token_usage=TokenUsageBaseModel()))
 
             self.step_manager.push_intermediate_step(stats)
@@ -103,6 +103,8 @@ class MCPFrontEndPlugin(FrontEndBase[MCPFrontEndConfig]):
                     await mcp.run_streamable_http_async()
             except KeyboardInterrupt:
                 logger.info("MCP server shutdown requested (Ctrl+C). Shutting down gracefully.")
+            finally:
+                await worker.cleanup()
 
     async def _run_with_mount(self, mcp: "FastMCP") -> None:
         """Run MCP server mounted at configured base_path using FastAPI wrapper.
@@ -28,6 +28,8 @@ from mcp.server.fastmcp import FastMCP
 if TYPE_CHECKING:
     from fastapi import FastAPI
 
+    from nat.plugins.mcp.server.introspection_token_verifier import IntrospectionTokenVerifier
+
 from nat.builder.function import Function
 from nat.builder.function_base import FunctionBase
 from nat.builder.workflow import Workflow
@@ -63,6 +65,9 @@ class MCPFrontEndPluginWorkerBase(ABC):
                                               top_n=self.front_end_config.memory_profile_top_n,
                                               log_level=self.front_end_config.memory_profile_log_level)
 
+        # Token verifier created by `create_mcp_server` when server auth is configured, closed by `cleanup`
+        self._token_verifier: IntrospectionTokenVerifier | None = None
+
     def _setup_health_endpoint(self, mcp: FastMCP):
         """Set up the HTTP health endpoint that exercises MCP ping handler."""
 
@@ -120,6 +125,12 @@ class MCPFrontEndPluginWorkerBase(ABC):
         """
         ...
 
+    async def cleanup(self) -> None:
+        """Release the resources held by the worker once the MCP server has stopped."""
+        token_verifier, self._token_verifier = self._token_verifier, None
+        if token_verifier is not None:
+            await token_verifier.aclose()
+
     async def _default_add_routes(self, mcp: FastMCP, builder: WorkflowBuilder):
         """Default route registration logic - reusable by subclasses.
 
@@ -396,6 +407,7 @@ class MCPFrontEndPluginWorker(MCPFrontEndPluginWorkerBase):
             from nat.plugins.mcp.server.introspection_token_verifier import IntrospectionTokenVerifier
 
             token_verifier = IntrospectionTokenVerifier(self.front_end_config.server_auth)
+            self._token_verifier = token_verifier
 
         return FastMCP(name=self.front_end_config.name,
                        host=self.front_end_config.host,
@@ -70,3 +70,7 @@ class IntrospectionTokenVerifier(TokenVerifier):
                                scopes=validation_result.scopes or [],
                                client_id=validation_result.client_id or "")
         return None
+
+    async def aclose(self) -> None:
+        """Close the HTTP clients used to fetch signing keys and introspect tokens."""
+        await self._bearer_token_validator.aclose()
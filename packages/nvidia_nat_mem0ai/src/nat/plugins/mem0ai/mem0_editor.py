@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import asyncio
+import json
 import warnings
 
 from pydantic.warnings import PydanticDeprecatedSince20
@@ -44,10 +45,12 @@ class Mem0Editor(MemoryEditor):
     async def add_items(self, items: list[MemoryItem]) -> None:
         """
         Insert Multiple MemoryItems into the memory.
-        Each MemoryItem is translated and uploaded.
+        Each MemoryItem is translated and uploaded. Items with the same user, run, tags
+        and metadata are uploaded together as a single conversation.
         """
 
-        coroutines = []
+        # Conversations to upload, keyed by the options they are uploaded with
+        grouped: dict[str, tuple[list[dict[str, str]], dict]] = {}
 
         # Iteratively insert memories into Mem0
         for memory_item in items:
@@ -58,15 +61,15 @@ class Mem0Editor(MemoryEditor):
             run_id = item_meta.pop("run_id", None)
             tags = memory_item.tags
 
-            coroutines.append(
-                self._client.add(content,
-                                 user_id=user_id,
-                                 run_id=run_id,
-                                 tags=tags,
-                                 metadata=item_meta,
-                                 output_format="v1.1"))
+            add_kwargs = {"user_id": user_id, "run_id": run_id, "tags": tags, "metadata": item_meta}
+            group_key = json.dumps(add_kwargs, sort_keys=True, default=str)
+            if group_key in grouped:
+                grouped[group_key][0].extend(content)
+            else:
+                grouped[group_key] = (list(content), add_kwargs)
 
-        await asyncio.gather(*coroutines)
+        await asyncio.gather(*(self._client.add(content, **add_kwargs, output_format="v1.1")
+                               for content, add_kwargs in grouped.values()))
 
     async def search(self, query: str, top_k: int = 5, **kwargs) \
             -> list[MemoryItem]:
@@ -56,17 +56,28 @@ def sample_memory_item_fixture():
 
 
 async def test_add_items_success(mem0_editor: Mem0Editor, mock_mem0_client: AsyncMock, sample_memory_item: MemoryItem):
-    """Test adding multiple MemoryItem objects successfully."""
+    """Test adding multiple MemoryItem objects with the same options uploads them as one conversation."""
     items = [sample_memory_item, sample_memory_item]
     await mem0_editor.add_items(items)
 
-    assert mock_mem0_client.add.call_count == len(items)
-    mock_mem0_client.add.assert_any_call(sample_memory_item.conversation,
-                                         user_id=sample_memory_item.user_id,
-                                         run_id=None,
-                                         tags=sample_memory_item.tags,
-                                         metadata=sample_memory_item.metadata,
-                                         output_format="v1.1")
+    mock_mem0_client.add.assert_called_once_with(sample_memory_item.conversation * 2,
+                                                 user_id=sample_memory_item.user_id,
+                                                 run_id=None,
+                                                 tags=sample_memory_item.tags,
+                                                 metadata=sample_memory_item.metadata,
+                                                 output_format="v1.1")
+
+
+async def test_add_items_groups_by_user(mem0_editor: Mem0Editor,
+                                        mock_mem0_client: AsyncMock,
+                                        sample_memory_item: MemoryItem):
+    """Test items for different users are uploaded separately."""
+    other_item = sample_memory_item.model_copy(update={"user_id": "user456"})
+    await mem0_editor.add_items([sample_memory_item, other_item, sample_memory_item])
+
+    assert mock_mem0_client.add.call_count == 2
+    assert [call.kwargs["user_id"] for call in mock_mem0_client.add.call_args_list] == ["user123", "user456"]
+    assert mock_mem0_client.add.call_args_list[0].args[0] == sample_memory_item.conversation * 2
 
 
 async def test_add_items_empty_list(mem0_editor: Mem0Editor, mock_mem0_client: AsyncMock):
@@ -102,6 +102,32 @@ class ARTTrainer(Trainer):
         Returns:
             TrainingJobRef: Reference to the submitted training job
         """
+        filtered_collection = await self.collect_trajectories(epoch, run_id)
+        if filtered_collection is None:
+            return None
+
+        # Submit filtered trajectories to trainer
+        job_ref = await self.submit_trajectories(filtered_collection)
+        logger.info(f"Submitted training job for epoch {epoch}: {job_ref}")
+
+        return job_ref
+
+    async def submit_trajectories(self, trajectories: TrajectoryCollection) -> TrainingJobRef:
+        job_ref = await super().submit_trajectories(trajectories)
+        self._job_refs.append(job_ref)
+        return job_ref
+
+    async def collect_trajectories(self, epoch: int, run_id: str) -> TrajectoryCollection | None:
+        """
+        Collect the trajectories of an epoch and apply curriculum learning, without submitting them.
+
+        Args:
+            epoch: The current epoch number (0-indexed)
+            run_id: Unique identifier for this training run
+
+        Returns:
+            TrajectoryCollection | None: The filtered trajectories, or None if there are none
+        """
         logger.info(f"Starting epoch {epoch + 1} for run {run_id}")
 
         # Start the trajectory builder for this epoch
@@ -230,13 +256,7 @@ class ARTTrainer(Trainer):
             logger.warning(f"No trajectories remaining after curriculum filtering for epoch {epoch}")
             return None
 
-        # Submit filtered trajectories to trainer
-        job_ref = await self.trainer_adapter.submit(filtered_collection)
-        self._job_refs.append(job_ref)
-
-        logger.info(f"Submitted training job for epoch {epoch}: {job_ref}")
-
-        return job_ref
+        return filtered_collection
 
     async def run(self, num_epochs: int) -> list[TrainingJobStatus]:
         """
@@ -253,6 +273,11 @@ class ARTTrainer(Trainer):
 
         logger.info(f"Starting finetuning run with {num_epochs} epochs")
 
+        if self.run_config.pipelined_training is not None:
+            return await self.run_pipelined(num_epochs,
+                                            self._run_id,
+                                            max_staleness=self.run_config.pipelined_training.max_staleness)
+
         job_statuses = []
 
         for epoch in range(num_epochs):
@@ -304,6 +329,8 @@ class ARTTrainer(Trainer):
             dict: Metrics from the training run
         """
         metrics = {"run_id": run_id, "total_epochs": len(self._job_refs), "jobs": []}
+        if self.pipeline_metrics:
+            metrics["pipeline"] = self.pipeline_metrics
 
         for job_ref in self._job_refs:
             try:
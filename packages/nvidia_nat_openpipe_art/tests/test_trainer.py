@@ -25,6 +25,7 @@ from nat.data_models.evaluate_runtime import EvaluationRunOutput
 from nat.data_models.finetuning import CurriculumLearningConfig
 from nat.data_models.finetuning import FinetuneConfig
 from nat.data_models.finetuning import FinetuneRunConfig
+from nat.data_models.finetuning import PipelinedTrainingConfig
 from nat.data_models.finetuning import RewardFunctionConfig
 from nat.data_models.finetuning import TrainingJobRef
 from nat.data_models.finetuning import TrainingJobStatus
@@ -192,6 +193,40 @@ class TestARTTrainer:
         assert mock_builder.start_run.call_count == 3
         assert mock_adapter.submit.call_count == 3
 
+    async def test_run_pipelined(self, trainer, finetune_config):
+        """Test running multiple epochs with collection overlapping training."""
+        finetune_config.pipelined_training = PipelinedTrainingConfig(max_staleness=1)
+        mock_trajectory = MagicMock(spec=Trajectory)
+        mock_trajectory.reward = 0.8
+
+        mock_builder = MagicMock()
+        mock_builder.initialize = AsyncMock()
+        mock_builder.start_run = AsyncMock()
+        mock_adapter = MagicMock()
+        mock_adapter.initialize = AsyncMock()
+
+        await trainer.bind_components(mock_builder, mock_adapter)
+        await trainer.initialize(finetune_config)
+
+        trajectory_collection = TrajectoryCollection(trajectories=[[mock_trajectory]], run_id=trainer._run_id)
+        mock_builder.finalize = AsyncMock(return_value=trajectory_collection)
+        mock_job_ref = TrainingJobRef(run_id=trainer._run_id, backend="openpipe-art")
+        mock_status = TrainingJobStatus(run_id=trainer._run_id,
+                                        backend="openpipe-art",
+                                        status=TrainingStatusEnum.COMPLETED)
+        mock_adapter.submit = AsyncMock(return_value=mock_job_ref)
+        mock_adapter.wait_until_complete = AsyncMock(return_value=mock_status)
+        mock_adapter.status = AsyncMock(return_value=mock_status)
+
+        statuses = await trainer.run(num_epochs=3)
+
+        assert len(statuses) == 3
+        assert all(s.status == TrainingStatusEnum.COMPLETED for s in statuses)
+        assert mock_adapter.submit.call_count == 3
+        assert len(trainer._job_refs) == 3
+        metrics = await trainer.get_metrics(trainer._run_id)
+        assert "overlap_seconds" in metrics["pipeline"]
+
     async def test_run_with_failed_epoch(self, trainer, finetune_config):
         """Test handling of failed training epoch."""
         # Mock trajectory builder with exception
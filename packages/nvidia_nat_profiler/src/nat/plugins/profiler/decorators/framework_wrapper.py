@@ -25,6 +25,8 @@ from contextvars import ContextVar
 from typing import Any
 
 from nat.builder.framework_enum import LLMFrameworkEnum
+from nat.data_models.profiler_callback import PayloadCaptureConfig
+from nat.data_models.profiler_callback import TokenEventsConfig
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +46,8 @@ callback_handler_var: ContextVar[Any | None] = ContextVar("callback_handler_var"
 def set_framework_profiler_handler(
     workflow_llms: dict | None = None,
     frameworks: list[LLMFrameworkEnum] | None = None,
+    token_events: TokenEventsConfig | None = None,
+    payload_capture: PayloadCaptureConfig | None = None,
 ) -> Callable[[Callable[..., AsyncContextManager[Any]]], Callable[..., AsyncContextManager[Any]]]:
     """
     Decorator that wraps an async context manager function to set up framework-specific profiling.
@@ -51,6 +55,8 @@ def set_framework_profiler_handler(
     Args:
         workflow_llms (dict | None): A dictionary of workflow LLM configurations.
         frameworks (list[LLMFrameworkEnum] | None): A list of LLM frameworks used in the workflow functions.
+        token_events (TokenEventsConfig | None): How the callback handlers report streamed LLM tokens.
+        payload_capture (PayloadCaptureConfig | None): How the callback handlers capture LLM and tool inputs.
 
     Returns:
         Callable[[Callable[..., AsyncContextManager[Any]]], Callable[..., AsyncContextManager[Any]]]:
@@ -77,7 +83,7 @@ def set_framework_profiler_handler(
                     # route to the active run. Only register the hook once globally.
                     from nat.plugins.langchain.callback_handler import LangchainProfilerHandler
 
-                    handler = LangchainProfilerHandler()
+                    handler = LangchainProfilerHandler(token_events=token_events, payload_capture=payload_capture)
                     callback_handler_var.set(handler)
 
                     if not _library_instrumented["langchain"]:
@@ -98,7 +104,7 @@ def set_framework_profiler_handler(
 
                     from nat.plugins.llama_index.callback_handler import LlamaIndexProfilerHandler
 
-                    handler = LlamaIndexProfilerHandler()
+                    handler = LlamaIndexProfilerHandler(payload_capture=payload_capture)
                     Settings.callback_manager = CallbackManager([handler])
                     logger.debug("LlamaIndex callback handler registered")
                 except ImportError as e:
@@ -110,7 +116,7 @@ def set_framework_profiler_handler(
             if LLMFrameworkEnum.CREWAI in frameworks and not _library_instrumented["crewai"]:
                 try:
                     from nat.plugins.crewai.callback_handler import CrewAIProfilerHandler
-                    handler = CrewAIProfilerHandler()
+                    handler = CrewAIProfilerHandler(payload_capture=payload_capture)
                     handler.instrument()
                     _library_instrumented["crewai"] = True
                     logger.debug("CrewAI callback handler registered")
@@ -123,7 +129,8 @@ def set_framework_profiler_handler(
             if LLMFrameworkEnum.SEMANTIC_KERNEL in frameworks and not _library_instrumented["semantic_kernel"]:
                 try:
                     from nat.plugins.semantic_kernel.callback_handler import SemanticKernelProfilerHandler
-                    handler = SemanticKernelProfilerHandler(workflow_llms=workflow_llms)
+                    handler = SemanticKernelProfilerHandler(workflow_llms=workflow_llms,
+                                                            payload_capture=payload_capture)
                     handler.instrument()
                     _library_instrumented["semantic_kernel"] = True
                     logger.debug("SemanticKernel callback handler registered")
@@ -136,7 +143,7 @@ def set_framework_profiler_handler(
             if LLMFrameworkEnum.AGNO in frameworks and not _library_instrumented["agno"]:
                 try:
                     from nat.plugins.agno.callback_handler import AgnoProfilerHandler
-                    handler = AgnoProfilerHandler()
+                    handler = AgnoProfilerHandler(payload_capture=payload_capture)
                     handler.instrument()
                     _library_instrumented["agno"] = True
                     logger.info("Agno callback handler registered")
@@ -149,7 +156,7 @@ def set_framework_profiler_handler(
             if LLMFrameworkEnum.ADK in frameworks and not _library_instrumented["adk"]:
                 try:
                     from nat.plugins.adk.callback_handler import ADKProfilerHandler
-                    handler = ADKProfilerHandler()
+                    handler = ADKProfilerHandler(payload_capture=payload_capture)
                     handler.instrument()
                     _library_instrumented["adk"] = True
                     logger.debug("ADK callback handler registered")
@@ -162,7 +169,7 @@ def set_framework_profiler_handler(
             if LLMFrameworkEnum.STRANDS in frameworks and not _library_instrumented["strands"]:
                 try:
                     from nat.plugins.strands.callback_handler import StrandsProfilerHandler
-                    handler = StrandsProfilerHandler()
+                    handler = StrandsProfilerHandler(payload_capture=payload_capture)
                     handler.instrument()
                     _library_instrumented["strands"] = True
                     logger.debug("Strands callback handler registered")
@@ -176,7 +183,7 @@ def set_framework_profiler_handler(
             if LLMFrameworkEnum.AUTOGEN in frameworks and not _library_instrumented["autogen"]:
                 try:
                     from nat.plugins.autogen.callback_handler import AutoGenProfilerHandler
-                    handler = AutoGenProfilerHandler()
+                    handler = AutoGenProfilerHandler(payload_capture=payload_capture)
                     handler.instrument()
                     _library_instrumented["autogen"] = True
                     logger.debug("AutoGen callback handler registered")
@@ -199,6 +206,8 @@ def chain_wrapped_build_fn(
     original_build_fn: Callable[..., AsyncContextManager],
     workflow_llms: dict,
     function_frameworks: list[LLMFrameworkEnum],
+    token_events: TokenEventsConfig | None = None,
+    payload_capture: PayloadCaptureConfig | None = None,
 ) -> Callable[..., AsyncContextManager]:
     """
     Convert an original build function into an async context manager that
@@ -209,6 +218,8 @@ def chain_wrapped_build_fn(
         original_build_fn (Callable[..., AsyncContextManager]): The original build function to wrap.
         workflow_llms (dict): A dictionary of workflow LLM configurations.
         function_frameworks (list[LLMFrameworkEnum]): A list of LLM frameworks used in the workflow functions.
+        token_events (TokenEventsConfig | None): How the callback handlers report streamed LLM tokens.
+        payload_capture (PayloadCaptureConfig | None): How the callback handlers capture LLM and tool inputs.
 
     Returns:
         Callable[..., AsyncContextManager]: The wrapped build function.
@@ -231,5 +242,6 @@ def chain_wrapped_build_fn(
 
     # Instead of wrapping iteratively, we now call the decorator once,
     # passing the entire list of frameworks along with the workflow_llms.
-    wrapped_fn = set_framework_profiler_handler(workflow_llms, function_frameworks)(base_fn)
+    wrapped_fn = set_framework_profiler_handler(workflow_llms, function_frameworks, token_events,
+                                                payload_capture)(base_fn)
     return wrapped_fn
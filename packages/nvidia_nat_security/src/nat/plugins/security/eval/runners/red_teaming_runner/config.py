@@ -107,6 +107,8 @@ class RedTeamingRunnerConfig(BaseModel):
         evaluator_defaults: Named evaluator configs that scenarios can extend.
         general: General evaluation settings (concurrency, output, dataset).
         scenarios: Dictionary of scenario configurations.
+        max_concurrent_scenarios: Maximum number of scenarios evaluated concurrently.
+        max_total_concurrency: Workflow request budget shared by all concurrently running scenarios.
 
     Example YAML configuration::
 
@@ -133,6 +135,9 @@ class RedTeamingRunnerConfig(BaseModel):
           max_concurrency: 4
           output_dir: ./.tmp/nat/redteaming/
 
+        max_concurrent_scenarios: 4
+        max_total_concurrency: 8
+
         scenarios:
           intercept_payload_42:
             middleware:
@@ -172,6 +177,17 @@ class RedTeamingRunnerConfig(BaseModel):
         description="Dictionary of scenarios. Pydantic tries RedTeamingScenario first, "
         "falls back to _RedTeamingScenarioRaw for dict-based evaluators with _extends.")
 
+    max_concurrent_scenarios: int = Field(default=1,
+                                          ge=1,
+                                          description="Maximum number of scenarios evaluated concurrently. "
+                                          "The default of 1 evaluates scenarios one after another.")
+
+    max_total_concurrency: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum number of workflow requests in flight across all concurrently running scenarios. "
+        "Each scenario is still limited by its own `general.max_concurrency`. 0 disables the shared limit.")
+
     @model_validator(mode="after")
     def validate_and_resolve_scenarios(self) -> RedTeamingRunnerConfig:
         """Validate scenarios and resolve _extends inheritance.
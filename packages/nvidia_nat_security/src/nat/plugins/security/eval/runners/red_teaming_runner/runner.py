@@ -125,13 +125,24 @@ class RedTeamingRunner:
         eval_configs = self._build_evaluation_configs(base_output_dir, generated_workflow_configs)
 
         # Run evaluation
-        multi_eval_config = MultiEvaluationRunConfig(configs=eval_configs)
-        logger.info("Running red team evaluation with %d scenario(s)", len(eval_configs))
+        multi_eval_config = MultiEvaluationRunConfig(
+            configs=eval_configs,
+            max_concurrent_runs=self.config.max_concurrent_scenarios if self.config else 1,
+            max_total_concurrency=self.config.max_total_concurrency if self.config else 0)
+        logger.info("Running red team evaluation with %d scenario(s), up to %d at a time",
+                    len(eval_configs),
+                    multi_eval_config.max_concurrent_runs)
 
         runner = MultiEvaluationRunner(config=multi_eval_config)
-        results = await runner.run_all()
+        completed_results: dict[str, EvaluationRunOutput] = {}
+        async for scenario_id, output in runner.iter_results():
+            completed_results[scenario_id] = output
+            self._log_scenario_completed(scenario_id, output, len(completed_results), len(eval_configs))
         logger.info("Red team evaluation completed")
 
+        # Scenarios finish in completion order; report them in config order
+        results = {scenario_id: completed_results[scenario_id] for scenario_id in eval_configs}
+
         # Flatten results once and reuse
         flat_results = self._build_flat_results(results)
         df = pd.DataFrame(flat_results)
@@ -700,6 +711,28 @@ class RedTeamingRunner:
             'evaluation_failures': evaluation_failures,
         }
 
+    def _log_scenario_completed(self,
+                                scenario_id: str,
+                                output: EvaluationRunOutput,
+                                num_completed: int,
+                                num_scenarios: int) -> None:
+        """Log the result of a single scenario as soon as its evaluation finishes.
+
+        Args:
+            scenario_id: The scenario that finished.
+            output: The evaluation output for the scenario.
+            num_completed: Number of scenarios finished so far.
+            num_scenarios: Total number of scenarios in the campaign.
+        """
+        scores = ", ".join(f"{evaluator_name}={eval_output.average_score}"
+                           for evaluator_name, eval_output in output.evaluation_results)
+        logger.info("Scenario '%s' completed (%d/%d)%s%s",
+                    scenario_id,
+                    num_completed,
+                    num_scenarios,
+                    f": {scores}" if scores else "",
+                    " [workflow interrupted]" if output.workflow_interrupted else "")
+
     def _log_results_summary(self,
                              summary: dict[str, typing.Any],
                              output_dir: Path,
@@ -13,7 +13,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
 import logging
 import threading
 import time
@@ -32,7 +31,9 @@ from nat.data_models.intermediate_step import StreamEventData
 from nat.data_models.intermediate_step import TraceMetadata
 from nat.data_models.intermediate_step import UsageInfo
 from nat.data_models.profiler_callback import BaseProfilerCallback
+from nat.data_models.profiler_callback import PayloadCaptureConfig
 from nat.data_models.token_usage import TokenUsageBaseModel
+from nat.profiler.callbacks.payload_capture import PayloadCapture
 
 logger = logging.getLogger(__name__)
 
@@ -56,7 +57,7 @@ class SemanticKernelProfilerHandler(BaseProfilerCallback):
     and store them in NAT's usage_stats queue for subsequent analysis.
     """
 
-    def __init__(self, workflow_llms: dict) -> None:
+    def __init__(self, workflow_llms: dict, payload_capture: PayloadCaptureConfig | None = None) -> None:
         from semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion_base import OpenAIChatCompletionBase
 
         super().__init__()
@@ -64,6 +65,7 @@ class SemanticKernelProfilerHandler(BaseProfilerCallback):
         self.last_call_ts = time.time()
         self.step_manager = Context.get().intermediate_step_manager
         self._builder_llms = workflow_llms
+        self._payload_capture = PayloadCapture(payload_capture)
 
         # Original references to SK methods
         self._original_tool_call = None
@@ -119,7 +121,7 @@ class SemanticKernelProfilerHandler(BaseProfilerCallback):
 
             # Build the input stats
             if args:
-                chat_input = [copy.deepcopy(args[0].model_dump())]
+                chat_input = [args[0].model_dump()]
             else:
                 # if no args, fallback on kwargs["chat_history"]
                 chat_input = [kwargs["chat_history"].model_dump()]
@@ -134,13 +136,15 @@ class SemanticKernelProfilerHandler(BaseProfilerCallback):
                             model_input += item["text"]
             except Exception as e:
                 logger.exception("Error in getting model input: %s", e)
+            model_input = self._payload_capture.capture(model_input)
+            chat_input = self._payload_capture.capture(chat_input)
 
             input_stats = IntermediateStepPayload(event_type=IntermediateStepType.LLM_START,
                                                   framework=LLMFrameworkEnum.SEMANTIC_KERNEL,
                                                   name=model_name,
                                                   UUID=uuid,
                                                   data=StreamEventData(input=model_input),
-                                                  metadata=TraceMetadata(chat_inputs=copy.deepcopy(chat_input)),
+                                                  metadata=TraceMetadata(chat_inputs=chat_input),
                                                   usage_info=UsageInfo(token_usage=TokenUsageBaseModel(),
                                                                        num_llm_calls=1,
                                                                        seconds_between_calls=seconds_between_calls))
@@ -187,6 +191,7 @@ class SemanticKernelProfilerHandler(BaseProfilerCallback):
                 tool_input = kwargs["function_call"].model_dump(exclude="content_type")
             else:
                 tool_input = args[0].model_dump(exclude="content_type")
+            captured_tool_input = self._payload_capture.capture(tool_input)
 
             try:
                 # Pre-call usage event
@@ -194,9 +199,9 @@ class SemanticKernelProfilerHandler(BaseProfilerCallback):
                                                      framework=LLMFrameworkEnum.SEMANTIC_KERNEL,
                                                      name=tool_input["name"],
                                                      UUID=uuid,
-                                                     data=StreamEventData(input=tool_input),
-                                                     metadata=TraceMetadata(tool_inputs=copy.deepcopy(tool_input),
-                                                                            tool_info=copy.deepcopy(tool_input)),
+                                                     data=StreamEventData(input=captured_tool_input),
+                                                     metadata=TraceMetadata(tool_inputs=captured_tool_input,
+                                                                            tool_info=captured_tool_input),
                                                      usage_info=UsageInfo(token_usage=TokenUsageBaseModel()))
 
                 self.step_manager.push_intermediate_step(input_stat)
@@ -205,10 +210,11 @@ class SemanticKernelProfilerHandler(BaseProfilerCallback):
                 result = await original_func(kernel_self, *args, **kwargs)
 
                 # Try to get the chat history from kwargs or args
+                # The items of the last message are dumped below, so the chat history does not need to be copied
                 if kwargs:
-                    chat_history = copy.deepcopy(kwargs["chat_history"])
+                    chat_history = kwargs["chat_history"]
                 else:
-                    chat_history = copy.deepcopy(args[1])
+                    chat_history = args[1]
 
                 # Post-call usage event
                 output_stat = IntermediateStepPayload(event_type=IntermediateStepType.TOOL_END,
@@ -216,7 +222,7 @@ class SemanticKernelProfilerHandler(BaseProfilerCallback):
                                                       framework=LLMFrameworkEnum.SEMANTIC_KERNEL,
                                                       name=tool_input["name"],
                                                       UUID=uuid,
-                                                      data=StreamEventData(input=tool_input,
+                                                      data=StreamEventData(input=captured_tool_input,
                                                                            output=[
                                                                                item.model_dump(exclude="content_type")
                                                                                for item in chat_history[-1].items
@@ -225,7 +231,7 @@ class SemanticKernelProfilerHandler(BaseProfilerCallback):
                                                           item.model_dump(exclude="content_type")
                                                           for item in chat_history[-1].items
                                                       ],
-                                                                             tool_info=copy.deepcopy(tool_input)),
+                                                                             tool_info=captured_tool_input),
                                                       usage_info=UsageInfo(token_usage=TokenUsageBaseModel()))
 
                 self.step_manager.push_intermediate_step(output_stat)
@@ -14,7 +14,6 @@
 # limitations under the License.
 
 import asyncio
-import copy
 import importlib
 import json
 import logging
@@ -32,7 +31,9 @@ from nat.data_models.intermediate_step import StreamEventData
 from nat.data_models.intermediate_step import TraceMetadata
 from nat.data_models.intermediate_step import UsageInfo
 from nat.data_models.profiler_callback import BaseProfilerCallback
+from nat.data_models.profiler_callback import PayloadCaptureConfig
 from nat.data_models.token_usage import TokenUsageBaseModel
+from nat.profiler.callbacks.payload_capture import PayloadCapture
 
 logger = logging.getLogger(__name__)
 
@@ -86,8 +87,8 @@ class StrandsToolInstrumentationHook:
                 UUID=tool_use_id,
                 data=StreamEventData(input=str(tool_input), output=""),
                 metadata=TraceMetadata(
-                    tool_inputs=copy.deepcopy(tool_input),
-                    tool_info=copy.deepcopy(getattr(selected_tool, 'tool_spec', {})),
+                    tool_inputs=self.handler.payload_capture.capture(tool_input),
+                    tool_info=self.handler.payload_capture.capture(getattr(selected_tool, 'tool_spec', {})),
                 ),
                 usage_info=UsageInfo(token_usage=TokenUsageBaseModel()),
             )
@@ -177,14 +178,20 @@ class StrandsToolInstrumentationHook:
 
 class StrandsProfilerHandler(BaseProfilerCallback):
 
-    def __init__(self) -> None:
+    def __init__(self, payload_capture: PayloadCaptureConfig | None = None) -> None:
         super().__init__()
         self._patched: bool = False
+        self._payload_capture = PayloadCapture(payload_capture)
         self.last_call_ts = time.time()
 
         # Note: tool hooks are now created per-agent-instance in wrapped_init
         # to avoid shared state in concurrent execution
 
+    @property
+    def payload_capture(self) -> PayloadCapture:
+        """Captures the LLM and tool inputs recorded in intermediate steps."""
+        return self._payload_capture
+
     def instrument(self) -> None:
         """
         Instrument Strands for telemetry capture.
@@ -346,7 +353,7 @@ class StrandsProfilerHandler(BaseProfilerCallback):
             if system_prompt:
                 all_messages.append({"text": system_prompt, "role": "system"})
             if isinstance(raw_messages, list):
-                all_messages.extend(copy.deepcopy(raw_messages))
+                all_messages.extend(handler._payload_capture.capture(raw_messages))
 
             # Extract tools schema for metadata
             tools_schema = []
@@ -384,8 +391,8 @@ class StrandsProfilerHandler(BaseProfilerCallback):
                 UUID=event_uuid,
                 data=StreamEventData(input=llm_input_str, output=""),
                 metadata=TraceMetadata(
-                    chat_inputs=copy.deepcopy(all_messages),
-                    tools_schema=copy.deepcopy(tools_schema),
+                    chat_inputs=all_messages,
+                    tools_schema=tools_schema,
                 ),
                 usage_info=UsageInfo(
                     token_usage=TokenUsageBaseModel(),
@@ -430,7 +437,7 @@ class StrandsProfilerHandler(BaseProfilerCallback):
                 metadata = TraceMetadata(
                     chat_responses=chat_responses_list,
                     chat_inputs=all_messages,
-                    tools_schema=copy.deepcopy(tools_schema),
+                    tools_schema=tools_schema,
                 )
 
                 # Push END with input/output and token usage
@@ -36,6 +36,9 @@ class ZepEditor(MemoryEditor):
     Uses thread-based memory management with automatic user creation.
     """
 
+    # Maximum number of messages Zep accepts in a single add_messages request
+    _MAX_MESSAGES_PER_REQUEST = 30
+
     def __init__(self, zep_client: AsyncZep) -> None:
         """
         Initialize class with Zep v3 AsyncZep Client.
@@ -45,16 +48,24 @@ class ZepEditor(MemoryEditor):
         """
         self._client = zep_client
 
+        # Users and threads known to exist in Zep, so they are only checked or created once per editor
+        self._ensured_users: set[str] = set()
+        self._created_threads: set[str] = set()
+
     def _get_thread_id(self, user_id: str) -> str:
         return Context.get().conversation_id or "default_zep_thread"
 
     async def _ensure_user_exists(self, user_id: str) -> None:
         """
-        Ensure a user exists in Zep v3, creating if necessary.
+        Ensure a user exists in Zep v3, creating if necessary. Users that were already ensured by this editor are
+        not checked again.
 
         Args:
             user_id (str): The user ID to check/create.
         """
+        if user_id in self._ensured_users:
+            return
+
         logger.debug("Checking if Zep user exists")
         try:
             await self._client.user.get(user_id=user_id)
@@ -90,6 +101,40 @@ class ZepEditor(MemoryEditor):
             logger.error("Failed fetching Zep user: %s", str(e))  # noqa: TRY400
             raise
 
+        self._ensured_users.add(user_id)
+
+    async def _ensure_thread_exists(self, thread_id: str, user_id: str) -> bool:
+        """
+        Ensure a thread exists in Zep v3, creating it if necessary. Threads that were already ensured by this editor
+        are not created again.
+
+        Args:
+            thread_id (str): The thread ID to check/create.
+            user_id (str): The user the thread belongs to.
+
+        Returns:
+            bool: Whether the thread exists.
+        """
+        if thread_id in self._created_threads:
+            return True
+
+        logger.info("Ensuring Zep thread exists (thread_id=%s)", thread_id)
+        try:
+            await self._client.thread.create(thread_id=thread_id, user_id=user_id)
+            logger.info("Created Zep thread (thread_id=%s)", thread_id)
+        except ApiError as create_error:
+            # Check for both 409 (Conflict) and 400 (Bad Request) with "already exists" message
+            if create_error.status_code == 409:
+                logger.debug("Zep thread already exists - 409 (thread_id=%s)", thread_id)
+            elif create_error.status_code == 400 and "already exists" in str(create_error).lower():
+                logger.debug("Zep thread already exists - 400 (thread_id=%s)", thread_id)
+            else:
+                logger.exception("Thread create failed (thread_id=%s)", thread_id)
+                return False
+
+        self._created_threads.add(thread_id)
+        return True
+
     async def add_items(self, items: list[MemoryItem], **kwargs) -> None:
         """
         Insert Multiple MemoryItems into the memory using Zep v3 thread API.
@@ -107,9 +152,8 @@ class ZepEditor(MemoryEditor):
         # Extract Zep-specific parameters
         ignore_roles = kwargs.get("ignore_roles", None)
 
-        coroutines = []
-        created_threads: set[str] = set()
-        ensured_users: set[str] = set()
+        # Messages for each thread, in order, so each thread is written with a single request
+        thread_messages: dict[str, list[Message]] = {}
 
         # Iteratively insert memories into Zep using threads
         for memory_item in items:
@@ -119,57 +163,38 @@ class ZepEditor(MemoryEditor):
             # Get thread_id from NAT context (unique per UI conversation), with a per-user fallback.
             thread_id = self._get_thread_id(user_id)
 
-            messages = []
-
-            # Ensure user exists before creating thread (only once per user)
-            if user_id not in ensured_users:
-                await self._ensure_user_exists(user_id)
-                ensured_users.add(user_id)
+            # Ensure user exists before creating thread
+            await self._ensure_user_exists(user_id)
 
             # Skip if no conversation data
             if not conversation:
                 continue
 
-            for msg in conversation:
-                # Create Message - role field instead of role_type in V3
-                message = Message(content=msg["content"], role=msg["role"])
-                messages.append(message)
-
-            # Ensure thread exists once per thread_id
-            thread_ready = True
-            if thread_id not in created_threads:
-                logger.info("Ensuring Zep thread exists (thread_id=%s)", thread_id)
-                try:
-                    await self._client.thread.create(thread_id=thread_id, user_id=user_id)
-                    logger.info("Created Zep thread (thread_id=%s)", thread_id)
-                    created_threads.add(thread_id)
-                except ApiError as create_error:
-                    # Check for both 409 (Conflict) and 400 (Bad Request) with "already exists" message
-                    if create_error.status_code == 409:
-                        logger.debug("Zep thread already exists - 409 (thread_id=%s)", thread_id)
-                        created_threads.add(thread_id)
-                    elif create_error.status_code == 400 and "already exists" in str(create_error).lower():
-                        logger.debug("Zep thread already exists - 400 (thread_id=%s)", thread_id)
-                        created_threads.add(thread_id)
-                    else:
-                        logger.exception("Thread create failed (thread_id=%s)", thread_id)
-                        thread_ready = False
-
             # Skip this item if thread creation failed unexpectedly
-            if not thread_ready:
+            if not await self._ensure_thread_exists(thread_id, user_id):
                 continue
 
-            # Add messages to thread using Zep v3 API
-            logger.info("Queueing add_messages (thread_id=%s, count=%d)", thread_id, len(messages))
+            for msg in conversation:
+                # Create Message - role field instead of role_type in V3
+                thread_messages.setdefault(thread_id, []).append(Message(content=msg["content"], role=msg["role"]))
+
+        async def add_thread_messages(thread_id: str, messages: list[Message]) -> None:
+            # Add messages to thread using Zep v3 API, respecting the per-request message limit. The chunks of a
+            # thread are sent one after another so its messages are stored in order.
+            for start in range(0, len(messages), self._MAX_MESSAGES_PER_REQUEST):
+                chunk = messages[start:start + self._MAX_MESSAGES_PER_REQUEST]
+                logger.info("Calling add_messages (thread_id=%s, count=%d)", thread_id, len(chunk))
 
-            # Build add_messages parameters
-            add_messages_params = {"thread_id": thread_id, "messages": messages}
-            if ignore_roles is not None:
-                add_messages_params["ignore_roles"] = ignore_roles
+                # Build add_messages parameters
+                add_messages_params = {"thread_id": thread_id, "messages": chunk}
+                if ignore_roles is not None:
+                    add_messages_params["ignore_roles"] = ignore_roles
 
-            coroutines.append(self._client.thread.add_messages(**add_messages_params))
+                await self._client.thread.add_messages(**add_messages_params)
 
-        await asyncio.gather(*coroutines)
+        # Different threads are written concurrently
+        await asyncio.gather(*(add_thread_messages(thread_id, messages)
+                               for thread_id, messages in thread_messages.items()))
 
     async def search(self, query: str, top_k: int = 5, **kwargs) -> list[MemoryItem]:
         """
@@ -273,6 +298,7 @@ class ZepEditor(MemoryEditor):
             # Delete specific thread
             thread_id = kwargs.pop("thread_id")
             logger.info("Deleting thread (thread_id=%s)", thread_id)
+            self._created_threads.discard(thread_id)
             await self._client.thread.delete(thread_id=thread_id)
         elif "user_id" in kwargs:
             # Delete all threads for a user
@@ -288,6 +314,7 @@ class ZepEditor(MemoryEditor):
             for thread in threads:
                 if thread.thread_id:
                     logger.debug("Queueing deletion of thread (thread_id=%s)", thread.thread_id)
+                    self._created_threads.discard(thread.thread_id)
                     delete_coroutines.append(self._client.thread.delete(thread_id=thread.thread_id))
 
             if delete_coroutines:
@@ -79,3 +79,69 @@ async def test_search_falls_back_to_thread_context_without_graph_results():
     zep_client.thread.get_user_context.assert_awaited_once_with(thread_id="conversation-123", mode="summary")
     assert len(results) == 1
     assert results[0].memory == "Formatted Zep context"
+
+
+async def test_add_items_caches_user_and_thread_and_batches_messages():
+    """Users and threads are only ensured once per editor, and each thread is written with one request."""
+    from nat.memory.models import MemoryItem
+
+    zep_client = Mock()
+    zep_client.user.get = AsyncMock()
+    zep_client.thread.create = AsyncMock()
+    zep_client.thread.add_messages = AsyncMock()
+    editor = ZepEditor(zep_client=zep_client)
+    context = Mock()
+    context.conversation_id = "conversation-123"
+
+    items = [
+        MemoryItem(conversation=[{
+            "role": "user", "content": "Hello"
+        }], user_id="user-123"),
+        MemoryItem(conversation=[{
+            "role": "assistant", "content": "Hi"
+        }], user_id="user-123"),
+    ]
+    with patch("nat.plugins.zep_cloud.zep_editor.Context.get", return_value=context):
+        await editor.add_items(items)
+        await editor.add_items(items[:1])
+
+    zep_client.user.get.assert_awaited_once_with(user_id="user-123")
+    zep_client.thread.create.assert_awaited_once_with(thread_id="conversation-123", user_id="user-123")
+    assert zep_client.thread.add_messages.await_count == 2
+    first_call = zep_client.thread.add_messages.await_args_list[0]
+    assert [message.content for message in first_call.kwargs["messages"]] == ["Hello", "Hi"]
+
+
+async def test_add_items_sends_chunks_of_a_thread_in_order():
+    """Messages over the per-request limit are split into chunks, which are sent one after another."""
+    import asyncio
+
+    from nat.memory.models import MemoryItem
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def add_messages(**kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    zep_client = Mock()
+    zep_client.user.get = AsyncMock()
+    zep_client.thread.create = AsyncMock()
+    zep_client.thread.add_messages = AsyncMock(side_effect=add_messages)
+    editor = ZepEditor(zep_client=zep_client)
+    context = Mock()
+    context.conversation_id = "conversation-123"
+
+    items = [MemoryItem(conversation=[{"role": "user", "content": str(i)}], user_id="user-123") for i in range(65)]
+    with patch("nat.plugins.zep_cloud.zep_editor.Context.get", return_value=context):
+        await editor.add_items(items)
+
+    chunks = [[message.content for message in call.kwargs["messages"]]
+              for call in zep_client.thread.add_messages.await_args_list]
+    assert [len(chunk) for chunk in chunks] == [30, 30, 5]
+    assert sum(chunks, []) == [str(i) for i in range(65)]
+    assert max_in_flight == 1